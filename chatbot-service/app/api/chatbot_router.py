@@ -1,6 +1,7 @@
 from fastapi import APIRouter, HTTPException
 from app.domain.controller.chat_controller import generate_response
 from app.domain.model.chat_model import ChatRequest, ChatResponse
+from app.platform.executor import run_blocking
 
 # 라우터 설정
 router = APIRouter()
@@ -26,7 +27,10 @@ async def chat(request: ChatRequest):
     - **status**: 요청 처리 상태
     """
     try:
-        response = generate_response(request.message)
+        # 토큰 생성(model.generate)은 블로킹 연산이므로 실행기 풀에서 실행
+        response = await run_blocking(generate_response, request.message)
         return ChatResponse(response=response)
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error processing chat: {str(e)}")
@@ -1,21 +1,26 @@
 import os
 from transformers import AutoTokenizer, AutoModelForCausalLM
+from app.platform.tracing import span
 
 class ChatService:
     def __init__(self):
         token = os.getenv("HUGGINGFACE_TOKEN")
-        self.tokenizer = AutoTokenizer.from_pretrained("lcw99/ko-dialoGPT-korean-chit-chat", token=token)
-        self.model = AutoModelForCausalLM.from_pretrained("lcw99/ko-dialoGPT-korean-chit-chat", token=token)
+        with span("chatbot.model_load"):
+            self.tokenizer = AutoTokenizer.from_pretrained("lcw99/ko-dialoGPT-korean-chit-chat", token=token)
+            self.model = AutoModelForCausalLM.from_pretrained("lcw99/ko-dialoGPT-korean-chit-chat", token=token)
 
     def get_response(self, message: str) -> str:
-        inputs = self.tokenizer.encode(message + self.tokenizer.eos_token, return_tensors="pt")
-        outputs = self.model.generate(
-            inputs,
-            max_length=50,
-            do_sample=True,
-            temperature=0.7,
-            top_p=0.9,
-            pad_token_id=self.tokenizer.eos_token_id
-        )
-        response = self.tokenizer.decode(outputs[0], skip_special_tokens=True)
+        with span("chatbot.preprocess"):
+            inputs = self.tokenizer.encode(message + self.tokenizer.eos_token, return_tensors="pt")
+        with span("chatbot.inference"):
+            outputs = self.model.generate(
+                inputs,
+                max_length=50,
+                do_sample=True,
+                temperature=0.7,
+                top_p=0.9,
+                pad_token_id=self.tokenizer.eos_token_id
+            )
+        with span("chatbot.decode"):
+            response = self.tokenizer.decode(outputs[0], skip_special_tokens=True)
         return response 
\ No newline at end of file
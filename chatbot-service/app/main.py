@@ -1,11 +1,16 @@
 import os
 import logging
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from dotenv import load_dotenv
 
 # 라우터 임포트
 from app.api.chatbot_router import router as chatbot_router
+from app.platform.executor import blocking
+from app.platform.instrumentation import instrument
+from app.platform import serving
+from app.platform.tracing import setup_tracing
 
 # 환경 변수 로드
 load_dotenv()
@@ -17,11 +22,27 @@ logging.basicConfig(
 )
 logger = logging.getLogger("chatbot_service")
 
+# 워커 초기화 - 모델은 chat_controller import 시(gunicorn 마스터에서 fork 전) 한 번 로드되어 워커끼리 공유됨
+# 워커마다 torch 가 모든 코어를 쓰면 서로 경합하므로 코어를 워커 수로 나눠 추론 스레드 수를 제한
+@serving.on_worker_init
+def limit_torch_threads():
+    import torch
+    torch.set_num_threads(max(1, serving.available_cpus() // serving.worker_count()))
+
+# 라이프스팬 - 워커 준비, 종료 시 블로킹 작업 실행기 정리
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await serving.startup("chatbot")
+    yield
+    blocking.close()
+    await serving.shutdown()
+
 # FastAPI 애플리케이션 생성
 app = FastAPI(
     title="Chatbot Service",
     description="KoBERT 기반 한국어 챗봇 서비스 API",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 # CORS 미들웨어 설정
@@ -33,9 +54,20 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 메트릭 계측 (/metrics)
+instrument(app, "chatbot")
+
+# 분산 추적 (traceparent 이어받기, 스팬 JSONL 기록)
+setup_tracing(app, "chatbot")
+
 # 라우터 등록
 app.include_router(chatbot_router, prefix="/api/chatbot", tags=["chatbot"])
 
+# 헬스 체크 (게이트웨이 능동 헬스 프로브용)
+@app.get("/health", tags=["상태 확인"])
+async def health():
+    return {"status": "ok"}
+
 # 직접 실행 시 Uvicorn 서버로 실행
 if __name__ == "__main__":
     import uvicorn
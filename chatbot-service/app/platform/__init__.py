@@ -0,0 +1,6 @@
+"""
+플랫폼 계층
+- 플랫폼 통합
+- 어댑터
+- 메시징
+""" 
\ No newline at end of file
@@ -1,29 +1,101 @@
 from fastapi import APIRouter
 import logging
+from functools import lru_cache
 from app.domain.controller.crime_controller import CrimeController
+from app.platform.executor import run_blocking
+from app.platform.jobs import jobs
+from app.domain.service.internal.geocoding import get_geocode_resolver
+from app.domain.service.crime_pipeline import pipeline_status, run_pipeline
+from app.domain.service.internal.dataset_store import crime_datasets
 
 # 로거 설정
 logger = logging.getLogger("crime_router")
 logger.setLevel(logging.INFO)
 router = APIRouter()
 
+
+@lru_cache(maxsize=None)
+def get_controller() -> CrimeController:
+    """요청마다 컨트롤러(전처리기/시각화기/지도 생성기)를 새로 만들지 않도록 프로세스당 하나만 생성"""
+    return CrimeController()
+
+
+# 블로킹 pandas/folium 연산 - 이벤트 루프 밖(실행기 풀)에서 실행
+# 프로세스 풀에서도 실행할 수 있도록 모듈 수준 함수로 둠
+def run_preprocess():
+    return get_controller().preprocess('cctv_in_seoul.csv', 'crime_in_seoul.csv', 'pop_in_seoul.xls')
+
+
+def run_draw_crime_map():
+    return get_controller().draw_crime_map()
+
+
+def run_draw_circle_marker_map():
+    return get_controller().draw_crime_circle_marker_map()
+
+
 # GET
 @router.get("/preprocess", summary="범죄상세")
 async def preprocess():
-    controller = CrimeController()
-    controller.preprocess('cctv_in_seoul.csv', 'crime_in_seoul.csv', 'pop_in_seoul.xls')
-    return {"message": '서울시의 범죄 데이터가 전처리 되었습니다.'}
+    summary = await run_blocking(run_preprocess)
+    return {"message": '서울시의 범죄 데이터가 전처리 되었습니다.', "pipeline": summary}
+
+@router.get("/datasets/stats", summary="메모리 데이터셋 저장소 통계")
+async def dataset_stats():
+    return crime_datasets.stats()
+
+@router.get("/pipeline/status", summary="파이프라인 단계별 최신 여부")
+async def get_pipeline_status():
+    # 출력 파일 내용 해시를 계산하므로 실행기 풀에서 실행
+    return await run_blocking(pipeline_status)
 
 @router.get("/map", summary="범죄지도 그리기")
 async def draw_crime_map():
-    controller = CrimeController()
-    controller.draw_crime_map()
+    await run_blocking(run_draw_crime_map)
     return {"message": '서울시의 범죄 지도가 완성되었습니다.'}
 
 @router.get("/map/circle-marker", summary="CCTV 부족비율 Circle Marker 지도 그리기")
 async def draw_crime_circle_marker_map():
     logger.info("CCTV 부족비율 Circle Marker 지도 생성 요청")
-    controller = CrimeController()
-    result = controller.draw_crime_circle_marker_map()
+    result = await run_blocking(run_draw_circle_marker_map)
     logger.info("CCTV 부족비율 Circle Marker 지도 생성 완료")
-    return {"message": '서울시의 CCTV 부족비율 Circle Marker 지도가 완성되었습니다.'}
\ No newline at end of file
+    return {"message": '서울시의 CCTV 부족비율 Circle Marker 지도가 완성되었습니다.'}
+
+@router.get("/geocode/stats", summary="지오코딩 캐시 통계")
+async def geocode_stats():
+    # SQLite COUNT 한 번이라 풀을 거치지 않음 (lambda 는 EXECUTOR_KIND=process 에서 pickle 할 수 없음)
+    return get_geocode_resolver().stats()
+
+# ✅ 비동기 작업 (POST /crime/jobs/{kind} 로 제출하고 /crime/jobs/{job_id} 로 조회)
+def _checked(result: dict) -> dict:
+    """컨트롤러가 오류를 dict 로 돌려주는 경우 작업을 실패로 처리합니다."""
+    if result.get("status") == "error":
+        raise RuntimeError(result.get("message"))
+    return result
+
+
+def preprocess_job(progress):
+    progress(0.0, "범죄 데이터 전처리 중")
+    summary = run_preprocess()
+    return {"message": '서울시의 범죄 데이터가 전처리 되었습니다.', "pipeline": summary}
+
+
+def pipeline_job(progress, targets=None, force=False):
+    progress(0.0, "범죄 데이터 파이프라인 실행 중")
+    return run_pipeline(targets, force=bool(force), progress=progress)
+
+
+def crime_map_job(progress):
+    progress(0.0, "범죄 지도 생성 중")
+    return _checked(run_draw_crime_map())
+
+
+def circle_marker_map_job(progress):
+    progress(0.0, "CCTV 부족비율 Circle Marker 지도 생성 중")
+    return _checked(run_draw_circle_marker_map())
+
+
+jobs.register("preprocess", preprocess_job, "서울시 범죄 데이터 전처리")
+jobs.register("map", crime_map_job, "범죄지도 그리기")
+jobs.register("circle-marker-map", circle_marker_map_job, "CCTV 부족비율 Circle Marker 지도 그리기")
+jobs.register("pipeline", pipeline_job, "범죄 데이터 파이프라인 증분 실행 (params: targets, force)")
@@ -1,4 +1,5 @@
 from app.domain.service.crime_preprocessor import CrimePreprocessor
+from app.domain.service.crime_pipeline import preprocess_targets, run_pipeline
 from app.domain.service.crime_visualizer import CrimeVisualizer
 from app.domain.model.crime_schema import CrimeSchema
 from app.domain.service.internal.crime_correlation import analyze_correlation, analyze_crime_correlation, get_interpretation_text, load_and_analyze
@@ -12,7 +13,8 @@ class CrimeController:
         self.map_creator = CrimeMapCreator()
 
     def preprocess(self, *args):
-        self.preprocessor.preprocess(*args)
+        # 원본 파일별 전처리 단계 중 입력이 바뀐 단계만 다시 계산
+        return run_pipeline(preprocess_targets(args))
 
     def correlation(self): #상관계수 분석
         print("Controller: Calling load_and_analyze for correlation analysis...")
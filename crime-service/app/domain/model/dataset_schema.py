@@ -0,0 +1,251 @@
+"""
+범죄 파이프라인 중간 데이터셋의 컬럼 스키마와 컬럼 형식(Arrow) 저장소
+- 단계마다 CSV 를 쓰고 다시 파싱(thousands=',', 타입 추론)하지 않고 Feather(기본) / Parquet 파일로 저장
+- 데이터셋마다 컬럼 타입을 명시해 두고 저장/로드할 때 그 타입으로 맞춤 (필수 컬럼이 없으면 ValueError)
+- Feather 는 압축 없이 저장해 메모리 맵으로 읽고, 필요한 컬럼만 읽을 수 있음
+- CSV 는 내보내기(export_csv)용으로만 사용 (<이름>.export.csv - 원본 입력 CSV 를 덮어쓰지 않도록 이름을 구분)
+- 이전에 CSV 로 저장한 결과는 <이름>.legacy.csv 로 이름을 바꾼 뒤 migrate_legacy_csv 로 한 번 변환
+  (stored_data/<이름>.csv 는 cctv / crime 처럼 원본 입력 파일일 수 있으므로 읽기 경로에서 변환하지 않음)
+
+사용:
+    write_dataset(cctv, stored_data, 'cctv_in_seoul')
+    cctv = read_dataset(stored_data, 'cctv_in_seoul', columns=['자치구', '소계'])
+"""
+import os
+import logging
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+import pyarrow.parquet as pq
+
+logger = logging.getLogger(__name__)
+
+# ✅ 저장 형식 설정
+# feather: Arrow IPC (압축 없음, 메모리 맵 읽기) / parquet: 더 작은 파일 (읽을 때 압축 해제)
+DATASET_FORMAT = os.getenv("DATASET_FORMAT", "feather").lower()
+# 데이터셋을 저장할 때 CSV(<이름>.export.csv)도 함께 내보낼지 여부 (엑셀 등에서 열어 보는 용도)
+DATASET_EXPORT_CSV = os.getenv("DATASET_EXPORT_CSV", "false").lower() in ("1", "true", "yes")
+
+DATASET_EXTENSIONS = {"feather": ".feather", "parquet": ".parquet"}
+# 이전 버전이 CSV 로 저장한 결과 (원본 입력 CSV 와 구분하기 위해 이름을 바꿔 둔 파일)
+LEGACY_CSV_SUFFIX = ".legacy.csv"
+# 내보낸 CSV (stored_data/<이름>.csv 같은 원본 입력 파일과 겹치지 않는 이름)
+EXPORT_CSV_SUFFIX = ".export.csv"
+
+CRIME_TYPES = ('살인', '강도', '강간', '절도', '폭력')
+ARREST_RATE_COLUMNS = tuple(f"{crime}검거율" for crime in CRIME_TYPES)
+
+
+@dataclass(frozen=True)
+class DatasetSchema:
+    """데이터셋 하나의 필수 컬럼과 타입 (그 밖의 컬럼은 저장할 때 추론한 타입을 파일에 그대로 기록)"""
+    name: str
+    columns: Tuple[Tuple[str, pa.DataType], ...]
+
+    @property
+    def column_names(self) -> List[str]:
+        return [column for column, _ in self.columns]
+
+
+def _schema(name: str, *columns: Tuple[str, pa.DataType]) -> DatasetSchema:
+    return DatasetSchema(name, tuple(columns))
+
+
+_MERGED_COLUMNS = (
+    ('자치구', pa.string()),
+    ('소계', pa.float64()),
+    ('인구수', pa.float64()),
+    ('외국인비율', pa.float64()),
+    ('고령자비율', pa.float64()),
+    ('범죄', pa.float64()),
+    ('인구당_CCTV', pa.float64()),
+    ('범죄_인구_가중치', pa.float64()),
+    ('취약지수', pa.float64()),
+    ('CCTV_필요지수', pa.float64()),
+)
+
+# ✅ 데이터셋별 스키마
+DATASET_SCHEMAS: Dict[str, DatasetSchema] = {schema.name: schema for schema in (
+    _schema('cctv_in_seoul', ('자치구', pa.string()), ('소계', pa.int64())),
+    _schema(
+        'crime_in_seoul', ('관서명', pa.string()), ('자치구', pa.string()),
+        *((f"{crime} {kind}", pa.int64()) for crime in CRIME_TYPES for kind in ('발생', '검거')),
+    ),
+    _schema(
+        'police_in_seoul', ('자치구', pa.string()),
+        *((f"{crime} 발생", pa.int64()) for crime in CRIME_TYPES),
+        *((column, pa.float64()) for column in ARREST_RATE_COLUMNS),
+    ),
+    _schema(
+        'police_norm_in_seoul', ('자치구', pa.string()),
+        *((crime, pa.float64()) for crime in CRIME_TYPES),
+        *((column, pa.float64()) for column in ARREST_RATE_COLUMNS),
+        ('범죄', pa.float64()), ('검거', pa.float64()),
+    ),
+    # 합계 행이 비어 있을 수 있어 인구 수는 실수형으로 저장
+    _schema(
+        'pop_in_seoul', ('자치구', pa.string()),
+        *((column, pa.float64()) for column in ('인구수', '한국인', '외국인', '고령자')),
+    ),
+    _schema('merged_data', *_MERGED_COLUMNS),
+    _schema('merged_data_with_shortfall', *_MERGED_COLUMNS, ('부족비율', pa.float64())),
+)}
+
+
+def dataset_path(context: str, name: str, fmt: str = DATASET_FORMAT) -> str:
+    """데이터셋 파일 경로 (context/name.feather 또는 .parquet)"""
+    if fmt not in DATASET_EXTENSIONS:
+        raise ValueError(f"DATASET_FORMAT 은 feather 또는 parquet 이어야 합니다: {fmt}")
+    return os.path.join(context, name + DATASET_EXTENSIONS[fmt])
+
+
+def find_dataset(context: str, name: str) -> Optional[str]:
+    """저장된 데이터셋 파일을 찾습니다. (설정한 형식 → 다른 형식 순, 없으면 None)"""
+    for fmt in dict.fromkeys((DATASET_FORMAT, *DATASET_EXTENSIONS)):
+        path = dataset_path(context, name, fmt)
+        if os.path.exists(path):
+            return path
+    return None
+
+
+def dataset_exists(context: str, name: str) -> bool:
+    return find_dataset(context, name) is not None
+
+
+def to_table(df: pd.DataFrame, name: str) -> pa.Table:
+    """
+    DataFrame 을 데이터셋 스키마에 맞춘 Arrow 테이블로 바꿉니다.
+
+    Args:
+        df: 저장할 DataFrame (인덱스는 저장하지 않음)
+        name: 데이터셋 이름
+
+    Returns:
+        스키마 컬럼이 앞에, 그 밖의 컬럼이 뒤에 오는 Arrow 테이블
+
+    Raises:
+        ValueError: 필수 컬럼이 없거나 타입을 맞출 수 없는 경우
+    """
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    schema = DATASET_SCHEMAS.get(name)
+    if schema is None:
+        return table
+    missing = [column for column in schema.column_names if column not in table.column_names]
+    if missing:
+        raise ValueError(f"{name} 데이터셋에 필요한 컬럼이 없습니다: {', '.join(missing)}")
+    extra = [column for column in table.column_names if column not in schema.column_names]
+    try:
+        arrays = [table[column].cast(dtype) for column, dtype in schema.columns]
+    except (pa.ArrowInvalid, pa.ArrowNotImplementedError) as e:
+        raise ValueError(f"{name} 데이터셋 컬럼 타입을 맞출 수 없습니다: {e}") from e
+    return pa.table(arrays + [table[column] for column in extra], names=schema.column_names + extra)
+
+
+def write_dataset(df: pd.DataFrame, context: str, name: str, fmt: str = DATASET_FORMAT) -> str:
+    """
+    데이터셋을 컬럼 형식 파일로 저장합니다.
+    임시 파일에 쓴 뒤 교체하므로 읽는 쪽(다른 워커)은 항상 완성된 파일만 봅니다.
+
+    Args:
+        df: 저장할 DataFrame
+        context: 저장 디렉토리
+        name: 데이터셋 이름 (확장자 없이)
+        fmt: 저장 형식 (feather / parquet)
+
+    Returns:
+        저장한 파일 경로
+    """
+    os.makedirs(context, exist_ok=True)
+    table = to_table(df, name)
+    path = dataset_path(context, name, fmt)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    if fmt == "feather":
+        feather.write_feather(table, tmp_path, compression="uncompressed")
+    else:
+        pq.write_table(table, tmp_path)
+    os.replace(tmp_path, path)
+    logger.info(f"데이터셋 저장: {path} {table.num_rows}x{table.num_columns}")
+    if DATASET_EXPORT_CSV:
+        export_csv(context, name)
+    return path
+
+
+def read_table(context: str, name: str, columns: Optional[Sequence[str]] = None) -> pa.Table:
+    """
+    데이터셋을 Arrow 테이블로 읽습니다. (메모리 맵, 필요한 컬럼만)
+    파일을 쓰지 않으며, 컬럼 형식 파일이 없으면 CSV 가 있어도 변환하지 않습니다.
+
+    Args:
+        context: 데이터셋 디렉토리
+        name: 데이터셋 이름
+        columns: 읽을 컬럼 (None 이면 전체)
+
+    Returns:
+        Arrow 테이블
+
+    Raises:
+        FileNotFoundError: 데이터셋 파일이 없는 경우 (아직 파이프라인을 실행하지 않음)
+    """
+    path = find_dataset(context, name)
+    if path is None:
+        raise FileNotFoundError(dataset_path(context, name))
+    columns = list(columns) if columns is not None else None
+    if path.endswith(DATASET_EXTENSIONS["feather"]):
+        return feather.read_table(path, columns=columns, memory_map=True)
+    return pq.read_table(path, columns=columns, memory_map=True)
+
+
+def read_dataset(context: str, name: str, columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
+    """read_table 로 읽은 데이터셋을 DataFrame 으로 돌려줍니다."""
+    return read_table(context, name, columns).to_pandas()
+
+
+def read_legacy_csv(csv_path: str, name: str) -> pd.DataFrame:
+    """이전 단계들이 CSV 로 저장한 데이터셋을 읽습니다. (police_norm 은 인덱스 컬럼을 자치구로 사용)"""
+    df = pd.read_csv(csv_path, thousands=',')
+    if '자치구' not in df.columns and 'Unnamed: 0' in df.columns:
+        df = df.rename(columns={'Unnamed: 0': '자치구'})
+    return df
+
+
+def migrate_legacy_csv(context: str, name: str) -> Optional[str]:
+    """
+    이전 버전이 저장한 결과 CSV(context/<이름>.legacy.csv)를 데이터셋 파일로 한 번 변환합니다.
+    이미 데이터셋 파일이 있으면 아무것도 하지 않습니다.
+
+    Args:
+        context: 데이터셋 디렉토리
+        name: 데이터셋 이름
+
+    Returns:
+        변환해 저장한 파일 경로 (변환할 파일이 없거나 이미 변환했으면 None)
+
+    Raises:
+        ValueError: CSV 가 데이터셋 스키마와 맞지 않는 경우
+    """
+    csv_path = os.path.join(context, name + LEGACY_CSV_SUFFIX)
+    if dataset_exists(context, name) or not os.path.exists(csv_path):
+        return None
+    logger.info(f"이전 CSV 를 데이터셋 파일로 변환: {csv_path}")
+    return write_dataset(read_legacy_csv(csv_path, name), context, name)
+
+
+def export_csv(context: str, name: str, path: Optional[str] = None) -> str:
+    """
+    저장된 데이터셋을 CSV 로 내보냅니다.
+
+    Args:
+        context: 데이터셋 디렉토리
+        name: 데이터셋 이름
+        path: CSV 경로 (기본: context/<이름>.export.csv)
+
+    Returns:
+        내보낸 CSV 경로
+    """
+    path = path or os.path.join(context, name + EXPORT_CSV_SUFFIX)
+    read_dataset(context, name).to_csv(path, index=False, encoding='utf-8')
+    logger.info(f"데이터셋 CSV 내보내기: {path}")
+    return path
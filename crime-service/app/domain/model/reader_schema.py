@@ -2,6 +2,7 @@ from dataclasses import dataclass
 import json
 import pandas as pd
 import os
+from app.domain.model.dataset_schema import read_dataset, write_dataset, export_csv
 
 @dataclass
 class ReaderSchema:
@@ -30,4 +31,13 @@ class ReaderSchema:
         return pd.read_excel(file, header=header, usecols=usecols)
     def json_load(self):
         file = self.new_file()
-        return json.load(open(file))
\ No newline at end of file
+        return json.load(open(file))
+    def dataset_to_dframe(self, columns=None) -> object:
+        """context 의 fname 데이터셋(Feather/Parquet)을 메모리 맵으로 읽음 (columns 로 필요한 컬럼만)"""
+        return read_dataset(self._context, self._fname, columns)
+    def dframe_to_dataset(self, df) -> str:
+        """DataFrame 을 fname 데이터셋 스키마에 맞춰 컬럼 형식 파일로 저장"""
+        return write_dataset(df, self._context, self._fname)
+    def dataset_to_csv(self) -> str:
+        """fname 데이터셋을 CSV 로 내보냄"""
+        return export_csv(self._context, self._fname)
\ No newline at end of file
@@ -0,0 +1,192 @@
+"""
+범죄 데이터 전처리 / 지표 / 지도 생성 파이프라인 (증분 실행 DAG)
+
+    cctv ─────────────────────────┐
+    pop ──────────────────────────┼─▶ merged ─▶ shortfall_map
+    crime(지오코딩) ─▶ police ─────┤
+                                  └─▶ crime_map
+
+- 원본 파일(csv/xls/GeoJSON) 내용이나 단계 파라미터가 바뀐 단계와 그 뒤 단계만 다시 계산
+- cctv / pop / crime 처럼 서로 의존하지 않는 단계는 동시에 실행
+- 실행 기록은 stored_data/pipeline_manifest.json 에 저장
+
+실행 (crime-service 디렉토리에서):
+    python -m app.domain.service.crime_pipeline status
+    python -m app.domain.service.crime_pipeline run [--force] [단계 ...]
+    python -m app.domain.service.crime_pipeline migrate   # 이전 결과 CSV(<이름>.legacy.csv) 변환
+"""
+import os
+import sys
+import json
+import argparse
+import logging
+from typing import Callable, Dict, Iterable, List, Optional
+
+from app.domain.model.dataset_schema import dataset_path, migrate_legacy_csv, read_dataset
+from app.domain.service.internal.pipeline_dag import PipelineDAG, Stage
+from app.platform.tracing import traced
+
+logger = logging.getLogger("crime_service")
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+STORED_DATA = os.path.join(APP_DIR, 'stored_data')
+UP_DATA = os.path.join(APP_DIR, 'up_data')
+STORED_MAP = os.path.join(APP_DIR, 'stored_map')
+
+# ✅ 파이프라인 설정
+PIPELINE_MANIFEST_PATH = os.getenv("PIPELINE_MANIFEST_PATH", os.path.join(STORED_DATA, 'pipeline_manifest.json'))
+
+# 파이프라인이 만드는 데이터셋 (서비스 시작 시 메모리 저장소에 미리 로드)
+PIPELINE_DATASETS = (
+    (STORED_DATA, 'cctv_in_seoul'),
+    (STORED_DATA, 'crime_in_seoul'),
+    (STORED_DATA, 'police_in_seoul'),
+    (STORED_DATA, 'police_norm_in_seoul'),
+    (STORED_DATA, 'pop_in_seoul'),
+    (UP_DATA, 'merged_data'),
+    (UP_DATA, 'merged_data_with_shortfall'),
+)
+
+# /preprocess 가 받는 원본 파일 이름 → 그 파일을 처리하는 단계
+PREPROCESS_TARGETS = {
+    'cctv_in_seoul.csv': 'cctv',
+    'crime_in_seoul.csv': 'police',
+    'pop_in_seoul.xls': 'pop',
+}
+
+
+# ✅ 단계 함수 (sklearn / folium 은 단계를 실행할 때만 import)
+def run_cctv() -> None:
+    from app.domain.service.crime_preprocessor import CrimePreprocessor
+    preprocessor = CrimePreprocessor()
+    preprocessor.cctv = preprocessor.create_matrix('cctv_in_seoul.csv')
+    preprocessor.update_cctv()
+
+
+def run_crime() -> None:
+    from app.domain.service.crime_preprocessor import CrimePreprocessor
+    preprocessor = CrimePreprocessor()
+    preprocessor.crime = preprocessor.create_matrix('crime_in_seoul.csv')
+    preprocessor.update_crime()
+
+
+def run_police() -> None:
+    from app.domain.service.crime_preprocessor import CrimePreprocessor
+    preprocessor = CrimePreprocessor()
+    preprocessor.crime = read_dataset(STORED_DATA, 'crime_in_seoul')
+    preprocessor.update_police()
+
+
+def run_pop() -> None:
+    from app.domain.service.crime_preprocessor import CrimePreprocessor
+    preprocessor = CrimePreprocessor()
+    preprocessor.pop = preprocessor.create_matrix('pop_in_seoul.xls')
+    preprocessor.update_pop()
+
+
+def run_merged() -> None:
+    from app.domain.service.internal.crime_indicator_builder import build_merged_dataset_and_indicators
+    build_merged_dataset_and_indicators(stored_data_dir=STORED_DATA, output_dir=UP_DATA)
+
+
+def run_shortfall_map() -> None:
+    from app.domain.service.internal.crime_map_circle_marker import create_crime_circle_marker_map
+    create_crime_circle_marker_map(merged_data_dir=UP_DATA, geo_json_dir=STORED_DATA, output_dir=STORED_MAP)
+
+
+def run_crime_map() -> None:
+    from app.domain.service.internal.crime_map_create import CrimeMapCreator
+    CrimeMapCreator(data_dir=STORED_DATA, output_dir=STORED_MAP, local_output_dir=STORED_MAP).create_map()
+
+
+def build_crime_pipeline(manifest_path: str = PIPELINE_MANIFEST_PATH) -> PipelineDAG:
+    """범죄 파이프라인 DAG 를 만듭니다."""
+    geo_json = os.path.join(STORED_DATA, 'geo_simple.json')
+    return PipelineDAG([
+        Stage("cctv", run_cctv, sources=(os.path.join(STORED_DATA, 'cctv_in_seoul.csv'),),
+              outputs=(dataset_path(STORED_DATA, 'cctv_in_seoul'),),
+              description="CCTV 데이터 정리"),
+        Stage("pop", run_pop, sources=(os.path.join(STORED_DATA, 'pop_in_seoul.xls'),),
+              outputs=(dataset_path(STORED_DATA, 'pop_in_seoul'),),
+              params={"header": 2, "usecols": "B,D,G,J,N"},
+              description="인구 데이터 정리"),
+        Stage("crime", run_crime, sources=(os.path.join(STORED_DATA, 'crime_in_seoul.csv'), geo_json),
+              outputs=(dataset_path(STORED_DATA, 'crime_in_seoul'),),
+              params={"geocode_language": "ko"},
+              description="경찰서 지오코딩 및 자치구 매핑 (주소에 자치구가 없으면 폴리곤으로 판정)"),
+        Stage("police", run_police, deps=("crime",),
+              outputs=(dataset_path(STORED_DATA, 'police_in_seoul'), dataset_path(STORED_DATA, 'police_norm_in_seoul')),
+              description="자치구별 검거율 및 정규화"),
+        Stage("merged", run_merged, deps=("cctv", "pop", "police"),
+              outputs=(dataset_path(UP_DATA, 'merged_data'),),
+              description="데이터 병합 및 범죄 지표 생성"),
+        Stage("shortfall_map", run_shortfall_map, deps=("merged",), sources=(geo_json,),
+              outputs=(dataset_path(UP_DATA, 'merged_data_with_shortfall'),
+                       os.path.join(STORED_MAP, 'crime_circle_marker_map.html')),
+              description="CCTV 부족비율 계산 및 Circle Marker 지도"),
+        Stage("crime_map", run_crime_map, deps=("police",), sources=(geo_json,),
+              outputs=(os.path.join(STORED_MAP, 'crime_map.html'),),
+              description="자치구별 범죄 지도"),
+    ], manifest_path)
+
+
+def preprocess_targets(fnames: Iterable[str]) -> List[str]:
+    """
+    원본 파일 이름을 처리 단계 이름으로 바꿉니다.
+
+    Raises:
+        ValueError: 처리할 수 없는 파일 이름인 경우
+    """
+    unknown = [fname for fname in fnames if fname not in PREPROCESS_TARGETS]
+    if unknown:
+        raise ValueError(f"전처리할 수 없는 파일입니다: {', '.join(unknown)}")
+    return [PREPROCESS_TARGETS[fname] for fname in fnames]
+
+
+@traced("crime.pipeline")
+def run_pipeline(targets: Optional[Iterable[str]] = None, force: bool = False,
+                 progress: Optional[Callable[[float, str], None]] = None) -> dict:
+    """범죄 파이프라인에서 최신이 아닌 단계만 실행합니다. (targets 가 None 이면 전체)"""
+    return build_crime_pipeline().run(targets, force=force, progress=progress)
+
+
+def pipeline_status(targets: Optional[Iterable[str]] = None) -> Dict[str, dict]:
+    """단계별 최신 여부를 반환합니다."""
+    return build_crime_pipeline().status(targets)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="범죄 데이터 파이프라인")
+    sub = parser.add_subparsers(dest="command", required=True)
+    status_parser = sub.add_parser("status", help="단계별 최신 여부")
+    status_parser.add_argument("stages", nargs="*")
+    status_parser.add_argument("--json", action="store_true")
+    run_parser = sub.add_parser("run", help="최신이 아닌 단계 실행")
+    run_parser.add_argument("stages", nargs="*")
+    run_parser.add_argument("--force", action="store_true", help="모든 단계 다시 계산")
+    sub.add_parser("migrate", help="이전 결과 CSV(<이름>.legacy.csv)를 데이터셋 파일로 변환")
+    args = parser.parse_args(argv)
+
+    if args.command == "migrate":
+        migrated = [path for context, name in PIPELINE_DATASETS if (path := migrate_legacy_csv(context, name))]
+        print(json.dumps({"migrated": migrated}, ensure_ascii=False, indent=2))
+        return 0
+
+    if args.command == "run":
+        summary = run_pipeline(args.stages or None, force=args.force)
+        print(json.dumps(summary, ensure_ascii=False, indent=2))
+        return 0
+
+    status = pipeline_status(args.stages or None)
+    if args.json:
+        print(json.dumps(status, ensure_ascii=False, indent=2))
+    else:
+        for name, info in status.items():
+            mark = "✅" if info["reason"] is None else "⏳"
+            print(f"{mark} {name:<14} {info['reason'] or '최신'}")
+    return 0 if all(info["reason"] is None for info in status.values()) else 1
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    sys.exit(main())
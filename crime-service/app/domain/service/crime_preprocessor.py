@@ -2,9 +2,12 @@ import numpy as np
 import pandas as pd
 import os
 from app.domain.model.reader_schema import ReaderSchema
+from app.domain.model.dataset_schema import write_dataset
 from sklearn import preprocessing
-from app.domain.model.google_map_schema import GoogleMapSchema
+from app.domain.service.internal.geocoding import get_geocode_resolver
+from app.domain.service.internal.dataset_store import crime_datasets
 import logging
+from app.platform.tracing import traced
 
 logger = logging.getLogger("crime_service")
 
@@ -21,13 +24,7 @@ class CrimePreprocessor:
         self.police = None
         self.pop = None
     
-    def preprocess(self, *args) -> None:
-        print(f"------------모델 전처리 시작-----------")
-        for i in list(args):
-            self.save_object_to_csv(i)
-        
-      
-    
+    @traced("crime.create_matrix")
     def create_matrix(self, fname) -> pd.DataFrame:
         print(f"😎🥇🐰파일명 : {fname}")
         self.reader.fname = fname
@@ -37,34 +34,16 @@ class CrimePreprocessor:
             return self.reader.xls_to_dframe(header=2, usecols='B,D,G,J,N')
         return None
     
-    def save_object_to_csv(self, fname) -> None:
-        print(f"🌱save_csv 실행 : {fname}")
-        full_name = os.path.join(self.stored_data, fname)
-
-        if not os.path.exists(full_name) and fname == "cctv_in_seoul.csv":
-            self.cctv = self.create_matrix(fname)
-            self.update_cctv()
-            
-        elif not os.path.exists(full_name) and fname == "crime_in_seoul.csv":
-            self.crime = self.create_matrix(fname)
-            self.update_crime()
-            self.update_police()
-
-        elif not os.path.exists(full_name) and fname == "pop_in_seoul.xls":
-            self.pop = self.create_matrix(fname)
-            self.update_pop()
-
-        else:
-            print(f"파일이 이미 존재합니다. {fname}")
-    
+    @traced("crime.update_cctv")
     def update_cctv(self) -> None:
         print(f"------------ update_cctv 실행 ------------")
         if self.cctv is not None:
             self.cctv = self.cctv.drop(['2013년도 이전', '2014년', '2015년', '2016년'], axis=1)
             print(f"CCTV 데이터 헤드: {self.cctv.head()}")
             self.cctv = self.cctv.rename(columns={'기관명': '자치구'})
-            self.cctv.to_csv(os.path.join(self.stored_data, 'cctv_in_seoul.csv'), index=False)
+            write_dataset(self.cctv, self.stored_data, 'cctv_in_seoul')
     
+    @traced("crime.update_crime")
     def update_crime(self) -> None:
         print(f"------------ update_crime 실행 ------------")
         if self.crime is not None:
@@ -76,10 +55,10 @@ class CrimePreprocessor:
             station_addrs = []
             station_lats = []
             station_lngs = []
-            gmaps = GoogleMapSchema()  # 구글맵 객체 생성
+            # 캐시에 없는 경찰서만 동시에 조회 (다시 전처리하면 네트워크 호출 없음)
+            geocoded = get_geocode_resolver().resolve_many(station_names, language='ko')
             
-            for name in station_names:
-                tmp = gmaps.geocode(name, language='ko')
+            for name, tmp in zip(station_names, geocoded):
                 print(f"""{name}의 검색 결과: {tmp[0].get("formatted_address")}""")
                 station_addrs.append(tmp[0].get("formatted_address"))
                 tmp_loc = tmp[0].get("geometry")
@@ -89,9 +68,18 @@ class CrimePreprocessor:
             print(f"🔥💧자치구 리스트: {station_addrs}")
             gu_names = []
             for addr in station_addrs:
-                tmp = addr.split()
-                tmp_gu = [gu for gu in tmp if gu[-1] == '구'][0]
-                gu_names.append(tmp_gu)
+                tmp = (addr or '').split()
+                tmp_gu = [gu for gu in tmp if gu[-1] == '구']
+                gu_names.append(tmp_gu[0] if tmp_gu else None)
+            # 주소에 자치구가 없으면 좌표가 속한 자치구 폴리곤으로 찾음 (한꺼번에 판정)
+            missing = [i for i, gu in enumerate(gu_names) if gu is None]
+            if missing:
+                located = crime_datasets.district_index().locate(
+                    [station_lats[i] for i in missing], [station_lngs[i] for i in missing])
+                for i, gu in zip(missing, located):
+                    if gu is None:
+                        raise ValueError(f"{station_names[i]} 의 자치구를 찾을 수 없습니다: {station_addrs[i]}")
+                    gu_names[i] = gu
             print(f"🔥💧자치구 리스트 2: {gu_names}")
             self.crime['자치구'] = gu_names
 
@@ -103,8 +91,9 @@ class CrimePreprocessor:
             self.crime.loc[self.crime['관서명'] == '방배서', ['자치구']] = '서초구'
             self.crime.loc[self.crime['관서명'] == '수서서', ['자치구']] = '강남구'
             
-            self.crime.to_csv(os.path.join(self.stored_data, 'crime_in_seoul.csv'), index=False)
+            write_dataset(self.crime, self.stored_data, 'crime_in_seoul')
     
+    @traced("crime.update_police")
     def update_police(self) -> None:
         print(f"------------ update_police 실행 ------------")
         if self.crime is not None:
@@ -120,7 +109,7 @@ class CrimePreprocessor:
             police['폭력검거율'] = (police['폭력 검거'].astype(int) / police['폭력 발생'].astype(int)) * 100
             
             police = police.drop(columns={'살인 검거', '강도 검거', '강간 검거', '절도 검거', '폭력 검거'}, axis=1)
-            police.to_csv(os.path.join(self.stored_data, 'police_in_seoul.csv'), index=False)
+            write_dataset(police, self.stored_data, 'police_in_seoul')
 
             # 검거율이 100%가 넘는 경우 처리
             for column in self.crime_rate_columns:
@@ -143,10 +132,13 @@ class CrimePreprocessor:
             police_norm[self.crime_rate_columns] = police[self.crime_rate_columns]
             police_norm['범죄'] = np.sum(police_norm[self.crime_rate_columns], axis=1)
             police_norm['검거'] = np.sum(police_norm[self.crime_columns], axis=1)
-            police_norm.to_csv(os.path.join(self.stored_data, 'police_norm_in_seoul.csv'))
+            # 인덱스 대신 자치구를 컬럼으로 저장 (CSV 의 'Unnamed: 0' 컬럼을 대신함)
+            police_norm.insert(0, '자치구', police['자치구'])
+            write_dataset(police_norm, self.stored_data, 'police_norm_in_seoul')
 
             self.police = police
     
+    @traced("crime.update_pop")
     def update_pop(self) -> None:
         print(f"------------ update_pop 실행 ------------")
         if self.pop is not None:
@@ -158,7 +150,7 @@ class CrimePreprocessor:
                 self.pop.columns[4]: '고령자'
             })
             
-            self.pop.to_csv(os.path.join(self.stored_data, 'pop_in_seoul.csv'), index=False)
+            write_dataset(self.pop, self.stored_data, 'pop_in_seoul')
             self.pop.drop([26], inplace=True)
             
             self.pop['외국인비율'] = self.pop['외국인'].astype(int) / self.pop['인구수'].astype(int) * 100
@@ -7,6 +7,9 @@ import traceback
 from app.domain.service.internal.crime_map_create import CrimeMapCreator
 from app.domain.service.internal.crime_indicator_builder import build_merged_dataset_and_indicators
 from app.domain.service.internal.crime_map_circle_marker import create_crime_circle_marker_map
+from app.domain.service.internal.geocoding import get_geocode_resolver
+from app.domain.model.dataset_schema import dataset_path
+from app.platform.tracing import traced
 
 logger = logging.getLogger("crime_service")
 
@@ -14,6 +17,7 @@ class CrimeVisualizer:
     def __init__(self):
         pass
     
+    @traced("crime.draw_crime_map")
     def draw_crime_map(self) -> dict:
         """범죄 지도를 생성하고 결과를 반환합니다."""
         try:
@@ -29,6 +33,7 @@ class CrimeVisualizer:
             raise HTTPException(status_code=500, detail=f"지도 생성 중 예상치 못한 서버 오류: {type(e).__name__}")
     
             
+    @traced("crime.draw_circle_marker_map")
     def draw_circle_marker_map(self, merged_data_dir='app/up_data', 
                               geo_json_dir='stored_data', 
                               output_dir='app/stored_map') -> dict:
@@ -38,7 +43,7 @@ class CrimeVisualizer:
         처리 단계:
         1. 병합 데이터 및 지표 생성 (build_merged_dataset_and_indicators 호출)
         2. 병합 데이터에서 부족비율 계산 (CCTV_필요지수/소계)
-        3. 부족비율 데이터 CSV 저장
+        3. 부족비율 데이터 저장 (Feather/Parquet 데이터셋)
         4. 부족비율에 따른 원형 마커 시각화 지도 생성
         5. HTML 지도 파일 저장
         """
@@ -46,15 +51,15 @@ class CrimeVisualizer:
             logger.info("CCTV 부족비율 Circle Marker 지도 생성 요청 시작")
             
             # 1. 먼저 지표 생성 (build_merged_dataset_and_indicators 직접 호출)
-            csv_data_dir = 'app/updated_data'  # CSV 데이터가 있는 경로를 고정값으로 설정
-            logger.info(f"1단계: 데이터 병합 및 지표 생성 시작 (CSV 데이터 경로: {csv_data_dir})")
+            dataset_dir = 'app/updated_data'  # 전처리 데이터셋이 있는 경로를 고정값으로 설정
+            logger.info(f"1단계: 데이터 병합 및 지표 생성 시작 (데이터셋 경로: {dataset_dir})")
             
             merged_data = build_merged_dataset_and_indicators(
-                stored_data_dir=csv_data_dir,  # CSV 파일 경로를 'app/updated_data'로 고정
+                stored_data_dir=dataset_dir,  # 데이터셋 경로를 'app/updated_data'로 고정
                 output_dir=merged_data_dir     # 병합 데이터 저장 경로
             )
             
-            logger.info(f"데이터 소스 경로: {csv_data_dir} (CSV 데이터 파일)")
+            logger.info(f"데이터 소스 경로: {dataset_dir} (데이터셋 파일)")
             logger.info(f"GeoJSON 경로: {geo_json_dir}")
             logger.info(f"결과 저장 경로: {merged_data_dir} (병합 데이터)")
             
@@ -81,8 +86,8 @@ class CrimeVisualizer:
             result = {
                 "status": "success",
                 "message": "CCTV 부족비율 Circle Marker 지도가 성공적으로 생성되었습니다.",
-                "indicator_data_path": os.path.join(merged_data_dir, 'merged_data.csv'),
-                "shortfall_data_path": os.path.join(merged_data_dir, 'merged_data_with_shortfall.csv'),
+                "indicator_data_path": dataset_path(merged_data_dir, 'merged_data'),
+                "shortfall_data_path": dataset_path(merged_data_dir, 'merged_data_with_shortfall'),
                 "file_path": map_file_path
             }
             
@@ -121,9 +126,8 @@ class CrimeVisualizer:
         station_addrs = []
         station_lats = []
         station_lngs = []
-        gmaps = reader.gmaps()
-        for name in station_names:
-            temp = gmaps.geocode(name, language='ko')
+        geocoded = get_geocode_resolver().resolve_many(station_names, language='ko')
+        for temp in geocoded:
             station_addrs.append(temp[0].get('formatted_address'))
             t_loc = temp[0].get('geometry')
             station_lats.append(t_loc['location']['lat'])
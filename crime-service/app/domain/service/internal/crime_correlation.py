@@ -2,6 +2,7 @@ import pandas as pd
 import numpy as np
 import os
 import traceback
+from app.domain.service.internal.dataset_store import crime_datasets
         
 def analyze_correlation(self, cctv_data, pop_data):
     """CCTV와 인구 데이터의 상관관계를 분석하는 함수"""
@@ -282,24 +283,19 @@ def load_and_analyze(self, data_dir='app/updated_data'):
         print("\n===== 상관계수 분석 시작 =====\n")
         
         # CCTV 데이터 로드
-        cctv_file = os.path.join(data_dir, 'cctv_in_seoul.csv')
-        cctv_data = pd.read_csv(cctv_file)
+        cctv_data = crime_datasets.get(data_dir, 'cctv_in_seoul')
         print(f"CCTV 데이터 로드 완료 - 형태: {cctv_data.shape}")
         print(f"CCTV 데이터 컬럼: {cctv_data.columns.tolist()}")
         
         # 인구 데이터 로드
-        pop_file = os.path.join(data_dir, 'pop_in_seoul.csv')
-        pop_data = pd.read_csv(pop_file)
+        pop_data = crime_datasets.get(data_dir, 'pop_in_seoul')
         print(f"인구 데이터 로드 완료 - 형태: {pop_data.shape}")
         print(f"인구 데이터 컬럼: {pop_data.columns.tolist()}")
         
         # 범죄 데이터 로드
-        crime_file = os.path.join(data_dir, 'crime_in_seoul.csv')
-        police_norm_file = os.path.join(data_dir, 'police_norm_in_seoul.csv')
-        
         try:
-            crime_data = pd.read_csv(crime_file)
-            police_norm_data = pd.read_csv(police_norm_file)
+            crime_data = crime_datasets.get(data_dir, 'crime_in_seoul')
+            police_norm_data = crime_datasets.get(data_dir, 'police_norm_in_seoul')
             print(f"범죄 데이터 로드 완료 - 형태: {crime_data.shape}")
             print(f"경찰서 정규화 데이터 로드 완료 - 형태: {police_norm_data.shape}")
             
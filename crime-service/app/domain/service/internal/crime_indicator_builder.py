@@ -2,15 +2,18 @@ import os
 import pandas as pd
 import numpy as np
 import logging
+from app.domain.model.dataset_schema import write_dataset
+from app.domain.service.internal.dataset_store import crime_datasets
 
 logger = logging.getLogger(__name__)
 
 def build_merged_dataset_and_indicators(stored_data_dir='stored_data', output_dir='app/up_data'):
     """
     세 개의 데이터셋을 병합하고 범죄 관련 지표를 생성하는 함수
-    1. police_norm_in_seoul.csv: 범죄율 및 검거율
-    2. cctv_in_seoul.csv: CCTV 설치 대수
-    3. pop_in_seoul.csv: 인구, 외국인, 고령자 비율
+    1. police_norm_in_seoul: 범죄율 및 검거율
+    2. cctv_in_seoul: CCTV 설치 대수
+    3. pop_in_seoul: 인구, 외국인, 고령자 비율
+    (각 데이터셋은 Feather/Parquet 파일, 결과는 merged_data 데이터셋으로 저장)
     
     반환값: 병합 및 지표가 추가된 DataFrame
     """
@@ -25,9 +28,8 @@ def build_merged_dataset_and_indicators(stored_data_dir='stored_data', output_di
         logger.info("데이터 로드 중...")
         
         # 경찰서 정규화 데이터 (범죄율)
-        police_norm_file = os.path.join(stored_data_dir, 'police_norm_in_seoul.csv')
         try:
-            police_norm = pd.read_csv(police_norm_file)
+            police_norm = crime_datasets.get(stored_data_dir, 'police_norm_in_seoul')
             logger.info(f"경찰서 정규화 데이터 로드 완료: {police_norm.shape}")
             
             # 자치구 컬럼 확인
@@ -52,9 +54,8 @@ def build_merged_dataset_and_indicators(stored_data_dir='stored_data', output_di
             raise
             
         # CCTV 데이터
-        cctv_file = os.path.join(stored_data_dir, 'cctv_in_seoul.csv')
         try:
-            cctv_data = pd.read_csv(cctv_file)
+            cctv_data = crime_datasets.get(stored_data_dir, 'cctv_in_seoul')
             logger.info(f"CCTV 데이터 로드 완료: {cctv_data.shape}")
             
             # 자치구 컬럼 확인
@@ -79,9 +80,8 @@ def build_merged_dataset_and_indicators(stored_data_dir='stored_data', output_di
             raise
             
         # 인구 데이터
-        pop_file = os.path.join(stored_data_dir, 'pop_in_seoul.csv')
         try:
-            pop_data = pd.read_csv(pop_file)
+            pop_data = crime_datasets.get(stored_data_dir, 'pop_in_seoul')
             logger.info(f"인구 데이터 로드 완료: {pop_data.shape}")
             
             # 자치구 컬럼 확인
@@ -206,9 +206,8 @@ def build_merged_dataset_and_indicators(stored_data_dir='stored_data', output_di
         logger.info(f"지표 샘플 데이터:\n{merged_df[['자치구'] + indicator_cols].head(3)}")
         
         # 4. 데이터 저장
-        output_file = os.path.join(output_dir, 'merged_data.csv')
         try:
-            merged_df.to_csv(output_file, index=False, encoding='utf-8')
+            output_file = write_dataset(merged_df, output_dir, 'merged_data')
             logger.info(f"병합 및 지표 데이터 저장 완료: {output_file}")
         except Exception as e:
             logger.error(f"데이터 저장 실패: {str(e)}")
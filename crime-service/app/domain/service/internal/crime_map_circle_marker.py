@@ -2,10 +2,13 @@ import os
 import pandas as pd
 import numpy as np
 import folium
-import json
 import logging
 from fastapi import HTTPException
 import traceback
+from app.domain.service.internal.geo_data import load_geo_json
+from app.domain.model.dataset_schema import write_dataset
+from app.domain.service.internal.dataset_store import crime_datasets
+from app.domain.service.internal.district_geometry import get_district_index
 
 logger = logging.getLogger(__name__)
 
@@ -40,10 +43,8 @@ def create_crime_circle_marker_map(merged_data_dir='app/up_data',
         logger.info(f"현재 작업 디렉토리: {current_dir}")
         
         # 1. 병합된 데이터 로드
-        merged_data_file = os.path.join(merged_data_dir, 'merged_data.csv')
-        
         try:
-            merged_df = pd.read_csv(merged_data_file)
+            merged_df = crime_datasets.get(merged_data_dir, 'merged_data')
             logger.info(f"병합 데이터 로드 완료: {merged_df.shape}")
             
             # 필수 컬럼 확인
@@ -83,87 +84,33 @@ def create_crime_circle_marker_map(merged_data_dir='app/up_data',
             logger.info(f"부족비율 샘플 데이터:\n{merged_df[['자치구', '소계', 'CCTV_필요지수', '부족비율']].head(3)}")
             
             # 부족비율이 포함된 데이터 저장
-            shortfall_file = os.path.join(merged_data_dir, 'merged_data_with_shortfall.csv')
-            merged_df.to_csv(shortfall_file, index=False, encoding='utf-8')
+            shortfall_file = write_dataset(merged_df, merged_data_dir, 'merged_data_with_shortfall')
             logger.info(f"부족비율 데이터 저장 완료: {shortfall_file}")
             
         except Exception as e:
             logger.error(f"부족비율 계산 중 오류 발생: {str(e)}")
             raise
         
-        # 3. GeoJSON 데이터 로드
-        # 여러 가능한 경로를 시도하여 GeoJSON 파일을 찾음
-        geo_json_file_paths = [
-            os.path.join(geo_json_dir, 'geo_simple.json'),  # 기존 경로
-            os.path.join('app', geo_json_dir, 'geo_simple.json'),  # app/ 하위 경로
-            os.path.join('app', 'stored_data', 'geo_simple.json'),  # 고정 경로
-            os.path.join('app', 'updated_data', 'geo_simple.json'),  # updated_data 경로
-            os.path.join('/app', 'stored_data', 'geo_simple.json'),  # 절대 경로
-            os.path.join(current_dir, geo_json_dir, 'geo_simple.json'),  # 현재 디렉토리 기준
-            os.path.join(current_dir, 'stored_data', 'geo_simple.json'),  # 현재 디렉토리의 stored_data
-            os.path.join(current_dir, 'app', 'stored_data', 'geo_simple.json')  # 현재 디렉토리의 app/stored_data
-        ]
-        
-        # 각 경로가 존재하는지 로깅
-        for path in geo_json_file_paths:
-            exists = os.path.exists(path)
-            logger.info(f"GeoJSON 경로 확인: {path} - {'존재함' if exists else '존재하지 않음'}")
-        
-        # 첫 번째로 존재하는 경로 선택
-        geo_json_file = None
-        for path in geo_json_file_paths:
-            if os.path.exists(path):
-                geo_json_file = path
-                logger.info(f"사용할 GeoJSON 파일 경로: {geo_json_file}")
-                break
-        
-        if geo_json_file is None:
-            # 파일이 없는 경우 대체 방법: 임베디드 GeoJSON 사용
-            logger.warning("GeoJSON 파일을 찾을 수 없습니다. 임베디드 GeoJSON 데이터를 사용합니다.")
-            # app/updated_data 디렉터리에서 geo_simple.json 파일을 찾아보기
-            updated_data_geo = os.path.join('app', 'updated_data', 'geo_simple.json')
-            if os.path.exists(updated_data_geo):
-                geo_json_file = updated_data_geo
-                logger.info(f"대체 GeoJSON 경로 사용: {geo_json_file}")
-            else:
-                error_msg = "GeoJSON 파일을 찾을 수 없습니다. Docker 볼륨 설정을 확인해주세요."
-                logger.error(error_msg)
-                raise FileNotFoundError(error_msg)
-        
+        # 3. GeoJSON 데이터 로드 (파싱된 GeoJSON 을 메모리에서 사용)
+        # geo_json_dir 에 파일이 없으면 서비스 시작 시 찾아 둔 기본 경로 사용 (후보 경로를 요청마다 찾지 않음)
         try:
-            with open(geo_json_file, 'r', encoding='utf-8') as f:
-                state_geo = json.load(f)
+            geo_json_file = os.path.join(geo_json_dir, 'geo_simple.json')
+            if os.path.exists(geo_json_file):
+                state_geo = load_geo_json(geo_json_file)
+            else:
+                geo_json_file = crime_datasets.geo_json_path()
+                state_geo = crime_datasets.geo_json()
             logger.info(f"GeoJSON 데이터 로드 완료: {geo_json_file}")
         except Exception as e:
             logger.error(f"GeoJSON 데이터 로드 실패: {str(e)}")
             raise
             
-        # 4. 자치구별 중심 좌표 추출
-        logger.info("자치구별 중심 좌표 추출 중...")
-        district_centers = {}
-        
+        # 4. 자치구별 중심 좌표 (GeoJSON 마다 한 번 만든 인덱스의 면적 가중 중심점)
         try:
-            for feature in state_geo['features']:
-                district_name = feature['id']
-                coords = feature['geometry']['coordinates']
-                
-                # 폴리곤(Polygon) 타입
-                if feature['geometry']['type'] == 'Polygon':
-                    # 첫 번째 좌표 사용 (간단한 방식)
-                    first_coord = coords[0][0]
-                    # GeoJSON은 [경도, 위도] 순서, Folium은 [위도, 경도] 순서
-                    district_centers[district_name] = (first_coord[1], first_coord[0])
-                    
-                # 멀티폴리곤(MultiPolygon) 타입
-                elif feature['geometry']['type'] == 'MultiPolygon':
-                    # 첫 번째 폴리곤의 첫 번째 좌표 사용
-                    first_coord = coords[0][0][0]
-                    district_centers[district_name] = (first_coord[1], first_coord[0])
-                    
-            logger.info(f"자치구별 중심 좌표 추출 완료: {len(district_centers)} 개 자치구")
-            
+            district_index = get_district_index(state_geo)
+            logger.info(f"자치구 geometry 인덱스: {len(district_index)} 개 자치구")
         except Exception as e:
-            logger.error(f"자치구별 중심 좌표 추출 중 오류 발생: {str(e)}")
+            logger.error(f"자치구 geometry 인덱스 생성 중 오류 발생: {str(e)}")
             raise
             
         # 5. Circle Marker 지도 생성
@@ -183,7 +130,8 @@ def create_crime_circle_marker_map(merged_data_dir='app/up_data',
                 shortfall_ratio = row['부족비율']
                 
                 # 자치구가 좌표 데이터에 있는지 확인
-                if district in district_centers:
+                center = district_index.centroid(district)
+                if center is not None:
                     # Circle Marker 크기 설정 (부족비율에 비례)
                     # 스케일링: 부족비율이 지나치게 큰 경우 제한
                     radius = min(shortfall_ratio * 8, 50)  # 최대 radius는 50으로 제한
@@ -204,7 +152,7 @@ def create_crime_circle_marker_map(merged_data_dir='app/up_data',
                     
                     # Circle Marker 추가
                     folium.CircleMarker(
-                        location=district_centers[district],
+                        location=center,
                         radius=radius,
                         color=color,
                         fill=True,
@@ -215,7 +163,7 @@ def create_crime_circle_marker_map(merged_data_dir='app/up_data',
                     
                     # 자치구명 표시
                     folium.Marker(
-                        location=district_centers[district],
+                        location=center,
                         icon=folium.DivIcon(
                             icon_size=(0, 0),
                             html=f'<div style="font-size: 10px; font-weight: bold;">{district}</div>'
@@ -5,6 +5,10 @@ import folium
 from fastapi import HTTPException
 import logging
 import traceback
+from app.domain.service.internal.geo_data import load_geo_json
+from app.domain.model.dataset_schema import dataset_path
+from app.domain.service.internal.dataset_store import crime_datasets
+from app.domain.service.internal.district_geometry import get_district_index
 
 logger = logging.getLogger(__name__)
 
@@ -14,7 +18,7 @@ class CrimeMapCreator:
         self.output_dir = output_dir
         self.local_output_dir = local_output_dir
         # 필요한 파일 경로 미리 정의
-        self.police_norm_file = os.path.join(self.data_dir, 'police_norm_in_seoul.csv')
+        self.police_norm_file = dataset_path(self.data_dir, 'police_norm_in_seoul')
         self.geo_json_file = os.path.join(self.data_dir, 'geo_simple.json')
         self.output_map_file = os.path.join(self.output_dir, 'crime_map.html')
         self.local_output_map_file = os.path.join(self.local_output_dir, 'crime_map.html')
@@ -56,10 +60,11 @@ class CrimeMapCreator:
         logger.info("필수 데이터 로드 중...")
 
         # police_norm 데이터 로드
-        if not os.path.exists(self.police_norm_file):
+        try:
+            police_norm = crime_datasets.get(self.data_dir, 'police_norm_in_seoul')
+        except FileNotFoundError:
             raise FileNotFoundError(self.police_norm_file)
         try:
-            police_norm = pd.read_csv(self.police_norm_file)
             logger.info(f"{self.police_norm_file} 파일 로드 완료")
             # '자치구' 컬럼 임시 처리 (Workaround) - 근본 원인 해결 후 제거 고려
             if '자치구' not in police_norm.columns and 'Unnamed: 0' in police_norm.columns:
@@ -78,8 +83,7 @@ class CrimeMapCreator:
         if not os.path.exists(self.geo_json_file):
             raise FileNotFoundError(self.geo_json_file)
         try:
-            with open(self.geo_json_file, 'r', encoding='utf-8') as f:
-                state_geo = json.load(f)
+            state_geo = load_geo_json(self.geo_json_file)
             logger.info(f"{self.geo_json_file} 파일 로드 완료")
         except json.JSONDecodeError as e:
             logger.error(f"{self.geo_json_file} 파일 로드 중 JSON 디코딩 오류: {e}")
@@ -112,6 +116,7 @@ class CrimeMapCreator:
         logger.info("Folium 지도 생성 중... (Choropleth + Markers)")
         # 기본 지도 생성 (서울 중심)
         folium_map = folium.Map(location=[37.5502, 126.982], zoom_start=12, tiles='OpenStreetMap')
+        district_index = get_district_index(state_geo)
 
         # 1. Choropleth (구별 범죄율)
         try:
@@ -119,8 +124,9 @@ class CrimeMapCreator:
             if not pd.api.types.is_string_dtype(police_norm['자치구']):
                  logger.warning("'자치구' 컬럼 타입이 문자열이 아닙니다. Choropleth 매칭 실패 가능성이 있습니다.")
 
+            # GEO_SIMPLIFY_TOLERANCE 를 설정하면 단순화한 폴리곤으로 그려 HTML 크기를 줄임
             folium.Choropleth(
-                geo_data=state_geo,
+                geo_data=district_index.geo_json() if district_index.tolerance > 0 else state_geo,
                 data=police_norm,
                 columns=['자치구', '범죄'],
                 key_on='feature.id',
@@ -150,34 +156,23 @@ class CrimeMapCreator:
              # 마커를 담을 FeatureGroup 생성
              marker_group = folium.FeatureGroup(name='위험 지역 (범죄 상위 3)', show=True) # 기본적으로 보이도록 설정
 
-             # GeoJSON에서 상위 3개 구의 좌표 찾아서 마커 추가
+             # 상위 3개 구의 위치는 자치구 geometry 인덱스의 면적 가중 중심점 사용
              for idx, row in top3_districts.iterrows():
                  gu_name = row['자치구']
                  crime_value = row['범죄']
-                 found_feature = False
-                 for feature in state_geo['features']:
-                     if feature['id'] == gu_name:
-                         # 폴리곤의 첫 번째 좌표를 대표 위치로 사용 (간단한 방법)
-                         # geometry 타입 확인 (Polygon 가정)
-                         coords = feature['geometry']['coordinates'][0]
-                         if coords and len(coords) > 0:
-                             # GeoJSON 좌표는 (경도, 위도) 순서일 수 있으므로 확인 필요
-                             # Folium은 (위도, 경도) 순서를 사용
-                             lng, lat = coords[0]
-                             marker_location = [lat, lng]
-
-                             # 마커 생성
-                             folium.Marker(
-                                 location=marker_location,
-                                 # 툴팁: 마우스 오버 시 표시
-                                 tooltip=f"{gu_name}: 범죄 지수 {crime_value:.2f}",
-                                 # 아이콘 설정
-                                 icon=folium.Icon(color='red', icon='exclamation-triangle', prefix='fa') # Font Awesome 아이콘 사용
-                             ).add_to(marker_group)
-                             found_feature = True
-                             break # 해당 구 찾았으므로 내부 루프 종료
-                 if not found_feature:
+                 marker_location = district_index.centroid(gu_name)
+                 if marker_location is None:
                      logger.warning(f"상위 3개 구 '{gu_name}'에 해당하는 좌표를 GeoJSON에서 찾지 못했습니다.")
+                     continue
+
+                 # 마커 생성 (centroid 는 Folium 순서인 (위도, 경도))
+                 folium.Marker(
+                     location=list(marker_location),
+                     # 툴팁: 마우스 오버 시 표시
+                     tooltip=f"{gu_name}: 범죄 지수 {crime_value:.2f}",
+                     # 아이콘 설정
+                     icon=folium.Icon(color='red', icon='exclamation-triangle', prefix='fa') # Font Awesome 아이콘 사용
+                 ).add_to(marker_group)
 
              marker_group.add_to(folium_map) # 마커 그룹을 지도에 추가
              logger.info("위험 지역 마커 추가 완료.")
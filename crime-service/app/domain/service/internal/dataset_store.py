@@ -0,0 +1,226 @@
+"""
+범죄 데이터셋 메모리 저장소
+- 전처리 데이터셋(Feather/Parquet)과 GeoJSON(자치구 geometry 인덱스 포함)을 서비스 시작 시(lifespan / gunicorn preload) 한 번 읽어 메모리에 보관
+- 요청은 파일을 다시 읽지 않고 메모리의 DataFrame 을 사용 (파일 상태만 stat 으로 확인)
+- 파일이 바뀌면(파이프라인 재실행 등) 감시 작업이 백그라운드에서 다시 로드하고, 요청 중에 바뀐 것을 보면 그 자리에서 다시 로드
+"""
+import os
+import time
+import asyncio
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+from app.domain.model.dataset_schema import find_dataset, read_dataset
+from app.domain.service.internal.district_geometry import DistrictGeometryIndex, get_district_index
+from app.domain.service.internal.geo_data import DEFAULT_GEO_JSON_FILES, load_geo_json
+
+logger = logging.getLogger(__name__)
+
+# ✅ 데이터셋 저장소 설정
+# 파일 변경 확인 주기 (초, 0 이면 감시 작업 없이 요청 시 확인만)
+DATASET_STORE_WATCH_INTERVAL = float(os.getenv("DATASET_STORE_WATCH_INTERVAL", "2"))
+# GeoJSON 경로 (지정하지 않으면 기본 위치 중 처음 찾은 파일)
+GEO_JSON_PATH = os.getenv("GEO_JSON_PATH", "")
+
+DatasetKey = Tuple[str, str]
+
+
+@dataclass(frozen=True)
+class LoadedDataset:
+    path: str
+    signature: Tuple[int, int, int]
+    frame: pd.DataFrame
+    loaded_at: float
+    load_ms: float
+
+
+def file_signature(path: str) -> Optional[Tuple[int, int, int]]:
+    """(inode, 크기, 수정 시각 ns) - os.replace 로 교체한 파일도 구분 (파일이 없으면 None)"""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return stat.st_ino, stat.st_size, stat.st_mtime_ns
+
+
+class CrimeDatasetStore:
+    """
+    (디렉토리, 데이터셋 이름) → DataFrame 메모리 저장소입니다.
+    get 은 기본적으로 복사본을 돌려주므로 호출한 쪽에서 컬럼을 바꿔도 다른 요청에 영향이 없습니다.
+    """
+
+    def __init__(self, watch_interval: float = DATASET_STORE_WATCH_INTERVAL, geo_json_path: str = GEO_JSON_PATH):
+        self.watch_interval = watch_interval
+        self._geo_json_path = geo_json_path or None
+        self._datasets: Dict[DatasetKey, LoadedDataset] = {}
+        self._lock = threading.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self.hits = 0
+        self.reloads = 0
+
+    def _load(self, key: DatasetKey) -> LoadedDataset:
+        """디스크에서 데이터셋을 읽어 저장소에 넣습니다. (같은 데이터셋은 한 스레드만 읽음)"""
+        context, name = key
+        with self._lock:
+            path = find_dataset(context, name)
+            signature = file_signature(path) if path else None
+            current = self._datasets.get(key)
+            if current is not None and current.path == path and current.signature == signature:
+                return current
+            started = time.perf_counter()
+            # 컬럼 형식 파일이 없으면 FileNotFoundError (이전 CSV 변환은 crime_pipeline migrate 로 따로 실행)
+            frame = read_dataset(context, name)
+            path = find_dataset(context, name)
+            loaded = LoadedDataset(
+                path=path,
+                signature=file_signature(path),
+                frame=frame,
+                loaded_at=time.time(),
+                load_ms=round((time.perf_counter() - started) * 1000, 3),
+            )
+            if current is not None:
+                self.reloads += 1
+                logger.info(f"데이터셋 다시 로드: {path} ({loaded.load_ms}ms)")
+            self._datasets[key] = loaded
+            return loaded
+
+    def get(self, context: str, name: str, copy: bool = True) -> pd.DataFrame:
+        """
+        데이터셋을 메모리에서 가져옵니다. 처음 요청했거나 파일이 바뀌었으면 다시 읽습니다.
+
+        Args:
+            context: 데이터셋 디렉토리
+            name: 데이터셋 이름
+            copy: False 면 공유 DataFrame 을 그대로 반환 (읽기 전용으로만 사용할 것)
+
+        Returns:
+            DataFrame
+
+        Raises:
+            FileNotFoundError: 데이터셋 파일이 없는 경우
+        """
+        key = (os.path.abspath(context), name)
+        loaded = self._datasets.get(key)
+        if loaded is None or file_signature(loaded.path) != loaded.signature:
+            loaded = self._load(key)
+        else:
+            self.hits += 1
+        return loaded.frame.copy() if copy else loaded.frame
+
+    def geo_json_path(self) -> str:
+        """
+        GeoJSON 경로를 반환합니다. (기본 위치 중 처음 찾은 파일을 기억해 두고 다시 찾지 않음)
+
+        Raises:
+            FileNotFoundError: GeoJSON 파일을 찾을 수 없는 경우
+        """
+        if self._geo_json_path is None or not os.path.exists(self._geo_json_path):
+            candidates = [os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))),
+                                       'stored_data', 'geo_simple.json'), *DEFAULT_GEO_JSON_FILES]
+            found = next((path for path in candidates if os.path.exists(path)), None)
+            if found is None:
+                raise FileNotFoundError("GeoJSON 파일을 찾을 수 없습니다. Docker 볼륨 설정을 확인해주세요.")
+            self._geo_json_path = os.path.abspath(found)
+        return self._geo_json_path
+
+    def geo_json(self) -> dict:
+        """파싱된 GeoJSON (공유 객체 - 수정 금지, 파일이 바뀌면 geo_data 가 다시 로드)"""
+        return load_geo_json(self.geo_json_path())
+
+    def district_index(self) -> DistrictGeometryIndex:
+        """GeoJSON 의 자치구 geometry 인덱스 (GeoJSON 이 바뀌면 다시 만듦)"""
+        return get_district_index(self.geo_json())
+
+    def preload(self, datasets: Iterable[DatasetKey]) -> List[str]:
+        """
+        데이터셋과 GeoJSON 을 미리 읽고 자치구 geometry 인덱스를 만듭니다.
+        아직 만들어지지 않은 데이터셋은 건너뛰고, 읽을 수 없는 데이터셋은 로그만 남깁니다.
+
+        Args:
+            datasets: (디렉토리, 데이터셋 이름) 목록
+
+        Returns:
+            로드한 데이터셋 이름 목록
+        """
+        loaded = []
+        for context, name in datasets:
+            # 파이프라인이 아직 만들지 않은 데이터셋은 건너뜀 (같은 이름의 원본 CSV 는 데이터셋이 아님)
+            if find_dataset(context, name) is None:
+                logger.info(f"데이터셋이 아직 없어 미리 읽지 않음: {context}/{name}")
+                continue
+            try:
+                self.get(context, name, copy=False)
+                loaded.append(name)
+            except FileNotFoundError:
+                logger.info(f"데이터셋이 아직 없어 미리 읽지 않음: {context}/{name}")
+            except ValueError as e:
+                # 손상되었거나 스키마가 맞지 않는 파일 때문에 서비스가 시작되지 못하는 일은 없도록 로그만 남김
+                logger.error(f"데이터셋 미리 로드 실패: {context}/{name} ({e})")
+        try:
+            self.district_index()
+        except FileNotFoundError as e:
+            logger.warning(str(e))
+        logger.info(f"데이터셋 미리 로드: {loaded}")
+        return loaded
+
+    def refresh(self) -> List[str]:
+        """바뀐 파일만 다시 읽습니다. (감시 작업이 주기적으로 호출)"""
+        changed = []
+        for key, loaded in list(self._datasets.items()):
+            # 파일이 사라지면 file_signature 가 None 이라 바뀐 것으로 봄
+            if file_signature(loaded.path) != loaded.signature:
+                try:
+                    self._load(key)
+                    changed.append(key[1])
+                except FileNotFoundError:
+                    logger.warning(f"데이터셋 파일이 사라짐: {loaded.path}")
+        return changed
+
+    async def _watch(self) -> None:
+        while True:
+            await asyncio.sleep(self.watch_interval)
+            try:
+                await asyncio.to_thread(self.refresh)
+            except Exception as e:
+                logger.error(f"데이터셋 감시 중 오류: {e}")
+
+    async def start(self, datasets: Sequence[DatasetKey] = ()) -> None:
+        """lifespan 시작 시 호출: 미리 로드하고 파일 감시 작업을 시작합니다."""
+        await asyncio.to_thread(self.preload, datasets)
+        if self.watch_interval > 0 and self._task is None:
+            self._task = asyncio.create_task(self._watch())
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    def stats(self) -> dict:
+        return {
+            "watch_interval": self.watch_interval,
+            "geo_json_path": self._geo_json_path,
+            "district_index": (self.district_index().stats()
+                               if self._geo_json_path and os.path.exists(self._geo_json_path) else None),
+            "hits": self.hits,
+            "reloads": self.reloads,
+            "datasets": {
+                f"{os.path.basename(context)}/{name}": {
+                    "path": loaded.path,
+                    "rows": len(loaded.frame),
+                    "columns": len(loaded.frame.columns),
+                    "bytes": int(loaded.frame.memory_usage(deep=True).sum()),
+                    "loaded_at": loaded.loaded_at,
+                    "load_ms": loaded.load_ms,
+                }
+                for (context, name), loaded in list(self._datasets.items())
+            },
+        }
+
+
+# ✅ 프로세스 전역 데이터셋 저장소
+crime_datasets = CrimeDatasetStore()
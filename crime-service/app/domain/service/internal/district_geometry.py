@@ -0,0 +1,285 @@
+"""
+자치구 geometry 인덱스
+- GeoJSON(geo_simple.json) 을 한 번 읽어 자치구 이름 → 면적 가중 중심점 / 경계 상자 / 단순화한 폴리곤으로 정리
+- 지도를 그릴 때 행마다 features 전체를 훑지 않고 이름으로 바로 조회 (O(1))
+- 좌표 여러 개가 어느 자치구에 속하는지 numpy 로 한꺼번에 판정 (경계 상자로 먼저 거른 뒤 ray casting)
+- 동 단위처럼 폴리곤이 많고 꼭짓점이 많은 GeoJSON 에서도 같은 방식으로 사용
+
+사용:
+    index = get_district_index(crime_datasets.geo_json())
+    index.centroid('강남구')                        # (위도, 경도)
+    index.locate(lats, lngs)                        # 좌표별 자치구 이름 (밖이면 None)
+"""
+import os
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# ✅ geometry 인덱스 설정
+# 폴리곤 단순화 허용 오차 (경도/위도 단위, 0 이면 단순화하지 않음 - 약 0.0001 ≈ 10m)
+GEO_SIMPLIFY_TOLERANCE = float(os.getenv("GEO_SIMPLIFY_TOLERANCE", "0"))
+# locate 에서 한 번에 판정할 (좌표 수 × 변 수) 최대 크기 (메모리 사용량 제한)
+GEO_LOCATE_CHUNK = int(os.getenv("GEO_LOCATE_CHUNK", str(1 << 22)))
+
+# (최소 경도, 최소 위도, 최대 경도, 최대 위도)
+BBox = Tuple[float, float, float, float]
+
+
+@dataclass(frozen=True)
+class DistrictGeometry:
+    """자치구 하나의 geometry 요약 (좌표는 GeoJSON 과 같은 [경도, 위도] 순서, centroid 만 folium 용 (위도, 경도))"""
+    name: str
+    centroid: Tuple[float, float]
+    bbox: BBox
+    area: float
+    polygons: Tuple[Tuple[np.ndarray, ...], ...]
+    simplified: Tuple[Tuple[np.ndarray, ...], ...]
+
+    @property
+    def vertex_count(self) -> int:
+        return sum(len(ring) for polygon in self.polygons for ring in polygon)
+
+
+def feature_name(feature: dict) -> Optional[str]:
+    """feature 의 자치구 이름 (id → properties.name 순)"""
+    return feature.get('id') or (feature.get('properties') or {}).get('name')
+
+
+def _polygons_of(geometry: dict) -> List[List[np.ndarray]]:
+    """Polygon / MultiPolygon 을 [폴리곤][고리] 배열 목록으로 바꿉니다. (그 밖의 타입은 빈 목록)"""
+    if geometry['type'] == 'Polygon':
+        parts = [geometry['coordinates']]
+    elif geometry['type'] == 'MultiPolygon':
+        parts = geometry['coordinates']
+    else:
+        return []
+    return [[np.asarray(ring, dtype=float)[:, :2] for ring in part if len(ring) >= 3] for part in parts]
+
+
+def ring_area_centroid(ring: np.ndarray) -> Tuple[float, float, float]:
+    """
+    shoelace 공식으로 고리의 면적과 중심점을 구합니다.
+
+    Returns:
+        (부호 없는 면적, 중심 경도, 중심 위도) - 면적이 0 이면 꼭짓점 평균
+    """
+    x, y = ring[:, 0], ring[:, 1]
+    x1, y1 = np.roll(x, -1), np.roll(y, -1)
+    cross = x * y1 - x1 * y
+    area = cross.sum() / 2
+    if abs(area) < 1e-15:
+        return 0.0, float(x.mean()), float(y.mean())
+    cx = ((x + x1) * cross).sum() / (6 * area)
+    cy = ((y + y1) * cross).sum() / (6 * area)
+    return abs(float(area)), float(cx), float(cy)
+
+
+def simplify_ring(ring: np.ndarray, tolerance: float) -> np.ndarray:
+    """
+    Douglas-Peucker 로 고리의 꼭짓점을 줄입니다. (닫힌 고리 유지, 꼭짓점이 4개 미만이 되면 원본 반환)
+
+    Args:
+        ring: [경도, 위도] 좌표 배열
+        tolerance: 허용 오차 (0 이하면 원본 반환)
+
+    Returns:
+        단순화한 좌표 배열
+    """
+    if tolerance <= 0 or len(ring) <= 4:
+        return ring
+    keep = np.zeros(len(ring), dtype=bool)
+    keep[0] = keep[-1] = True
+    stack = [(0, len(ring) - 1)]
+    while stack:
+        start, end = stack.pop()
+        if end - start < 2:
+            continue
+        segment = ring[end] - ring[start]
+        points = ring[start + 1:end] - ring[start]
+        length = np.hypot(*segment)
+        if length == 0:
+            distances = np.hypot(points[:, 0], points[:, 1])
+        else:
+            distances = np.abs(segment[0] * points[:, 1] - segment[1] * points[:, 0]) / length
+        farthest = int(np.argmax(distances))
+        if distances[farthest] > tolerance:
+            split = start + 1 + farthest
+            keep[split] = True
+            stack.extend(((start, split), (split, end)))
+    simplified = ring[keep]
+    return simplified if len(simplified) >= 4 else ring
+
+
+class DistrictGeometryIndex:
+    """
+    자치구 이름 → DistrictGeometry 인덱스입니다.
+    만든 뒤에는 바꾸지 않으므로 여러 요청/스레드가 함께 사용해도 됩니다.
+    """
+
+    def __init__(self, geo_json: dict, tolerance: float = GEO_SIMPLIFY_TOLERANCE):
+        self.tolerance = tolerance
+        self._geo_json: Optional[dict] = None
+        self._districts: Dict[str, DistrictGeometry] = {}
+        for feature in geo_json.get('features', []):
+            name = feature_name(feature)
+            polygons = _polygons_of(feature.get('geometry') or {'type': None})
+            if name is None or not polygons:
+                logger.warning(f"이름이나 폴리곤이 없는 feature 는 인덱스에서 제외: {feature.get('properties')}")
+                continue
+            self._districts[name] = self._summarize(name, polygons)
+
+        names = list(self._districts)
+        self._names = np.array(names, dtype=object)
+        self._bboxes = np.array([self._districts[name].bbox for name in names], dtype=float).reshape(-1, 4)
+        # 판정용 변 목록 (x1, y1, x2, y2) - 자치구의 모든 고리(구멍 포함)를 함께 두고 짝/홀 규칙으로 판정
+        self._edges = [self._edges_of(self._districts[name].polygons) for name in names]
+
+    def _summarize(self, name: str, polygons: List[List[np.ndarray]]) -> DistrictGeometry:
+        """면적 가중 중심점(구멍은 면적을 빼서 반영) / 경계 상자 / 단순화 폴리곤을 계산합니다."""
+        total_area = weighted_x = weighted_y = 0.0
+        for polygon in polygons:
+            for i, ring in enumerate(polygon):
+                area, cx, cy = ring_area_centroid(ring)
+                sign = 1 if i == 0 else -1
+                total_area += sign * area
+                weighted_x += sign * area * cx
+                weighted_y += sign * area * cy
+        points = np.concatenate([ring for polygon in polygons for ring in polygon])
+        if total_area > 0:
+            lng, lat = weighted_x / total_area, weighted_y / total_area
+        else:
+            lng, lat = float(points[:, 0].mean()), float(points[:, 1].mean())
+        return DistrictGeometry(
+            name=name,
+            centroid=(lat, lng),
+            bbox=(float(points[:, 0].min()), float(points[:, 1].min()),
+                  float(points[:, 0].max()), float(points[:, 1].max())),
+            area=total_area,
+            polygons=tuple(tuple(polygon) for polygon in polygons),
+            simplified=tuple(tuple(simplify_ring(ring, self.tolerance) for ring in polygon) for polygon in polygons),
+        )
+
+    @staticmethod
+    def _edges_of(polygons: Sequence[Sequence[np.ndarray]]) -> np.ndarray:
+        edges = [np.hstack((ring, np.roll(ring, -1, axis=0))) for polygon in polygons for ring in polygon]
+        return np.concatenate(edges)
+
+    def __len__(self) -> int:
+        return len(self._districts)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._districts
+
+    def names(self) -> List[str]:
+        return list(self._districts)
+
+    def get(self, name: str) -> Optional[DistrictGeometry]:
+        return self._districts.get(name)
+
+    def centroid(self, name: str) -> Optional[Tuple[float, float]]:
+        """자치구의 면적 가중 중심점 (위도, 경도) - 인덱스에 없으면 None"""
+        district = self._districts.get(name)
+        return district.centroid if district is not None else None
+
+    def locate(self, lats: Iterable[float], lngs: Iterable[float]) -> np.ndarray:
+        """
+        좌표마다 그 좌표를 포함하는 자치구를 찾습니다.
+
+        Args:
+            lats: 위도 목록
+            lngs: 경도 목록
+
+        Returns:
+            좌표와 같은 길이의 자치구 이름 배열 (어느 자치구에도 속하지 않으면 None)
+        """
+        lats = np.asarray(lats, dtype=float).ravel()
+        lngs = np.asarray(lngs, dtype=float).ravel()
+        if lats.shape != lngs.shape:
+            raise ValueError("위도와 경도의 개수가 다릅니다.")
+        result = np.full(len(lats), None, dtype=object)
+        if not len(lats) or not len(self._names):
+            return result
+
+        # 경계 상자로 후보 (좌표 × 자치구) 를 먼저 거름
+        b = self._bboxes
+        candidates = ((lngs[:, None] >= b[:, 0]) & (lats[:, None] >= b[:, 1])
+                      & (lngs[:, None] <= b[:, 2]) & (lats[:, None] <= b[:, 3]))
+        for j in np.flatnonzero(candidates.any(axis=0)):
+            # 앞 자치구에 이미 속한 좌표는 다시 판정하지 않음
+            rows = np.flatnonzero(candidates[:, j] & (result == None))  # noqa: E711
+            if len(rows):
+                inside = self._contains(self._edges[j], lngs[rows], lats[rows])
+                result[rows[inside]] = self._names[j]
+        return result
+
+    @staticmethod
+    def _contains(edges: np.ndarray, px: np.ndarray, py: np.ndarray) -> np.ndarray:
+        """ray casting (짝/홀 규칙) - 좌표 × 변 행렬로 교차 수를 세고, 크기가 크면 나눠서 계산"""
+        x1, y1, x2, y2 = (edges[:, k] for k in range(4))
+        inside = np.zeros(len(px), dtype=bool)
+        step = max(1, GEO_LOCATE_CHUNK // max(1, len(edges)))
+        for start in range(0, len(px), step):
+            x, y = px[start:start + step, None], py[start:start + step, None]
+            straddles = (y1 > y) != (y2 > y)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                cross_x = x1 + (y - y1) * (x2 - x1) / (y2 - y1)
+            inside[start:start + step] = ((straddles & (x < cross_x)).sum(axis=1) % 2).astype(bool)
+        return inside
+
+    def geo_json(self) -> dict:
+        """단순화한 폴리곤으로 만든 FeatureCollection (Choropleth 등에 넘겨 HTML 크기를 줄이는 용도, 공유 객체 - 수정 금지)"""
+        if self._geo_json is not None:
+            return self._geo_json
+        features = []
+        for name, district in self._districts.items():
+            coordinates = [[ring.tolist() for ring in polygon] for polygon in district.simplified]
+            geometry = ({'type': 'Polygon', 'coordinates': coordinates[0]} if len(coordinates) == 1
+                        else {'type': 'MultiPolygon', 'coordinates': coordinates})
+            features.append({'type': 'Feature', 'id': name, 'properties': {'name': name}, 'geometry': geometry})
+        self._geo_json = {'type': 'FeatureCollection', 'features': features}
+        return self._geo_json
+
+    def stats(self) -> dict:
+        return {
+            "districts": len(self._districts),
+            "tolerance": self.tolerance,
+            "vertices": sum(district.vertex_count for district in self._districts.values()),
+            "simplified_vertices": sum(len(ring) for district in self._districts.values()
+                                       for polygon in district.simplified for ring in polygon),
+        }
+
+
+# GeoJSON 객체별 인덱스 캐시 (load_geo_json 은 파일이 바뀌기 전까지 같은 dict 를 돌려줌)
+_indexes: Dict[int, Tuple[dict, DistrictGeometryIndex]] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_district_index(geo_json: dict) -> DistrictGeometryIndex:
+    """
+    GeoJSON 의 자치구 인덱스를 반환합니다. 같은 GeoJSON 객체에 대해서는 한 번만 만듭니다.
+
+    Args:
+        geo_json: 파싱된 GeoJSON (load_geo_json / crime_datasets.geo_json 이 돌려준 공유 객체)
+
+    Returns:
+        DistrictGeometryIndex
+    """
+    key = id(geo_json)
+    cached = _indexes.get(key)
+    if cached is not None and cached[0] is geo_json:
+        return cached[1]
+    with _indexes_lock:
+        cached = _indexes.get(key)
+        if cached is None or cached[0] is not geo_json:
+            # GeoJSON 이 다시 로드되면 이전 인덱스는 버림 (객체를 함께 보관해 id 가 재사용되지 않게 함)
+            _indexes.clear()
+            index = DistrictGeometryIndex(geo_json)
+            cached = (geo_json, index)
+            _indexes[key] = cached
+            logger.info(f"자치구 geometry 인덱스 생성: {index.stats()}")
+    return cached[1]
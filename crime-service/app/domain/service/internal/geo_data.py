@@ -0,0 +1,52 @@
+"""
+GeoJSON(geo_simple.json) 캐시
+- 지도를 그릴 때마다 파일을 다시 읽고 파싱하지 않도록 경로별로 한 번만 로드 (파일이 바뀌면 다시 로드)
+- 운영 서빙(gunicorn preload)에서는 fork 전에 로드해 워커들이 같은 메모리를 공유
+- 반환된 dict 는 여러 요청이 공유하므로 수정하지 말 것
+"""
+import os
+import json
+import logging
+import threading
+from typing import Dict, Tuple
+
+logger = logging.getLogger(__name__)
+
+# GeoJSON 기본 위치 (지도 생성기들이 찾는 위치, dataset_store 가 처음 찾은 파일을 사용)
+DEFAULT_GEO_JSON_FILES = (
+    os.path.join('app', 'up_data', 'geo_simple.json'),
+    os.path.join('app', 'stored_data', 'geo_simple.json'),
+)
+
+_cache: Dict[str, Tuple[float, dict]] = {}
+_lock = threading.Lock()
+
+
+def load_geo_json(path: str) -> dict:
+    """
+    GeoJSON 파일을 읽어 캐시된 dict 를 반환합니다.
+
+    Args:
+        path: GeoJSON 파일 경로
+
+    Returns:
+        파싱된 GeoJSON (공유 객체 - 수정 금지)
+
+    Raises:
+        FileNotFoundError: 파일이 없는 경우
+        json.JSONDecodeError: JSON 형식이 잘못된 경우
+    """
+    key = os.path.abspath(path)
+    mtime = os.path.getmtime(key)
+    cached = _cache.get(key)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    with _lock:
+        cached = _cache.get(key)
+        if cached is None or cached[0] != mtime:
+            with open(key, 'r', encoding='utf-8') as f:
+                cached = (mtime, json.load(f))
+            _cache[key] = cached
+            logger.info(f"GeoJSON 로드: {key}")
+    return cached[1]
+
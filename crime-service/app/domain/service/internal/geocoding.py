@@ -0,0 +1,283 @@
+"""
+지오코딩 캐시와 동시 조회
+- 조회 결과를 SQLite 파일에 (정규화한 검색어, 언어) 키로 저장해 전처리를 다시 돌려도 네트워크 호출 없이 재사용
+- 캐시에 없는 검색어만 제한된 수의 스레드로 동시에 조회 (같은 검색어는 한 번만 조회)
+- 오프라인 모드에서는 네트워크를 쓰지 않고, 만료된 캐시도 그대로 사용하며 캐시에 없으면 오류
+- SQLite WAL 모드라 gunicorn 워커 여러 개가 같은 캐시 파일을 함께 써도 안전
+
+사용:
+    results = get_geocode_resolver().resolve_many(['서울중부경찰서', '서울종로경찰서'])
+    results[0][0]['formatted_address']
+"""
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import logging
+import threading
+import unicodedata
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# ✅ 지오코딩 설정
+GEOCODE_CACHE_PATH = os.getenv(
+    "GEOCODE_CACHE_PATH",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))),
+                 'stored_data', 'geocode_cache.sqlite3')
+)
+# 캐시 유효 기간 (초, 기본 30일) - 경찰서 위치처럼 거의 바뀌지 않는 주소 기준
+GEOCODE_CACHE_TTL = float(os.getenv("GEOCODE_CACHE_TTL", str(30 * 24 * 3600)))
+# 오프라인 모드: 네트워크 호출 없이 캐시만 사용 (만료된 항목도 사용)
+GEOCODE_OFFLINE = os.getenv("GEOCODE_OFFLINE", "false").lower() in ("1", "true", "yes")
+# 캐시에 없는 검색어를 동시에 조회할 최대 수 (Google Maps API 초당 한도 고려)
+GEOCODE_CONCURRENCY = int(os.getenv("GEOCODE_CONCURRENCY", "8"))
+# 지오코더 종류: google (GoogleMapSchema) / fake (네트워크 없는 테스트/개발용)
+GEOCODER = os.getenv("GEOCODER", "google").lower()
+
+GeocodeResult = List[dict]
+
+
+class GeocodeUnavailable(LookupError):
+    """오프라인 모드에서 캐시에 없는 검색어를 조회한 경우"""
+
+    def __init__(self, queries: Sequence[str]):
+        super().__init__(f"오프라인 모드라 캐시에 없는 주소를 조회할 수 없습니다: {', '.join(queries)}")
+        self.queries = list(queries)
+
+
+def normalize_query(address: str) -> str:
+    """
+    캐시 키로 쓸 검색어를 정규화합니다. (유니코드 NFC, 앞뒤 공백 제거, 연속 공백 하나로)
+
+    Args:
+        address: 검색할 주소 또는 장소 이름
+
+    Returns:
+        정규화된 검색어
+    """
+    return " ".join(unicodedata.normalize("NFC", str(address)).split())
+
+
+class GeocodeCache:
+    """
+    (검색어, 언어) → 지오코딩 결과(JSON) 를 저장하는 SQLite 캐시입니다.
+    호출마다 연결을 새로 열어 스레드/프로세스 사이에 연결을 공유하지 않습니다.
+    """
+
+    def __init__(self, path: str = GEOCODE_CACHE_PATH, ttl: float = GEOCODE_CACHE_TTL,
+                 clock: Callable[[], float] = time.time):
+        self.path = path
+        self.ttl = ttl
+        self.clock = clock
+        self._initialized = False
+        self._init_lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=10)
+        if not self._initialized:
+            with self._init_lock:
+                if not self._initialized:
+                    conn.execute("PRAGMA journal_mode=WAL")
+                    conn.execute(
+                        "CREATE TABLE IF NOT EXISTS geocode ("
+                        " query TEXT NOT NULL, language TEXT NOT NULL, result TEXT NOT NULL,"
+                        " fetched_at REAL NOT NULL, PRIMARY KEY (query, language))"
+                    )
+                    conn.commit()
+                    self._initialized = True
+        return conn
+
+    def get_many(self, queries: Sequence[str], language: str,
+                 allow_stale: bool = False) -> Dict[str, GeocodeResult]:
+        """
+        캐시에 있는 검색어의 결과를 한 번의 쿼리로 가져옵니다.
+
+        Args:
+            queries: 정규화된 검색어 목록
+            language: 결과 언어
+            allow_stale: True 면 유효 기간이 지난 항목도 반환 (오프라인 모드)
+
+        Returns:
+            {검색어: 결과} 딕셔너리 (캐시에 없거나 만료된 검색어는 빠짐)
+        """
+        if not queries:
+            return {}
+        min_fetched_at = float("-inf") if allow_stale else self.clock() - self.ttl
+        placeholders = ",".join("?" * len(queries))
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                f"SELECT query, result FROM geocode WHERE language = ? AND fetched_at >= ? AND query IN ({placeholders})",
+                (language, min_fetched_at, *queries)
+            ).fetchall()
+        return {query: json.loads(result) for query, result in rows}
+
+    def put_many(self, results: Dict[str, GeocodeResult], language: str) -> None:
+        """조회 결과를 한 트랜잭션으로 저장합니다. (빈 결과도 저장해 없는 주소를 반복 조회하지 않음)"""
+        if not results:
+            return
+        now = self.clock()
+        with closing(self._connect()) as conn, conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO geocode (query, language, result, fetched_at) VALUES (?, ?, ?, ?)",
+                [(query, language, json.dumps(result, ensure_ascii=False), now) for query, result in results.items()]
+            )
+
+    def size(self) -> int:
+        if not os.path.exists(self.path):
+            return 0
+        with closing(self._connect()) as conn:
+            return conn.execute("SELECT COUNT(*) FROM geocode").fetchone()[0]
+
+
+# 가짜 지오코더가 주소에 넣을 자치구 (검색어 해시로 고름)
+SEOUL_DISTRICTS = (
+    '강남구', '강동구', '강북구', '강서구', '관악구', '광진구', '구로구', '금천구', '노원구', '도봉구',
+    '동대문구', '동작구', '마포구', '서대문구', '서초구', '성동구', '성북구', '송파구', '양천구', '영등포구',
+    '용산구', '은평구', '종로구', '중구', '중랑구',
+)
+
+
+class FakeGeocoder:
+    """
+    네트워크 없이 결정적인 결과를 돌려주는 지오코더입니다. (테스트 / 오프라인 개발용)
+    googlemaps 응답과 같은 형태({"formatted_address", "geometry": {"location": {"lat", "lng"}}})를 돌려주고,
+    호출한 검색어를 calls 에 기록합니다.
+    """
+
+    def __init__(self, results: Optional[Dict[str, GeocodeResult]] = None, latency: float = 0.0):
+        self.results = results or {}
+        self.latency = latency
+        self.calls: List[Tuple[str, str]] = []
+        self._lock = threading.Lock()
+
+    def geocode(self, address: str, language: str = 'ko') -> GeocodeResult:
+        with self._lock:
+            self.calls.append((address, language))
+        if self.latency:
+            time.sleep(self.latency)
+        if address in self.results:
+            return self.results[address]
+        digest = hashlib.sha256(address.encode()).digest()
+        district = SEOUL_DISTRICTS[digest[0] % len(SEOUL_DISTRICTS)]
+        return [{
+            "formatted_address": f"대한민국 서울특별시 {district} {address}",
+            "geometry": {"location": {
+                "lat": round(37.45 + digest[1] / 255 * 0.2, 6),
+                "lng": round(126.85 + digest[2] / 255 * 0.3, 6),
+            }},
+        }]
+
+
+class GeocodeResolver:
+    """
+    캐시를 먼저 보고, 캐시에 없는 검색어만 지오코더로 동시에 조회합니다.
+    """
+
+    def __init__(self, geocoder, cache: GeocodeCache, concurrency: int = GEOCODE_CONCURRENCY,
+                 offline: bool = GEOCODE_OFFLINE):
+        self.geocoder = geocoder
+        self.cache = cache
+        self.concurrency = max(1, concurrency)
+        self.offline = offline
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+        self._lock = threading.Lock()
+
+    def resolve_many(self, addresses: Sequence[str], language: str = 'ko') -> List[GeocodeResult]:
+        """
+        여러 주소를 한꺼번에 지오코딩합니다.
+
+        Args:
+            addresses: 검색할 주소 목록 (중복 가능)
+            language: 결과 언어
+
+        Returns:
+            addresses 와 같은 순서의 결과 목록 (각 결과는 googlemaps geocode 응답 목록)
+
+        Raises:
+            GeocodeUnavailable: 오프라인 모드에서 캐시에 없는 주소가 있는 경우
+            Exception: 지오코더 조회 오류 (성공한 결과는 캐시에 저장한 뒤 첫 오류를 다시 발생)
+        """
+        queries = [normalize_query(address) for address in addresses]
+        unique = list(dict.fromkeys(queries))
+        found = self.cache.get_many(unique, language, allow_stale=self.offline)
+        missing = [query for query in unique if query not in found]
+        with self._lock:
+            self.hits += len(unique) - len(missing)
+            self.misses += len(missing)
+
+        if missing:
+            if self.offline:
+                raise GeocodeUnavailable(missing)
+            found.update(self._fetch(missing, language))
+        return [found[query] for query in queries]
+
+    def resolve(self, address: str, language: str = 'ko') -> GeocodeResult:
+        return self.resolve_many([address], language)[0]
+
+    def _fetch(self, queries: List[str], language: str) -> Dict[str, GeocodeResult]:
+        """캐시에 없는 검색어를 최대 concurrency 개씩 동시에 조회하고 성공한 결과를 캐시에 저장합니다."""
+        started = time.perf_counter()
+        fetched: Dict[str, GeocodeResult] = {}
+        first_error: Optional[Exception] = None
+        with ThreadPoolExecutor(max_workers=min(self.concurrency, len(queries)),
+                                thread_name_prefix="geocode") as pool:
+            futures = {query: pool.submit(self.geocoder.geocode, query, language=language) for query in queries}
+            for query, future in futures.items():
+                try:
+                    fetched[query] = future.result()
+                except Exception as e:
+                    with self._lock:
+                        self.errors += 1
+                    logger.warning(f"지오코딩 실패: {query} ({e})")
+                    first_error = first_error or e
+        self.cache.put_many(fetched, language)
+        logger.info(f"지오코딩 {len(fetched)}/{len(queries)}건 조회 ({(time.perf_counter() - started) * 1000:.0f}ms)")
+        if first_error is not None:
+            raise first_error
+        return fetched
+
+    def stats(self) -> dict:
+        return {
+            "geocoder": type(self.geocoder).__name__ if self.geocoder is not None else None,
+            "offline": self.offline,
+            "concurrency": self.concurrency,
+            "cache_path": self.cache.path,
+            "cache_entries": self.cache.size(),
+            "ttl": self.cache.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "errors": self.errors,
+        }
+
+
+def create_geocoder(kind: str = GEOCODER):
+    """설정한 종류의 지오코더를 만듭니다. (google / fake)"""
+    if kind == "fake":
+        return FakeGeocoder()
+    if kind != "google":
+        raise ValueError(f"GEOCODER 는 google 또는 fake 여야 합니다: {kind}")
+    # googlemaps 패키지는 실제로 조회할 때만 필요
+    from app.domain.model.google_map_schema import GoogleMapSchema
+    return GoogleMapSchema()
+
+
+_resolver: Optional[GeocodeResolver] = None
+_resolver_lock = threading.Lock()
+
+
+def get_geocode_resolver() -> GeocodeResolver:
+    """프로세스 전역 지오코딩 조회기를 반환합니다. (처음 호출할 때 생성)"""
+    global _resolver
+    if _resolver is None:
+        with _resolver_lock:
+            if _resolver is None:
+                # 오프라인 모드에서는 지오코더(네트워크 클라이언트)를 만들지 않음
+                geocoder = None if GEOCODE_OFFLINE else create_geocoder()
+                _resolver = GeocodeResolver(geocoder, GeocodeCache())
+    return _resolver
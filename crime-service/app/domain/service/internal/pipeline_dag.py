@@ -0,0 +1,320 @@
+"""
+증분 실행 파이프라인(DAG)
+- 단계마다 원본 입력 파일 / 선행 단계 출력 파일의 내용 해시와 파라미터로 지문(fingerprint)을 만들어 매니페스트(JSON)에 기록
+- 지문이 그대로이고 출력 파일도 기록한 내용 그대로면 건너뛰고, 바뀐 단계와 그 뒤 단계만 다시 계산
+  (선행 단계를 다시 계산해도 출력 내용이 같으면 뒤 단계는 건너뜀)
+- 서로 의존하지 않는 단계는 스레드 풀에서 동시에 실행
+- 여러 워커가 동시에 실행하지 않도록 매니페스트 옆의 잠금 파일로 실행을 직렬화
+"""
+import os
+import json
+import time
+import fcntl
+import hashlib
+import logging
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# ✅ 파이프라인 설정
+# 동시에 실행할 단계 수
+PIPELINE_WORKERS = int(os.getenv("PIPELINE_WORKERS", "3"))
+
+UP_TO_DATE = "up_to_date"
+STALE = "stale"
+
+
+@dataclass(frozen=True)
+class Stage:
+    """
+    파이프라인 단계 하나입니다.
+    - sources: 원본 입력 파일 (내용이 바뀌면 다시 계산)
+    - deps: 선행 단계 이름 (선행 단계 출력 내용이 바뀌면 다시 계산)
+    - params: 결과에 영향을 주는 설정값 (JSON 직렬화 가능해야 함)
+    - version: 단계 코드가 바뀌어 다시 계산해야 할 때 올리는 값
+    """
+    name: str
+    run: Callable[[], None]
+    outputs: Tuple[str, ...]
+    sources: Tuple[str, ...] = ()
+    deps: Tuple[str, ...] = ()
+    params: Mapping = field(default_factory=dict)
+    version: str = "1"
+    description: str = ""
+
+
+class PipelineError(RuntimeError):
+    """하나 이상의 단계가 실패한 경우"""
+
+    def __init__(self, failed: Dict[str, str]):
+        super().__init__("파이프라인 단계 실패: " + ", ".join(f"{name} ({error})" for name, error in failed.items()))
+        self.failed = failed
+
+
+def file_hash(path: str) -> Optional[str]:
+    """파일 내용의 sha256 (파일이 없으면 None)"""
+    if not os.path.exists(path):
+        return None
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class PipelineDAG:
+    """
+    Stage 들을 의존 관계에 따라 실행하고 결과를 매니페스트에 기록합니다.
+    """
+
+    def __init__(self, stages: Iterable[Stage], manifest_path: str, workers: int = PIPELINE_WORKERS):
+        self.stages: Dict[str, Stage] = {}
+        for stage in stages:
+            if stage.name in self.stages:
+                raise ValueError(f"단계 이름이 중복되었습니다: {stage.name}")
+            self.stages[stage.name] = stage
+        self.manifest_path = manifest_path
+        self.workers = max(1, workers)
+        self.order = self._topological_order()
+        self._manifest_lock = threading.Lock()
+
+    def _topological_order(self) -> List[str]:
+        """등록 순서를 유지한 위상 정렬 (없는 선행 단계나 순환이 있으면 ValueError)"""
+        order: List[str] = []
+        visiting, done = set(), set()
+
+        def visit(name: str, path: Tuple[str, ...]) -> None:
+            if name in done:
+                return
+            if name in visiting:
+                raise ValueError(f"단계 의존 관계에 순환이 있습니다: {' → '.join(path + (name,))}")
+            if name not in self.stages:
+                raise ValueError(f"없는 단계에 의존합니다: {path[-1]} → {name}")
+            visiting.add(name)
+            for dep in self.stages[name].deps:
+                visit(dep, path + (name,))
+            visiting.discard(name)
+            done.add(name)
+            order.append(name)
+
+        for name in self.stages:
+            visit(name, ())
+        return order
+
+    def plan(self, targets: Optional[Iterable[str]] = None) -> List[str]:
+        """targets 와 그 선행 단계들을 실행 순서대로 반환합니다. (None 이면 전체)"""
+        if targets is None:
+            return list(self.order)
+        needed = set()
+        pending = list(targets)
+        while pending:
+            name = pending.pop()
+            if name not in self.stages:
+                raise KeyError(f"없는 단계입니다: {name}")
+            if name not in needed:
+                needed.add(name)
+                pending.extend(self.stages[name].deps)
+        return [name for name in self.order if name in needed]
+
+    # ✅ 매니페스트
+    def load_manifest(self) -> Dict[str, dict]:
+        if not os.path.exists(self.manifest_path):
+            return {}
+        with open(self.manifest_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def _save_manifest(self, manifest: Dict[str, dict]) -> None:
+        tmp_path = f"{self.manifest_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.manifest_path)
+
+    def inputs_of(self, stage: Stage, hashes: Dict[str, Optional[str]]) -> dict:
+        """지문을 만드는 입력 구성 요소 (원본 파일 해시, 선행 단계 출력 해시, 파라미터)"""
+        def cached_hash(path: str) -> Optional[str]:
+            if path not in hashes:
+                hashes[path] = file_hash(path)
+            return hashes[path]
+
+        return {
+            "version": stage.version,
+            "params": json.loads(json.dumps(stage.params, sort_keys=True, default=str)),
+            "sources": {path: cached_hash(path) for path in stage.sources},
+            "deps": {
+                path: cached_hash(path)
+                for dep in stage.deps for path in self.stages[dep].outputs
+            },
+        }
+
+    @staticmethod
+    def fingerprint(inputs: dict) -> str:
+        return hashlib.sha256(json.dumps(inputs, sort_keys=True).encode()).hexdigest()
+
+    def check(self, stage: Stage, entry: Optional[dict], inputs: dict,
+              hashes: Dict[str, Optional[str]]) -> Optional[str]:
+        """
+        단계를 다시 계산해야 하는 이유를 반환합니다. (최신이면 None)
+
+        Args:
+            stage: 단계
+            entry: 매니페스트에 기록된 마지막 실행 결과
+            inputs: 현재 입력 구성 요소 (inputs_of)
+            hashes: 이번 확인에서 계산한 파일 해시 캐시
+        """
+        missing_sources = [path for path, digest in inputs["sources"].items() if digest is None]
+        if missing_sources:
+            return f"원본 파일 없음: {', '.join(missing_sources)}"
+        if entry is None:
+            return "실행 기록 없음"
+        recorded = entry.get("inputs", {})
+        for key, reason in (("version", "단계 버전 변경"), ("params", "파라미터 변경"),
+                            ("sources", "원본 파일 변경"), ("deps", "선행 단계 출력 변경")):
+            if recorded.get(key) != inputs[key]:
+                return reason
+        for path in stage.outputs:
+            if path not in hashes:
+                hashes[path] = file_hash(path)
+            if hashes[path] is None:
+                return f"출력 파일 없음: {path}"
+            if hashes[path] != entry.get("outputs", {}).get(path):
+                return f"출력 파일이 바뀜: {path}"
+        return None
+
+    def status(self, targets: Optional[Iterable[str]] = None) -> Dict[str, dict]:
+        """
+        단계별 최신 여부를 실행하지 않고 확인합니다.
+        선행 단계가 최신이 아니면 뒤 단계도 최신이 아닌 것으로 표시합니다.
+
+        Returns:
+            {단계 이름: {"state", "reason", "finished_at", "duration", "deps", "description"}} 딕셔너리
+        """
+        manifest = self.load_manifest()
+        hashes: Dict[str, Optional[str]] = {}
+        result: Dict[str, dict] = {}
+        for name in self.plan(targets):
+            stage = self.stages[name]
+            entry = manifest.get(name)
+            stale_deps = [dep for dep in stage.deps if result[dep]["state"] != UP_TO_DATE]
+            if stale_deps:
+                reason = f"선행 단계가 최신이 아님: {', '.join(stale_deps)}"
+            else:
+                reason = self.check(stage, entry, self.inputs_of(stage, hashes), hashes)
+            result[name] = {
+                "state": STALE if reason else UP_TO_DATE,
+                "reason": reason,
+                "finished_at": entry.get("finished_at") if entry else None,
+                "duration": entry.get("duration") if entry else None,
+                "deps": list(stage.deps),
+                "description": stage.description,
+            }
+        return result
+
+    def _lock_file(self):
+        os.makedirs(os.path.dirname(os.path.abspath(self.manifest_path)), exist_ok=True)
+        lock = open(self.manifest_path + ".lock", 'w')
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        return lock
+
+    def run(self, targets: Optional[Iterable[str]] = None, force: bool = False,
+            progress: Optional[Callable[[float, str], None]] = None) -> dict:
+        """
+        필요한 단계만 실행합니다. 선행 단계가 끝난 단계부터 동시에 실행합니다.
+
+        Args:
+            targets: 실행할 단계 (None 이면 전체, 선행 단계는 자동 포함)
+            force: True 면 최신 여부와 상관없이 모두 다시 계산
+            progress: progress(비율, 메시지) 진행률 콜백
+
+        Returns:
+            {"ran": [...], "skipped": [...], "blocked": [...], "reasons": {...}, "elapsed": 초} 딕셔너리
+            (skipped: 최신이라 건너뛴 단계, blocked: 선행 단계 실패로 실행하지 않은 단계)
+
+        Raises:
+            PipelineError: 실패한 단계가 있는 경우 (실패한 단계의 뒤 단계는 실행하지 않음)
+        """
+        plan = self.plan(targets)
+        started = time.perf_counter()
+        ran: List[str] = []
+        skipped: List[str] = []
+        reasons: Dict[str, str] = {}
+        failed: Dict[str, str] = {}
+        blocked = set()
+        hashes: Dict[str, Optional[str]] = {}
+        hashes_lock = threading.Lock()
+
+        with self._lock_file():
+            manifest = self.load_manifest()
+
+            def execute(name: str) -> bool:
+                """단계 하나를 확인하고 필요하면 실행합니다. (실행했으면 True)"""
+                stage = self.stages[name]
+                with hashes_lock:
+                    local = dict(hashes)
+                inputs = self.inputs_of(stage, local)
+                reason = "강제 실행" if force else self.check(stage, manifest.get(name), inputs, local)
+                if reason is None:
+                    return False
+                reasons[name] = reason
+                logger.info(f"단계 실행: {name} ({reason})")
+                stage_started = time.perf_counter()
+                stage.run()
+                outputs = {path: file_hash(path) for path in stage.outputs}
+                missing = [path for path, digest in outputs.items() if digest is None]
+                if missing:
+                    raise FileNotFoundError(f"단계가 출력 파일을 만들지 않았습니다: {', '.join(missing)}")
+                with hashes_lock:
+                    hashes.update(outputs)
+                with self._manifest_lock:
+                    manifest[name] = {
+                        "fingerprint": self.fingerprint(inputs),
+                        "inputs": inputs,
+                        "outputs": outputs,
+                        "finished_at": time.time(),
+                        "duration": round(time.perf_counter() - stage_started, 3),
+                    }
+                    self._save_manifest(manifest)
+                return True
+
+            remaining = list(plan)
+            running: Dict[Future, str] = {}
+            finished = set()
+            with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="pipeline") as pool:
+                while remaining or running:
+                    for name in list(remaining):
+                        deps = self.stages[name].deps
+                        if any(dep in failed or dep in blocked for dep in deps):
+                            remaining.remove(name)
+                            reasons[name] = "선행 단계 실패"
+                            blocked.add(name)
+                            finished.add(name)
+                        elif all(dep in finished for dep in deps):
+                            remaining.remove(name)
+                            running[pool.submit(execute, name)] = name
+                    if not running:
+                        break
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        name = running.pop(future)
+                        finished.add(name)
+                        try:
+                            (ran if future.result() else skipped).append(name)
+                        except Exception as e:
+                            logger.error(f"단계 실패: {name} ({e})")
+                            failed[name] = str(e)
+                        if progress is not None:
+                            progress(len(finished) / len(plan), f"{name} 완료 ({len(finished)}/{len(plan)})")
+
+        summary = {
+            "ran": ran,
+            "skipped": skipped,
+            "blocked": sorted(blocked),
+            "reasons": reasons,
+            "elapsed": round(time.perf_counter() - started, 3),
+        }
+        logger.info(f"파이프라인 완료: {summary}")
+        if failed:
+            raise PipelineError(failed)
+        return summary
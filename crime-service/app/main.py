@@ -12,6 +12,13 @@ import json
 from pydantic import BaseModel
 
 from app.api.crime_router import router as crime_api_router
+from app.domain.service.crime_pipeline import PIPELINE_DATASETS
+from app.domain.service.internal.dataset_store import crime_datasets
+from app.platform import serving
+from app.platform.executor import blocking
+from app.platform.instrumentation import instrument
+from app.platform.jobs import jobs, create_job_router
+from app.platform.tracing import setup_tracing
 
 # ✅ 로깅 설정
 logging.basicConfig(
@@ -28,11 +35,22 @@ load_dotenv()
 class CrimeRequest(BaseModel):
     data: Dict[str, Any]
 
+# ✅ 운영 서빙 - 데이터셋과 GeoJSON 은 fork 전에 로드해 워커끼리 공유
+serving.on_preload(lambda: crime_datasets.preload(PIPELINE_DATASETS))
+
 # ✅ 라이프스팬 설정
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     print("🚀🚀🚀 Crime Service가 시작됩니다.")
+    await serving.startup("crime")
+    # 이미 로드한 데이터셋(preload)은 바뀐 경우에만 다시 읽음
+    await crime_datasets.start(PIPELINE_DATASETS)
+    await jobs.start()
     yield
+    await jobs.close()
+    await crime_datasets.close()
+    blocking.close()
+    await serving.shutdown()
     print("🛑 Crime Service가 종료됩니다.")
 
 # ✅ FastAPI 설정
@@ -52,13 +70,27 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# ✅ 메트릭 계측 (/metrics)
+instrument(app, "crime")
+
+# ✅ 분산 추적 (traceparent 이어받기, 스팬 JSONL 기록)
+setup_tracing(app, "crime")
+
 # ✅ 서브 라우터 생성
 crime_router = APIRouter(prefix="/crime", tags=["Finance API"])
 
 # ✅ 서브 라우터와 엔드포인트를 연결함
 app.include_router(crime_api_router, prefix="/crime")
 
+# ✅ 비동기 작업 API (/crime/jobs/...)
+app.include_router(create_job_router(jobs), prefix="/crime")
+
 
 # ✅ 서브 라우터 등록
 app.include_router(crime_router)
 
+# ✅ 헬스 체크 (게이트웨이 능동 헬스 프로브용)
+@app.get("/health", tags=["상태 확인"])
+async def health():
+    return {"status": "ok"}
+
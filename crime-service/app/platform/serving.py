@@ -0,0 +1,236 @@
+"""
+운영 서빙 모듈 (원본: crime-service - 수정 후 tools/sync_platform.py 로 각 서비스에 복사)
+- gunicorn + UvicornWorker 다중 워커 실행 (서비스 루트의 gunicorn.conf.py 에서 사용)
+- 워커 수는 컨테이너에 할당된 CPU 수에서 계산
+- 무거운 읽기 전용 상태(모델, GeoJSON 등)는 fork 전에 마스터에서 로드해 워커끼리 copy-on-write 로 공유 (@on_preload)
+- fork 후에 만들어야 하는 상태(JVM, TF 런타임 등)는 워커마다 요청을 받기 전에 로드 (@on_worker_init)
+- 마스터/워커 기동 시간과 워커별 RSS/PSS 를 로그와 /metrics 로 보고
+
+단일 uvicorn 프로세스(개발 모드)에서는 lifespan 의 startup() 이 같은 훅을 한 번 실행합니다.
+prometheus_client 는 PROMETHEUS_MULTIPROC_DIR 설정 이후에 import 되어야 하므로 함수 안에서만 import 합니다.
+"""
+import os
+import gc
+import time
+import shutil
+import asyncio
+import logging
+from typing import Callable, Dict, List, Optional
+
+logger = logging.getLogger("platform.serving")
+
+# ✅ 서빙 설정
+# WEB_CONCURRENCY 를 지정하면 그대로 사용, 아니면 CPU 수 x WORKERS_PER_CORE (MAX_WORKERS 이하)
+WORKERS_PER_CORE = float(os.getenv("WORKERS_PER_CORE", "1"))
+MAX_WORKERS = int(os.getenv("MAX_WORKERS", "8"))
+# 워커 메모리 게이지 갱신 간격 (초)
+SERVING_MEMORY_REPORT_INTERVAL = float(os.getenv("SERVING_MEMORY_REPORT_INTERVAL", "60"))
+
+_preloaders: List[Callable[[], object]] = []
+_worker_initializers: List[Callable[[], object]] = []
+_preloaded = False
+_initialized_pid: Optional[int] = None
+_forked_at: Optional[float] = None
+_report_task: Optional[asyncio.Task] = None
+_memory_gauge = None
+
+
+def on_preload(func: Callable[[], object]) -> Callable[[], object]:
+    """fork 전에 마스터에서 한 번 실행할 로더를 등록합니다. (fork 해도 안전한 읽기 전용 상태만)"""
+    _preloaders.append(func)
+    return func
+
+
+def on_worker_init(func: Callable[[], object]) -> Callable[[], object]:
+    """워커마다 fork 후, 요청을 받기 전에 실행할 초기화 함수를 등록합니다."""
+    _worker_initializers.append(func)
+    return func
+
+
+def available_cpus() -> int:
+    """
+    이 프로세스가 쓸 수 있는 CPU 수를 반환합니다.
+    CPU affinity 와 cgroup(v2 cpu.max / v1 cfs quota) 제한 중 작은 값을 사용합니다.
+    """
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:
+        cpus = os.cpu_count() or 1
+    quota = _cgroup_cpu_quota()
+    if quota is not None:
+        cpus = min(cpus, max(1, int(quota + 0.5)))
+    return max(1, cpus)
+
+
+def _cgroup_cpu_quota() -> Optional[float]:
+    try:
+        with open("/sys/fs/cgroup/cpu.max") as f:
+            quota, period = f.read().split()[:2]
+        return None if quota == "max" else int(quota) / int(period)
+    except (OSError, ValueError):
+        pass
+    try:
+        with open("/sys/fs/cgroup/cpu/cpu.cfs_quota_us") as f:
+            quota = int(f.read())
+        with open("/sys/fs/cgroup/cpu/cpu.cfs_period_us") as f:
+            period = int(f.read())
+        return None if quota <= 0 else quota / period
+    except (OSError, ValueError):
+        return None
+
+
+def worker_count() -> int:
+    """gunicorn 워커 수 (WEB_CONCURRENCY > CPU 수 x WORKERS_PER_CORE)"""
+    configured = os.getenv("WEB_CONCURRENCY")
+    if configured:
+        return max(1, int(configured))
+    return max(1, min(MAX_WORKERS, int(available_cpus() * WORKERS_PER_CORE)))
+
+
+def memory_usage(pid: str = "self") -> Dict[str, int]:
+    """
+    프로세스 메모리 사용량(바이트)을 반환합니다.
+    PSS 는 공유 페이지를 공유한 프로세스 수로 나눈 값이라 워커 간 copy-on-write 공유 효과를 보여줍니다.
+
+    Returns:
+        {"rss", "pss", "shared", "private"} (smaps_rollup 이 없으면 rss 만)
+    """
+    fields = {"Rss": "rss", "Pss": "pss", "Shared_Clean": "shared", "Shared_Dirty": "shared",
+              "Private_Clean": "private", "Private_Dirty": "private"}
+    usage: Dict[str, int] = {}
+    try:
+        with open(f"/proc/{pid}/smaps_rollup") as f:
+            for line in f:
+                name, _, rest = line.partition(":")
+                if name in fields:
+                    usage[fields[name]] = usage.get(fields[name], 0) + int(rest.split()[0]) * 1024
+        return usage
+    except OSError:
+        pass
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return {"rss": int(line.split()[1]) * 1024}
+    except OSError:
+        pass
+    import resource
+    return {"rss": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024}
+
+
+def _format_memory(usage: Dict[str, int]) -> str:
+    return " ".join(f"{name}={value / 2**20:.0f}MiB" for name, value in usage.items())
+
+
+def preload() -> None:
+    """등록된 preload 로더를 실행합니다. (프로세스당 한 번)"""
+    global _preloaded
+    if _preloaded:
+        return
+    _preloaded = True
+    for func in _preloaders:
+        started = time.perf_counter()
+        func()
+        logger.info("preload %s: %.2fs", func.__qualname__, time.perf_counter() - started)
+
+
+def init_worker() -> None:
+    """등록된 워커 초기화 함수를 실행합니다. (워커 프로세스당 한 번)"""
+    global _initialized_pid
+    if _initialized_pid == os.getpid():
+        return
+    _initialized_pid = os.getpid()
+    for func in _worker_initializers:
+        started = time.perf_counter()
+        func()
+        logger.info("worker init %s: %.2fs", func.__qualname__, time.perf_counter() - started)
+
+
+def _update_memory_gauge() -> Dict[str, int]:
+    from prometheus_client import Gauge
+    global _memory_gauge
+    if _memory_gauge is None:
+        _memory_gauge = Gauge(
+            "serving_worker_memory_bytes", "워커 프로세스 메모리 (rss/pss/shared/private)",
+            ["kind"], multiprocess_mode="all"
+        )
+    usage = memory_usage()
+    for kind, value in usage.items():
+        _memory_gauge.labels(kind).set(value)
+    return usage
+
+
+async def startup(service: str) -> None:
+    """
+    lifespan 시작 시 호출합니다.
+    gunicorn 에서는 훅이 이미 실행되어 있고, 단일 uvicorn 에서는 여기서 preload/워커 초기화를 실행합니다.
+    """
+    global _report_task
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(None, preload)
+    await loop.run_in_executor(None, init_worker)
+    usage = _update_memory_gauge()
+    since_fork = f" (fork 후 {time.monotonic() - _forked_at:.2f}s)" if _forked_at is not None else ""
+    logger.info("%s 워커 준비 완료 pid=%d%s %s", service, os.getpid(), since_fork, _format_memory(usage))
+    if SERVING_MEMORY_REPORT_INTERVAL > 0:
+        _report_task = asyncio.create_task(_report_memory())
+
+
+async def shutdown() -> None:
+    """lifespan 종료 시 호출합니다."""
+    global _report_task
+    if _report_task is not None:
+        _report_task.cancel()
+        _report_task = None
+
+
+async def _report_memory() -> None:
+    while True:
+        await asyncio.sleep(SERVING_MEMORY_REPORT_INTERVAL)
+        _update_memory_gauge()
+
+
+# ✅ gunicorn 설정/훅 (gunicorn.conf.py 에서 사용)
+def prepare_master() -> None:
+    """
+    마스터 프로세스 환경을 준비합니다. 앱과 prometheus_client 를 import 하기 전(gunicorn.conf.py 맨 앞)에 호출해야 합니다.
+    - 워커 메트릭을 합쳐서 노출하도록 PROMETHEUS_MULTIPROC_DIR 을 비워서 생성
+    - 서빙 시작 시각을 SERVING_STARTED_AT 으로 기록
+    """
+    directory = os.environ.setdefault("PROMETHEUS_MULTIPROC_DIR", "/tmp/prometheus_multiproc")
+    shutil.rmtree(directory, ignore_errors=True)
+    os.makedirs(directory, exist_ok=True)
+    # 기동 시간 보고와 재시작 전에 끝나지 못한 작업 판별에 사용 (모든 워커가 같은 값)
+    os.environ.setdefault("SERVING_STARTED_AT", str(time.time()))
+
+
+def when_ready(server) -> None:
+    """마스터: 앱(preload_app)을 import 한 뒤, 워커를 fork 하기 전"""
+    preload()
+    # 이후 GC 가 공유 객체의 헤더를 건드려 copy-on-write 페이지가 복사되지 않도록 현재 객체를 고정
+    gc.collect()
+    gc.freeze()
+    started_at = float(os.environ.get("SERVING_STARTED_AT", time.time()))
+    server.log.info(
+        "마스터 준비 완료: 기동 %.2fs, 워커 %d개 (CPU %d개) %s",
+        time.time() - started_at, server.cfg.workers, available_cpus(), _format_memory(memory_usage())
+    )
+
+
+def post_fork(server, worker) -> None:
+    global _forked_at
+    _forked_at = time.monotonic()
+
+
+def post_worker_init(worker) -> None:
+    init_worker()
+
+
+def child_exit(server, worker) -> None:
+    from prometheus_client import multiprocess
+    multiprocess.mark_process_dead(worker.pid)
+
+
+if __name__ == "__main__":
+    # 현재 환경에서 사용할 워커 수 확인: python -m app.platform.serving
+    print(f"CPU {available_cpus()}개 → 워커 {worker_count()}개")
@@ -0,0 +1,341 @@
+"""
+분산 추적 모듈 (원본: gateway - 수정 후 tools/sync_platform.py 로 각 서비스에 복사)
+- W3C traceparent / X-Request-ID 헤더 파싱과 전파
+- 요청 단위 서버 스팬 + 파이프라인 단계 스팬 (span / traced)
+- 스팬 기록은 TRACING_ENABLED=true 일 때만 (기본 꺼짐), 백그라운드 스레드가 프로세스별 JSONL 파일로 기록
+  (요청 경로에서 파일 I/O 없음, 워커끼리 같은 파일에 쓰지 않음, 크기를 넘으면 교체)
+"""
+import os
+import json
+import time
+import queue
+import atexit
+import random
+import secrets
+import threading
+import functools
+import inspect
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+from fastapi import FastAPI
+
+# ✅ 추적 설정
+# 스팬 파일 기록 여부 (꺼져 있어도 traceparent / X-Request-ID 전파는 함)
+TRACING_ENABLED = os.getenv("TRACING_ENABLED", "false").lower() in ("1", "true", "yes")
+# 실제 파일은 프로세스마다 따로 씀 (traces/spans.<pid>.jsonl)
+TRACE_EXPORT_PATH = os.getenv("TRACE_EXPORT_PATH", "traces/spans.jsonl")
+# 파일 하나의 최대 크기 (바이트, 넘으면 .1 .2 ... 로 밀어내고 새 파일) 와 남길 이전 파일 수
+TRACE_EXPORT_MAX_BYTES = int(os.getenv("TRACE_EXPORT_MAX_BYTES", str(50 * 1024 * 1024)))
+TRACE_EXPORT_BACKUPS = int(os.getenv("TRACE_EXPORT_BACKUPS", "3"))
+# 기록 대기 중인 스팬 최대 수 (넘으면 버리고 dropped 로 셈)
+TRACE_EXPORT_QUEUE_SIZE = int(os.getenv("TRACE_EXPORT_QUEUE_SIZE", "10000"))
+# 새 트레이스를 시작할 때의 샘플링 비율 (상위에서 받은 traceparent 의 sampled 플래그는 그대로 따름)
+TRACE_SAMPLE_RATE = float(os.getenv("TRACE_SAMPLE_RATE", "0.1"))
+
+REQUEST_ID_HEADER = "x-request-id"
+TRACEPARENT_HEADER = "traceparent"
+
+_service_name = "unknown"
+
+
+class Span:
+    """추적 구간 하나"""
+
+    __slots__ = ("trace_id", "span_id", "parent_id", "request_id", "sampled", "name", "attributes",
+                 "start", "_started", "duration_ms", "status")
+
+    def __init__(self, name: str, trace_id: str, parent_id: Optional[str], request_id: str, sampled: bool,
+                 attributes: Optional[Dict[str, Any]] = None):
+        self.trace_id = trace_id
+        self.span_id = secrets.token_hex(8)
+        self.parent_id = parent_id
+        self.request_id = request_id
+        self.sampled = sampled
+        self.name = name
+        self.attributes = attributes or {}
+        self.start = time.time()
+        self._started = time.perf_counter()
+        self.duration_ms = 0.0
+        self.status = "ok"
+
+    def traceparent(self) -> str:
+        return f"00-{self.trace_id}-{self.span_id}-{'01' if self.sampled else '00'}"
+
+    def set(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def finish(self) -> None:
+        self.duration_ms = round((time.perf_counter() - self._started) * 1000, 3)
+        if self.sampled:
+            exporter.export(self)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "service": _service_name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "request_id": self.request_id,
+            "name": self.name,
+            "start": self.start,
+            "duration_ms": self.duration_ms,
+            "status": self.status,
+            "attributes": self.attributes,
+        }
+
+
+_current_span: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+
+
+class JsonlSpanExporter:
+    """
+    완료된 스팬을 큐에 넣고 백그라운드 스레드가 JSONL 파일에 한 줄씩 기록합니다.
+    gunicorn 워커처럼 fork 한 프로세스는 자기 PID 파일에 따로 쓰므로 줄이 섞이지 않습니다.
+    """
+
+    def __init__(self, path: str, max_bytes: int = TRACE_EXPORT_MAX_BYTES,
+                 backups: int = TRACE_EXPORT_BACKUPS, queue_size: int = TRACE_EXPORT_QUEUE_SIZE):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.queue_size = queue_size
+        self.dropped = 0
+        self._reset()
+        if hasattr(os, "register_at_fork"):
+            # preload 한 마스터에서 시작된 스레드/큐는 fork 한 워커에서 쓸 수 없으므로 새로 만듦
+            os.register_at_fork(after_in_child=self._reset)
+
+    def _reset(self) -> None:
+        self._queue: "queue.Queue[Optional[Dict[str, Any]]]" = queue.Queue(maxsize=self.queue_size)
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def file_path(self) -> str:
+        """이 프로세스가 쓰는 파일 경로 (traces/spans.jsonl → traces/spans.<pid>.jsonl)"""
+        root, ext = os.path.splitext(self.path)
+        return f"{root}.{os.getpid()}{ext}"
+
+    def _ensure_thread(self) -> None:
+        if self._thread is None:
+            with self._lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._run, name="span-exporter", daemon=True)
+                    self._thread.start()
+                    atexit.register(self.close)
+
+    def export(self, span: Span) -> None:
+        if not TRACING_ENABLED:
+            return
+        self._ensure_thread()
+        try:
+            self._queue.put_nowait(span.to_dict())
+        except queue.Full:
+            self.dropped += 1
+
+    def _rotate(self, path: str) -> None:
+        """path → path.1 → path.2 ... (backups 개까지만 남김)"""
+        if self.backups <= 0:
+            os.remove(path)
+            return
+        for i in range(self.backups - 1, 0, -1):
+            if os.path.exists(f"{path}.{i}"):
+                os.replace(f"{path}.{i}", f"{path}.{i + 1}")
+        os.replace(path, f"{path}.1")
+
+    def _run(self) -> None:
+        path = self.file_path()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        f = open(path, "a", encoding="utf-8")
+        size = f.tell()
+        try:
+            while True:
+                record = self._queue.get()
+                if record is None:
+                    break
+                line = json.dumps(record, ensure_ascii=False, default=str) + "\n"
+                f.write(line)
+                size += len(line.encode("utf-8"))
+                if self.max_bytes and size >= self.max_bytes:
+                    f.close()
+                    self._rotate(path)
+                    f = open(path, "a", encoding="utf-8")
+                    size = 0
+                # 큐가 비었을 때만 flush 해서 몰리는 구간에서는 쓰기를 묶음
+                elif self._queue.empty():
+                    f.flush()
+        finally:
+            f.close()
+
+    def close(self) -> None:
+        """남은 스팬을 모두 기록하고 스레드를 종료합니다."""
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join(timeout=5)
+            self._thread = None
+
+
+exporter = JsonlSpanExporter(TRACE_EXPORT_PATH)
+
+
+def parse_traceparent(value: Optional[str]) -> Optional[Tuple[str, str, bool]]:
+    """
+    W3C traceparent 헤더를 파싱합니다.
+
+    Args:
+        value: 헤더 값 (예: 00-<32 hex>-<16 hex>-01)
+
+    Returns:
+        (trace_id, parent_span_id, sampled) 또는 형식이 잘못되면 None
+    """
+    if not value:
+        return None
+    parts = value.strip().split("-")
+    if len(parts) != 4 or len(parts[1]) != 32 or len(parts[2]) != 16 or len(parts[3]) != 2:
+        return None
+    try:
+        int(parts[1], 16), int(parts[2], 16)
+        flags = int(parts[3], 16)
+    except ValueError:
+        return None
+    if parts[1] == "0" * 32 or parts[2] == "0" * 16:
+        return None
+    return parts[1], parts[2], bool(flags & 1)
+
+
+def current_span() -> Optional[Span]:
+    return _current_span.get()
+
+
+def current_request_id() -> Optional[str]:
+    span = _current_span.get()
+    return span.request_id if span is not None else None
+
+
+@contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Span]:
+    """
+    현재 스팬의 자식 스팬을 만듭니다. 진행 중인 트레이스가 없으면 새 트레이스를 시작합니다.
+
+    Args:
+        name: 스팬 이름 (예: "nlp.extract_noun")
+        **attributes: 스팬 속성
+    """
+    parent = _current_span.get()
+    if parent is not None:
+        child = Span(name, parent.trace_id, parent.span_id, parent.request_id, parent.sampled, attributes)
+    else:
+        trace_id = secrets.token_hex(16)
+        child = Span(name, trace_id, None, trace_id, random.random() < TRACE_SAMPLE_RATE, attributes)
+    token = _current_span.set(child)
+    try:
+        yield child
+    except BaseException as e:
+        child.status = "error"
+        child.set("error", f"{type(e).__name__}: {e}")
+        raise
+    finally:
+        _current_span.reset(token)
+        child.finish()
+
+
+def traced(name: Optional[str] = None) -> Callable:
+    """
+    함수 실행을 스팬으로 기록하는 데코레이터입니다. 동기/비동기 함수 모두 지원합니다.
+
+    Args:
+        name: 스팬 이름 (생략하면 함수의 qualname)
+    """
+    def decorator(func: Callable) -> Callable:
+        span_name = name or func.__qualname__
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with span(span_name):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(span_name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def trace_headers() -> Dict[str, str]:
+    """
+    업스트림 호출에 붙일 추적 헤더를 반환합니다. (현재 스팬이 부모가 됨)
+
+    Returns:
+        traceparent, x-request-id 헤더 (진행 중인 트레이스가 없으면 빈 딕셔너리)
+    """
+    current = _current_span.get()
+    if current is None:
+        return {}
+    return {TRACEPARENT_HEADER: current.traceparent(), REQUEST_ID_HEADER: current.request_id}
+
+
+class TracingMiddleware:
+    """
+    요청마다 서버 스팬을 만드는 ASGI 미들웨어입니다.
+    들어온 traceparent 가 있으면 이어 받고, 없으면 새 트레이스를 시작합니다.
+    응답에는 X-Request-ID 를 붙여 클라이언트 로그와 맞춰 볼 수 있게 합니다.
+    """
+
+    def __init__(self, app: Callable):
+        self.app = app
+
+    async def __call__(self, scope: dict, receive: Callable, send: Callable) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = {k.decode("latin-1"): v.decode("latin-1") for k, v in scope["headers"]
+                   if k in (b"traceparent", b"x-request-id")}
+        parent = parse_traceparent(headers.get(TRACEPARENT_HEADER))
+        if parent is not None:
+            trace_id, parent_id, sampled = parent
+        else:
+            trace_id, parent_id, sampled = secrets.token_hex(16), None, random.random() < TRACE_SAMPLE_RATE
+        request_id = headers.get(REQUEST_ID_HEADER) or trace_id
+
+        server_span = Span(
+            f"{scope['method']} {scope['path']}", trace_id, parent_id, request_id, sampled,
+            {"http.method": scope["method"], "http.path": scope["path"]}
+        )
+        token = _current_span.set(server_span)
+
+        async def send_with_request_id(message: dict) -> None:
+            if message["type"] == "http.response.start":
+                server_span.set("http.status_code", message["status"])
+                if message["status"] >= 500:
+                    server_span.status = "error"
+                message.setdefault("headers", [])
+                message["headers"] = list(message["headers"]) + [(b"x-request-id", request_id.encode("latin-1"))]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        except BaseException:
+            server_span.status = "error"
+            raise
+        finally:
+            _current_span.reset(token)
+            server_span.finish()
+
+
+def setup_tracing(app: FastAPI, service: str) -> None:
+    """
+    앱에 추적 미들웨어를 등록합니다.
+
+    Args:
+        app: FastAPI 앱
+        service: 스팬에 기록할 서비스 이름
+    """
+    global _service_name
+    _service_name = service
+    app.add_middleware(TracingMiddleware)
@@ -0,0 +1,90 @@
+"""
+컬럼 형식 데이터셋 저장소 테스트
+"""
+import os
+
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from app.domain.model import dataset_schema
+from app.domain.model.dataset_schema import (
+    dataset_exists, export_csv, migrate_legacy_csv, read_dataset, read_table, write_dataset
+)
+from app.domain.model.reader_schema import ReaderSchema
+
+
+def cctv_frame():
+    return pd.DataFrame({"자치구": ["강남구", "종로구"], "소계": [3238, 1619], "비고": ["a", "b"]})
+
+
+@pytest.mark.parametrize("fmt", ["feather", "parquet"])
+def test_round_trip_keeps_schema_types(tmp_path, fmt):
+    df = cctv_frame()
+    df["소계"] = df["소계"].astype(float)  # 스키마(int64)로 맞춰 저장
+    path = write_dataset(df, str(tmp_path), "cctv_in_seoul", fmt=fmt)
+    assert path.endswith("." + fmt)
+
+    table = read_table(str(tmp_path), "cctv_in_seoul")
+    assert table.schema.field("자치구").type == pa.string()
+    assert table.schema.field("소계").type == pa.int64()
+    assert table.column_names == ["자치구", "소계", "비고"]
+    assert read_dataset(str(tmp_path), "cctv_in_seoul", columns=["소계"]).columns.tolist() == ["소계"]
+
+
+def test_missing_required_columns_are_rejected(tmp_path):
+    with pytest.raises(ValueError, match="소계"):
+        write_dataset(pd.DataFrame({"자치구": ["강남구"]}), str(tmp_path), "cctv_in_seoul")
+    with pytest.raises(ValueError):
+        write_dataset(pd.DataFrame({"자치구": ["강남구"], "소계": ["많음"]}), str(tmp_path), "cctv_in_seoul")
+    assert not dataset_exists(str(tmp_path), "cctv_in_seoul")
+
+
+def test_legacy_csv_is_migrated_only_explicitly(tmp_path):
+    # 원본 입력 CSV(같은 이름)는 읽기 경로에서 변환하지 않음
+    (tmp_path / "cctv_in_seoul.csv").write_text("기관명,소계\n강남구,3238\n", encoding="utf-8")
+    with pytest.raises(FileNotFoundError):
+        read_dataset(str(tmp_path), "cctv_in_seoul")
+    assert migrate_legacy_csv(str(tmp_path), "cctv_in_seoul") is None
+    assert sorted(os.listdir(tmp_path)) == ["cctv_in_seoul.csv"]
+
+    (tmp_path / "police_norm_in_seoul.legacy.csv").write_text(
+        ",살인,강도,강간,절도,폭력,살인검거율,강도검거율,강간검거율,절도검거율,폭력검거율,범죄,검거\n"
+        "강남구,1,0.5,0.2,0.1,0.3,90,100,80,50,70,390,2.1\n",
+        encoding="utf-8",
+    )
+    assert migrate_legacy_csv(str(tmp_path), "police_norm_in_seoul").endswith(".feather")
+    df = read_dataset(str(tmp_path), "police_norm_in_seoul")
+    assert df["자치구"].tolist() == ["강남구"]
+    assert df["범죄"].dtype == "float64"
+    assert migrate_legacy_csv(str(tmp_path), "police_norm_in_seoul") is None
+
+
+def test_csv_is_export_only(tmp_path, monkeypatch):
+    reader = ReaderSchema()
+    reader.context, reader.fname = str(tmp_path), "cctv_in_seoul"
+    reader.dframe_to_dataset(cctv_frame())
+    assert not os.path.exists(tmp_path / "cctv_in_seoul.csv")
+
+    exported = reader.dataset_to_csv()
+    assert pd.read_csv(exported)["소계"].tolist() == [3238, 1619]
+
+    monkeypatch.setattr(dataset_schema, "DATASET_EXPORT_CSV", True)
+    os.remove(exported)
+    write_dataset(cctv_frame(), str(tmp_path), "cctv_in_seoul")
+    assert os.path.exists(exported)
+    assert exported.endswith("cctv_in_seoul.export.csv")
+    assert reader.dataset_to_dframe(["자치구"])["자치구"].tolist() == ["강남구", "종로구"]
+
+
+def test_export_leaves_raw_inputs_untouched(tmp_path, monkeypatch):
+    # stored_data/cctv_in_seoul.csv 는 파이프라인의 원본 입력
+    raw_path = tmp_path / "cctv_in_seoul.csv"
+    raw = "기관명,소계,2013년도 이전\n강남구,\"3,238\",1292\n"
+    raw_path.write_text(raw, encoding="utf-8")
+
+    monkeypatch.setattr(dataset_schema, "DATASET_EXPORT_CSV", True)
+    write_dataset(cctv_frame(), str(tmp_path), "cctv_in_seoul")
+    export_csv(str(tmp_path), "cctv_in_seoul")
+    assert raw_path.read_text(encoding="utf-8") == raw
+    assert pd.read_csv(tmp_path / "cctv_in_seoul.export.csv")["소계"].tolist() == [3238, 1619]
@@ -0,0 +1,66 @@
+"""
+메모리 데이터셋 저장소 테스트
+"""
+import asyncio
+import json
+import os
+
+import pandas as pd
+import pytest
+
+from app.domain.model.dataset_schema import write_dataset
+from app.domain.service.internal.dataset_store import CrimeDatasetStore
+
+
+def cctv(total: int) -> pd.DataFrame:
+    return pd.DataFrame({"자치구": ["강남구", "종로구"], "소계": [total, 1619]})
+
+
+def test_reads_from_memory_and_reloads_on_change(tmp_path):
+    write_dataset(cctv(3238), str(tmp_path), "cctv_in_seoul")
+    store = CrimeDatasetStore(watch_interval=0)
+    assert store.preload([(str(tmp_path), "cctv_in_seoul"), (str(tmp_path), "pop_in_seoul")]) == ["cctv_in_seoul"]
+
+    for _ in range(100):
+        frame = store.get(str(tmp_path), "cctv_in_seoul")
+    assert store.hits == 100 and store.reloads == 0
+
+    # 복사본을 바꿔도 저장소의 데이터는 그대로
+    frame["소계"] = 0
+    assert store.get(str(tmp_path), "cctv_in_seoul")["소계"].tolist() == [3238, 1619]
+
+    write_dataset(cctv(4000), str(tmp_path), "cctv_in_seoul")
+    assert store.get(str(tmp_path), "cctv_in_seoul", copy=False)["소계"].tolist() == [4000, 1619]
+    assert store.reloads == 1
+    with pytest.raises(FileNotFoundError):
+        store.get(str(tmp_path), "pop_in_seoul")
+
+
+def test_preload_skips_raw_inputs_and_broken_files(tmp_path):
+    # 첫 파이프라인 실행 전: stored_data 에는 같은 이름의 원본 CSV 만 있음
+    (tmp_path / "cctv_in_seoul.csv").write_text("기관명,소계,2013년도 이전\n강남구,3238,1292\n", encoding="utf-8")
+    (tmp_path / "pop_in_seoul.feather").write_bytes(b"not an arrow file")
+    store = CrimeDatasetStore(watch_interval=0, geo_json_path=str(tmp_path / "missing.json"))
+    assert store.preload([(str(tmp_path), "cctv_in_seoul"), (str(tmp_path), "pop_in_seoul")]) == []
+    assert sorted(os.listdir(tmp_path)) == ["cctv_in_seoul.csv", "pop_in_seoul.feather"]
+
+
+@pytest.mark.asyncio
+async def test_watcher_reloads_changed_files_in_background(tmp_path):
+    write_dataset(cctv(1), str(tmp_path), "cctv_in_seoul")
+    geo = tmp_path / "geo_simple.json"
+    geo.write_text(json.dumps({"type": "FeatureCollection", "features": []}))
+    store = CrimeDatasetStore(watch_interval=0.05, geo_json_path=str(geo))
+    await store.start([(str(tmp_path), "cctv_in_seoul")])
+    try:
+        assert store.geo_json()["features"] == []
+        write_dataset(cctv(2), str(tmp_path), "cctv_in_seoul")
+        for _ in range(40):
+            if store.reloads:
+                break
+            await asyncio.sleep(0.05)
+        assert store.reloads == 1
+        assert store.get(str(tmp_path), "cctv_in_seoul")["소계"].tolist() == [2, 1619]
+        assert store.stats()["datasets"][f"{tmp_path.name}/cctv_in_seoul"]["rows"] == 2
+    finally:
+        await store.close()
@@ -0,0 +1,75 @@
+"""
+자치구 geometry 인덱스 테스트
+"""
+import os
+
+import numpy as np
+import pytest
+
+from app.domain.service.internal.district_geometry import (
+    DistrictGeometryIndex, get_district_index, simplify_ring,
+)
+from app.domain.service.internal.geo_data import load_geo_json
+
+GEO_JSON_FILE = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'stored_data', 'geo_simple.json')
+
+
+def square(x0: float, y0: float, size: float) -> list:
+    return [[x0, y0], [x0 + size, y0], [x0 + size, y0 + size], [x0, y0 + size], [x0, y0]]
+
+
+def feature(name: str, geometry: dict) -> dict:
+    return {"type": "Feature", "id": name, "properties": {"name": name}, "geometry": geometry}
+
+
+def test_centroid_bbox_and_locate():
+    # L 자 모양은 첫 꼭짓점도, 꼭짓점 평균도 면적 중심과 다름
+    l_shape = [[0, 0], [4, 0], [4, 1], [1, 1], [1, 4], [0, 4], [0, 0]]
+    geo_json = {"type": "FeatureCollection", "features": [
+        feature("L구", {"type": "Polygon", "coordinates": [l_shape]}),
+        # 구멍 뚫린 정사각형 + 떨어진 섬
+        feature("섬구", {"type": "MultiPolygon", "coordinates": [
+            [square(10, 0, 4), square(11, 1, 2)],
+            [square(20, 0, 1)],
+        ]}),
+    ]}
+    index = DistrictGeometryIndex(geo_json)
+
+    lat, lng = index.centroid("L구")
+    assert (lng, lat) == pytest.approx((19 / 14, 19 / 14))
+    assert index.get("L구").bbox == (0, 0, 4, 4)
+    assert index.get("섬구").area == pytest.approx(16 - 4 + 1)
+    assert index.centroid("없는구") is None
+
+    lats = [0.5, 3.0, 2.0, 2.0, 0.5, 0.5, -1.0]
+    lngs = [3.0, 3.0, 10.5, 12.0, 20.5, 15.0, 0.5]
+    assert index.locate(lats, lngs).tolist() == ["L구", None, "섬구", None, "섬구", None, None]
+
+
+def test_seoul_geo_json_index():
+    geo_json = load_geo_json(GEO_JSON_FILE)
+    index = get_district_index(geo_json)
+    assert get_district_index(geo_json) is index
+    assert len(index) == 25 and "강남구" in index
+
+    # 중심점은 자기 자치구 안에 있음 (서울 자치구는 모두 볼록에 가까운 모양)
+    centroids = np.array([index.centroid(name) for name in index.names()])
+    assert index.locate(centroids[:, 0], centroids[:, 1]).tolist() == index.names()
+
+    # 여러 좌표를 한꺼번에 판정 - 서울 밖 좌표는 None
+    rng = np.random.default_rng(0)
+    lats = rng.uniform(37.40, 37.72, 20000)
+    lngs = rng.uniform(126.75, 127.20, 20000)
+    located = index.locate(lats, lngs)
+    assert located.shape == (20000,)
+    assert 0 < sum(name is None for name in located) < 20000
+    assert index.locate([35.1], [129.0]).tolist() == [None]
+
+
+def test_simplify_ring_keeps_shape():
+    theta = np.linspace(0, 2 * np.pi, 401)
+    circle = np.column_stack((np.cos(theta), np.sin(theta)))
+    simplified = simplify_ring(circle, 0.01)
+    assert 4 <= len(simplified) < len(circle) / 4
+    assert np.allclose(simplified[0], simplified[-1])
+    assert simplify_ring(circle, 0) is circle
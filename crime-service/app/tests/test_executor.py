@@ -0,0 +1,47 @@
+"""
+블로킹 작업 실행기 테스트
+"""
+import asyncio
+import threading
+
+import pytest
+
+from app.platform.executor import BlockingExecutor
+
+
+@pytest.mark.asyncio
+async def test_cancelled_call_keeps_slot_until_work_finishes():
+    executor = BlockingExecutor(kind="thread", workers=2, max_concurrency=1, max_pending=4)
+    release = threading.Event()
+    started = []
+
+    def slow() -> str:
+        started.append("slow")
+        release.wait(5)
+        return "slow"
+
+    def fast() -> str:
+        started.append("fast")
+        return "fast"
+
+    try:
+        first = asyncio.create_task(executor.run(slow))
+        while not started:
+            await asyncio.sleep(0.01)
+        # 요청이 취소돼도 워커는 계속 실행 중이므로 슬롯은 그대로 차 있어야 함
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        assert executor.running == 1
+
+        second = asyncio.create_task(executor.run(fast))
+        await asyncio.sleep(0.1)
+        assert started == ["slow"] and executor.pending == 1 and not second.done()
+
+        release.set()
+        assert await asyncio.wait_for(second, 5) == "fast"
+        assert started == ["slow", "fast"]
+        assert executor.stats()["running"] == 0 and executor.completed == 2
+    finally:
+        release.set()
+        executor.close()
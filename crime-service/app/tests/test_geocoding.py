@@ -0,0 +1,97 @@
+"""
+지오코딩 캐시 / 동시 조회 테스트 (FakeGeocoder 사용, 네트워크 없음)
+"""
+import threading
+import time
+
+import pytest
+
+from app.domain.service.internal.geocoding import (
+    FakeGeocoder, GeocodeCache, GeocodeResolver, GeocodeUnavailable, normalize_query
+)
+
+STATIONS = [f"서울{name}경찰서" for name in ("중부", "종로", "남대문", "서대문", "혜화", "용산", "성북", "동대문")]
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return GeocodeCache(str(tmp_path / "geocode.sqlite3"), ttl=3600, clock=Clock())
+
+
+def test_normalize_query():
+    assert normalize_query("  서울중부경찰서 ") == "서울중부경찰서"
+    assert normalize_query("서울  중부\t경찰서") == "서울 중부 경찰서"
+
+
+def test_repeat_resolution_makes_no_geocoder_calls(cache):
+    geocoder = FakeGeocoder()
+    first = GeocodeResolver(geocoder, cache).resolve_many(STATIONS + [STATIONS[0]])
+    assert len(first) == len(STATIONS) + 1
+    assert first[0] == first[-1]
+    assert len(geocoder.calls) == len(STATIONS)
+
+    # 새 조회기(다른 워커/다음 전처리 실행)도 같은 캐시 파일을 사용
+    resolver = GeocodeResolver(geocoder, GeocodeCache(cache.path, ttl=3600, clock=cache.clock))
+    assert resolver.resolve_many([f" {name}" for name in STATIONS]) == first[:-1]
+    assert len(geocoder.calls) == len(STATIONS)
+    assert resolver.stats()["hits"] == len(STATIONS)
+    assert resolver.stats()["cache_entries"] == len(STATIONS)
+
+
+def test_expired_entries_are_refetched_unless_offline(cache):
+    geocoder = FakeGeocoder()
+    GeocodeResolver(geocoder, cache).resolve_many(STATIONS[:2])
+    cache.clock.now += 7200
+
+    GeocodeResolver(geocoder, cache, offline=True).resolve_many(STATIONS[:2])
+    assert len(geocoder.calls) == 2
+    with pytest.raises(GeocodeUnavailable) as e:
+        GeocodeResolver(None, cache, offline=True).resolve_many(STATIONS[:3])
+    assert e.value.queries == [STATIONS[2]]
+
+    GeocodeResolver(geocoder, cache).resolve_many(STATIONS[:2])
+    assert len(geocoder.calls) == 4
+
+
+def test_misses_resolve_concurrently_with_bounded_parallelism(cache):
+    active, peak = 0, 0
+    lock = threading.Lock()
+
+    class Tracking(FakeGeocoder):
+        def geocode(self, address, language='ko'):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            try:
+                return super().geocode(address, language)
+            finally:
+                with lock:
+                    active -= 1
+
+    started = time.perf_counter()
+    GeocodeResolver(Tracking(latency=0.05), cache, concurrency=4).resolve_many(STATIONS)
+    assert peak == 4
+    assert time.perf_counter() - started < 0.05 * len(STATIONS) / 2
+
+
+def test_failed_lookups_keep_successful_results(cache):
+    class Flaky(FakeGeocoder):
+        def geocode(self, address, language='ko'):
+            if address == STATIONS[1]:
+                raise RuntimeError("OVER_QUERY_LIMIT")
+            return super().geocode(address, language)
+
+    resolver = GeocodeResolver(Flaky(), cache)
+    with pytest.raises(RuntimeError):
+        resolver.resolve_many(STATIONS[:3])
+    assert set(cache.get_many(STATIONS[:3], 'ko')) == {STATIONS[0], STATIONS[2]}
+    assert resolver.stats()["errors"] == 1
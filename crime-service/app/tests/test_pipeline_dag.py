@@ -0,0 +1,106 @@
+"""
+증분 실행 파이프라인(DAG) 테스트
+"""
+import time
+
+import pytest
+
+from app.domain.service.internal.pipeline_dag import UP_TO_DATE, PipelineDAG, PipelineError, Stage
+
+
+@pytest.fixture
+def workspace(tmp_path):
+    (tmp_path / "a.txt").write_text("a1")
+    (tmp_path / "b.txt").write_text("b1")
+    return tmp_path
+
+
+def build(tmp_path, calls, fail=(), delay=0.0, params=None, transform=str.upper):
+    def step(name, func):
+        def run():
+            calls.append(name)
+            if delay:
+                time.sleep(delay)
+            if name in fail:
+                raise RuntimeError(f"{name} 실패")
+            func()
+        return run
+
+    def read(name):
+        return (tmp_path / name).read_text()
+
+    def write(name, text):
+        (tmp_path / name).write_text(text)
+
+    return PipelineDAG([
+        Stage("a", step("a", lambda: write("a.out", transform(read("a.txt")))),
+              sources=(str(tmp_path / "a.txt"),), outputs=(str(tmp_path / "a.out"),)),
+        Stage("b", step("b", lambda: write("b.out", read("b.txt") * 2)),
+              sources=(str(tmp_path / "b.txt"),), outputs=(str(tmp_path / "b.out"),), params=params or {}),
+        Stage("merged", step("merged", lambda: write("merged.out", read("a.out") + read("b.out"))),
+              deps=("a", "b"), outputs=(str(tmp_path / "merged.out"),)),
+    ], str(tmp_path / "manifest.json"), workers=2)
+
+
+def test_only_invalidated_stages_rerun(workspace):
+    calls = []
+    assert sorted(build(workspace, calls).run()["ran"]) == ["a", "b", "merged"]
+    assert all(info["state"] == UP_TO_DATE for info in build(workspace, calls).status().values())
+
+    calls.clear()
+    assert build(workspace, calls).run()["ran"] == []
+    assert calls == []
+
+    (workspace / "b.txt").write_text("b2")
+    status = build(workspace, calls).status()
+    assert status["a"]["state"] == UP_TO_DATE
+    assert status["b"]["reason"] == "원본 파일 변경"
+    assert status["merged"]["reason"].startswith("선행 단계가 최신이 아님")
+    assert build(workspace, calls).run()["ran"] == ["b", "merged"]
+    assert (workspace / "merged.out").read_text() == "A1b2b2"
+
+
+def test_params_outputs_and_early_cutoff(workspace):
+    calls = []
+    build(workspace, calls).run()
+
+    calls.clear()
+    summary = build(workspace, calls, params={"repeat": 2}).run()
+    assert summary["reasons"]["b"] == "파라미터 변경"
+    # b 를 다시 계산했지만 출력 내용이 같으므로 merged 는 건너뜀
+    assert calls == ["b"]
+
+    (workspace / "merged.out").write_text("직접 수정")
+    calls.clear()
+    assert build(workspace, calls, params={"repeat": 2}).run()["ran"] == ["merged"]
+
+    calls.clear()
+    assert sorted(build(workspace, calls, params={"repeat": 2}).run(["a"], force=True)["ran"]) == ["a"]
+
+
+def test_independent_stages_run_in_parallel(workspace):
+    calls = []
+    started = time.perf_counter()
+    build(workspace, calls, delay=0.2).run()
+    # a, b 가 동시에 실행되면 0.4초 정도 (순서대로 실행하면 0.6초)
+    assert time.perf_counter() - started < 0.55
+    assert set(calls[:2]) == {"a", "b"} and calls[-1] == "merged"
+
+
+def test_failure_blocks_dependents_only(workspace):
+    calls = []
+    with pytest.raises(PipelineError) as e:
+        build(workspace, calls, fail=("b",)).run()
+    assert list(e.value.failed) == ["b"]
+    assert "merged" not in calls and "a" in calls
+
+    calls.clear()
+    assert build(workspace, calls).run()["ran"] == ["b", "merged"]
+
+
+def test_invalid_graphs_are_rejected(tmp_path):
+    noop = lambda: None
+    with pytest.raises(ValueError, match="순환"):
+        PipelineDAG([Stage("x", noop, (), deps=("y",)), Stage("y", noop, (), deps=("x",))], str(tmp_path / "m.json"))
+    with pytest.raises(ValueError, match="없는 단계"):
+        PipelineDAG([Stage("x", noop, (), deps=("z",))], str(tmp_path / "m.json"))
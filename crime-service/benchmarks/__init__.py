@@ -0,0 +1,3 @@
+"""
+crime 서비스 성능 측정 스크립트
+"""
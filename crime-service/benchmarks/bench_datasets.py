@@ -0,0 +1,76 @@
+"""
+중간 데이터셋 저장 형식별 로드 + 병합 시간 비교 (CSV / Feather / Parquet)
+
+지표 생성(build_merged_dataset_and_indicators)처럼 cctv / pop / police_norm 세 데이터셋을 읽어
+자치구로 병합하는 시간을 잽니다. --rows 로 자치구(행) 수를 늘려 데이터가 커질 때를 흉내 냅니다.
+
+실행 (crime-service 디렉토리에서):
+    python -m benchmarks.bench_datasets --rows 200000
+"""
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from app.domain.model.dataset_schema import read_dataset, write_dataset
+
+CRIME_TYPES = ('살인', '강도', '강간', '절도', '폭력')
+
+
+def make_datasets(rows: int):
+    rng = np.random.default_rng(0)
+    districts = [f"구{i}" for i in range(rows)]
+    cctv = pd.DataFrame({"자치구": districts, "소계": rng.integers(100, 5000, rows)})
+    pop = pd.DataFrame({"자치구": districts, **{
+        column: rng.integers(1000, 600000, rows).astype(float) for column in ('인구수', '한국인', '외국인', '고령자')
+    }})
+    police_norm = pd.DataFrame({"자치구": districts, **{
+        column: rng.random(rows) for column in (*CRIME_TYPES, *(f"{c}검거율" for c in CRIME_TYPES), '범죄', '검거')
+    }})
+    return {"cctv_in_seoul": cctv, "pop_in_seoul": pop, "police_norm_in_seoul": police_norm}
+
+
+def merge(frames) -> pd.DataFrame:
+    merged = pd.merge(frames["cctv_in_seoul"], frames["pop_in_seoul"], on="자치구", how="outer")
+    return pd.merge(merged, frames["police_norm_in_seoul"], on="자치구", how="outer")
+
+
+def measure(label: str, load, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        merge(load())
+        best = min(best, time.perf_counter() - started)
+    print(f"{label:<10} {best * 1000:9.1f} ms")
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    datasets = make_datasets(args.rows)
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_dir, feather_dir, parquet_dir = (os.path.join(tmp, name) for name in ("csv", "feather", "parquet"))
+        os.makedirs(csv_dir)
+        for name, df in datasets.items():
+            # 기존 파이프라인과 같은 CSV (읽을 때 thousands=',' 로 파싱)
+            df.to_csv(os.path.join(csv_dir, name + ".csv"), index=False, float_format="%.6f")
+            write_dataset(df, feather_dir, name, fmt="feather")
+            write_dataset(df, parquet_dir, name, fmt="parquet")
+
+        print(f"rows={args.rows} (로드 + 병합, {args.repeat}회 중 최소)")
+        csv = measure("csv", lambda: {n: pd.read_csv(os.path.join(csv_dir, n + ".csv"), thousands=",") for n in datasets},
+                      args.repeat)
+        feather = measure("feather", lambda: {n: read_dataset(feather_dir, n) for n in datasets}, args.repeat)
+        measure("parquet", lambda: {n: read_dataset(parquet_dir, n) for n in datasets}, args.repeat)
+        print(f"feather / csv = {feather / csv:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""
+블로킹 연산을 async 핸들러 안에서 바로 실행할 때와 실행기 풀(run_blocking)로 넘길 때의
+동시 요청 지연 시간 비교
+
+전처리와 비슷한 pandas 연산(merge + groupby)을 하는 느린 요청을 여러 개 동시에 보내면서,
+그 사이 일정 간격으로 들어오는 가벼운 요청(/health)의 지연 시간을 잽니다.
+인라인 실행에서는 느린 요청이 이벤트 루프를 막아 가벼운 요청도 그만큼 기다리게 됩니다.
+
+실행 (crime-service 디렉토리에서):
+    python -m benchmarks.bench_executor --slow 8 --rows 300000
+"""
+import os
+
+# 스팬 파일 기록은 측정 대상이 아니므로 끔
+os.environ.setdefault("TRACING_ENABLED", "false")
+
+import argparse
+import asyncio
+import time
+from typing import List
+
+import httpx
+import numpy as np
+import pandas as pd
+from fastapi import FastAPI
+
+from app.platform.executor import BlockingExecutor
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+def make_frames(rows: int):
+    rng = np.random.default_rng(0)
+    crime = pd.DataFrame({
+        "관서명": rng.integers(0, 31, rows).astype(str),
+        "살인 발생": rng.integers(0, 10, rows),
+        "강도 발생": rng.integers(0, 50, rows),
+        "절도 발생": rng.integers(0, 500, rows),
+    })
+    police = pd.DataFrame({"관서명": [str(i) for i in range(31)], "자치구": [f"구{i % 25}" for i in range(31)]})
+    return crime, police
+
+
+def preprocess_like(crime: pd.DataFrame, police: pd.DataFrame) -> int:
+    merged = crime.merge(police, on="관서명")
+    grouped = merged.groupby("자치구")[["살인 발생", "강도 발생", "절도 발생"]].sum()
+    normalized = grouped / grouped.max()
+    return int(normalized.rank().sum().sum())
+
+
+def build_app(mode: str, executor: BlockingExecutor, crime: pd.DataFrame, police: pd.DataFrame) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/slow")
+    async def slow():
+        if mode == "inline":
+            return {"result": preprocess_like(crime, police)}
+        return {"result": await executor.run(preprocess_like, crime, police)}
+
+    @app.get("/health")
+    async def health():
+        return {"status": "ok"}
+
+    return app
+
+
+async def measure(mode: str, slow: int, fast: int, crime: pd.DataFrame, police: pd.DataFrame, workers: int,
+                  slow_interval: float = 0.05, fast_interval: float = 0.01) -> dict:
+    executor = BlockingExecutor(kind="thread", workers=workers, max_concurrency=workers, max_pending=slow * 2)
+    app = build_app(mode, executor, crime, police)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://crime", timeout=None) as client:
+        await client.get("/slow")  # 워밍업
+        slow_latencies: List[float] = []
+        fast_latencies: List[float] = []
+        started = time.perf_counter()
+
+        # 지연 시간은 예정된 전송 시각부터 잼 (루프가 막혀 늦게 보낸 시간도 지연에 포함)
+        async def call(path: str, scheduled: float, latencies: List[float]):
+            delay = scheduled - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            await client.get(path)
+            latencies.append(time.perf_counter() - scheduled)
+
+        await asyncio.gather(
+            *(call("/slow", started + i * slow_interval, slow_latencies) for i in range(slow)),
+            *(call("/health", started + i * fast_interval, fast_latencies) for i in range(fast)),
+        )
+        elapsed = time.perf_counter() - started
+    executor.close()
+    return {
+        "elapsed": elapsed,
+        "slow_p50": percentile(slow_latencies, 50),
+        "fast_p50": percentile(fast_latencies, 50),
+        "fast_p99": percentile(fast_latencies, 99),
+        "fast_max": max(fast_latencies),
+    }
+
+
+async def main(slow: int, fast: int, rows: int, workers: int) -> None:
+    crime, police = make_frames(rows)
+    started = time.perf_counter()
+    preprocess_like(crime, police)
+    print(f"[느린 요청 1회 (pandas merge + groupby, {rows}행)] {(time.perf_counter() - started) * 1000:.0f}ms, CPU {os.cpu_count()}개")
+    print(f"[느린 요청 {slow}개 동시 + 가벼운 요청 {fast}개]")
+    for mode in ("inline", "run_blocking"):
+        result = await measure(mode, slow, fast, crime, police, workers)
+        print(
+            f"{mode:<13} 전체 {result['elapsed']:.2f}s  느린 p50 {result['slow_p50'] * 1000:.0f}ms  "
+            f"가벼운 p50 {result['fast_p50'] * 1000:.1f}ms  p99 {result['fast_p99'] * 1000:.1f}ms  "
+            f"max {result['fast_max'] * 1000:.1f}ms"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="블로킹 연산 실행기 전후 동시 요청 지연 시간 비교")
+    parser.add_argument("--slow", type=int, default=8, help="동시에 보내는 느린 요청 수")
+    parser.add_argument("--fast", type=int, default=100, help="가벼운 요청 수")
+    parser.add_argument("--rows", type=int, default=300_000)
+    parser.add_argument("--workers", type=int, default=2)
+    args = parser.parse_args()
+    asyncio.run(main(args.slow, args.fast, args.rows, args.workers))
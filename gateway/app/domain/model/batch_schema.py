@@ -0,0 +1,44 @@
+from typing import Any, Dict, List, Optional, Union
+from pydantic import BaseModel, Field
+from app.domain.model.service_type import ServiceType
+
+
+# ✅ 배치 요청 모델 (/ai/v1/batch)
+class BatchItem(BaseModel):
+    """배치 안의 하위 요청 하나 (/ai/v1/{service}/{path} 호출과 같은 의미)"""
+    id: Optional[str] = Field(None, description="응답에서 결과를 찾을 때 쓰는 식별자 (기본값: 순번)")
+    service: ServiceType
+    method: str = "GET"
+    path: str
+    query: Dict[str, Union[str, int, float, bool]] = Field(default_factory=dict)
+    headers: Dict[str, str] = Field(default_factory=dict, description="이 하위 요청에만 추가할 헤더")
+    body: Optional[Any] = Field(None, description="JSON 본문 (GET 이 아닌 요청)")
+
+
+class BatchRequest(BaseModel):
+    requests: List[BatchItem] = Field(..., min_length=1)
+    timeout: Optional[float] = Field(None, gt=0, description="배치 전체 제한 시간 (초)")
+
+
+# ✅ 배치 응답 모델
+class BatchItemResult(BaseModel):
+    id: str
+    service: ServiceType
+    status: int
+    headers: Dict[str, str] = Field(default_factory=dict)
+    body: Any = None
+    body_encoding: Optional[str] = Field(None, description="본문이 바이너리면 base64")
+    elapsed_ms: float
+
+
+class BatchSummary(BaseModel):
+    total: int
+    succeeded: int
+    failed: int
+    timed_out: int
+    elapsed_ms: float
+
+
+class BatchResponse(BaseModel):
+    results: List[BatchItemResult]
+    summary: BatchSummary
@@ -1,54 +1,74 @@
-from typing import Dict, Any, Tuple, List, Union, Callable
+from typing import Dict, Any, Tuple, List, Union, Callable, Optional, AsyncIterator
 from fastapi import HTTPException, status
 import httpx
 import logging
 import json as json_module
 from app.domain.model.service_type import SERVICE_URLS, ServiceType
+from app.foundation.infrastructure.http_client_registry import client_registry
+from app.foundation.core.resilience import resilience, CircuitOpenError
+from app.foundation.core.admission import admission, AdmissionRejected
+from app.foundation.infrastructure.load_balancer import load_balancer, Replica
+from app.platform.tracing import span, trace_headers
 
-# 로깅 설정
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+# 로깅 설정은 app.platform.logging_setup 에서 루트 로거에 한 번만 적용
 logger = logging.getLogger("service_proxy")
 
+SUPPORTED_METHODS = frozenset(("GET", "POST", "PUT", "DELETE", "PATCH"))
+
+# 업스트림으로 전달하지 않는 요청 헤더 (httpx 가 다시 계산)
+PROXY_EXCLUDED_HEADERS = frozenset(("host", "content-length"))
+
 class ServiceProxyFactory:
     def __init__(self, service_type: ServiceType):
         self.service_type = service_type
         self.base_url = SERVICE_URLS.get(service_type)
+        # 서비스 URL 값은 콤마로 구분된 레플리카 목록일 수 있음
+        self.pool = load_balancer.pool(service_type)
 
-        if not self.base_url:
+        if not self.pool:
             error_msg = f"서비스 URL을 찾을 수 없습니다: {service_type}"
             logger.error(error_msg)
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=error_msg)
 
-        logger.info(f"서비스 프록시 생성: {service_type} → {self.base_url}")
+        logger.debug("서비스 프록시 생성: %s → %s", service_type.value, self.base_url)
+
+    def _url(self, replica: Replica, path: str, query: str = "") -> str:
+        """레플리카 주소와 요청 경로(+ 클라이언트 쿼리 문자열)로 업스트림 URL 을 만듭니다."""
+        url = f"{replica.url}/{path}" if not path.startswith("http") else path
+        return f"{url}?{query}" if query else url
 
-    async def _send_json_or_content(self, request_method: Callable, url: str, headers: Dict[str, str], 
-                                   json: Any = None, body: Any = None):
+    async def _send_json_or_content(self, client: httpx.AsyncClient, method: str, url: str, headers: Dict[str, str],
+                                   json: Any = None, body: Any = None, content: Optional[bytes] = None):
         """
         JSON 또는 일반 콘텐츠를 전송하는 내부 헬퍼 메서드입니다.
         
         Args:
-            request_method: 요청 메서드 (client.post, client.put 등)
+            client: 서비스 공유 HTTP 클라이언트
+            method: 대문자 HTTP 메서드
             url: 요청 URL
             headers: 요청 헤더
             json: JSON 데이터 (선택적)
             body: 본문 데이터 (선택적)
+            content: 그대로 전송할 본문 바이트 (선택적)
             
         Returns:
             요청 응답 객체
         """
+        if content is not None:
+            return await client.request(method, url, headers=headers, content=content)
         if json is not None:
-            return await request_method(url, headers=headers, json=json)
+            return await client.request(method, url, headers=headers, json=json)
         elif body:
             if isinstance(body, str):
                 try:
                     json_data = json_module.loads(body)
-                    return await request_method(url, headers=headers, json=json_data)
+                    return await client.request(method, url, headers=headers, json=json_data)
                 except json_module.JSONDecodeError:
-                    return await request_method(url, headers=headers, content=body)
+                    return await client.request(method, url, headers=headers, content=body)
             else:
-                return await request_method(url, headers=headers, json=body)
+                return await client.request(method, url, headers=headers, json=body)
         else:
-            return await request_method(url, headers=headers)
+            return await client.request(method, url, headers=headers)
 
     async def request(
         self,
@@ -58,7 +78,9 @@ class ServiceProxyFactory:
         body: Any = None,
         files: Dict[str, Tuple[str, bytes, str]] = None,
         form_data: Dict[str, str] = None,
-        json: Any = None
+        json: Any = None,
+        content: Optional[bytes] = None,
+        query: str = ""
     ):
         """
         HTTP 요청을 보내는 메서드입니다.
@@ -71,14 +93,12 @@ class ServiceProxyFactory:
             files: 업로드할 파일 (선택적)
             form_data: 폼 데이터 (선택적)
             json: JSON 데이터 (선택적)
+            content: 디코딩 없이 그대로 전송할 본문 바이트 (선택적)
+            query: 업스트림에 그대로 붙일 쿼리 문자열 (선택적)
             
         Returns:
             요청 응답 객체
         """
-        # URL 준비
-        url = f"{self.base_url}/{path}" if not path.startswith("http") else path
-        logger.info(f"요청 URL: {url}")
-
         # 요청 헤더 준비
         request_headers = {}
         if headers:
@@ -87,68 +107,192 @@ class ServiceProxyFactory:
                 headers = {k.decode(): v.decode() for k, v in headers}
             
             # 필터링된 헤더 생성
-            for k, v in headers.items():
-                if k.lower() not in ['host', 'content-length']:
-                    request_headers[k] = v
+            request_headers = {k: v for k, v in headers.items() if k.lower() not in PROXY_EXCLUDED_HEADERS}
 
-        # 타임아웃 설정
-        timeout = httpx.Timeout(30.0)
-        
-        # HTTP 메서드 맵핑
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            try:
-                # HTTP 메서드 맵핑 딕셔너리
-                method_map = {
-                    'POST': client.post,
-                    'GET': client.get,
-                    'PUT': client.put,
-                    'DELETE': client.delete,
-                    'PATCH': client.patch
-                }
-                
-                # 요청 메서드 선택
-                request_method = method_map.get(method.upper())
-                if not request_method:
-                    error_msg = f"지원하지 않는 HTTP 메서드: {method}"
-                    logger.error(error_msg)
-                    raise HTTPException(
-                        status_code=status.HTTP_405_METHOD_NOT_ALLOWED,
-                        detail=error_msg
-                    )
+        # 공유 커넥션 풀 클라이언트 (lifespan 에서 생성/종료)
+        client = client_registry.get(self.service_type)
+        method = method.upper()
+
+        try:
+            if method not in SUPPORTED_METHODS:
+                error_msg = f"지원하지 않는 HTTP 메서드: {method}"
+                logger.error(error_msg)
+                raise HTTPException(
+                    status_code=status.HTTP_405_METHOD_NOT_ALLOWED,
+                    detail=error_msg
+                )
+            
+            form_data = form_data or None  # 빈 dict 방지
+            
+            async def send():
+                # 시도마다 레플리카를 다시 골라 재시도/헤징이 다른 레플리카로 갈 수 있게 함
+                replica = self.pool.pick()
+                url = self._url(replica, path, query)
+                logger.info("요청 URL: %s %s", method, url)
                 
-                # POST 메서드의 파일 업로드 특수 처리
-                if method.upper() == 'POST' and files:
-                    logger.info(f"POST 파일 업로드 요청 전송: {url}")
-                    form_data = form_data or None  # 빈 dict 방지
-                    response = await client.post(
+                with self.pool.track(replica), span("gateway.upstream", service=self.service_type.value, url=url) as attempt:
+                    # 시도 스팬이 업스트림 서버 스팬의 부모가 되도록 traceparent 갱신
+                    attempt_headers = {**request_headers, **trace_headers()}
+                    # POST 메서드의 파일 업로드 특수 처리
+                    if method == 'POST' and files:
+                        logger.info("POST 파일 업로드 요청 전송: %s", url)
+                        response = await client.post(
+                            url,
+                            headers=attempt_headers,
+                            files=files,
+                            data=form_data
+                        )
+                    else:
+                        # 일반 요청 처리 (JSON 또는 콘텐츠)
+                        response = await self._send_json_or_content(
+                            client=client,
+                            method=method,
+                            url=url,
+                            headers=attempt_headers,
+                            json=json,
+                            body=body,
+                            content=content
+                        )
+                    attempt.set("http.status_code", response.status_code)
+                    return response
+            
+            # 서비스별 동시 실행 슬롯을 얻은 뒤 차단기/재시도/헤징 정책을 적용해 전송 (재시도는 멱등 메서드만)
+            async with admission.get(self.service_type).slot():
+                response = await resilience.get(self.service_type).call(method, send)
+
+            logger.info("응답 상태 코드: %d", response.status_code)
+            return response
+
+        except CircuitOpenError as e:
+            logger.warning(str(e))
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail=str(e),
+                headers={"Retry-After": str(max(1, round(e.retry_after)))}
+            )
+        except AdmissionRejected as e:
+            logger.warning(str(e))
+            raise HTTPException(
+                status_code=e.status_code,
+                detail=str(e),
+                headers={"Retry-After": str(max(1, round(e.retry_after)))}
+            )
+        except httpx.TimeoutException as e:
+            error_msg = f"요청 시간 초과: {type(e).__name__}"
+            logger.error(error_msg)
+            raise HTTPException(
+                status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+                detail=error_msg
+            )
+        except httpx.RequestError as e:
+            error_msg = f"요청 중 오류 발생: {str(e)}"
+            logger.error(error_msg)
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail=error_msg
+            )
+
+    async def stream(
+        self,
+        method: str,
+        path: str,
+        headers: Union[List[Tuple[bytes, bytes]], Dict[str, str]] = None,
+        content: Optional[AsyncIterator[bytes]] = None,
+        read_timeout: Optional[float] = None,
+        query: str = ""
+    ) -> httpx.Response:
+        """
+        요청 본문과 응답 본문을 메모리에 올리지 않고 그대로 흘려보내는 스트리밍 요청 메서드입니다.
+        반환된 응답은 아직 읽히지 않은 상태이므로 호출자가 aiter_raw() 로 소비한 뒤 aclose() 해야 합니다.
+        
+        Args:
+            method: HTTP 메서드
+            path: 요청 경로
+            headers: 요청 헤더 (content-length 는 유지하여 chunked 전송을 피함)
+            content: 업스트림으로 전달할 요청 본문 스트림 (선택적)
+            read_timeout: 클라이언트 기본 read 타임아웃 대신 사용할 값 (선택적, SSE 등 긴 스트림용)
+            query: 업스트림에 그대로 붙일 쿼리 문자열 (선택적)
+            
+        Returns:
+            스트리밍 모드의 응답 객체
+        """
+        replica = self.pool.pick()
+        url = self._url(replica, path, query)
+        logger.info("스트리밍 요청 URL: %s %s", method.upper(), url)
+
+        if isinstance(headers, list):
+            headers = {k.decode(): v.decode() for k, v in headers}
+        request_headers = {k: v for k, v in (headers or {}).items() if k.lower() != 'host'}
+
+        client = client_registry.get(self.service_type)
+        guard = resilience.get(self.service_type)
+        timeout = client.timeout if read_timeout is None else httpx.Timeout(read_timeout, connect=client.timeout.connect)
+        try:
+            # 본문 스트림은 한 번만 읽을 수 있으므로 재시도/헤징 없이 차단기만 적용
+            # 슬롯은 응답 헤더를 받을 때까지만 점유 (백엔드 연산은 헤더 전에 끝남)
+            async with admission.get(self.service_type).slot():
+                with self.pool.track(replica), span("gateway.upstream", service=self.service_type.value, url=url, streaming=True) as attempt:
+                    upstream_request = client.build_request(
+                        method.upper(),
                         url,
-                        headers=request_headers,
-                        files=files,
-                        data=form_data
-                    )
-                # 일반 요청 처리 (JSON 또는 콘텐츠)
-                else:
-                    if method.upper() == 'POST':
-                        log_msg = "POST JSON 요청 전송"
-                        if json is not None:
-                            log_msg += "(직접 json 파라미터 사용)"
-                        logger.info(f"{log_msg}: {url}")
-                    
-                    response = await self._send_json_or_content(
-                        request_method=request_method,
-                        url=url,
-                        headers=request_headers,
-                        json=json,
-                        body=body
+                        headers={**request_headers, **trace_headers()},
+                        content=content,
+                        timeout=timeout
                     )
+                    response = await guard.call_once(lambda: client.send(upstream_request, stream=True))
+                    attempt.set("http.status_code", response.status_code)
+            logger.info("스트리밍 응답 상태 코드: %d", response.status_code)
+            return response
+        except CircuitOpenError as e:
+            logger.warning(str(e))
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail=str(e),
+                headers={"Retry-After": str(max(1, round(e.retry_after)))}
+            )
+        except AdmissionRejected as e:
+            logger.warning(str(e))
+            raise HTTPException(
+                status_code=e.status_code,
+                detail=str(e),
+                headers={"Retry-After": str(max(1, round(e.retry_after)))}
+            )
+        except httpx.TimeoutException as e:
+            error_msg = f"스트리밍 요청 시간 초과: {type(e).__name__}"
+            logger.error(error_msg)
+            raise HTTPException(
+                status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+                detail=error_msg
+            )
+        except httpx.RequestError as e:
+            error_msg = f"스트리밍 요청 중 오류 발생: {str(e)}"
+            logger.error(error_msg)
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail=error_msg
+            )
 
-                logger.info(f"응답 상태 코드: {response.status_code}")
-                return response
 
-            except httpx.RequestError as e:
-                error_msg = f"요청 중 오류 발생: {str(e)}"
-                logger.error(error_msg)
-                raise HTTPException(
-                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                    detail=error_msg
-                )
\ No newline at end of file
+# ✅ 서비스별 프록시 인스턴스 캐시
+# 인스턴스에는 요청별 상태가 없으므로 재사용하고, 서비스 URL 이 바뀌어 레플리카 풀이 새로 만들어지면 다시 생성
+_proxies: Dict[ServiceType, ServiceProxyFactory] = {}
+
+
+def get_service_proxy(service_type: ServiceType) -> ServiceProxyFactory:
+    """
+    서비스의 프록시 인스턴스를 반환합니다.
+
+    Args:
+        service_type: 서비스 타입
+
+    Returns:
+        캐시된 ServiceProxyFactory (레플리카 풀이 바뀌었으면 새로 생성)
+
+    Raises:
+        HTTPException: 서비스 URL 이 설정되지 않은 경우 (404)
+    """
+    proxy = _proxies.get(service_type)
+    if proxy is None or proxy.pool is not load_balancer.pool(service_type):
+        proxy = ServiceProxyFactory(service_type=service_type)
+        _proxies[service_type] = proxy
+    return proxy
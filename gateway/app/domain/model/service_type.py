@@ -21,6 +21,7 @@ TF_SERVICE_URL = os.getenv("TF_SERVICE_URL")
 CHATBOT_SERVICE_URL = os.getenv("CHATBOT_SERVICE_URL")
 
 # ✅ 서비스 URL 매핑
+# 값은 콤마로 구분된 레플리카 목록일 수 있음 (예: CRIME_SERVICE_URL=http://crime-1:9002,http://crime-2:9002)
 SERVICE_URLS = {
     ServiceType.TITANIC: TITANIC_SERVICE_URL,
     ServiceType.CRIME: CRIME_SERVICE_URL,
@@ -30,6 +31,17 @@ SERVICE_URLS = {
     ServiceType.CHATBOT: CHATBOT_SERVICE_URL,
 }
 
+# ✅ 게이트웨이 공개 API 경로 (/ai/v1/{service}/...)
+API_PREFIX = "/ai/v1"
+
+# ✅ 스트리밍 패스스루 모드 서비스
+# 요청/응답 본문을 디코딩하지 않고 그대로 흘려보냄 (대용량 업로드, HTML 지도 등)
+STREAMING_SERVICES = frozenset(
+    ServiceType(name.strip())
+    for name in os.getenv("GATEWAY_STREAMING_SERVICES", "tf,crime").split(",")
+    if name.strip()
+)
+
 # (선택) 필요하다면 도메인도 별도로 활용 가능
 # 예시
 print(f"도메인: {DOMAIN}")
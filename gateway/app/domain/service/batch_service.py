@@ -0,0 +1,244 @@
+import os
+import json
+import time
+import base64
+import asyncio
+import logging
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlencode
+from fastapi import HTTPException, Request, status
+from starlette.responses import Response
+import httpx
+
+from app.domain.model.batch_schema import BatchItem, BatchRequest
+from app.domain.model.service_type import API_PREFIX
+from app.domain.model.service_proxy_factory import SUPPORTED_METHODS
+from app.domain.service.request_service import JOB_EVENTS_PATH, dispatch_body, dispatch_get, enforce_rate_limit
+from app.foundation.utils.request_utils import clean_request_path, PASSTHROUGH_RESPONSE_HEADERS
+from app.platform.gateway_metrics import observe_batch_item
+from app.platform.tracing import span
+
+logger = logging.getLogger("domain.service.batch_service")
+
+# ✅ 배치 설정
+# 한 배치에 담을 수 있는 하위 요청 수
+GATEWAY_BATCH_MAX_ITEMS = int(os.getenv("GATEWAY_BATCH_MAX_ITEMS", "20"))
+# 배치 전체 제한 시간 (요청의 timeout 이 없을 때 기본값 / 요청할 수 있는 최대값, 초)
+GATEWAY_BATCH_TIMEOUT = float(os.getenv("GATEWAY_BATCH_TIMEOUT", "10"))
+GATEWAY_BATCH_MAX_TIMEOUT = float(os.getenv("GATEWAY_BATCH_MAX_TIMEOUT", "30"))
+# 결과 하나에 담을 수 있는 본문 크기 (큰 지도 HTML 등은 개별 호출로 받아야 함)
+GATEWAY_BATCH_MAX_ITEM_BYTES = int(os.getenv("GATEWAY_BATCH_MAX_ITEM_BYTES", str(4 * 1024 * 1024)))
+
+# 하위 요청에 넘기지 않는 배치 요청 헤더 (본문 관련 헤더는 하위 요청마다 다시 만듦)
+BATCH_EXCLUDED_HEADERS = frozenset(['content-length', 'content-type', 'transfer-encoding', 'content-encoding'])
+# 텍스트로 돌려줄 Content-Type
+TEXT_CONTENT_TYPES = ('text/', 'application/xml', 'application/javascript')
+
+TIMED_OUT = "timeout"
+
+
+def build_item_request(parent: Request, item: BatchItem, path: str) -> Request:
+    """
+    하위 요청을 일반 프록시 요청과 같은 형태의 Request 로 만듭니다.
+    배치 요청의 헤더(인증, 추적 등)를 이어받고, 하위 요청의 헤더/쿼리/JSON 본문을 덧씌웁니다.
+
+    Args:
+        parent: 배치 요청 객체
+        item: 하위 요청
+        path: 정규화된 하위 요청 경로
+
+    Returns:
+        하위 요청용 Request 객체
+    """
+    body = json.dumps(item.body).encode() if item.body is not None else b""
+    headers = {k: v for k, v in parent.headers.items() if k not in BATCH_EXCLUDED_HEADERS}
+    headers.update((k.lower(), v) for k, v in item.headers.items())
+    if body:
+        headers['content-type'] = 'application/json'
+        headers['content-length'] = str(len(body))
+
+    scope = {
+        **parent.scope,
+        "method": item.method.upper(),
+        "path": f"{API_PREFIX}/{item.service.value}/{path}",
+        "raw_path": f"{API_PREFIX}/{item.service.value}/{path}".encode(),
+        "query_string": urlencode(item.query).encode(),
+        "headers": [(k.encode('latin-1'), v.encode('latin-1')) for k, v in headers.items()],
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    return Request(scope, receive)
+
+
+def encode_item_body(response: httpx.Response) -> Tuple[object, Optional[str]]:
+    """
+    업스트림 응답 본문을 배치 응답에 넣을 값으로 바꿉니다.
+    JSON 은 파싱해서 그대로 넣고, 텍스트는 문자열로, 그 외 바이너리는 base64 로 넣습니다.
+
+    Returns:
+        (본문 값, 인코딩) 튜플 - 인코딩은 base64 일 때만 값이 있음
+    """
+    if not response.content:
+        return None, None
+    content_type = response.headers.get('content-type', '')
+    if 'json' in content_type:
+        try:
+            return json.loads(response.content), None
+        except ValueError:
+            return response.text, None
+    if content_type.startswith(TEXT_CONTENT_TYPES):
+        return response.text, None
+    return base64.b64encode(response.content).decode('ascii'), 'base64'
+
+
+def error_result(status_code: int, error: str, headers: Optional[Dict[str, str]] = None) -> dict:
+    return {"status": status_code, "headers": headers or {}, "body": {"error": error}, "body_encoding": None}
+
+
+class BatchExecutor:
+    """
+    배치 요청의 하위 요청들을 동시에 실행하고 결과를 하나의 응답으로 모읍니다.
+    - 하위 요청은 일반 프록시와 같은 디스패처를 거치므로 속도 제한/캐시/요청 합치기/입장 제어/차단기/재시도가 그대로 적용
+    - 서비스별 공유 커넥션 풀을 사용하므로 여러 하위 요청의 업스트림 지연이 겹쳐서 진행
+    - 배치 전체 제한 시간이 지나면 끝나지 않은 하위 요청을 취소하고 504 로 표시
+    """
+
+    def __init__(self, max_items: int = GATEWAY_BATCH_MAX_ITEMS, default_timeout: float = GATEWAY_BATCH_TIMEOUT,
+                 max_timeout: float = GATEWAY_BATCH_MAX_TIMEOUT, max_item_bytes: int = GATEWAY_BATCH_MAX_ITEM_BYTES):
+        self.max_items = max_items
+        self.default_timeout = default_timeout
+        self.max_timeout = max_timeout
+        self.max_item_bytes = max_item_bytes
+        self.batches = 0
+        self.items = 0
+        self.timed_out = 0
+
+    async def run_item(self, parent: Request, item: BatchItem) -> dict:
+        """
+        하위 요청 하나를 실행합니다. 오류는 예외 대신 결과의 status/body 로 돌려줍니다.
+
+        Args:
+            parent: 배치 요청 객체
+            item: 하위 요청
+
+        Returns:
+            {"status", "headers", "body", "body_encoding"} 딕셔너리
+        """
+        method = item.method.upper()
+        path = clean_request_path(item.path.lstrip('/'))
+        if method not in SUPPORTED_METHODS:
+            return error_result(status.HTTP_405_METHOD_NOT_ALLOWED, f"지원하지 않는 HTTP 메서드: {method}")
+        if JOB_EVENTS_PATH.search(path):
+            return error_result(status.HTTP_400_BAD_REQUEST, "작업 이벤트(SSE) 스트림은 배치로 요청할 수 없습니다.")
+
+        # 쿼리는 경로에 붙이지 않고 하위 요청의 query_string 으로 넘김 (캐시 경로 매칭/업스트림 전달이 개별 호출과 같음)
+        request = build_item_request(parent, item, path)
+        try:
+            with span("gateway.batch.item", service=item.service.value, method=method, path=path):
+                # 하위 요청도 각각 클라이언트의 서비스별 한도에서 차감
+                await enforce_rate_limit(item.service, request)
+                # 결과를 하나의 JSON 으로 모으므로 스트리밍 서비스도 버퍼링 디스패처로 처리
+                if method == "GET":
+                    response = await dispatch_get(item.service, path, request, method)
+                else:
+                    response = await dispatch_body(item.service, path, request, method)
+        except HTTPException as e:
+            return error_result(e.status_code, str(e.detail), e.headers)
+        except Exception as e:
+            logger.error("배치 하위 요청 오류 (%s %s/%s): %s", method, item.service.value, path, e)
+            return error_result(status.HTTP_500_INTERNAL_SERVER_ERROR, str(e))
+
+        if isinstance(response, Response) or response.status_code == 304:
+            # 디스패처가 이미 만든 응답(스트림 등)이나 본문 없는 304 는 배치에 담지 않음
+            return {"status": response.status_code, "headers": {}, "body": None, "body_encoding": None}
+        if len(response.content) > self.max_item_bytes:
+            return error_result(
+                status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                f"응답 본문이 배치 한도({self.max_item_bytes} bytes)보다 큽니다. 개별 요청으로 받아 주세요."
+            )
+        body, encoding = encode_item_body(response)
+        headers = {k: v for k, v in response.headers.items() if k.lower() in PASSTHROUGH_RESPONSE_HEADERS}
+        return {"status": response.status_code, "headers": headers, "body": body, "body_encoding": encoding}
+
+    async def run(self, batch: BatchRequest, request: Request) -> dict:
+        """
+        배치의 하위 요청을 동시에 실행합니다.
+
+        Args:
+            batch: 배치 요청 본문
+            request: 배치 요청 객체
+
+        Returns:
+            {"results": [...], "summary": {...}} 딕셔너리 (results 는 요청 순서)
+
+        Raises:
+            HTTPException: 하위 요청 수가 GATEWAY_BATCH_MAX_ITEMS 를 넘은 경우 (413)
+        """
+        if len(batch.requests) > self.max_items:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=f"배치 하위 요청은 최대 {self.max_items}개입니다: {len(batch.requests)}개"
+            )
+        timeout = min(batch.timeout or self.default_timeout, self.max_timeout)
+        self.batches += 1
+        self.items += len(batch.requests)
+        started = time.perf_counter()
+
+        with span("gateway.batch", items=len(batch.requests), timeout=timeout):
+            elapsed: Dict[int, float] = {}
+
+            async def timed(index: int, item: BatchItem) -> dict:
+                try:
+                    return await self.run_item(request, item)
+                finally:
+                    elapsed[index] = (time.perf_counter() - started) * 1000
+
+            tasks = [asyncio.create_task(timed(index, item)) for index, item in enumerate(batch.requests)]
+            done, pending = await asyncio.wait(tasks, timeout=timeout)
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+        results: List[dict] = []
+        summary = {"total": len(tasks), "succeeded": 0, "failed": 0, "timed_out": 0}
+        for index, (item, task) in enumerate(zip(batch.requests, tasks)):
+            if task in done:
+                result, outcome = task.result(), None
+            else:
+                result = error_result(status.HTTP_504_GATEWAY_TIMEOUT, f"배치 제한 시간({timeout}s)을 넘었습니다.")
+                outcome = TIMED_OUT
+            if outcome == TIMED_OUT:
+                summary["timed_out"] += 1
+                self.timed_out += 1
+            elif result["status"] < 400:
+                summary["succeeded"] += 1
+            else:
+                summary["failed"] += 1
+            observe_batch_item(item.service.value, outcome or f"{result['status'] // 100}xx")
+            results.append({
+                "id": item.id if item.id is not None else str(index),
+                "service": item.service.value,
+                **result,
+                "elapsed_ms": round(elapsed.get(index, timeout * 1000), 2),
+            })
+        summary["elapsed_ms"] = round((time.perf_counter() - started) * 1000, 2)
+        logger.info("배치 완료: %s", summary)
+        return {"results": results, "summary": summary}
+
+    def stats(self) -> dict:
+        return {
+            "max_items": self.max_items,
+            "default_timeout": self.default_timeout,
+            "max_timeout": self.max_timeout,
+            "max_item_bytes": self.max_item_bytes,
+            "batches": self.batches,
+            "items": self.items,
+            "timed_out": self.timed_out,
+        }
+
+
+# ✅ 게이트웨이 전역 배치 실행기
+batch_executor = BatchExecutor()
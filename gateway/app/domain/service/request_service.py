@@ -1,15 +1,39 @@
+import os
+import re
+import math
 import json
-from typing import Optional
-from fastapi import Request, UploadFile
-from fastapi.responses import JSONResponse
+import time
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Awaitable, Callable, Mapping, Optional, Tuple
+from fastapi import HTTPException, Request, UploadFile, status
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from starlette.background import BackgroundTask
+import httpx
 import logging
 
-from app.domain.model.service_type import ServiceType
-from app.domain.model.service_proxy_factory import ServiceProxyFactory
-from app.foundation.utils.request_utils import clean_request_path, prepare_headers, prepare_body
+from app.domain.model.service_type import ServiceType, STREAMING_SERVICES
+from app.domain.model.service_proxy_factory import get_service_proxy, SUPPORTED_METHODS
+from app.foundation.core.single_flight import request_coalescer, make_flight_key
+from app.foundation.core.rate_limit import rate_limiter, RateLimited
+from app.foundation.core.transform import transforms
+# 서비스별 변환 등록 (라우팅 테이블을 만들기 전에 import)
+import app.domain.service.transforms  # noqa: F401
+from app.foundation.infrastructure.response_cache import response_cache, CachedResponse
+from app.platform.tracing import span
+from app.platform.logging_setup import lazy
+from app.foundation.utils.request_utils import (
+    clean_request_path, prepare_headers, prepare_body,
+    prepare_streaming_headers, read_form_fields, HOP_BY_HOP_HEADERS, PASSTHROUGH_RESPONSE_HEADERS
+)
 
 logger = logging.getLogger("domain.service.request_service")
 
+# ✅ 서비스 비동기 작업의 진행 이벤트(SSE) 경로 - 서비스와 무관하게 스트리밍으로 전달
+JOB_EVENTS_PATH = re.compile(r'(?:^|/)jobs/[^/]+/events$')
+# SSE 는 하트비트 사이 간격만큼 읽을 데이터가 없으므로 서비스 read 타임아웃 대신 사용
+GATEWAY_JOB_EVENTS_READ_TIMEOUT = float(os.getenv("GATEWAY_JOB_EVENTS_READ_TIMEOUT", "60"))
+
 async def handle_file_upload_request(service: ServiceType, path: str, request: Request, headers: dict, file: UploadFile, json_data: Optional[str] = None):
     """
     파일 업로드 요청 처리를 위한 함수입니다.
@@ -25,10 +49,9 @@ async def handle_file_upload_request(service: ServiceType, path: str, request: R
     Returns:
         처리된 응답 객체
     """
-    # 파일 데이터 준비
-    file_content = await file.read()
+    # 파일 데이터 준비 (파일 객체를 그대로 넘겨 httpx 가 청크 단위로 읽도록 함)
     await file.seek(0)
-    files = {"file": (file.filename, file_content, file.content_type)}
+    files = {"file": (file.filename, file.file, file.content_type)}
     
     # Form 데이터 처리
     form_data = None
@@ -39,7 +62,7 @@ async def handle_file_upload_request(service: ServiceType, path: str, request: R
             form_data = {"data": json_data}
     
     # 서비스 프록시 생성
-    factory = ServiceProxyFactory(service_type=service)
+    factory = get_service_proxy(service)
     
     # 파일 업로드 요청 전송
     response = await factory.request(
@@ -47,14 +70,158 @@ async def handle_file_upload_request(service: ServiceType, path: str, request: R
         path=path,
         headers=headers,
         files=files,
-        form_data=form_data
+        form_data=form_data,
+        query=request.url.query
     )
     
     return response
 
+async def dispatch_get(service: ServiceType, path: str, request: Request, method: str,
+                       json_data: Optional[str] = None, file: Optional[UploadFile] = None):
+    """
+    GET 요청 디스패처입니다.
+    - 캐시 정책이 있는 경로는 캐시에서 먼저 응답 (캐시를 위해 본문을 버퍼링, 인증 헤더가 있으면 캐시하지 않음)
+    - 진행 중인 동일 요청이 있으면 업스트림 호출을 공유
+    - 작업 진행 이벤트(SSE)는 버퍼링 없이 스트리밍으로 전달
+    """
+    if JOB_EVENTS_PATH.search(path):
+        return await handle_streaming_request(service, path, request, method, read_timeout=GATEWAY_JOB_EVENTS_READ_TIMEOUT)
+    ttl = response_cache.ttl_for_request(path, request.headers)
+    if ttl:
+        return await handle_cached_request(service, path, request, ttl)
+    
+    factory = get_service_proxy(service)
+    headers = prepare_headers(request, service)
+    flight_key = make_flight_key(method, service.value, path, request.url.query, request.headers)
+    return await request_coalescer.do(
+        flight_key,
+        lambda: factory.request(method=method, path=path, headers=headers, query=request.url.query)
+    )
+
+async def dispatch_streaming_get(service: ServiceType, path: str, request: Request, method: str,
+                                 json_data: Optional[str] = None, file: Optional[UploadFile] = None):
+    """스트리밍 서비스의 GET 요청 디스패처입니다. (캐시 정책이 있는 경로만 버퍼링)"""
+    if JOB_EVENTS_PATH.search(path):
+        return await handle_streaming_request(service, path, request, method, read_timeout=GATEWAY_JOB_EVENTS_READ_TIMEOUT)
+    ttl = response_cache.ttl_for_request(path, request.headers)
+    if ttl:
+        return await handle_cached_request(service, path, request, ttl)
+    return await handle_streaming_request(service, path, request, method)
+
+async def dispatch_streaming(service: ServiceType, path: str, request: Request, method: str,
+                             json_data: Optional[str] = None, file: Optional[UploadFile] = None):
+    """스트리밍 패스스루 디스패처입니다. (본문을 읽거나 디코딩하지 않고 그대로 전달)"""
+    return await handle_streaming_request(service, path, request, method)
+
+async def dispatch_body(service: ServiceType, path: str, request: Request, method: str,
+                        json_data: Optional[str] = None, file: Optional[UploadFile] = None):
+    """
+    본문이 있는 버퍼링 요청(POST, PUT, DELETE, PATCH) 디스패처입니다.
+    - POST 폼 요청이면 파일/JSON 필드를 추출하고, 파일이 있으면 업로드로 전달
+    - 본문 변환이 없는 서비스는 본문 바이트를 디코딩/파싱 없이 그대로 전달
+    - 본문 변환이 있는 서비스(챗봇 등)만 본문을 JSON 으로 파싱해 변환 후 전달
+    """
+    headers = prepare_headers(request, service)
+    
+    # 폼 요청이면 파일/JSON 필드 추출 (스트리밍이 아닐 때만 본문을 파싱)
+    if method == "POST" and file is None and json_data is None:
+        file, json_data = await read_form_fields(request)
+    
+    # 파일 업로드 처리 (POST 메서드 + 파일 있음)
+    if method == "POST" and file and file.filename:
+        return await handle_file_upload_request(service, path, request, headers, file, json_data)
+    
+    factory = get_service_proxy(service)
+    pipeline = transforms.get(service)
+    
+    # 변환 없는 서비스: 받은 본문 바이트를 그대로 전달 (Content-Type 도 클라이언트 값 유지)
+    if json_data is None and not pipeline.rewrites_body:
+        content = await request.body()
+        return await factory.request(
+            method=method,
+            path=path,
+            headers=headers,
+            content=content or None,
+            query=request.url.query
+        )
+    
+    # 요청 본문 준비 (파싱 + 변환)
+    with span("gateway.prepare_body", service=service.value):
+        body_dict = await prepare_body(request, json_data, service)
+    
+    if pipeline.rewrites_body:
+        logger.info("%s 변환 후 요청 본문 (%s): %s", service.value, ",".join(pipeline.names),
+                    lazy(json.dumps, body_dict, ensure_ascii=False))
+    
+    return await factory.request(
+        method=method,
+        path=path,
+        headers=headers,
+        json=body_dict,
+        query=request.url.query
+    )
+
+Dispatcher = Callable[..., Awaitable[object]]
+
+@dataclass(frozen=True)
+class Route:
+    """라우팅 테이블 항목: (서비스, 메서드) 에 대해 미리 정해 둔 디스패처"""
+    service: ServiceType
+    method: str
+    streaming: bool
+    dispatch: Dispatcher
+
+def build_route_table() -> Mapping[Tuple[ServiceType, str], Route]:
+    """
+    (서비스, 메서드) → Route 라우팅 테이블을 만듭니다.
+    스트리밍 여부처럼 요청마다 바뀌지 않는 분기는 여기서 한 번만 결정합니다.
+    변환 파이프라인도 여기서 컴파일하며, 변환이 등록된 서비스는 본문을 다뤄야 하므로 스트리밍에서 제외합니다.
+    
+    Returns:
+        변경할 수 없는 라우팅 테이블
+    """
+    table = {}
+    for service in ServiceType:
+        streaming = service in STREAMING_SERVICES and transforms.get(service).identity
+        for method in SUPPORTED_METHODS:
+            if method == "GET":
+                dispatch = dispatch_streaming_get if streaming else dispatch_get
+            else:
+                dispatch = dispatch_streaming if streaming else dispatch_body
+            table[(service, method)] = Route(service, method, streaming, dispatch)
+    return MappingProxyType(table)
+
+# ✅ 시작 시 한 번 만드는 라우팅 테이블
+ROUTE_TABLE = build_route_table()
+
+async def enforce_rate_limit(service: ServiceType, request: Request) -> None:
+    """
+    클라이언트의 서비스별 요청 한도를 확인합니다.
+    
+    Args:
+        service: 서비스 타입
+        request: FastAPI 요청 객체
+        
+    Raises:
+        HTTPException: 한도를 넘은 경우 (429, Retry-After 포함)
+    """
+    try:
+        await rate_limiter.check(service, request)
+    except RateLimited as e:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=str(e),
+            headers={
+                "Retry-After": str(max(1, math.ceil(e.retry_after))),
+                "X-RateLimit-Limit": str(e.policy.burst),
+                "X-RateLimit-Remaining": "0",
+            }
+        )
+
 async def handle_request(service: ServiceType, path: str, request: Request, method: str, json_data: Optional[str] = None, file: Optional[UploadFile] = None):
     """
     모든 HTTP 요청 처리를 위한 통합 함수입니다.
+    클라이언트의 요청 한도를 확인한 뒤, 라우팅 테이블에서 (서비스, 메서드) 의 디스패처를 찾아 정규화된 경로로 호출합니다.
     
     Args:
         service: 서비스 타입
@@ -67,69 +234,232 @@ async def handle_request(service: ServiceType, path: str, request: Request, meth
     Returns:
         처리된 응답 객체
     """
-    logger.info(f"{method} 요청: {service.value}/{path}")
+    logger.info("%s 요청: %s/%s", method, service.value, path)
     
-    # 경로 정규화
-    clean_path = clean_request_path(path)
+    route = ROUTE_TABLE.get((service, method))
+    if route is None:
+        raise HTTPException(
+            status_code=status.HTTP_405_METHOD_NOT_ALLOWED,
+            detail=f"지원하지 않는 HTTP 메서드: {method}"
+        )
+    await enforce_rate_limit(service, request)
+    return await route.dispatch(service, clean_request_path(path), request, method, json_data, file)
+
+def weak_etag(tag: str) -> str:
+    """약한 비교(If-None-Match)를 위해 W/ 접두사를 제거합니다. (압축 응답은 약한 ETag 로 나감)"""
+    return tag[2:] if tag.startswith('W/') else tag
+
+def cached_to_response(entry: CachedResponse, request: Request, cache_status: str) -> httpx.Response:
+    """
+    캐시 항목을 응답 객체로 변환합니다. 클라이언트의 If-None-Match 가 (약한 비교로) 일치하면 304 를 반환합니다.
     
-    # 헤더 처리
-    headers = prepare_headers(request, service)
+    Args:
+        entry: 캐시 항목
+        request: FastAPI 요청 객체
+        cache_status: X-Cache 헤더 값 (HIT, REVALIDATED, MISS)
+        
+    Returns:
+        응답 객체
+    """
+    if_none_match = request.headers.get('if-none-match')
+    if if_none_match and weak_etag(entry.etag) in [weak_etag(tag.strip()) for tag in if_none_match.split(',')]:
+        return httpx.Response(304, headers={'etag': entry.etag, 'x-cache': cache_status})
+    return httpx.Response(
+        entry.status_code,
+        headers={**entry.headers, 'x-cache': cache_status},
+        content=entry.content
+    )
+
+async def handle_cached_request(service: ServiceType, path: str, request: Request, ttl: float):
+    """
+    캐시 정책이 있는 GET 요청 처리를 위한 함수입니다.
+    - 유효한 캐시 항목이 있으면 업스트림 호출 없이 응답
+    - 만료된 항목에 업스트림 ETag 가 있으면 If-None-Match 로 재검증
+    - 그 외에는 업스트림 응답을 캐시에 저장
+    - 동시에 들어온 동일 미스 요청은 하나의 업스트림 호출을 공유
     
-    # 파일 업로드 처리 (POST 메서드 + 파일 있음)
-    if method == "POST" and file and file.filename:
-        return await handle_file_upload_request(service, clean_path, request, headers, file, json_data)
+    Args:
+        service: 서비스 타입
+        path: 정규화된 요청 경로
+        request: FastAPI 요청 객체
+        ttl: 경로에 설정된 캐시 TTL (초)
+        
+    Returns:
+        처리된 응답 객체
+    """
+    key = response_cache.make_key(service, path, request.url.query, request.headers)
+    entry = response_cache.get(key)
     
-    # 서비스 프록시 생성
-    factory = ServiceProxyFactory(service_type=service)
+    if entry is not None and entry.is_fresh(time.monotonic()):
+        response_cache.hits += 1
+        return cached_to_response(entry, request, 'HIT')
+    response_cache.misses += 1
     
-    # 일반 요청 처리 (GET, POST, PUT, DELETE, PATCH)
-    if method != "GET":
-        # 요청 본문 준비 (GET 이외의 메서드)
-        body_dict = await prepare_body(request, json_data, service)
+    # 클라이언트의 조건부 헤더는 게이트웨이가 처리하므로 업스트림에는 캐시 항목의 ETag 만 보냄
+    headers = {k: v for k, v in prepare_headers(request, service).items() if k.lower() != 'if-none-match'}
+    if entry is not None and entry.upstream_etag:
+        headers['If-None-Match'] = entry.etag
+    
+    factory = get_service_proxy(service)
+    
+    async def fetch():
+        # 업스트림 호출과 캐시 저장은 동일 요청들 중 한 번만 수행
+        response = await factory.request(method="GET", path=path, headers=headers, query=request.url.query)
         
-        # 챗봇 서비스 디버깅 로그
-        if service == ServiceType.CHATBOT:
-            logger.info(f"챗봇 서비스 요청 본문: {json.dumps(body_dict)}")
+        if response.status_code == 304 and entry is not None:
+            response_cache.refresh(key, ttl)
+            return response, entry, 'REVALIDATED'
         
-        # 요청 전송
-        response = await factory.request(
-            method=method,
-            path=clean_path,
-            headers=headers,
-            json=body_dict
-        )
-    else:
-        # GET 요청 (본문 없음)
-        response = await factory.request(
-            method=method,
-            path=clean_path,
-            headers=headers
-        )
+        if response.status_code == 200:
+            cache_headers = {
+                k: v for k, v in response.headers.items()
+                if k.lower() in PASSTHROUGH_RESPONSE_HEADERS
+            }
+            stored = response_cache.store(key, response.status_code, cache_headers, response.content, ttl)
+            if stored is not None:
+                return response, stored, 'MISS'
+        
+        return response, None, None
+    
+    # 클라이언트별 조건부 헤더(If-None-Match)는 공유 결과를 받은 뒤 각자 처리
+    response, stored, cache_status = await request_coalescer.do(('cache',) + key, fetch)
+    if stored is not None:
+        return cached_to_response(stored, request, cache_status)
     
     return response
 
-def process_response(response):
+async def handle_streaming_request(service: ServiceType, path: str, request: Request, method: str,
+                                   read_timeout: Optional[float] = None):
+    """
+    스트리밍 패스스루 요청 처리를 위한 함수입니다.
+    요청 본문은 request.stream() 으로 업스트림에 흘려보내고, 응답도 읽지 않은 채 StreamingResponse 로 전달합니다.
+    
+    Args:
+        service: 서비스 타입
+        path: 정규화된 요청 경로
+        request: FastAPI 요청 객체
+        method: HTTP 메서드
+        read_timeout: 서비스 기본값 대신 사용할 read 타임아웃 (선택, SSE 등 긴 스트림용)
+        
+    Returns:
+        StreamingResponse 객체
+    """
+    headers = prepare_streaming_headers(request, service)
+    has_body = method != "GET" and (
+        'content-length' in request.headers or 'transfer-encoding' in request.headers
+    )
+    
+    factory = get_service_proxy(service)
+    response = await factory.stream(
+        method=method,
+        path=path,
+        headers=headers,
+        content=request.stream() if has_body else None,
+        read_timeout=read_timeout,
+        query=request.url.query
+    )
+    return build_streaming_response(response)
+
+def build_streaming_response(response) -> StreamingResponse:
+    """
+    읽지 않은 업스트림 응답을 디코딩 없이 StreamingResponse 로 전달합니다.
+    응답 전송이 끝나면 업스트림 연결을 커넥션 풀로 반환합니다.
+    
+    Args:
+        response: 스트리밍 모드의 서비스 응답 객체
+        
+    Returns:
+        StreamingResponse 객체
+    """
+    headers = {
+        k: v for k, v in response.headers.items()
+        if k.lower() not in HOP_BY_HOP_HEADERS
+    }
+    return StreamingResponse(
+        response.aiter_raw(),
+        status_code=response.status_code,
+        headers=headers,
+        background=BackgroundTask(response.aclose)
+    )
+
+def build_passthrough_response(response, service: Optional[ServiceType] = None) -> Response:
     """
-    서비스 응답을 처리하여 적절한 JSONResponse를 반환합니다.
+    업스트림 본문 바이트를 JSON 파싱/재인코딩 없이 그대로 전달합니다.
+    httpx 가 이미 content-encoding 을 해제한 본문이므로 content-encoding 은 제외하고,
+    content-length 는 Response 가 다시 계산합니다.
+    응답 변환이 등록된 서비스만 JSON 본문을 파싱해 변환합니다.
+    
+    Args:
+        response: 서비스 응답 객체 (본문을 이미 읽은 상태)
+        service: 서비스 타입 (선택, 응답 변환용)
+        
+    Returns:
+        원본(또는 변환된) 바이트를 담은 Response 객체
+    """
+    headers = {
+        k: v for k, v in response.headers.items()
+        if k.lower() in PASSTHROUGH_RESPONSE_HEADERS
+    }
+    content = response.content
+    if service is not None:
+        pipeline = transforms.get(service)
+        if pipeline.rewrites_response and 'json' in response.headers.get('content-type', ''):
+            content = pipeline.apply_response(content)
+            # 본문이 바뀌었으므로 업스트림 ETag 는 더 이상 맞지 않음
+            headers.pop('etag', None)
+    return Response(
+        content=content,
+        status_code=response.status_code,
+        headers=headers
+    )
+
+def process_response(response, service: Optional[ServiceType] = None):
+    """
+    서비스 응답을 처리하여 클라이언트에 돌려줄 응답을 반환합니다.
+    - 성공 응답: 본문 바이트를 그대로 전달 (응답 변환이 등록된 서비스만 JSON 변환)
+    - 오류 응답: 게이트웨이 오류 형식(JSONResponse)으로 감싸서 전달 (Retry-After 는 유지)
     
     Args:
         response: 서비스 응답 객체
+        service: 서비스 타입 (선택, 응답 변환용)
         
     Returns:
-        처리된 JSONResponse 객체
+        처리된 Response 객체
     """
+    # 스트리밍 패스스루 응답은 이미 완성된 응답이므로 그대로 반환
+    if isinstance(response, StreamingResponse):
+        return response
+    
     # 성공 응답 처리 (상태 코드 < 400)
     if response.status_code < 400:
-        try:
-            return JSONResponse(content=response.json(), status_code=response.status_code)
-        except Exception:
-            return JSONResponse(
-                content={"message": "성공", "raw_response": response.text[:1000]},
-                status_code=response.status_code
-            )
+        return build_passthrough_response(response, service)
     else:
         # 오류 응답 처리
+        retry_after = response.headers.get("retry-after")
         return JSONResponse(
             content={"error": f"서비스 오류: HTTP {response.status_code}", "details": response.text[:500]},
-            status_code=response.status_code
-        ) 
\ No newline at end of file
+            status_code=response.status_code,
+            headers={"Retry-After": retry_after} if retry_after else None
+        )
+
+def error_response(e: Exception) -> JSONResponse:
+    """
+    게이트웨이 처리 중 발생한 예외를 오류 응답으로 변환합니다.
+    HTTPException 은 상태 코드와 헤더(Retry-After 등)를 유지하고, 그 외 예외는 500 으로 응답합니다.
+    
+    Args:
+        e: 발생한 예외
+        
+    Returns:
+        오류 JSONResponse 객체
+    """
+    if isinstance(e, HTTPException):
+        return JSONResponse(
+            content={"error": e.detail},
+            status_code=e.status_code,
+            headers=e.headers
+        )
+    return JSONResponse(
+        content={"error": str(e)},
+        status_code=500
+    )
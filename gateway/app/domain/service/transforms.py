@@ -0,0 +1,49 @@
+"""
+서비스별 요청/응답 변환 등록
+여기서 등록한 변환만 본문을 파싱하고, 변환이 없는 서비스는 본문 바이트를 그대로 전달합니다.
+라우팅 테이블(request_service.ROUTE_TABLE)을 만들기 전에 import 되어야 합니다.
+"""
+import logging
+from typing import Any, Dict
+
+from app.domain.model.service_type import ServiceType
+from app.foundation.core.transform import Transform, transforms
+
+logger = logging.getLogger("domain.service.transforms")
+
+# 챗봇 요청에 user_id 가 없을 때 채우는 기본값
+CHATBOT_DEFAULT_USER_ID = "123"
+
+
+def chatbot_json_content_type(headers: Dict[str, str]) -> Dict[str, str]:
+    """챗봇 서비스는 항상 JSON 본문을 받으므로 기존 Content-Type 을 지우고 application/json 으로 설정"""
+    headers = {k: v for k, v in headers.items() if k.lower() != 'content-type'}
+    headers["Content-Type"] = "application/json"
+    return headers
+
+
+def chatbot_message(parsed: Any) -> Dict[str, Any]:
+    """
+    챗봇 요청 본문을 {"message": ..., "user_id": ...} 형식으로 맞춥니다.
+    - message 필드가 있으면 그대로 두고 user_id 만 채움
+    - 다른 형식의 객체면 첫 번째 필드 값을, 그 외에는 값 전체를 문자열로 바꿔 message 로 사용
+    
+    Args:
+        parsed: 파싱한 요청 본문
+        
+    Returns:
+        챗봇 요청 본문
+    """
+    if isinstance(parsed, dict) and "message" in parsed:
+        parsed.setdefault("user_id", CHATBOT_DEFAULT_USER_ID)
+        return parsed
+    message = str(parsed)
+    if isinstance(parsed, dict) and len(parsed) > 0:
+        message = str(parsed[next(iter(parsed))])
+    return {"message": message, "user_id": CHATBOT_DEFAULT_USER_ID}
+
+
+# ✅ 변환 등록 (시작 시 한 번)
+transforms.register(ServiceType.CHATBOT, Transform(
+    "chatbot.message", request_headers=chatbot_json_content_type, request_body=chatbot_message
+))
@@ -0,0 +1,185 @@
+import os
+import math
+import time
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator, Dict, Optional
+
+from app.domain.model.service_type import ServiceType
+from app.platform.tracing import span
+
+logger = logging.getLogger("foundation.core.admission")
+
+
+@dataclass(frozen=True)
+class AdmissionPolicy:
+    """서비스별 동시 실행 한도와 대기열 설정"""
+    max_concurrency: int
+    max_queue: int
+    queue_timeout: float
+
+
+# ✅ 서비스별 기본 입장 제어 정책
+# tf / chatbot 은 단일 프로세스 CPU 바운드 백엔드라 동시 실행을 작게 제한한다.
+DEFAULT_ADMISSION_POLICIES: Dict[ServiceType, AdmissionPolicy] = {
+    ServiceType.TITANIC: AdmissionPolicy(max_concurrency=64, max_queue=256, queue_timeout=2.0),
+    ServiceType.CRIME: AdmissionPolicy(max_concurrency=8, max_queue=64, queue_timeout=5.0),
+    ServiceType.MATZIP: AdmissionPolicy(max_concurrency=32, max_queue=128, queue_timeout=5.0),
+    ServiceType.NLP: AdmissionPolicy(max_concurrency=4, max_queue=32, queue_timeout=10.0),
+    ServiceType.TF: AdmissionPolicy(max_concurrency=2, max_queue=16, queue_timeout=10.0),
+    ServiceType.CHATBOT: AdmissionPolicy(max_concurrency=1, max_queue=8, queue_timeout=30.0),
+}
+
+
+def get_admission_policy(service_type: ServiceType) -> AdmissionPolicy:
+    """
+    서비스별 입장 제어 정책을 반환합니다.
+    환경 변수 {SERVICE}_MAX_CONCURRENCY, {SERVICE}_MAX_QUEUE, {SERVICE}_QUEUE_TIMEOUT 으로 덮어쓸 수 있습니다.
+
+    Args:
+        service_type: 서비스 타입
+
+    Returns:
+        입장 제어 정책
+    """
+    default = DEFAULT_ADMISSION_POLICIES.get(service_type, AdmissionPolicy(32, 128, 5.0))
+    prefix = service_type.value.upper()
+    return AdmissionPolicy(
+        max_concurrency=int(os.getenv(f"{prefix}_MAX_CONCURRENCY", default.max_concurrency)),
+        max_queue=int(os.getenv(f"{prefix}_MAX_QUEUE", default.max_queue)),
+        queue_timeout=float(os.getenv(f"{prefix}_QUEUE_TIMEOUT", default.queue_timeout)),
+    )
+
+
+class AdmissionRejected(Exception):
+    """대기열이 가득 찼거나 대기 시간이 초과되어 요청을 거절한 경우"""
+
+    def __init__(self, service_type: ServiceType, status_code: int, reason: str, retry_after: float):
+        super().__init__(f"{service_type.value} 서비스 {reason}")
+        self.service_type = service_type
+        self.status_code = status_code
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class AdmissionController:
+    """
+    서비스 하나의 동시 실행 슬롯과 대기열을 관리합니다.
+    - 슬롯이 비어 있으면 바로 입장
+    - 슬롯이 없으면 최대 max_queue 개까지 대기, queue_timeout 안에 슬롯을 얻지 못하면 503
+    - 대기열이 가득 차면 기다리지 않고 바로 429
+    """
+
+    def __init__(self, service_type: ServiceType, policy: Optional[AdmissionPolicy] = None):
+        self.service_type = service_type
+        self.policy = policy or get_admission_policy(service_type)
+        self._semaphore = asyncio.Semaphore(self.policy.max_concurrency)
+        self.active = 0
+        self.waiting = 0
+        self.max_waiting_seen = 0
+        self.admitted = 0
+        self.rejected_queue_full = 0
+        self.rejected_timeout = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+        # 슬롯 점유 시간 이동 평균 (Retry-After 추정용)
+        self._hold_ewma = 0.0
+
+    def retry_after(self) -> float:
+        """현재 대기열이 빠지는 데 걸릴 예상 시간 (초)"""
+        drain = self._hold_ewma * (self.waiting + 1) / self.policy.max_concurrency
+        return max(1.0, math.ceil(drain))
+
+    async def acquire(self) -> None:
+        """
+        실행 슬롯을 얻습니다.
+
+        Raises:
+            AdmissionRejected: 대기열이 가득 찼거나(429) 대기 시간이 초과된(503) 경우
+        """
+        if not self._semaphore.locked():
+            await self._semaphore.acquire()
+            self._admit(0.0)
+            return
+
+        if self.waiting >= self.policy.max_queue:
+            self.rejected_queue_full += 1
+            raise AdmissionRejected(self.service_type, 429, "대기열 초과", self.retry_after())
+
+        self.waiting += 1
+        self.max_waiting_seen = max(self.max_waiting_seen, self.waiting)
+        started = time.monotonic()
+        try:
+            with span("gateway.admission_wait", service=self.service_type.value, queue_depth=self.waiting):
+                await asyncio.wait_for(self._semaphore.acquire(), timeout=self.policy.queue_timeout)
+        except asyncio.TimeoutError:
+            self.rejected_timeout += 1
+            self._record_wait(time.monotonic() - started)
+            raise AdmissionRejected(self.service_type, 503, "대기 시간 초과", self.retry_after())
+        finally:
+            self.waiting -= 1
+        self._admit(time.monotonic() - started)
+
+    def _admit(self, waited: float) -> None:
+        self.active += 1
+        self.admitted += 1
+        self._record_wait(waited)
+
+    def _record_wait(self, waited: float) -> None:
+        self.wait_seconds_total += waited
+        self.wait_seconds_max = max(self.wait_seconds_max, waited)
+
+    def release(self, held: float) -> None:
+        """실행 슬롯을 반환합니다."""
+        self.active -= 1
+        self._hold_ewma = held if self._hold_ewma == 0.0 else 0.8 * self._hold_ewma + 0.2 * held
+        self._semaphore.release()
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """실행 슬롯을 점유하는 컨텍스트 매니저"""
+        await self.acquire()
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            self.release(time.monotonic() - started)
+
+    def stats(self) -> dict:
+        waits = self.admitted + self.rejected_timeout
+        return {
+            "max_concurrency": self.policy.max_concurrency,
+            "max_queue": self.policy.max_queue,
+            "queue_timeout": self.policy.queue_timeout,
+            "active": self.active,
+            "queue_depth": self.waiting,
+            "max_queue_depth_seen": self.max_waiting_seen,
+            "admitted": self.admitted,
+            "rejected_queue_full": self.rejected_queue_full,
+            "rejected_timeout": self.rejected_timeout,
+            "avg_wait_seconds": round(self.wait_seconds_total / waits, 6) if waits else 0.0,
+            "max_wait_seconds": round(self.wait_seconds_max, 6),
+        }
+
+
+class AdmissionRegistry:
+    """서비스별 AdmissionController 레지스트리"""
+
+    def __init__(self):
+        self._controllers: Dict[ServiceType, AdmissionController] = {}
+
+    def get(self, service_type: ServiceType) -> AdmissionController:
+        controller = self._controllers.get(service_type)
+        if controller is None:
+            controller = AdmissionController(service_type)
+            self._controllers[service_type] = controller
+        return controller
+
+    def stats(self) -> dict:
+        return {service_type.value: controller.stats() for service_type, controller in self._controllers.items()}
+
+
+# ✅ 프로세스 전역 입장 제어
+admission = AdmissionRegistry()
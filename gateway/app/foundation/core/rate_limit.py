@@ -0,0 +1,296 @@
+import os
+import time
+import hashlib
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Tuple
+
+from fastapi import Request
+
+from app.domain.model.service_type import ServiceType
+
+logger = logging.getLogger("foundation.core.rate_limit")
+
+# ✅ 요청 속도 제한 설정
+# 기본은 꺼 둠 - 클라이언트를 API 키 헤더 또는 IP 로 구분하므로, 프론트엔드나 리버스 프록시 뒤에서는
+# 모든 사용자가 프록시 IP 하나의 버킷을 나눠 쓰게 되어 평범한 트래픽과 작업 상태 폴링도 429 를 받음
+# 켜기 전에 확인할 것:
+#   1) 앞단 프록시가 X-Forwarded-For 에 실제 클라이언트 IP 를 붙이도록 설정
+#      (nginx: proxy_set_header X-Forwarded-For $proxy_add_x_forwarded_for;)
+#   2) 게이트웨이에 프록시를 거쳐서만 접근할 수 있을 때만 GATEWAY_TRUST_FORWARDED_FOR=true
+#      (직접 접근할 수 있으면 클라이언트가 헤더를 위조해 제한을 피할 수 있음)
+#   3) 프론트엔드 서버가 사용자 대신 호출한다면 사용자별 API 키 헤더(GATEWAY_RATE_LIMIT_KEY_HEADER)를 전달
+#   4) 서비스별 한도는 {SERVICE}_RATE_LIMIT_RATE / {SERVICE}_RATE_LIMIT_BURST 로 조정
+GATEWAY_RATE_LIMIT_ENABLED = os.getenv("GATEWAY_RATE_LIMIT_ENABLED", "false").lower() in ("1", "true", "yes")
+# 버킷 저장소: local (게이트웨이 프로세스 메모리) / redis (여러 게이트웨이 레플리카가 공유)
+GATEWAY_RATE_LIMIT_STORE = os.getenv("GATEWAY_RATE_LIMIT_STORE", "local").lower()
+GATEWAY_RATE_LIMIT_REDIS_URL = os.getenv("GATEWAY_RATE_LIMIT_REDIS_URL", "redis://localhost:6379/0")
+# 로컬 저장소에 유지할 최대 버킷 수 (오래 안 쓴 버킷부터 제거)
+GATEWAY_RATE_LIMIT_MAX_KEYS = int(os.getenv("GATEWAY_RATE_LIMIT_MAX_KEYS", "100000"))
+# 클라이언트를 구분하는 API 키 헤더 (없으면 IP 로 구분)
+GATEWAY_RATE_LIMIT_KEY_HEADER = os.getenv("GATEWAY_RATE_LIMIT_KEY_HEADER", "x-api-key").lower()
+# 앞단 프록시(로드 밸런서)가 붙인 X-Forwarded-For 의 첫 주소를 클라이언트 IP 로 사용할지 여부
+# (false 면 소켓 상대 주소 = 프록시 뒤에서는 프록시 IP, 위 설정 순서 참고)
+GATEWAY_TRUST_FORWARDED_FOR = os.getenv("GATEWAY_TRUST_FORWARDED_FOR", "false").lower() in ("1", "true", "yes")
+
+
+@dataclass(frozen=True)
+class RateLimitPolicy:
+    """서비스별 토큰 버킷 설정: 초당 rate 개씩 채워지고 최대 burst 개까지 쌓임 (rate <= 0 이면 제한 없음)"""
+    rate: float
+    burst: int
+
+
+# ✅ 서비스별 기본 속도 제한 (클라이언트 하나 기준)
+# 챗봇 생성 / tf 추론 / 지도 렌더링처럼 비싼 백엔드일수록 작게 설정
+DEFAULT_RATE_LIMIT_POLICIES: Dict[ServiceType, RateLimitPolicy] = {
+    ServiceType.TITANIC: RateLimitPolicy(rate=20.0, burst=40),
+    ServiceType.CRIME: RateLimitPolicy(rate=2.0, burst=10),
+    ServiceType.MATZIP: RateLimitPolicy(rate=10.0, burst=20),
+    ServiceType.NLP: RateLimitPolicy(rate=1.0, burst=5),
+    ServiceType.TF: RateLimitPolicy(rate=2.0, burst=5),
+    ServiceType.CHATBOT: RateLimitPolicy(rate=0.5, burst=3),
+}
+
+
+def get_rate_limit_policy(service_type: ServiceType) -> RateLimitPolicy:
+    """
+    서비스별 속도 제한 정책을 반환합니다.
+    환경 변수 {SERVICE}_RATE_LIMIT_RATE, {SERVICE}_RATE_LIMIT_BURST 로 덮어쓸 수 있습니다.
+
+    Args:
+        service_type: 서비스 타입
+
+    Returns:
+        속도 제한 정책
+    """
+    default = DEFAULT_RATE_LIMIT_POLICIES.get(service_type, RateLimitPolicy(10.0, 20))
+    prefix = service_type.value.upper()
+    return RateLimitPolicy(
+        rate=float(os.getenv(f"{prefix}_RATE_LIMIT_RATE", default.rate)),
+        burst=int(os.getenv(f"{prefix}_RATE_LIMIT_BURST", default.burst)),
+    )
+
+
+class RateLimited(Exception):
+    """클라이언트의 토큰 버킷이 비어 요청을 거절한 경우"""
+
+    def __init__(self, service_type: ServiceType, policy: RateLimitPolicy, retry_after: float):
+        super().__init__(f"{service_type.value} 서비스 요청 한도 초과 (초당 {policy.rate}회, 최대 {policy.burst}회 연속)")
+        self.service_type = service_type
+        self.policy = policy
+        self.retry_after = retry_after
+
+
+class LocalBucketStore:
+    """
+    게이트웨이 프로세스 메모리에 두는 토큰 버킷 저장소입니다.
+    이벤트 루프 안에서만 호출되므로 잠금 없이 (남은 토큰, 갱신 시각) 을 읽고 씁니다.
+    """
+    kind = "local"
+
+    def __init__(self, max_keys: int = GATEWAY_RATE_LIMIT_MAX_KEYS, clock: Callable[[], float] = time.monotonic):
+        self.max_keys = max_keys
+        self.clock = clock
+        self._buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+
+    async def take(self, key: str, rate: float, burst: int) -> Tuple[bool, float, float]:
+        """
+        버킷에서 토큰 하나를 꺼냅니다.
+
+        Args:
+            key: 버킷 키
+            rate: 초당 채워지는 토큰 수
+            burst: 버킷 용량
+
+        Returns:
+            (허용 여부, 남은 토큰 수, 다음 토큰까지 남은 시간(초)) 튜플
+        """
+        now = self.clock()
+        tokens, updated = self._buckets.pop(key, (float(burst), now))
+        tokens = min(float(burst), tokens + (now - updated) * rate)
+        allowed = tokens >= 1.0
+        if allowed:
+            tokens -= 1.0
+        self._buckets[key] = (tokens, now)
+        if len(self._buckets) > self.max_keys:
+            self._buckets.popitem(last=False)
+        return allowed, tokens, 0.0 if allowed else (1.0 - tokens) / rate
+
+    async def start(self) -> None:
+        pass
+
+    async def close(self) -> None:
+        self._buckets.clear()
+
+    def size(self) -> int:
+        return len(self._buckets)
+
+
+# 토큰 버킷을 Redis 서버 안에서 원자적으로 갱신 (서버 시각 기준이라 게이트웨이 간 시계 차이 영향 없음)
+TOKEN_BUCKET_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local time = redis.call('TIME')
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'updated')
+local tokens = tonumber(state[1]) or burst
+local updated = tonumber(state[2]) or now
+tokens = math.min(burst, tokens + math.max(0, now - updated) * rate)
+local allowed = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+    allowed = 1
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'updated', tostring(now))
+redis.call('PEXPIRE', KEYS[1], math.ceil(burst / rate * 1000) + 1000)
+return {allowed, tostring(tokens)}
+"""
+
+
+class RedisBucketStore:
+    """
+    여러 게이트웨이 레플리카가 공유하는 Redis 토큰 버킷 저장소입니다.
+    Redis 에 연결할 수 없으면 요청을 막지 않고 허용합니다 (오류 수는 stats 로 확인).
+    """
+    kind = "redis"
+
+    def __init__(self, url: str = GATEWAY_RATE_LIMIT_REDIS_URL, prefix: str = "gateway:ratelimit:"):
+        self.url = url
+        self.prefix = prefix
+        self.errors = 0
+        self._redis = None
+        self._script = None
+
+    async def start(self) -> None:
+        # redis 패키지는 이 저장소를 쓸 때만 필요
+        import redis.asyncio as redis
+        self._redis = redis.from_url(self.url, socket_timeout=0.1, socket_connect_timeout=0.1)
+        self._script = self._redis.register_script(TOKEN_BUCKET_SCRIPT)
+
+    async def take(self, key: str, rate: float, burst: int) -> Tuple[bool, float, float]:
+        """LocalBucketStore.take 와 같은 의미입니다."""
+        if self._script is None:
+            await self.start()
+        try:
+            allowed, tokens = await self._script(keys=[self.prefix + key], args=[rate, burst])
+        except Exception as e:
+            self.errors += 1
+            logger.warning("속도 제한 저장소(redis) 오류, 요청을 허용합니다: %s", e)
+            return True, float(burst), 0.0
+        tokens = float(tokens)
+        return bool(allowed), tokens, 0.0 if allowed else (1.0 - tokens) / rate
+
+    async def close(self) -> None:
+        if self._redis is not None:
+            await self._redis.aclose()
+            self._redis = None
+            self._script = None
+
+    def size(self) -> Optional[int]:
+        return None
+
+
+def create_bucket_store(kind: str = GATEWAY_RATE_LIMIT_STORE):
+    """설정한 종류의 버킷 저장소를 만듭니다. (local / redis)"""
+    if kind == "redis":
+        return RedisBucketStore()
+    if kind != "local":
+        raise ValueError(f"GATEWAY_RATE_LIMIT_STORE 는 local 또는 redis 여야 합니다: {kind}")
+    return LocalBucketStore()
+
+
+def client_key(request: Request) -> str:
+    """
+    요청한 클라이언트의 식별자를 만듭니다.
+    API 키 헤더가 있으면 키의 해시, 없으면 클라이언트 IP 를 사용합니다.
+
+    Args:
+        request: FastAPI 요청 객체
+
+    Returns:
+        "key:..." 또는 "ip:..." 형식의 식별자
+    """
+    api_key = request.headers.get(GATEWAY_RATE_LIMIT_KEY_HEADER)
+    if api_key:
+        # 저장소(redis)에 API 키 원문이 남지 않도록 해시로 저장
+        return "key:" + hashlib.sha256(api_key.encode()).hexdigest()[:32]
+    if GATEWAY_TRUST_FORWARDED_FOR:
+        forwarded = request.headers.get("x-forwarded-for")
+        if forwarded:
+            return "ip:" + forwarded.split(",")[0].strip()
+    return "ip:" + (request.client.host if request.client else "unknown")
+
+
+class RateLimiter:
+    """
+    클라이언트(API 키 또는 IP) x 서비스별 토큰 버킷으로 요청 속도를 제한합니다.
+    - 버킷이 비면 업스트림을 호출하지 않고 바로 429 (Retry-After: 다음 토큰까지 남은 시간)
+    - 저장소는 local(기본) 또는 redis 로 바꿀 수 있음
+    """
+
+    def __init__(self, store=None, enabled: bool = GATEWAY_RATE_LIMIT_ENABLED):
+        self.enabled = enabled
+        self.store = store if store is not None else create_bucket_store()
+        self._policies: Dict[ServiceType, RateLimitPolicy] = {}
+        self.allowed: Dict[ServiceType, int] = {}
+        self.limited: Dict[ServiceType, int] = {}
+
+    def policy(self, service_type: ServiceType) -> RateLimitPolicy:
+        policy = self._policies.get(service_type)
+        if policy is None:
+            policy = get_rate_limit_policy(service_type)
+            self._policies[service_type] = policy
+        return policy
+
+    async def check(self, service_type: ServiceType, request: Request) -> None:
+        """
+        요청 하나를 버킷에서 차감합니다.
+
+        Args:
+            service_type: 서비스 타입
+            request: FastAPI 요청 객체
+
+        Raises:
+            RateLimited: 클라이언트의 버킷이 빈 경우
+        """
+        policy = self.policy(service_type)
+        if not self.enabled or policy.rate <= 0:
+            return
+        key = f"{service_type.value}:{client_key(request)}"
+        allowed, _, retry_after = await self.store.take(key, policy.rate, policy.burst)
+        if allowed:
+            self.allowed[service_type] = self.allowed.get(service_type, 0) + 1
+            return
+        self.limited[service_type] = self.limited.get(service_type, 0) + 1
+        logger.warning("요청 한도 초과: %s %s", service_type.value, key)
+        raise RateLimited(service_type, policy, retry_after)
+
+    async def start(self) -> None:
+        if self.enabled:
+            await self.store.start()
+
+    async def close(self) -> None:
+        await self.store.close()
+
+    def stats(self) -> dict:
+        return {
+            "enabled": self.enabled,
+            "store": self.store.kind,
+            "buckets": self.store.size(),
+            "store_errors": getattr(self.store, "errors", 0),
+            "services": {
+                service_type.value: {
+                    "rate": policy.rate,
+                    "burst": policy.burst,
+                    "allowed": self.allowed.get(service_type, 0),
+                    "limited": self.limited.get(service_type, 0),
+                }
+                for service_type, policy in ((s, self.policy(s)) for s in ServiceType)
+            },
+        }
+
+
+# ✅ 프로세스 전역 속도 제한
+rate_limiter = RateLimiter()
@@ -0,0 +1,372 @@
+import os
+import time
+import random
+import asyncio
+import logging
+from collections import deque
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Deque, Dict, Optional
+
+import httpx
+
+from app.domain.model.service_type import ServiceType
+from app.platform.gateway_metrics import observe_upstream, status_outcome
+
+logger = logging.getLogger("foundation.core.resilience")
+
+# ✅ 재시도해도 안전한(멱등) HTTP 메서드
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+# ✅ 업스트림 장애로 보고 재시도/차단 판단에 쓰는 상태 코드
+RETRYABLE_STATUS_CODES = frozenset({502, 503, 504})
+
+
+@dataclass(frozen=True)
+class ResiliencePolicy:
+    """서비스별 타임아웃/재시도/차단기/헤징 설정"""
+    connect_timeout: float
+    read_timeout: float
+    max_retries: int = 2
+    backoff_base: float = 0.1
+    backoff_max: float = 2.0
+    failure_threshold: int = 5
+    recovery_timeout: float = 30.0
+    hedge: bool = False
+    hedge_min_delay: float = 0.05
+    hedge_quantile: float = 0.95
+
+    def timeout(self) -> httpx.Timeout:
+        """connect/read 를 분리한 httpx 타임아웃"""
+        return httpx.Timeout(
+            connect=self.connect_timeout,
+            read=self.read_timeout,
+            write=self.read_timeout,
+            pool=self.connect_timeout,
+        )
+
+
+# ✅ 서비스별 기본 정책
+# 챗봇 생성은 수십 초가 걸릴 수 있어 read 타임아웃을 길게, titanic CRUD 스텁은 짧게 잡는다.
+DEFAULT_POLICIES: Dict[ServiceType, ResiliencePolicy] = {
+    ServiceType.TITANIC: ResiliencePolicy(connect_timeout=1.0, read_timeout=5.0),
+    ServiceType.CRIME: ResiliencePolicy(connect_timeout=2.0, read_timeout=30.0),
+    ServiceType.MATZIP: ResiliencePolicy(connect_timeout=2.0, read_timeout=10.0),
+    ServiceType.NLP: ResiliencePolicy(connect_timeout=2.0, read_timeout=60.0),
+    ServiceType.TF: ResiliencePolicy(connect_timeout=2.0, read_timeout=60.0),
+    ServiceType.CHATBOT: ResiliencePolicy(connect_timeout=2.0, read_timeout=120.0, max_retries=0),
+}
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.lower() in ("1", "true", "yes")
+
+
+def get_policy(service_type: ServiceType) -> ResiliencePolicy:
+    """
+    서비스별 정책을 반환합니다.
+    환경 변수 {SERVICE}_CONNECT_TIMEOUT, {SERVICE}_READ_TIMEOUT, {SERVICE}_MAX_RETRIES,
+    {SERVICE}_FAILURE_THRESHOLD, {SERVICE}_RECOVERY_TIMEOUT, {SERVICE}_HEDGE 로 덮어쓸 수 있습니다.
+
+    Args:
+        service_type: 서비스 타입
+
+    Returns:
+        서비스 정책
+    """
+    default = DEFAULT_POLICIES.get(service_type, ResiliencePolicy(connect_timeout=2.0, read_timeout=30.0))
+    prefix = service_type.value.upper()
+    return ResiliencePolicy(
+        connect_timeout=float(os.getenv(f"{prefix}_CONNECT_TIMEOUT", default.connect_timeout)),
+        read_timeout=float(os.getenv(f"{prefix}_READ_TIMEOUT", default.read_timeout)),
+        max_retries=int(os.getenv(f"{prefix}_MAX_RETRIES", default.max_retries)),
+        backoff_base=default.backoff_base,
+        backoff_max=default.backoff_max,
+        failure_threshold=int(os.getenv(f"{prefix}_FAILURE_THRESHOLD", default.failure_threshold)),
+        recovery_timeout=float(os.getenv(f"{prefix}_RECOVERY_TIMEOUT", default.recovery_timeout)),
+        hedge=_env_bool(f"{prefix}_HEDGE", default.hedge),
+        hedge_min_delay=default.hedge_min_delay,
+        hedge_quantile=default.hedge_quantile,
+    )
+
+
+class CircuitOpenError(Exception):
+    """차단기가 열려 있어 업스트림 호출을 보내지 않은 경우"""
+
+    def __init__(self, service_type: ServiceType, retry_after: float):
+        super().__init__(f"{service_type.value} 서비스 차단기 열림 ({retry_after:.0f}초 후 재시도)")
+        self.service_type = service_type
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    """
+    연속 실패 횟수 기반 차단기입니다.
+    - closed: 정상 호출, 연속 실패가 임계값에 도달하면 open
+    - open: recovery_timeout 동안 즉시 실패
+    - half-open: 시험 호출 하나만 허용, 성공하면 closed / 실패하면 다시 open
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int, recovery_timeout: float):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self.times_opened = 0
+        self._probe_in_flight = False
+
+    def allow(self) -> bool:
+        """호출을 보내도 되는지 확인합니다. half-open 에서는 시험 호출 하나만 허용합니다."""
+        if self.state == self.OPEN:
+            if time.monotonic() - self.opened_at < self.recovery_timeout:
+                return False
+            self.state = self.HALF_OPEN
+            self._probe_in_flight = False
+        if self.state == self.HALF_OPEN:
+            if self._probe_in_flight:
+                return False
+            self._probe_in_flight = True
+        return True
+
+    def retry_after(self) -> float:
+        """차단이 풀릴 때까지 남은 시간 (초)"""
+        return max(0.0, self.recovery_timeout - (time.monotonic() - self.opened_at))
+
+    def release_probe(self) -> None:
+        """시험 호출이 결과 없이 끝난 경우(취소, 업스트림과 무관한 오류) 다음 시험 호출을 허용합니다."""
+        self._probe_in_flight = False
+
+    def record_success(self) -> None:
+        if self.state != self.CLOSED:
+            logger.info("차단기 닫힘 (업스트림 회복)")
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        self.consecutive_failures += 1
+        if self.state == self.HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+            if self.state != self.OPEN:
+                self.times_opened += 1
+                logger.warning("차단기 열림 (연속 실패 %d회)", self.consecutive_failures)
+            self.state = self.OPEN
+            self.opened_at = time.monotonic()
+            self._probe_in_flight = False
+
+
+class LatencyTracker:
+    """최근 성공 응답 시간을 보관하고 분위수를 계산합니다. (헤징 지연 산정용)"""
+
+    def __init__(self, window: int = 200, min_samples: int = 20):
+        self._samples: Deque[float] = deque(maxlen=window)
+        self.min_samples = min_samples
+
+    def record(self, seconds: float) -> None:
+        self._samples.append(seconds)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """표본이 부족하면 None"""
+        if len(self._samples) < self.min_samples:
+            return None
+        ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+class UpstreamGuard:
+    """
+    서비스 하나의 업스트림 호출을 감싸는 복원력 계층입니다.
+    차단기 확인 → (멱등 메서드면) 헤징 → 지터가 있는 지수 백오프 재시도 순서로 동작합니다.
+    """
+
+    def __init__(self, service_type: ServiceType, policy: Optional[ResiliencePolicy] = None):
+        self.service_type = service_type
+        self.policy = policy or get_policy(service_type)
+        self.breaker = CircuitBreaker(self.policy.failure_threshold, self.policy.recovery_timeout)
+        self.latency = LatencyTracker()
+        self.calls = 0
+        self.retries = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+        self.rejected = 0
+        self.failures = 0
+
+    def _check_breaker(self) -> None:
+        if not self.breaker.allow():
+            self.rejected += 1
+            raise CircuitOpenError(self.service_type, self.breaker.retry_after())
+
+    def _backoff(self, attempt: int) -> float:
+        # full jitter: 0 ~ min(max, base * 2^attempt)
+        return random.uniform(0, min(self.policy.backoff_max, self.policy.backoff_base * (2 ** attempt)))
+
+    def hedge_delay(self) -> Optional[float]:
+        """헤징 요청을 보내기 전 기다릴 시간. 헤징이 꺼져 있거나 표본이 부족하면 None."""
+        if not self.policy.hedge:
+            return None
+        p = self.latency.quantile(self.policy.hedge_quantile)
+        if p is None:
+            return None
+        return max(self.policy.hedge_min_delay, p)
+
+    async def _attempt(self, send: Callable[[], Awaitable[httpx.Response]]) -> httpx.Response:
+        """한 번의 업스트림 호출. 결과를 차단기와 지연 통계에 반영합니다."""
+        started = time.monotonic()
+        service = self.service_type.value
+        try:
+            response = await send()
+        except httpx.RequestError as e:
+            self.failures += 1
+            self.breaker.record_failure()
+            outcome = "timeout" if isinstance(e, httpx.TimeoutException) else "connect_error"
+            observe_upstream(service, outcome, time.monotonic() - started)
+            raise
+        except BaseException:
+            # 헤징에서 진 요청 등 취소된 호출, 업스트림과 무관한 오류(StreamConsumed, InvalidURL, 레플리카 선택 실패 등)는
+            # 성공/실패로 세지 않음 - 반개방 상태의 시험 요청 표시는 풀어서 다음 요청이 다시 시험할 수 있게 함
+            self.breaker.release_probe()
+            raise
+        elapsed = time.monotonic() - started
+        observe_upstream(service, status_outcome(response.status_code), elapsed)
+        if response.status_code in RETRYABLE_STATUS_CODES:
+            self.failures += 1
+            self.breaker.record_failure()
+        else:
+            self.breaker.record_success()
+            self.latency.record(elapsed)
+        return response
+
+    async def _hedged_attempt(self, send: Callable[[], Awaitable[httpx.Response]], delay: float) -> httpx.Response:
+        """첫 요청이 delay 안에 끝나지 않으면 두 번째 요청을 보내고 먼저 성공한 응답을 사용합니다."""
+        primary = asyncio.ensure_future(self._attempt(send))
+        done, _ = await asyncio.wait({primary}, timeout=delay)
+        if done:
+            return primary.result()
+
+        self.hedges += 1
+        hedge = asyncio.ensure_future(self._attempt(send))
+        pending = {primary, hedge}
+        result: Optional[httpx.Response] = None
+        error: Optional[BaseException] = None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is not None:
+                        error = task.exception()
+                        continue
+                    response = task.result()
+                    if response.status_code not in RETRYABLE_STATUS_CODES:
+                        if task is hedge:
+                            self.hedge_wins += 1
+                        return response
+                    result = response
+        finally:
+            for task in pending:
+                task.cancel()
+        if result is not None:
+            return result
+        raise error
+
+    async def call(self, method: str, send: Callable[[], Awaitable[httpx.Response]]) -> httpx.Response:
+        """
+        업스트림 호출을 복원력 정책에 따라 실행합니다.
+
+        Args:
+            method: HTTP 메서드 (멱등 메서드만 재시도/헤징)
+            send: 업스트림 요청을 한 번 보내는 코루틴 함수 (여러 번 호출될 수 있음)
+
+        Returns:
+            업스트림 응답 객체
+
+        Raises:
+            CircuitOpenError: 차단기가 열려 있는 경우
+            httpx.RequestError: 재시도 후에도 연결/타임아웃 오류가 나는 경우
+        """
+        self.calls += 1
+        idempotent = method.upper() in IDEMPOTENT_METHODS
+        max_retries = self.policy.max_retries if idempotent else 0
+
+        attempt = 0
+        while True:
+            self._check_breaker()
+            delay = self.hedge_delay() if idempotent else None
+            try:
+                if delay is not None:
+                    response = await self._hedged_attempt(send, delay)
+                else:
+                    response = await self._attempt(send)
+            except httpx.RequestError as e:
+                if attempt >= max_retries:
+                    raise
+                logger.warning("%s 요청 실패, 재시도 %d/%d: %s", self.service_type.value, attempt + 1, max_retries, e)
+            else:
+                if response.status_code not in RETRYABLE_STATUS_CODES or attempt >= max_retries:
+                    return response
+                logger.warning(
+                    "%s 응답 %d, 재시도 %d/%d", self.service_type.value, response.status_code, attempt + 1, max_retries
+                )
+                await response.aclose()
+            attempt += 1
+            self.retries += 1
+            await asyncio.sleep(self._backoff(attempt))
+
+    async def call_once(self, send: Callable[[], Awaitable[httpx.Response]]) -> httpx.Response:
+        """
+        재시도/헤징 없이 차단기만 적용해 한 번 호출합니다. (본문 스트림처럼 다시 보낼 수 없는 요청용)
+
+        Args:
+            send: 업스트림 요청을 보내는 코루틴 함수
+
+        Returns:
+            업스트림 응답 객체
+        """
+        self.calls += 1
+        self._check_breaker()
+        return await self._attempt(send)
+
+    def stats(self) -> dict:
+        return {
+            "state": self.breaker.state,
+            "consecutive_failures": self.breaker.consecutive_failures,
+            "times_opened": self.breaker.times_opened,
+            "calls": self.calls,
+            "failures": self.failures,
+            "retries": self.retries,
+            "rejected": self.rejected,
+            "hedges": self.hedges,
+            "hedge_wins": self.hedge_wins,
+            "p95_seconds": self.latency.quantile(0.95),
+            "connect_timeout": self.policy.connect_timeout,
+            "read_timeout": self.policy.read_timeout,
+        }
+
+
+class ResilienceRegistry:
+    """서비스별 UpstreamGuard 레지스트리"""
+
+    def __init__(self):
+        self._guards: Dict[ServiceType, UpstreamGuard] = {}
+
+    def get(self, service_type: ServiceType) -> UpstreamGuard:
+        guard = self._guards.get(service_type)
+        if guard is None:
+            guard = UpstreamGuard(service_type)
+            self._guards[service_type] = guard
+        return guard
+
+    def reset(self) -> None:
+        self._guards.clear()
+
+    def stats(self) -> dict:
+        return {service_type.value: guard.stats() for service_type, guard in self._guards.items()}
+
+
+# ✅ 프로세스 전역 복원력 레지스트리
+resilience = ResilienceRegistry()
@@ -0,0 +1,97 @@
+import os
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Hashable, Mapping, Tuple
+
+logger = logging.getLogger("foundation.core.single_flight")
+
+# ✅ 동일 요청 합치기(single-flight) 사용 여부
+GATEWAY_COALESCE_ENABLED = os.getenv("GATEWAY_COALESCE_ENABLED", "true").lower() in ("1", "true", "yes")
+
+# ✅ "동일한 요청" 판단에 포함할 요청 헤더 (응답을 바꿀 수 있는 헤더)
+GATEWAY_COALESCE_VARY_HEADERS = tuple(
+    name.strip().lower()
+    for name in os.getenv(
+        "GATEWAY_COALESCE_VARY_HEADERS",
+        "accept,accept-encoding,accept-language,authorization,cookie"
+    ).split(",")
+    if name.strip()
+)
+
+
+def make_flight_key(method: str, service: str, path: str, query: str, headers: Mapping[str, str]) -> Tuple:
+    """
+    동일 요청 판단용 키를 생성합니다.
+
+    Args:
+        method: HTTP 메서드
+        service: 서비스 이름
+        path: 정규화된 요청 경로
+        query: 쿼리 문자열
+        headers: 요청 헤더
+
+    Returns:
+        요청 키
+    """
+    selected = tuple((name, headers.get(name, "")) for name in GATEWAY_COALESCE_VARY_HEADERS)
+    return (method.upper(), service, path.strip("/"), query, selected)
+
+
+class SingleFlight:
+    """
+    진행 중인 동일 요청을 하나의 업스트림 호출로 합칩니다.
+    첫 요청(leader)이 작업을 태스크로 시작하고, 같은 키로 들어온 요청은 그 결과를 함께 기다립니다.
+    작업은 태스크로 분리되어 있어 leader 클라이언트가 연결을 끊어도 나머지 대기자에게 결과가 전달됩니다.
+    """
+
+    def __init__(self, enabled: bool = GATEWAY_COALESCE_ENABLED):
+        self.enabled = enabled
+        self._inflight: Dict[Hashable, "asyncio.Task[Any]"] = {}
+        self.leaders = 0
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        키에 해당하는 작업이 진행 중이면 그 결과를 기다리고, 아니면 새로 실행합니다.
+
+        Args:
+            key: 요청 키
+            fn: 업스트림 호출 코루틴을 만드는 함수
+
+        Returns:
+            작업 결과 (모든 대기자가 같은 객체를 공유)
+        """
+        if not self.enabled:
+            return await fn()
+
+        task = self._inflight.get(key)
+        if task is not None:
+            self.coalesced += 1
+            logger.debug("진행 중인 요청에 합류: %s", key)
+        else:
+            self.leaders += 1
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t, k=key: self._finish(k, t))
+        return await asyncio.shield(task)
+
+    def _finish(self, key: Hashable, task: "asyncio.Task[Any]") -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # 대기자가 모두 사라진 경우에도 "exception was never retrieved" 경고가 나지 않도록 확인
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self) -> dict:
+        total = self.leaders + self.coalesced
+        return {
+            "enabled": self.enabled,
+            "inflight": len(self._inflight),
+            "upstream_calls": self.leaders,
+            "coalesced": self.coalesced,
+            "coalesced_ratio": round(self.coalesced / total, 4) if total else 0.0,
+        }
+
+
+# ✅ 프로세스 전역 요청 합치기
+request_coalescer = SingleFlight()
@@ -0,0 +1,135 @@
+import json
+import logging
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+from app.domain.model.service_type import ServiceType
+
+logger = logging.getLogger("foundation.core.transform")
+
+HeaderStep = Callable[[Dict[str, str]], Dict[str, str]]
+BodyStep = Callable[[Any], Any]
+
+
+@dataclass(frozen=True)
+class Transform:
+    """
+    서비스 하나에 적용할 요청/응답 변환 단계입니다. 필요한 훅만 지정합니다.
+    - request_headers: 업스트림으로 보낼 헤더 딕셔너리 → 새 헤더 딕셔너리
+    - request_body: 파싱한 요청 본문(JSON 값 또는 문자열) → 업스트림으로 보낼 JSON 값
+    - response_body: 파싱한 JSON 응답 본문 → 클라이언트로 돌려줄 JSON 값 (버퍼링 응답만)
+    """
+    name: str
+    request_headers: Optional[HeaderStep] = None
+    request_body: Optional[BodyStep] = None
+    response_body: Optional[BodyStep] = None
+
+
+@dataclass(frozen=True)
+class TransformPipeline:
+    """서비스 하나의 변환 단계를 훅별로 미리 나눠 둔 실행 계획"""
+    service: ServiceType
+    names: Tuple[str, ...] = ()
+    header_steps: Tuple[HeaderStep, ...] = ()
+    body_steps: Tuple[BodyStep, ...] = ()
+    response_steps: Tuple[BodyStep, ...] = ()
+
+    @property
+    def rewrites_body(self) -> bool:
+        """요청 본문을 파싱해야 하는지 여부 (False 면 본문 바이트를 그대로 전달)"""
+        return bool(self.body_steps)
+
+    @property
+    def rewrites_response(self) -> bool:
+        return bool(self.response_steps)
+
+    @property
+    def identity(self) -> bool:
+        """변환이 하나도 없는 서비스인지 여부"""
+        return not (self.header_steps or self.body_steps or self.response_steps)
+
+    def apply_headers(self, headers: Dict[str, str]) -> Dict[str, str]:
+        for step in self.header_steps:
+            headers = step(headers)
+        return headers
+
+    def apply_body(self, body: Any) -> Any:
+        for step in self.body_steps:
+            body = step(body)
+        return body
+
+    def apply_response(self, content: bytes) -> bytes:
+        """
+        JSON 응답 본문에 응답 변환을 적용합니다. JSON 이 아니면 그대로 돌려줍니다.
+
+        Args:
+            content: 업스트림 응답 본문 바이트
+
+        Returns:
+            변환된 본문 바이트
+        """
+        try:
+            body = json.loads(content)
+        except ValueError:
+            return content
+        for step in self.response_steps:
+            body = step(body)
+        return json.dumps(body, ensure_ascii=False).encode()
+
+
+class TransformRegistry:
+    """
+    서비스별 변환 단계를 등록받아, 시작 시 한 번 서비스별 파이프라인으로 컴파일합니다.
+    컴파일 이후에는 등록할 수 없고, 요청 처리 중에는 불변 매핑에서 파이프라인을 꺼내기만 합니다.
+    """
+
+    def __init__(self):
+        self._registered: Dict[ServiceType, List[Transform]] = {}
+        self._pipelines: Optional[Mapping[ServiceType, TransformPipeline]] = None
+
+    def register(self, service: ServiceType, transform: Transform) -> Transform:
+        """
+        서비스에 변환 단계를 추가합니다. (등록 순서대로 실행)
+
+        Raises:
+            RuntimeError: 파이프라인을 이미 컴파일한 경우
+        """
+        if self._pipelines is not None:
+            raise RuntimeError(f"변환 파이프라인이 이미 컴파일되었습니다: {service.value} {transform.name}")
+        self._registered.setdefault(service, []).append(transform)
+        return transform
+
+    def compile(self) -> Mapping[ServiceType, TransformPipeline]:
+        """등록된 변환을 서비스별 파이프라인으로 만들고 등록을 닫습니다. (여러 번 호출해도 한 번만 컴파일)"""
+        if self._pipelines is None:
+            pipelines = {}
+            for service in ServiceType:
+                steps = self._registered.get(service, [])
+                pipelines[service] = TransformPipeline(
+                    service=service,
+                    names=tuple(t.name for t in steps),
+                    header_steps=tuple(t.request_headers for t in steps if t.request_headers),
+                    body_steps=tuple(t.request_body for t in steps if t.request_body),
+                    response_steps=tuple(t.response_body for t in steps if t.response_body),
+                )
+            self._pipelines = MappingProxyType(pipelines)
+            logger.info("변환 파이프라인: %s", {s.value: p.names for s, p in pipelines.items() if p.names})
+        return self._pipelines
+
+    def get(self, service: ServiceType) -> TransformPipeline:
+        return self.compile()[service]
+
+    def stats(self) -> dict:
+        return {
+            service.value: {
+                "transforms": list(pipeline.names),
+                "rewrites_body": pipeline.rewrites_body,
+                "rewrites_response": pipeline.rewrites_response,
+            }
+            for service, pipeline in self.compile().items()
+        }
+
+
+# ✅ 프로세스 전역 변환 레지스트리 (등록: app.domain.service.transforms)
+transforms = TransformRegistry()
@@ -0,0 +1,198 @@
+import os
+import logging
+from dataclasses import dataclass
+from typing import AsyncIterator, Dict, Tuple
+
+import httpx
+
+from app.domain.model.service_type import ServiceType
+from app.foundation.core.resilience import get_policy
+
+logger = logging.getLogger("foundation.infrastructure.http_client_registry")
+
+# ✅ HTTP/2 사용 여부 (h2 패키지가 설치되어 있어야 활성화됨)
+GATEWAY_HTTP2 = os.getenv("GATEWAY_HTTP2", "false").lower() in ("1", "true", "yes")
+
+# ✅ keep-alive 연결 유지 시간 (초)
+GATEWAY_KEEPALIVE_EXPIRY = float(os.getenv("GATEWAY_KEEPALIVE_EXPIRY", "30"))
+
+
+@dataclass(frozen=True)
+class PoolLimits:
+    """서비스별 커넥션 풀 한도"""
+    max_connections: int
+    max_keepalive_connections: int
+
+
+# ✅ 서비스별 기본 커넥션 풀 한도
+# CPU 바운드 단일 프로세스 서비스(tf, chatbot)는 작게, 가벼운 서비스는 넉넉하게 잡는다.
+DEFAULT_POOL_LIMITS: Dict[ServiceType, PoolLimits] = {
+    ServiceType.TITANIC: PoolLimits(max_connections=100, max_keepalive_connections=20),
+    ServiceType.CRIME: PoolLimits(max_connections=50, max_keepalive_connections=10),
+    ServiceType.MATZIP: PoolLimits(max_connections=50, max_keepalive_connections=10),
+    ServiceType.NLP: PoolLimits(max_connections=20, max_keepalive_connections=10),
+    ServiceType.TF: PoolLimits(max_connections=20, max_keepalive_connections=10),
+    ServiceType.CHATBOT: PoolLimits(max_connections=20, max_keepalive_connections=10),
+}
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+def get_pool_limits(service_type: ServiceType) -> PoolLimits:
+    """
+    서비스별 커넥션 풀 한도를 반환합니다.
+    환경 변수 {SERVICE}_MAX_CONNECTIONS, {SERVICE}_MAX_KEEPALIVE_CONNECTIONS 로 덮어쓸 수 있습니다.
+
+    Args:
+        service_type: 서비스 타입
+
+    Returns:
+        커넥션 풀 한도
+    """
+    default = DEFAULT_POOL_LIMITS.get(service_type, PoolLimits(50, 10))
+    prefix = service_type.value.upper()
+    return PoolLimits(
+        max_connections=int(os.getenv(f"{prefix}_MAX_CONNECTIONS", default.max_connections)),
+        max_keepalive_connections=int(
+            os.getenv(f"{prefix}_MAX_KEEPALIVE_CONNECTIONS", default.max_keepalive_connections)
+        ),
+    )
+
+
+class _CountedStream(httpx.AsyncByteStream):
+    """응답 본문 스트림을 닫을 때 CountingTransport 의 사용 중 수를 줄입니다."""
+
+    def __init__(self, stream: httpx.AsyncByteStream, transport: "CountingTransport"):
+        self._stream = stream
+        self._transport = transport
+        self._closed = False
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        if not self._closed:
+            self._closed = True
+            self._transport.in_use -= 1
+        await self._stream.aclose()
+
+
+class CountingTransport(httpx.AsyncBaseTransport):
+    """
+    요청을 보낸 뒤 응답 본문을 닫을 때까지를 "사용 중"으로 세는 transport 래퍼입니다.
+    httpx/httpcore 내부(_pool 등)를 읽지 않고 공개 transport API 만으로 커넥션 사용량을 추적합니다.
+    (HTTP/1.1 에서는 사용 중인 연결 수, HTTP/2 에서는 진행 중인 요청 수)
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport):
+        self._transport = transport
+        self.in_use = 0
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self.in_use += 1
+        try:
+            response = await self._transport.handle_async_request(request)
+        except BaseException:
+            self.in_use -= 1
+            raise
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=response.headers,
+            stream=_CountedStream(response.stream, self),
+            extensions=response.extensions,
+        )
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+class HttpClientRegistry:
+    """
+    업스트림 서비스별로 공유되는 httpx.AsyncClient 레지스트리입니다.
+    - 게이트웨이 lifespan 에서 start() / close() 로 관리
+    - 서비스별 커넥션 풀 한도, HTTP/1.1 keep-alive, 선택적 HTTP/2
+    - 서비스별 connect/read 타임아웃 (resilience 정책)
+    """
+
+    def __init__(self):
+        self._clients: Dict[ServiceType, httpx.AsyncClient] = {}
+        # 사용량 메트릭용 (클라이언트를 만들 때 함께 기록)
+        self._transports: Dict[ServiceType, CountingTransport] = {}
+        self._limits: Dict[ServiceType, PoolLimits] = {}
+        self._http2 = GATEWAY_HTTP2 and _http2_available()
+        if GATEWAY_HTTP2 and not self._http2:
+            logger.warning("GATEWAY_HTTP2 가 설정되었지만 h2 패키지가 없어 HTTP/1.1 로 동작합니다.")
+
+    def _create_client(self, service_type: ServiceType) -> httpx.AsyncClient:
+        limits = get_pool_limits(service_type)
+        policy = get_policy(service_type)
+        logger.info(
+            "HTTP 클라이언트 생성: %s (max_connections=%d, keepalive=%d, http2=%s, connect=%.1fs, read=%.1fs)",
+            service_type.value, limits.max_connections, limits.max_keepalive_connections, self._http2,
+            policy.connect_timeout, policy.read_timeout,
+        )
+        transport = CountingTransport(httpx.AsyncHTTPTransport(
+            limits=httpx.Limits(
+                max_connections=limits.max_connections,
+                max_keepalive_connections=limits.max_keepalive_connections,
+                keepalive_expiry=GATEWAY_KEEPALIVE_EXPIRY,
+            ),
+            http2=self._http2,
+        ))
+        self._transports[service_type] = transport
+        self._limits[service_type] = limits
+        # 서비스별 connect/read 타임아웃 분리
+        return httpx.AsyncClient(timeout=policy.timeout(), transport=transport)
+
+    async def start(self) -> None:
+        """모든 서비스의 클라이언트를 미리 생성합니다."""
+        for service_type in ServiceType:
+            self.get(service_type)
+
+    def get(self, service_type: ServiceType) -> httpx.AsyncClient:
+        """
+        서비스용 공유 클라이언트를 반환합니다. lifespan 밖에서 호출되면 지연 생성합니다.
+
+        Args:
+            service_type: 서비스 타입
+
+        Returns:
+            공유 httpx.AsyncClient
+        """
+        client = self._clients.get(service_type)
+        if client is None or client.is_closed:
+            client = self._create_client(service_type)
+            self._clients[service_type] = client
+        return client
+
+    def pool_usage(self) -> Dict[ServiceType, Tuple[int, int]]:
+        """
+        서비스별 커넥션 풀 사용량을 반환합니다. (메트릭 수집용)
+
+        Returns:
+            서비스별 (사용 중 연결 수, 설정한 최대 연결 수)
+        """
+        return {
+            service_type: (transport.in_use, self._limits[service_type].max_connections)
+            for service_type, transport in self._transports.items()
+        }
+
+    async def close(self) -> None:
+        """모든 클라이언트를 닫고 커넥션 풀을 정리합니다."""
+        for service_type, client in list(self._clients.items()):
+            await client.aclose()
+            logger.info("HTTP 클라이언트 종료: %s", service_type.value)
+        self._clients.clear()
+        self._transports.clear()
+        self._limits.clear()
+
+
+# ✅ 프로세스 전역 레지스트리
+client_registry = HttpClientRegistry()
@@ -0,0 +1,263 @@
+import os
+import time
+import random
+import asyncio
+import logging
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import httpx
+
+from app.domain.model.service_type import SERVICE_URLS, ServiceType
+
+logger = logging.getLogger("foundation.infrastructure.load_balancer")
+
+# ✅ 레플리카 선택 전략: round_robin | least_outstanding | p2c (power of two choices)
+GATEWAY_LB_STRATEGY = os.getenv("GATEWAY_LB_STRATEGY", "p2c")
+
+# ✅ 능동 헬스 체크 설정
+GATEWAY_HEALTH_PATH = os.getenv("GATEWAY_HEALTH_PATH", "/health")
+GATEWAY_HEALTH_INTERVAL = float(os.getenv("GATEWAY_HEALTH_INTERVAL", "5"))
+GATEWAY_HEALTH_TIMEOUT = float(os.getenv("GATEWAY_HEALTH_TIMEOUT", "2"))
+GATEWAY_UNHEALTHY_THRESHOLD = int(os.getenv("GATEWAY_UNHEALTHY_THRESHOLD", "2"))
+GATEWAY_HEALTHY_THRESHOLD = int(os.getenv("GATEWAY_HEALTHY_THRESHOLD", "2"))
+
+# ✅ 요청 실패(연결 오류)가 연속으로 이만큼 나면 헬스 체크를 기다리지 않고 제외
+GATEWAY_EJECT_CONSECUTIVE_ERRORS = int(os.getenv("GATEWAY_EJECT_CONSECUTIVE_ERRORS", "5"))
+
+# ✅ 복귀한 레플리카의 트래픽 비중을 최소 비중에서 1.0 까지 올리는 시간 (초)
+GATEWAY_SLOW_START = float(os.getenv("GATEWAY_SLOW_START", "30"))
+SLOW_START_MIN_WEIGHT = 0.1
+
+
+def parse_replicas(spec: Optional[str]) -> List[str]:
+    """
+    콤마로 구분된 레플리카 URL 목록을 파싱합니다. (예: "http://crime-1:9002,http://crime-2:9002")
+
+    Args:
+        spec: 환경 변수 값
+
+    Returns:
+        끝의 / 를 제거한 URL 목록
+    """
+    if not spec:
+        return []
+    return [url.strip().rstrip("/") for url in spec.split(",") if url.strip()]
+
+
+class Replica:
+    """업스트림 레플리카 하나의 상태"""
+
+    def __init__(self, url: str):
+        self.url = url
+        self.healthy = True
+        self.outstanding = 0
+        self.requests = 0
+        self.errors = 0
+        self.consecutive_errors = 0
+        self.probe_failures = 0
+        self.probe_successes = 0
+        self.ejections = 0
+        self.reinstated_at: Optional[float] = None
+
+    def weight(self, now: float) -> float:
+        """복귀 직후에는 작은 비중에서 시작해 GATEWAY_SLOW_START 동안 1.0 까지 올라갑니다."""
+        if self.reinstated_at is None or GATEWAY_SLOW_START <= 0:
+            return 1.0
+        progress = (now - self.reinstated_at) / GATEWAY_SLOW_START
+        if progress >= 1.0:
+            self.reinstated_at = None
+            return 1.0
+        return max(SLOW_START_MIN_WEIGHT, progress)
+
+    def load(self, now: float) -> float:
+        """비중을 반영한 부하 (작을수록 우선)"""
+        return (self.outstanding + 1) / self.weight(now)
+
+    def eject(self, reason: str) -> None:
+        if self.healthy:
+            self.healthy = False
+            self.ejections += 1
+            self.reinstated_at = None
+            logger.warning("레플리카 제외: %s (%s)", self.url, reason)
+
+    def reinstate(self) -> None:
+        if not self.healthy:
+            self.healthy = True
+            self.consecutive_errors = 0
+            self.reinstated_at = time.monotonic()
+            logger.info("레플리카 복귀 (slow start %.0fs): %s", GATEWAY_SLOW_START, self.url)
+
+    def stats(self) -> dict:
+        return {
+            "url": self.url,
+            "healthy": self.healthy,
+            "weight": round(self.weight(time.monotonic()), 3),
+            "outstanding": self.outstanding,
+            "requests": self.requests,
+            "errors": self.errors,
+            "ejections": self.ejections,
+        }
+
+
+class ReplicaPool:
+    """
+    서비스 하나의 레플리카 목록과 선택 전략입니다.
+    정상 레플리카가 하나도 없으면 전체 레플리카를 대상으로 선택합니다. (모두 거절하는 것보다 낫다)
+    """
+
+    def __init__(self, service_type: ServiceType, urls: List[str], strategy: str = GATEWAY_LB_STRATEGY):
+        if strategy not in ("round_robin", "least_outstanding", "p2c"):
+            raise ValueError(f"지원하지 않는 로드 밸런싱 전략: {strategy}")
+        self.service_type = service_type
+        self.replicas = [Replica(url) for url in urls]
+        self.strategy = strategy
+        self._cursor = 0
+
+    def _candidates(self) -> List[Replica]:
+        healthy = [replica for replica in self.replicas if replica.healthy]
+        return healthy or self.replicas
+
+    def pick(self) -> Replica:
+        """전략에 따라 요청을 보낼 레플리카를 고릅니다."""
+        candidates = self._candidates()
+        if len(candidates) == 1:
+            return candidates[0]
+        now = time.monotonic()
+
+        if self.strategy == "round_robin":
+            # slow start 중인 레플리카는 비중만큼의 확률로만 차례를 받음
+            for _ in range(len(candidates)):
+                replica = candidates[self._cursor % len(candidates)]
+                self._cursor += 1
+                if random.random() < replica.weight(now):
+                    return replica
+            return replica
+        if self.strategy == "least_outstanding":
+            return min(candidates, key=lambda replica: replica.load(now))
+        first, second = random.sample(candidates, 2)
+        return first if first.load(now) <= second.load(now) else second
+
+    @contextmanager
+    def track(self, replica: Replica) -> Iterator[None]:
+        """
+        레플리카로 보낸 요청의 진행 중 개수와 결과를 기록합니다.
+        연결 오류가 연속으로 나면 헬스 체크를 기다리지 않고 제외합니다.
+        """
+        replica.outstanding += 1
+        replica.requests += 1
+        try:
+            yield
+        except httpx.TransportError:
+            replica.errors += 1
+            replica.consecutive_errors += 1
+            if replica.consecutive_errors >= GATEWAY_EJECT_CONSECUTIVE_ERRORS:
+                replica.eject(f"연속 요청 오류 {replica.consecutive_errors}회")
+            raise
+        else:
+            replica.consecutive_errors = 0
+        finally:
+            replica.outstanding -= 1
+
+    def stats(self) -> dict:
+        return {
+            "strategy": self.strategy,
+            "replicas": [replica.stats() for replica in self.replicas],
+        }
+
+
+class LoadBalancer:
+    """
+    서비스별 ReplicaPool 레지스트리와 능동 헬스 체커입니다.
+    레플리카 목록은 SERVICE_URLS 의 값(콤마로 구분된 URL 목록)에서 읽고, 값이 바뀌면 다시 만듭니다.
+    """
+
+    def __init__(self):
+        self._pools: Dict[ServiceType, Tuple[str, ReplicaPool]] = {}
+        self._health_task: Optional["asyncio.Task[None]"] = None
+        self._health_client: Optional[httpx.AsyncClient] = None
+
+    def pool(self, service_type: ServiceType) -> Optional[ReplicaPool]:
+        """
+        서비스의 레플리카 풀을 반환합니다.
+
+        Args:
+            service_type: 서비스 타입
+
+        Returns:
+            레플리카 풀 (설정된 URL 이 없으면 None)
+        """
+        spec = SERVICE_URLS.get(service_type)
+        cached = self._pools.get(service_type)
+        if cached is not None and cached[0] == spec:
+            return cached[1]
+        urls = parse_replicas(spec)
+        if not urls:
+            return None
+        pool = ReplicaPool(service_type, urls)
+        self._pools[service_type] = (spec, pool)
+        logger.info("레플리카 풀 구성: %s → %s (%s)", service_type.value, urls, pool.strategy)
+        return pool
+
+    async def probe(self, replica: Replica) -> None:
+        """레플리카 하나의 헬스 엔드포인트를 호출해 상태를 갱신합니다."""
+        try:
+            response = await self._health_client.get(f"{replica.url}{GATEWAY_HEALTH_PATH}")
+            ok = response.status_code < 500
+        except httpx.HTTPError:
+            ok = False
+
+        if ok:
+            replica.probe_failures = 0
+            replica.probe_successes += 1
+            if not replica.healthy and replica.probe_successes >= GATEWAY_HEALTHY_THRESHOLD:
+                replica.reinstate()
+        else:
+            replica.probe_successes = 0
+            replica.probe_failures += 1
+            if replica.probe_failures >= GATEWAY_UNHEALTHY_THRESHOLD:
+                replica.eject(f"헬스 체크 실패 {replica.probe_failures}회")
+
+    async def probe_all(self) -> None:
+        """모든 서비스의 레플리카를 한 번씩 점검합니다."""
+        replicas = []
+        for service_type in ServiceType:
+            pool = self.pool(service_type)
+            if pool is not None:
+                replicas.extend(pool.replicas)
+        await asyncio.gather(*(self.probe(replica) for replica in replicas))
+
+    async def _health_loop(self) -> None:
+        while True:
+            try:
+                await self.probe_all()
+            except Exception as e:
+                logger.error(f"헬스 체크 오류: {str(e)}")
+            await asyncio.sleep(GATEWAY_HEALTH_INTERVAL)
+
+    async def start(self) -> None:
+        """백그라운드 헬스 체크를 시작합니다. (GATEWAY_HEALTH_INTERVAL <= 0 이면 비활성)"""
+        if GATEWAY_HEALTH_INTERVAL <= 0 or self._health_task is not None:
+            return
+        self._health_client = httpx.AsyncClient(timeout=GATEWAY_HEALTH_TIMEOUT)
+        self._health_task = asyncio.create_task(self._health_loop())
+
+    async def close(self) -> None:
+        """헬스 체크를 중지합니다."""
+        if self._health_task is not None:
+            self._health_task.cancel()
+            try:
+                await self._health_task
+            except asyncio.CancelledError:
+                pass
+            self._health_task = None
+        if self._health_client is not None:
+            await self._health_client.aclose()
+            self._health_client = None
+
+    def stats(self) -> dict:
+        return {service_type.value: pool.stats() for service_type, (_, pool) in self._pools.items()}
+
+
+# ✅ 프로세스 전역 로드 밸런서
+load_balancer = LoadBalancer()
@@ -0,0 +1,234 @@
+import os
+import time
+import hashlib
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, Mapping, Optional, Tuple
+
+from app.domain.model.service_type import ServiceType
+
+logger = logging.getLogger("foundation.infrastructure.response_cache")
+
+# ✅ 캐시 전체 메모리 한도 (바이트)
+GATEWAY_CACHE_MAX_BYTES = int(os.getenv("GATEWAY_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+
+# ✅ 항목 하나의 최대 크기 (이보다 큰 응답은 캐시하지 않음)
+GATEWAY_CACHE_MAX_ENTRY_BYTES = int(os.getenv("GATEWAY_CACHE_MAX_ENTRY_BYTES", str(8 * 1024 * 1024)))
+
+# ✅ 경로별 TTL (초) - "경로=TTL" 을 콤마로 구분
+# 경로는 게이트웨이가 업스트림으로 보내는 경로 (예: /ai/v1/crime/crime/map → crime/map)
+GATEWAY_CACHE_TTLS = os.getenv(
+    "GATEWAY_CACHE_TTLS",
+    "crime/map=300,crime/map/circle-marker=300,nlp/generate-wordcloud=600,tf/mnist-sample=3600"
+)
+
+# ✅ 캐시 키에 포함할 요청 헤더
+GATEWAY_CACHE_VARY_HEADERS = tuple(
+    name.strip().lower()
+    for name in os.getenv("GATEWAY_CACHE_VARY_HEADERS", "accept,accept-encoding,accept-language").split(",")
+    if name.strip()
+)
+
+# ✅ 이 헤더가 있는 요청은 캐시를 쓰지 않음 (사용자별 응답을 다른 클라이언트에게 주지 않도록)
+GATEWAY_CACHE_BYPASS_HEADERS = tuple(
+    name.strip().lower()
+    for name in os.getenv("GATEWAY_CACHE_BYPASS_HEADERS", "authorization,cookie").split(",")
+    if name.strip()
+)
+
+
+def parse_route_ttls(spec: str) -> Dict[str, float]:
+    """
+    "경로=TTL,경로=TTL" 형식의 설정 문자열을 파싱합니다.
+
+    Args:
+        spec: 설정 문자열
+
+    Returns:
+        경로별 TTL 딕셔너리
+    """
+    ttls = {}
+    for item in spec.split(","):
+        if "=" not in item:
+            continue
+        path, ttl = item.split("=", 1)
+        ttls[path.strip().strip("/")] = float(ttl)
+    return ttls
+
+
+CacheKey = Tuple[str, str, str, Tuple[Tuple[str, str], ...]]
+
+
+@dataclass
+class CachedResponse:
+    """캐시에 저장되는 응답"""
+    status_code: int
+    headers: Dict[str, str]
+    content: bytes
+    etag: str
+    upstream_etag: bool
+    expires_at: float
+    size: int = field(init=False)
+
+    def __post_init__(self):
+        self.size = len(self.content) + sum(len(k) + len(v) for k, v in self.headers.items())
+
+    def is_fresh(self, now: float) -> bool:
+        return now < self.expires_at
+
+
+class ResponseCache:
+    """
+    게이트웨이 GET 응답 캐시입니다.
+    - 서비스/경로/쿼리/선택 헤더를 키로 사용
+    - 전체 바이트 수 기준 LRU 제거
+    - 경로별 TTL, 만료 후 ETag(If-None-Match) 재검증
+    - 적중/미스 카운터
+    """
+
+    def __init__(
+        self,
+        route_ttls: Optional[Dict[str, float]] = None,
+        max_bytes: int = GATEWAY_CACHE_MAX_BYTES,
+        max_entry_bytes: int = GATEWAY_CACHE_MAX_ENTRY_BYTES,
+        vary_headers: Tuple[str, ...] = GATEWAY_CACHE_VARY_HEADERS,
+        bypass_headers: Tuple[str, ...] = GATEWAY_CACHE_BYPASS_HEADERS,
+    ):
+        self.route_ttls = route_ttls if route_ttls is not None else parse_route_ttls(GATEWAY_CACHE_TTLS)
+        self.max_bytes = max_bytes
+        self.max_entry_bytes = max_entry_bytes
+        self.vary_headers = vary_headers
+        self.bypass_headers = bypass_headers
+        self._entries: "OrderedDict[CacheKey, CachedResponse]" = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.stores = 0
+        self.evictions = 0
+        self.bypasses = 0
+
+    def ttl_for(self, path: str) -> Optional[float]:
+        """경로에 설정된 TTL 을 반환합니다. 캐시 대상이 아니면 None."""
+        return self.route_ttls.get(path.strip("/"))
+
+    def ttl_for_request(self, path: str, headers: Mapping[str, str]) -> Optional[float]:
+        """
+        요청에 적용할 캐시 TTL 을 반환합니다.
+        인증 정보(Authorization, Cookie)가 있는 요청은 사용자별 응답일 수 있으므로 캐시하지 않습니다.
+
+        Args:
+            path: 정규화된 요청 경로
+            headers: 요청 헤더
+
+        Returns:
+            TTL (캐시 대상이 아니면 None)
+        """
+        ttl = self.ttl_for(path)
+        if ttl and any(name in headers for name in self.bypass_headers):
+            self.bypasses += 1
+            return None
+        return ttl
+
+    def make_key(self, service: ServiceType, path: str, query: str, headers: Mapping[str, str]) -> CacheKey:
+        """
+        캐시 키를 생성합니다.
+
+        Args:
+            service: 서비스 타입
+            path: 정규화된 요청 경로
+            query: 쿼리 문자열
+            headers: 요청 헤더
+
+        Returns:
+            캐시 키
+        """
+        selected = tuple((name, headers.get(name, "")) for name in self.vary_headers)
+        return (service.value, path.strip("/"), query, selected)
+
+    def get(self, key: CacheKey) -> Optional[CachedResponse]:
+        """만료 여부와 관계없이 저장된 항목을 반환하고 LRU 순서를 갱신합니다."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def store(
+        self,
+        key: CacheKey,
+        status_code: int,
+        headers: Mapping[str, str],
+        content: bytes,
+        ttl: float,
+    ) -> Optional[CachedResponse]:
+        """
+        응답을 캐시에 저장합니다. 너무 크거나 no-store 인 응답은 저장하지 않습니다.
+
+        Returns:
+            저장된 항목 (저장하지 않았으면 None)
+        """
+        cache_control = headers.get("cache-control", "").lower()
+        if "no-store" in cache_control or "private" in cache_control:
+            return None
+        if len(content) > self.max_entry_bytes:
+            return None
+
+        upstream_etag = headers.get("etag")
+        etag = upstream_etag or f'W/"{hashlib.blake2b(content, digest_size=16).hexdigest()}"'
+        stored_headers = dict(headers)
+        stored_headers["etag"] = etag
+        entry = CachedResponse(
+            status_code=status_code,
+            headers=stored_headers,
+            content=content,
+            etag=etag,
+            upstream_etag=upstream_etag is not None,
+            expires_at=time.monotonic() + ttl,
+        )
+
+        self._remove(key)
+        self._entries[key] = entry
+        self._bytes += entry.size
+        self.stores += 1
+        while self._bytes > self.max_bytes and self._entries:
+            evicted_key, _ = next(iter(self._entries.items()))
+            self._remove(evicted_key)
+            self.evictions += 1
+        return entry
+
+    def refresh(self, key: CacheKey, ttl: float) -> None:
+        """재검증(304)에 성공한 항목의 만료 시간을 연장합니다."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            entry.expires_at = time.monotonic() + ttl
+            self.revalidations += 1
+
+    def _remove(self, key: CacheKey) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry.size
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._bytes = 0
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            "revalidations": self.revalidations,
+            "stores": self.stores,
+            "evictions": self.evictions,
+            "bypasses": self.bypasses,
+            "routes": self.route_ttls,
+        }
+
+
+# ✅ 프로세스 전역 응답 캐시
+response_cache = ResponseCache()
@@ -1,14 +1,45 @@
+import re
 import json
-from typing import Optional
+from typing import Optional, Tuple
 from fastapi import Request
-from app.domain.model.service_type import ServiceType
+from starlette.datastructures import UploadFile
+from app.domain.model.service_type import ServiceType, API_PREFIX
+from app.foundation.core.transform import transforms
+from app.platform.tracing import trace_headers
 import logging
 
 logger = logging.getLogger("foundation.utils.request_utils")
 
+# 프록시 구간에서 그대로 전달하면 안 되는 hop-by-hop 헤더
+HOP_BY_HOP_HEADERS = frozenset([
+    'connection', 'keep-alive', 'proxy-authenticate', 'proxy-authorization',
+    'te', 'trailer', 'transfer-encoding', 'upgrade'
+])
+
+# 버퍼링된 업스트림 응답에서 클라이언트로 그대로 전달할 헤더
+PASSTHROUGH_RESPONSE_HEADERS = frozenset([
+    'content-type', 'content-disposition', 'content-language',
+    'cache-control', 'etag', 'last-modified', 'expires', 'vary', 'location',
+    'x-cache', 'retry-after'
+])
+
+# 버퍼링 프록시 요청에서 제외할 헤더 (starlette 헤더 이름은 이미 소문자)
+# accept-encoding 은 httpx 가 풀 수 있는 인코딩으로 다시 설정 (클라이언트 압축은 게이트웨이가 협상)
+EXCLUDED_REQUEST_HEADERS = frozenset(['content-length', 'host', 'accept-encoding'])
+# 스트리밍 패스스루에서 제외할 헤더 (content-length 는 유지)
+STREAMING_EXCLUDED_REQUEST_HEADERS = HOP_BY_HOP_HEADERS | {'host'}
+
+_REPEATED_SLASHES = re.compile(r'/{2,}')
+
+# 서비스가 게이트웨이 기준 URL(작업 상태 URL 등)을 만들 수 있도록 전달하는 경로 접두사
+FORWARDED_PREFIX_HEADER = 'X-Forwarded-Prefix'
+
+# 폼 파싱이 필요한 Content-Type
+FORM_CONTENT_TYPES = ('multipart/form-data', 'application/x-www-form-urlencoded')
+
 def clean_request_path(path: str) -> str:
     """
-    경로 문자열에서 중복된 슬래시(//)를 하나로 정리합니다.
+    경로 문자열에서 중복된 슬래시(//)를 하나로 정리합니다. (한 번의 치환으로 처리)
     
     Args:
         path: 정리할 경로 문자열
@@ -16,15 +47,17 @@ def clean_request_path(path: str) -> str:
     Returns:
         정규화된 경로 문자열
     """
-    while '//' in path:
-        path = path.replace('//', '/')
-    return path
+    if '//' not in path:
+        return path
+    return _REPEATED_SLASHES.sub('/', path)
 
 def prepare_headers(request: Request, service: ServiceType) -> dict:
     """
     요청 헤더를 준비합니다.
-    - content-length, host 헤더 제거
-    - 챗봇 서비스의 경우 Content-Type을 application/json으로 설정
+    - content-length, host, accept-encoding 헤더 제거
+    - X-Request-ID / traceparent 추적 헤더 전달
+    - X-Forwarded-Prefix 로 게이트웨이 경로 접두사 전달
+    - 서비스에 등록된 헤더 변환 적용 (예: 챗봇은 Content-Type 을 application/json 으로 설정)
     
     Args:
         request: FastAPI 요청 객체
@@ -33,21 +66,17 @@ def prepare_headers(request: Request, service: ServiceType) -> dict:
     Returns:
         처리된 헤더 딕셔너리
     """
-    headers = {k: v for k, v in request.headers.items() if k.lower() not in ['content-length', 'host']}
-    
-    if service == ServiceType.CHATBOT:
-        # 기존 Content-Type 헤더를 제거하고 새로 설정
-        headers = {k: v for k, v in headers.items() if k.lower() != 'content-type'}
-        headers["Content-Type"] = "application/json"
-        logger.info("챗봇 서비스용 Content-Type 헤더 설정: application/json")
-    
-    return headers
+    headers = {k: v for k, v in request.headers.items() if k not in EXCLUDED_REQUEST_HEADERS}
+    headers.update(trace_headers())
+    headers[FORWARDED_PREFIX_HEADER] = f"{API_PREFIX}/{service.value}"
+    return transforms.get(service).apply_headers(headers)
 
 async def prepare_body(request: Request, json_data: Optional[str], service: ServiceType) -> dict:
     """
-    요청 본문을 준비합니다.
-    - JSON 파싱 처리
-    - 챗봇 서비스의 경우 {"message": ..., "user_id": "123"} 형식으로 변환
+    본문 변환이 필요한 요청의 본문을 준비합니다. (변환이 없는 서비스는 본문 바이트를 그대로 전달하므로 호출하지 않음)
+    - Form 의 json_data 또는 요청 본문을 JSON 으로 파싱 (실패하면 문자열 그대로)
+    - 서비스에 등록된 본문 변환 적용 (예: 챗봇은 {"message": ..., "user_id": ...} 형식으로 변환)
+    - 결과가 객체가 아니면 {"data": 문자열} 로 감쌈
     
     Args:
         request: FastAPI 요청 객체
@@ -57,54 +86,62 @@ async def prepare_body(request: Request, json_data: Optional[str], service: Serv
     Returns:
         처리된 요청 본문 딕셔너리
     """
-    is_chatbot = service == ServiceType.CHATBOT
-    body_dict = {}
-    
-    # JSON 데이터 파싱
-    if json_data:
+    raw = json_data if json_data else await request.body()
+    if raw:
         try:
-            parsed = json.loads(json_data)
-            logger.debug(f"Form 데이터에서 JSON 파싱 성공: {type(parsed)}")
-        except json.JSONDecodeError:
-            parsed = json_data
-            logger.debug(f"Form 데이터 JSON 파싱 실패, 원본 문자열 사용: {type(parsed)}")
+            parsed = json.loads(raw)
+        except ValueError:
+            # 바이트 본문은 JSON 이 아닐 때만 문자열로 디코딩
+            parsed = raw if isinstance(raw, str) else raw.decode('utf-8', errors='replace')
+            logger.debug("본문 JSON 파싱 실패, 원본 문자열 사용")
     else:
-        # 요청 본문에서 데이터 가져오기
-        body_bytes = await request.body()
-        if body_bytes:
-            body_text = body_bytes.decode('utf-8', errors='replace')
-            try:
-                parsed = json.loads(body_text)
-                logger.debug(f"요청 본문에서 JSON 파싱 성공: {type(parsed)}")
-            except json.JSONDecodeError:
-                parsed = body_text
-                logger.debug(f"요청 본문 JSON 파싱 실패, 원본 문자열 사용: {type(parsed)}")
-        else:
-            parsed = {}
-            logger.debug("요청 본문 없음, 빈 객체 사용")
+        parsed = {}
     
-    # 챗봇 서비스 처리
-    if is_chatbot:
-        if isinstance(parsed, dict) and "message" in parsed:
-            # 이미 올바른 형식이면 user_id 추가 (없는 경우)
-            if "user_id" not in parsed:
-                parsed["user_id"] = "123"
-            return parsed
-        else:
-            # 다른 형식이면 message 필드로 변환
-            message = str(parsed)
-            if isinstance(parsed, dict) and len(parsed) > 0:
-                # 첫 번째 필드 값을 message로 사용
-                first_key = next(iter(parsed))
-                message = str(parsed[first_key])
-            
-            return {
-                "message": message,
-                "user_id": "123"
-            }
-    
-    # 일반 서비스 처리
+    parsed = transforms.get(service).apply_body(parsed)
     if isinstance(parsed, dict):
         return parsed
-    else:
-        return {"data": str(parsed)} 
\ No newline at end of file
+    return {"data": str(parsed)}
+
+def prepare_streaming_headers(request: Request, service: ServiceType) -> dict:
+    """
+    스트리밍 패스스루용 요청 헤더를 준비합니다.
+    - host, hop-by-hop 헤더 제거
+    - content-length 는 유지하여 업스트림에 chunked 인코딩 없이 그대로 전달
+    - X-Request-ID / traceparent 추적 헤더 전달
+    - X-Forwarded-Prefix 로 게이트웨이 경로 접두사 전달
+    
+    Args:
+        request: FastAPI 요청 객체
+        service: 서비스 타입
+        
+    Returns:
+        처리된 헤더 딕셔너리
+    """
+    headers = {k: v for k, v in request.headers.items() if k not in STREAMING_EXCLUDED_REQUEST_HEADERS}
+    headers.update(trace_headers())
+    headers[FORWARDED_PREFIX_HEADER] = f"{API_PREFIX}/{service.value}"
+    return headers
+
+async def read_form_fields(request: Request) -> Tuple[Optional[UploadFile], Optional[str]]:
+    """
+    폼 요청에서 업로드 파일(file)과 JSON 문자열(json_data) 필드를 꺼냅니다.
+    폼 요청이 아니면 본문을 건드리지 않고 (None, None)을 반환합니다.
+    
+    Args:
+        request: FastAPI 요청 객체
+        
+    Returns:
+        (업로드 파일, JSON 문자열) 튜플
+    """
+    content_type = request.headers.get('content-type', '')
+    if not content_type.startswith(FORM_CONTENT_TYPES):
+        return None, None
+    
+    form = await request.form()
+    file = form.get('file')
+    json_data = form.get('json_data')
+    if not isinstance(file, UploadFile):
+        file = None
+    if json_data is not None and not isinstance(json_data, str):
+        json_data = None
+    return file, json_data
\ No newline at end of file
@@ -1,23 +1,33 @@
-from fastapi import FastAPI, APIRouter, Request, File, UploadFile, Form
+from fastapi import FastAPI, APIRouter, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from dotenv import load_dotenv
 from typing import Dict, Any, Optional
 import logging
-import sys
 from contextlib import asynccontextmanager
 import json
 from pydantic import BaseModel
 from app.domain.model.service_proxy_factory import ServiceProxyFactory
-from app.domain.model.service_type import ServiceType
-from app.domain.service.request_service import handle_request, process_response
-
-# ✅ 로깅 설정
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[logging.StreamHandler(sys.stdout)]
-)
+from app.domain.model.service_type import ServiceType, API_PREFIX
+from app.domain.model.batch_schema import BatchRequest, BatchResponse
+from app.domain.service.batch_service import batch_executor
+from app.domain.service.request_service import handle_request, process_response, error_response
+from app.foundation.infrastructure.http_client_registry import client_registry
+from app.foundation.infrastructure.response_cache import response_cache
+from app.foundation.infrastructure.load_balancer import load_balancer
+from app.platform.instrumentation import instrument
+from app.platform.tracing import setup_tracing
+from app.platform.compression import setup_compression, compression_stats
+from app.platform.logging_setup import configure_logging, shutdown_logging, logging_stats
+import app.platform.gateway_metrics  # noqa: F401  (게이트웨이 상태 수집기 등록)
+from app.foundation.core.single_flight import request_coalescer
+from app.foundation.core.resilience import resilience
+from app.foundation.core.admission import admission
+from app.foundation.core.rate_limit import rate_limiter
+from app.foundation.core.transform import transforms
+
+# ✅ 로깅 설정 (큐 기반 비동기 핸들러, GATEWAY_LOG_FORMAT=json 이면 구조화 로그)
+configure_logging()
 logger = logging.getLogger("gateway_api")
 
 # ✅ 환경변수 로드
@@ -35,8 +45,20 @@ class FinanceRequest(BaseModel):
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     print("🚀🚀🚀 FastAPI 앱이 시작됩니다.")
+    # 업스트림 서비스별 공유 커넥션 풀 생성
+    await client_registry.start()
+    # 레플리카 능동 헬스 체크 시작
+    await load_balancer.start()
+    # 속도 제한 저장소 연결 (redis 사용 시)
+    await rate_limiter.start()
     yield
+    await rate_limiter.close()
+    await load_balancer.close()
+    # 커넥션 풀 정리
+    await client_registry.close()
     print("🛑 FastAPI 앱이 종료됩니다.")
+    # 큐에 남은 로그 기록
+    shutdown_logging()
 
 # ✅ FastAPI 설정
 app = FastAPI(
@@ -55,8 +77,32 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# ✅ 응답 압축 (Accept-Encoding 협상: zstd / br / gzip)
+setup_compression(app)
+
+# ✅ 메트릭 계측 (/metrics)
+instrument(app, "gateway")
+
+# ✅ 분산 추적 (X-Request-ID / traceparent 생성, 스팬 JSONL 기록)
+setup_tracing(app, "gateway")
+
 # ✅ 메인 라우터 생성
-gateway_router = APIRouter(prefix="/ai/v1", tags=["Gateway API"])
+gateway_router = APIRouter(prefix=API_PREFIX, tags=["Gateway API"])
+
+# ✅ 배치 요청 (여러 서비스 호출을 한 번의 왕복으로)
+# /{service}/{path} 프록시 경로보다 먼저 등록
+@gateway_router.post(
+    "/batch",
+    summary="배치 프록시 (하위 요청 동시 실행)",
+    description="하위 요청들을 동시에 실행하고 요청 순서대로 결과(하위 요청별 상태 포함)를 돌려줍니다.",
+    response_model=BatchResponse
+)
+async def proxy_batch(batch: BatchRequest, request: Request):
+    try:
+        return JSONResponse(await batch_executor.run(batch, request))
+    except Exception as e:
+        logger.error(f"게이트웨이 배치 오류: {str(e)}")
+        return error_response(e)
 
 # ✅ 메인 라우터 실행
 # GET
@@ -68,78 +114,128 @@ async def proxy_get(
 ):
     try:
         response = await handle_request(service, path, request, "GET")
-        return process_response(response)
+        return process_response(response, service)
     except Exception as e:
         logger.error(f"게이트웨이 오류: {str(e)}")
-        return JSONResponse(
-            content={"error": str(e)},
-            status_code=500
-        )
+        return error_response(e)
 
 # 통합 POST 요청 처리 (JSON 또는 파일 업로드)
+# 업로드 본문을 스트리밍으로 넘길 수 있도록 File/Form 파라미터를 선언하지 않고,
+# 필요할 때만 handle_request 안에서 폼을 파싱한다. (문서용 스키마는 openapi_extra 로 유지)
 @gateway_router.post(
     "/{service}/{path:path}", 
     summary="통합 POST 프록시 (JSON 또는 파일 업로드)", 
-    description="하나의 엔드포인트에서 JSON 요청과 파일 업로드를 모두 처리합니다."
+    description="하나의 엔드포인트에서 JSON 요청과 파일 업로드를 모두 처리합니다.",
+    openapi_extra={
+        "requestBody": {
+            "content": {
+                "multipart/form-data": {
+                    "schema": {
+                        "type": "object",
+                        "properties": {
+                            "file": {"type": "string", "format": "binary", "description": "업로드할 파일 (선택 사항)"},
+                            "json_data": {"type": "string", "description": "JSON 형식의 데이터 (선택 사항)"}
+                        }
+                    }
+                },
+                "application/json": {"schema": {"type": "object"}}
+            }
+        }
+    }
 )
 async def proxy_post(
     service: ServiceType, 
     path: str,
-    request: Request,
-    file: UploadFile = File(None, description="업로드할 파일 (선택 사항)"),
-    json_data: Optional[str] = Form(None, description="JSON 형식의 데이터 (선택 사항)")
+    request: Request
 ):
     try:
-        response = await handle_request(service, path, request, "POST", json_data, file)
-        return process_response(response)
+        response = await handle_request(service, path, request, "POST")
+        return process_response(response, service)
     except Exception as e:
         logger.error(f"게이트웨이 오류: {str(e)}")
-        return JSONResponse(
-            content={"error": str(e)},
-            status_code=500
-        )
+        return error_response(e)
 
 # PUT
 @gateway_router.put("/{service}/{path:path}", summary="PUT 프록시")
 async def proxy_put(service: ServiceType, path: str, request: Request):
     try:
         response = await handle_request(service, path, request, "PUT")
-        return process_response(response)
+        return process_response(response, service)
     except Exception as e:
         logger.error(f"게이트웨이 오류: {str(e)}")
-        return JSONResponse(
-            content={"error": str(e)},
-            status_code=500
-        )
+        return error_response(e)
 
 # DELETE
 @gateway_router.delete("/{service}/{path:path}", summary="DELETE 프록시")
 async def proxy_delete(service: ServiceType, path: str, request: Request):
     try:
         response = await handle_request(service, path, request, "DELETE")
-        return process_response(response)
+        return process_response(response, service)
     except Exception as e:
         logger.error(f"게이트웨이 오류: {str(e)}")
-        return JSONResponse(
-            content={"error": str(e)},
-            status_code=500
-        )
+        return error_response(e)
 
 # PATCH
 @gateway_router.patch("/{service}/{path:path}", summary="PATCH 프록시")
 async def proxy_patch(service: ServiceType, path: str, request: Request):
     try:
         response = await handle_request(service, path, request, "PATCH")
-        return process_response(response)
+        return process_response(response, service)
     except Exception as e:
         logger.error(f"게이트웨이 오류: {str(e)}")
-        return JSONResponse(
-            content={"error": str(e)},
-            status_code=500
-        )
+        return error_response(e)
+
+# ✅ 게이트웨이 관리 라우터
+admin_router = APIRouter(prefix="/gateway", tags=["Gateway Admin"])
+
+@admin_router.get("/cache/stats", summary="응답 캐시 통계")
+async def cache_stats():
+    return response_cache.stats()
+
+@admin_router.delete("/cache", summary="응답 캐시 비우기")
+async def clear_cache():
+    response_cache.clear()
+    return {"message": "응답 캐시를 비웠습니다."}
+
+@admin_router.get("/coalescing/stats", summary="동일 요청 합치기(single-flight) 통계")
+async def coalescing_stats():
+    return request_coalescer.stats()
+
+@admin_router.get("/resilience/stats", summary="서비스별 차단기/재시도/헤징 통계")
+async def resilience_stats():
+    return resilience.stats()
+
+@admin_router.get("/admission/stats", summary="서비스별 동시 실행/대기열 통계")
+async def admission_stats():
+    return admission.stats()
+
+@admin_router.get("/batch/stats", summary="배치 요청 설정과 통계")
+async def batch_stats():
+    return batch_executor.stats()
+
+@admin_router.get("/rate-limit/stats", summary="클라이언트 x 서비스별 속도 제한 통계")
+async def rate_limit_stats():
+    return rate_limiter.stats()
+
+@admin_router.get("/transforms/stats", summary="서비스별 요청/응답 변환 파이프라인")
+async def transforms_stats():
+    return transforms.stats()
+
+@admin_router.get("/upstreams", summary="서비스별 레플리카 상태")
+async def upstream_stats():
+    return load_balancer.stats()
+
+@admin_router.get("/compression/stats", summary="응답 압축 통계")
+async def compression_stats_endpoint():
+    return compression_stats()
+
+@admin_router.get("/logging/stats", summary="로깅 설정과 샘플링 통계")
+async def logging_stats_endpoint():
+    return logging_stats()
 
 # ✅ 메인 라우터 등록
 app.include_router(gateway_router)
+app.include_router(admin_router)
 
 if __name__ == "__main__":
     import uvicorn
@@ -0,0 +1,423 @@
+"""
+게이트웨이 응답 압축 (Accept-Encoding 협상)
+- zstd / br / gzip 중 클라이언트가 받는 것을 선택 (brotli, zstandard 패키지가 없으면 해당 인코딩은 제외)
+- 크기 임계값 미만, 압축 효과가 없는 Content-Type, 304/204, Cache-Control: no-transform 응답은 그대로 전달
+- 업스트림이 이미 압축한 본문은 클라이언트가 받을 수 있으면 다시 압축하지 않고 그대로 전달
+  (받을 수 없는 인코딩이면 풀어서 전달)
+- 스트리밍 응답은 청크 단위로 압축하고, ETag 가 있는 버퍼링 응답은 압축 결과를 재사용 (본문 해시로 구분)
+- Accept-Encoding 에 따라 달라질 수 있는 응답에는 모두 Vary: Accept-Encoding 을 붙임
+"""
+import os
+import zlib
+import hashlib
+import logging
+from collections import OrderedDict
+from typing import Callable, Dict, Optional, Tuple
+
+from fastapi import FastAPI
+from starlette.datastructures import MutableHeaders
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - 선택 의존성
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - 선택 의존성
+    zstandard = None
+
+logger = logging.getLogger("platform.compression")
+
+# ✅ 압축 설정
+GATEWAY_COMPRESSION_ENABLED = os.getenv("GATEWAY_COMPRESSION_ENABLED", "true").lower() in ("1", "true", "yes")
+# 이보다 작은 응답은 압축하지 않음 (헤더/CPU 비용이 이득보다 큼)
+GATEWAY_COMPRESSION_MIN_SIZE = int(os.getenv("GATEWAY_COMPRESSION_MIN_SIZE", "1024"))
+# 동적 응답 기준 속도/압축률 균형 값 (benchmarks/bench_compression.py 결과: 이보다 높이면 크기는 거의 그대로, 시간만 늘어남)
+GATEWAY_GZIP_LEVEL = int(os.getenv("GATEWAY_GZIP_LEVEL", "4"))
+GATEWAY_BROTLI_QUALITY = int(os.getenv("GATEWAY_BROTLI_QUALITY", "4"))
+GATEWAY_ZSTD_LEVEL = int(os.getenv("GATEWAY_ZSTD_LEVEL", "3"))
+# 서버 선호 순서 (클라이언트 q 값이 같을 때 앞쪽을 선택)
+GATEWAY_COMPRESSION_ENCODINGS = tuple(
+    name.strip()
+    for name in os.getenv("GATEWAY_COMPRESSION_ENCODINGS", "zstd,br,gzip").split(",")
+    if name.strip()
+)
+# ETag 가 있는 버퍼링 응답의 압축 결과 재사용 캐시 한도 (바이트)
+GATEWAY_COMPRESSION_MEMO_BYTES = int(os.getenv("GATEWAY_COMPRESSION_MEMO_BYTES", str(16 * 1024 * 1024)))
+
+# ✅ 압축할 Content-Type (접두사)
+COMPRESSIBLE_TYPES = (
+    "text/", "application/json", "application/javascript", "application/xml",
+    "application/geo+json", "application/problem+json", "image/svg+xml",
+)
+# 이벤트 단위로 바로 전달해야 하는 타입 (압축기 버퍼에 묶이면 진행 이벤트가 늦게 도착함)
+UNCOMPRESSED_TYPES = ("text/event-stream",)
+
+Encoder = Tuple[Callable[[bytes], bytes], Callable[[], bytes]]
+
+
+def _gzip_encoder() -> Encoder:
+    compressor = zlib.compressobj(GATEWAY_GZIP_LEVEL, zlib.DEFLATED, 31)
+    return compressor.compress, compressor.flush
+
+
+def _brotli_encoder() -> Encoder:
+    compressor = brotli.Compressor(quality=GATEWAY_BROTLI_QUALITY)
+    return compressor.process, compressor.finish
+
+
+def _zstd_encoder() -> Encoder:
+    compressor = zstandard.ZstdCompressor(level=GATEWAY_ZSTD_LEVEL).compressobj()
+    return compressor.compress, compressor.flush
+
+
+def _zlib_decoder() -> Encoder:
+    # 47 = gzip / zlib 헤더 자동 감지
+    decompressor = zlib.decompressobj(47)
+    return decompressor.decompress, decompressor.flush
+
+
+def _brotli_decoder() -> Encoder:
+    decompressor = brotli.Decompressor()
+    return decompressor.process, lambda: b""
+
+
+def _zstd_decoder() -> Encoder:
+    decompressor = zstandard.ZstdDecompressor().decompressobj()
+    return decompressor.decompress, lambda: b""
+
+
+ENCODERS: Dict[str, Callable[[], Encoder]] = {"gzip": _gzip_encoder}
+DECODERS: Dict[str, Callable[[], Encoder]] = {"gzip": _zlib_decoder, "x-gzip": _zlib_decoder, "deflate": _zlib_decoder}
+if brotli is not None:
+    ENCODERS["br"] = _brotli_encoder
+    DECODERS["br"] = _brotli_decoder
+if zstandard is not None:
+    ENCODERS["zstd"] = _zstd_encoder
+    DECODERS["zstd"] = _zstd_decoder
+
+# 설정한 선호 순서 중 실제로 사용할 수 있는 인코딩
+AVAILABLE_ENCODINGS = tuple(name for name in GATEWAY_COMPRESSION_ENCODINGS if name in ENCODERS)
+
+
+def parse_accept_encoding(value: str) -> Dict[str, float]:
+    """
+    Accept-Encoding 헤더를 {인코딩: q 값} 으로 파싱합니다.
+
+    Args:
+        value: 헤더 값 (예: "gzip;q=0.8, br")
+
+    Returns:
+        인코딩별 q 값 (소문자)
+    """
+    accepted = {}
+    for item in value.split(","):
+        name, _, params = item.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        accepted[name] = q
+    return accepted
+
+
+def negotiate_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """
+    클라이언트가 받을 수 있는 인코딩 중 q 값이 가장 높은 것을 고릅니다. (같으면 서버 선호 순서)
+
+    Args:
+        accept_encoding: Accept-Encoding 헤더 값
+
+    Returns:
+        선택한 인코딩 (받을 수 있는 것이 없으면 None)
+    """
+    if not accept_encoding:
+        return None
+    accepted = parse_accept_encoding(accept_encoding)
+    wildcard = accepted.get("*", 0.0)
+    best, best_q = None, 0.0
+    for name in AVAILABLE_ENCODINGS:
+        q = accepted.get(name, wildcard)
+        if q > best_q:
+            best, best_q = name, q
+    return best
+
+
+def accepts(accept_encoding: Optional[str], encoding: str) -> bool:
+    """클라이언트가 해당 인코딩을 받을 수 있는지 확인합니다."""
+    if not accept_encoding:
+        return False
+    accepted = parse_accept_encoding(accept_encoding)
+    return accepted.get(encoding, accepted.get("*", 0.0)) > 0
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    """본문 전체를 한 번에 압축합니다."""
+    process, finish = ENCODERS[encoding]()
+    return process(body) + finish()
+
+
+def is_compressible(content_type: Optional[str]) -> bool:
+    if not content_type:
+        return False
+    content_type = content_type.lower()
+    return content_type.startswith(COMPRESSIBLE_TYPES) and not content_type.startswith(UNCOMPRESSED_TYPES)
+
+
+class CompressionStats:
+    """압축 처리 통계"""
+
+    def __init__(self):
+        self.compressed: Dict[str, int] = {}
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.memo_hits = 0
+        self.passthrough_encoded = 0
+        self.decoded = 0
+        self.skipped = 0
+
+    def record(self, encoding: str, bytes_in: int, bytes_out: int) -> None:
+        self.compressed[encoding] = self.compressed.get(encoding, 0) + 1
+        self.bytes_in += bytes_in
+        self.bytes_out += bytes_out
+
+
+MemoKey = Tuple[str, bytes]
+
+
+def memo_key(encoding: str, body: bytes) -> MemoKey:
+    return encoding, hashlib.blake2b(body, digest_size=16).digest()
+
+
+class CompressedBodyMemo:
+    """
+    (인코딩, 본문 해시) → 압축 결과 LRU 캐시입니다.
+    응답 캐시 적중처럼 같은 본문이 반복해서 나갈 때 다시 압축하지 않습니다.
+    서비스/경로가 달라도 본문이 같으면 같은 결과이므로 본문 해시로만 구분합니다.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self._entries: "OrderedDict[MemoKey, bytes]" = OrderedDict()
+
+    def get(self, key: MemoKey) -> Optional[bytes]:
+        body = self._entries.get(key)
+        if body is not None:
+            self._entries.move_to_end(key)
+        return body
+
+    def put(self, key: MemoKey, body: bytes) -> None:
+        if len(body) > self.max_bytes or key in self._entries:
+            return
+        self._entries[key] = body
+        self.bytes += len(body)
+        while self.bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.bytes -= len(evicted)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.bytes = 0
+
+
+counters = CompressionStats()
+memo = CompressedBodyMemo(GATEWAY_COMPRESSION_MEMO_BYTES)
+
+
+class _Responder:
+    """응답 하나의 압축 여부를 첫 본문 메시지에서 결정하고 이후 메시지를 변환합니다."""
+
+    def __init__(self, send: Callable, accept_encoding: Optional[str], minimum_size: int):
+        self.send = send
+        self.accept_encoding = accept_encoding
+        self.minimum_size = minimum_size
+        self.start: Optional[dict] = None
+        # None: 아직 결정 전, False: 그대로 전달, (process, finish): 변환 중
+        self.transform = None
+
+    async def __call__(self, message: dict) -> None:
+        if message["type"] == "http.response.start":
+            self.start = message
+            return
+        if message["type"] != "http.response.body":
+            await self.send(message)
+            return
+
+        if self.transform is None:
+            await self._first_body(message)
+            return
+        if self.transform is False:
+            await self.send(message)
+            return
+
+        process, finish = self.transform
+        body = process(message.get("body", b""))
+        more_body = message.get("more_body", False)
+        if not more_body:
+            body += finish()
+        if body or not more_body:
+            await self.send({"type": "http.response.body", "body": body, "more_body": more_body})
+
+    async def _first_body(self, message: dict) -> None:
+        headers = MutableHeaders(scope=self.start)
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        current = headers.get("content-encoding", "identity").lower()
+
+        # 업스트림이 이미 압축한 본문 (그대로 보낼지 풀어서 보낼지가 Accept-Encoding 에 따라 다름)
+        if current != "identity":
+            if accepts(self.accept_encoding, current) or current not in DECODERS:
+                counters.passthrough_encoded += 1
+                if current in DECODERS:
+                    headers.add_vary_header("Accept-Encoding")
+                await self._passthrough(message)
+                return
+            counters.decoded += 1
+            headers.add_vary_header("Accept-Encoding")
+            del headers["content-encoding"]
+            await self._start_transform(headers, DECODERS[current](), message)
+            return
+
+        if not self._eligible(headers, body, more_body):
+            counters.skipped += 1
+            await self._passthrough(message)
+            return
+        # 압축 대상인 응답은 압축하지 않게 되더라도 Accept-Encoding 에 따라 달라지는 응답
+        headers.add_vary_header("Accept-Encoding")
+        encoding = negotiate_encoding(self.accept_encoding)
+        if encoding is None:
+            counters.skipped += 1
+            await self._passthrough(message)
+            return
+
+        headers["content-encoding"] = encoding
+        etag = headers.get("etag")
+        if etag and not etag.startswith("W/"):
+            # 인코딩만 다른 표현이므로 약한 ETag 로 바꿈
+            headers["etag"] = f"W/{etag}"
+
+        if not more_body:
+            # 버퍼링 응답은 한 번에 압축 (ETag 가 있으면 결과 재사용)
+            key = memo_key(encoding, body) if etag else None
+            compressed = memo.get(key) if key else None
+            if compressed is not None:
+                counters.memo_hits += 1
+            else:
+                compressed = compress(body, encoding)
+                if key:
+                    memo.put(key, compressed)
+            counters.record(encoding, len(body), len(compressed))
+            headers["content-length"] = str(len(compressed))
+            await self.send(self.start)
+            await self.send({"type": "http.response.body", "body": compressed, "more_body": False})
+            self.transform = False
+            return
+
+        process, finish = ENCODERS[encoding]()
+        counted = {"in": 0, "out": 0}
+
+        def counting_process(chunk: bytes) -> bytes:
+            out = process(chunk)
+            counted["in"] += len(chunk)
+            counted["out"] += len(out)
+            return out
+
+        def counting_finish() -> bytes:
+            out = finish()
+            counters.record(encoding, counted["in"], counted["out"] + len(out))
+            return out
+
+        await self._start_transform(headers, (counting_process, counting_finish), message)
+
+    def _eligible(self, headers: MutableHeaders, body: bytes, more_body: bool) -> bool:
+        """상태 코드 / Content-Type / no-transform / 크기로 압축 대상인지 판단합니다. (Accept-Encoding 과 무관)"""
+        status_code = self.start["status"]
+        if status_code < 200 or status_code in (204, 206, 304):
+            return False
+        if not is_compressible(headers.get("content-type")):
+            return False
+        if "no-transform" in headers.get("cache-control", "").lower():
+            return False
+        if more_body:
+            length = headers.get("content-length")
+            if length is not None and int(length) < self.minimum_size:
+                return False
+        elif len(body) < self.minimum_size:
+            return False
+        return True
+
+    async def _start_transform(self, headers: MutableHeaders, transform: Encoder, message: dict) -> None:
+        # 변환 후 길이는 미리 알 수 없으므로 chunked 로 전송
+        if "content-length" in headers:
+            del headers["content-length"]
+        self.transform = transform
+        await self.send(self.start)
+        await self(message)
+
+    async def _passthrough(self, message: dict) -> None:
+        self.transform = False
+        await self.send(self.start)
+        await self.send(message)
+
+
+class CompressionMiddleware:
+    """
+    Accept-Encoding 을 협상해 응답을 압축하는 ASGI 미들웨어입니다.
+    버퍼링 응답과 스트리밍 응답(StreamingResponse)을 모두 처리합니다.
+    """
+
+    def __init__(self, app: Callable, minimum_size: int = GATEWAY_COMPRESSION_MIN_SIZE):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope: dict, receive: Callable, send: Callable) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        accept_encoding = next(
+            (v.decode("latin-1") for k, v in scope["headers"] if k == b"accept-encoding"), None
+        )
+        await self.app(scope, receive, _Responder(send, accept_encoding, self.minimum_size))
+
+
+def compression_stats() -> dict:
+    """압축 처리 통계"""
+    return {
+        "enabled": GATEWAY_COMPRESSION_ENABLED,
+        "encodings": list(AVAILABLE_ENCODINGS),
+        "minimum_size": GATEWAY_COMPRESSION_MIN_SIZE,
+        "compressed": dict(counters.compressed),
+        "bytes_in": counters.bytes_in,
+        "bytes_out": counters.bytes_out,
+        "ratio": round(counters.bytes_out / counters.bytes_in, 4) if counters.bytes_in else None,
+        "memo_hits": counters.memo_hits,
+        "memo_bytes": memo.bytes,
+        "passthrough_encoded": counters.passthrough_encoded,
+        "decoded": counters.decoded,
+        "skipped": counters.skipped,
+    }
+
+
+def setup_compression(app: FastAPI) -> None:
+    """
+    앱에 응답 압축 미들웨어를 등록합니다. (GATEWAY_COMPRESSION_ENABLED=false 면 등록하지 않음)
+
+    Args:
+        app: FastAPI 앱
+    """
+    if not GATEWAY_COMPRESSION_ENABLED:
+        return
+    if len(AVAILABLE_ENCODINGS) < len(GATEWAY_COMPRESSION_ENCODINGS):
+        logger.warning(
+            "압축 인코딩 일부를 사용할 수 없습니다 (brotli/zstandard 패키지 확인): 사용 가능 %s",
+            list(AVAILABLE_ENCODINGS)
+        )
+    app.add_middleware(CompressionMiddleware)
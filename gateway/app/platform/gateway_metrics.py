@@ -0,0 +1,176 @@
+"""
+게이트웨이 전용 메트릭
+- 업스트림 호출 수(결과별) / 지연 히스토그램
+- 배치(/ai/v1/batch) 하위 요청 수(결과별)
+- 커넥션 풀 사용률, 입장 제어 대기열, 속도 제한, 차단기, 응답 캐시, 요청 합치기, 레플리카 상태, 응답 압축 (수집 시점에 계산)
+"""
+from typing import Iterator
+
+from prometheus_client import Counter, Histogram
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+from prometheus_client.registry import Collector
+
+from app.platform.instrumentation import LATENCY_BUCKETS, register_collector
+
+UPSTREAM_REQUESTS = Counter(
+    "gateway_upstream_requests_total", "업스트림 호출 시도 수 (결과별)",
+    ["service", "outcome"]
+)
+UPSTREAM_LATENCY = Histogram(
+    "gateway_upstream_duration_seconds", "업스트림 호출 시도당 응답 헤더 수신까지 걸린 시간",
+    ["service"], buckets=LATENCY_BUCKETS
+)
+BATCH_ITEMS = Counter(
+    "gateway_batch_items_total", "배치 하위 요청 수 (결과별)",
+    ["service", "outcome"]
+)
+
+BREAKER_STATES = {"closed": 0, "half_open": 1, "open": 2}
+
+
+def status_outcome(status_code: int) -> str:
+    """상태 코드를 결과 라벨(2xx, 4xx, 5xx ...)로 변환합니다."""
+    return f"{status_code // 100}xx"
+
+
+def observe_upstream(service: str, outcome: str, seconds: float) -> None:
+    """
+    업스트림 호출 시도 한 번을 기록합니다.
+
+    Args:
+        service: 서비스 이름
+        outcome: 결과 라벨 (2xx/3xx/4xx/5xx/connect_error/timeout)
+        seconds: 소요 시간 (초)
+    """
+    UPSTREAM_REQUESTS.labels(service, outcome).inc()
+    UPSTREAM_LATENCY.labels(service).observe(seconds)
+
+
+def observe_batch_item(service: str, outcome: str) -> None:
+    """
+    배치 하위 요청 하나의 결과를 기록합니다.
+
+    Args:
+        service: 서비스 이름
+        outcome: 결과 라벨 (2xx/4xx/5xx/timeout)
+    """
+    BATCH_ITEMS.labels(service, outcome).inc()
+
+
+class GatewayStateCollector(Collector):
+    """게이트웨이 구성 요소의 stats() 를 수집 시점에 읽어 메트릭으로 변환합니다."""
+
+    def describe(self) -> Iterator:
+        # 등록 시 collect() 가 호출되지 않도록 빈 설명을 반환
+        return iter(())
+
+    def collect(self) -> Iterator:
+        # 순환 import 를 피하기 위해 수집 시점에 가져옴
+        from app.foundation.core.admission import admission
+        from app.foundation.core.rate_limit import rate_limiter
+        from app.foundation.core.resilience import resilience
+        from app.foundation.core.single_flight import request_coalescer
+        from app.foundation.infrastructure.http_client_registry import client_registry
+        from app.foundation.infrastructure.load_balancer import load_balancer
+        from app.foundation.infrastructure.response_cache import response_cache
+        from app.platform.compression import counters as compression
+
+        # 유휴 연결 수는 httpx 공개 API 로 알 수 없어 사용 중(active) 연결만 기록
+        pool_connections = GaugeMetricFamily(
+            "gateway_upstream_pool_connections", "업스트림 커넥션 풀 연결 수", labels=["service", "state"]
+        )
+        pool_utilization = GaugeMetricFamily(
+            "gateway_upstream_pool_utilization", "사용 중 연결 수 / 최대 연결 수", labels=["service"]
+        )
+        for service_type, (active, maximum) in client_registry.pool_usage().items():
+            pool_connections.add_metric([service_type.value, "active"], active)
+            pool_utilization.add_metric([service_type.value], active / maximum if maximum else 0.0)
+        yield pool_connections
+        yield pool_utilization
+
+        queue_depth = GaugeMetricFamily("gateway_admission_queue_depth", "입장 대기 중인 요청 수", labels=["service"])
+        active_slots = GaugeMetricFamily("gateway_admission_active", "실행 슬롯을 점유한 요청 수", labels=["service"])
+        wait_seconds = CounterMetricFamily(
+            "gateway_admission_wait_seconds", "입장 대기 시간 합계", labels=["service"]
+        )
+        admission_rejected = CounterMetricFamily(
+            "gateway_admission_rejected", "입장 거절 수", labels=["service", "reason"]
+        )
+        for service_type, controller in admission._controllers.items():
+            queue_depth.add_metric([service_type.value], controller.waiting)
+            active_slots.add_metric([service_type.value], controller.active)
+            wait_seconds.add_metric([service_type.value], controller.wait_seconds_total)
+            admission_rejected.add_metric([service_type.value, "queue_full"], controller.rejected_queue_full)
+            admission_rejected.add_metric([service_type.value, "timeout"], controller.rejected_timeout)
+        yield queue_depth
+        yield active_slots
+        yield wait_seconds
+        yield admission_rejected
+
+        rate_limit_decisions = CounterMetricFamily(
+            "gateway_rate_limit_decisions", "속도 제한 판정 수 (allowed/limited)", labels=["service", "decision"]
+        )
+        for service_type, count in rate_limiter.allowed.items():
+            rate_limit_decisions.add_metric([service_type.value, "allowed"], count)
+        for service_type, count in rate_limiter.limited.items():
+            rate_limit_decisions.add_metric([service_type.value, "limited"], count)
+        yield rate_limit_decisions
+        yield CounterMetricFamily(
+            "gateway_rate_limit_store_errors", "속도 제한 저장소 오류 수 (요청은 허용됨)",
+            value=getattr(rate_limiter.store, "errors", 0)
+        )
+
+        breaker_state = GaugeMetricFamily(
+            "gateway_circuit_state", "차단기 상태 (0=closed, 1=half_open, 2=open)", labels=["service"]
+        )
+        resilience_events = CounterMetricFamily(
+            "gateway_resilience_events", "재시도/헤징/차단 이벤트 수", labels=["service", "event"]
+        )
+        for service_type, guard in resilience._guards.items():
+            breaker_state.add_metric([service_type.value], BREAKER_STATES[guard.breaker.state])
+            for event, value in (("retry", guard.retries), ("hedge", guard.hedges),
+                                 ("hedge_win", guard.hedge_wins), ("circuit_rejected", guard.rejected)):
+                resilience_events.add_metric([service_type.value, event], value)
+        yield breaker_state
+        yield resilience_events
+
+        cache_stats = response_cache.stats()
+        cache_events = CounterMetricFamily("gateway_cache_events", "응답 캐시 이벤트 수", labels=["event"])
+        for event in ("hits", "misses", "revalidations", "stores", "evictions"):
+            cache_events.add_metric([event], cache_stats[event])
+        yield cache_events
+        yield GaugeMetricFamily("gateway_cache_bytes", "응답 캐시 사용 바이트", value=cache_stats["bytes"])
+
+        yield CounterMetricFamily(
+            "gateway_coalesced_requests", "진행 중인 동일 요청에 합류한 요청 수", value=request_coalescer.coalesced
+        )
+
+        replica_outstanding = GaugeMetricFamily(
+            "gateway_replica_outstanding", "레플리카별 진행 중 요청 수", labels=["service", "replica"]
+        )
+        replica_healthy = GaugeMetricFamily(
+            "gateway_replica_healthy", "레플리카 정상 여부 (1=정상)", labels=["service", "replica"]
+        )
+        for service_type, (_, pool) in load_balancer._pools.items():
+            for replica in pool.replicas:
+                replica_outstanding.add_metric([service_type.value, replica.url], replica.outstanding)
+                replica_healthy.add_metric([service_type.value, replica.url], 1 if replica.healthy else 0)
+        yield replica_outstanding
+        yield replica_healthy
+
+        compression_bytes = CounterMetricFamily(
+            "gateway_compression_bytes", "압축 전/후 응답 바이트", labels=["stage"]
+        )
+        compression_bytes.add_metric(["in"], compression.bytes_in)
+        compression_bytes.add_metric(["out"], compression.bytes_out)
+        yield compression_bytes
+        compressed_responses = CounterMetricFamily(
+            "gateway_compressed_responses", "압축해서 보낸 응답 수", labels=["encoding"]
+        )
+        for encoding, count in compression.compressed.items():
+            compressed_responses.add_metric([encoding], count)
+        yield compressed_responses
+
+
+# 모듈을 처음 import 할 때 한 번만 등록
+register_collector(GatewayStateCollector())
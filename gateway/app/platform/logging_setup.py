@@ -0,0 +1,197 @@
+"""
+게이트웨이 로깅 설정
+- 요청 경로에서는 레코드를 큐에 넣기만 하고, 백그라운드 QueueListener 스레드가 포맷팅과 stdout 쓰기를 담당
+- GATEWAY_LOG_FORMAT=json 이면 한 줄 JSON (request_id / trace_id 포함), text 면 기존 형식 + request_id
+- 요청마다 찍히는 INFO 이하 로그는 GATEWAY_LOG_SAMPLE_RATE 비율로 샘플링
+  (request_id 기준으로 결정하므로 같은 요청의 로그는 함께 남거나 함께 빠짐, WARNING 이상은 항상 기록)
+- lazy(): json.dumps 처럼 비싼 메시지 인자는 실제로 기록될 때만 계산
+"""
+import os
+import sys
+import json
+import zlib
+import queue
+import atexit
+import random
+import logging
+import logging.handlers
+from typing import Any, Callable, FrozenSet, Optional, TextIO
+
+from app.platform.tracing import current_span
+
+# ✅ 로깅 설정
+GATEWAY_LOG_LEVEL = os.getenv("GATEWAY_LOG_LEVEL", "INFO").upper()
+GATEWAY_LOG_FORMAT = os.getenv("GATEWAY_LOG_FORMAT", "text").lower()
+GATEWAY_LOG_SAMPLE_RATE = float(os.getenv("GATEWAY_LOG_SAMPLE_RATE", "0.1"))
+
+# ✅ 요청마다 로그를 남기는 로거 (샘플링 대상)
+GATEWAY_LOG_SAMPLED_LOGGERS: FrozenSet[str] = frozenset(
+    name.strip()
+    for name in os.getenv(
+        "GATEWAY_LOG_SAMPLED_LOGGERS",
+        "service_proxy,domain.service.request_service,foundation.utils.request_utils"
+    ).split(",")
+    if name.strip()
+)
+
+TEXT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - [%(request_id)s] %(message)s"
+
+# JSON 출력에서 제외할 LogRecord 기본 속성 (나머지는 extra 로 보고 그대로 출력)
+_RESERVED_ATTRS = frozenset(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {
+    "message", "asctime", "request_id", "trace_id"
+}
+
+
+class lazy:
+    """
+    로그 메시지 인자를 실제로 기록될 때까지 계산하지 않는 래퍼입니다.
+
+    예:
+        logger.info("요청 본문: %s", lazy(json.dumps, body))
+    """
+
+    __slots__ = ("func", "args", "kwargs")
+
+    def __init__(self, func: Callable[..., Any], *args: Any, **kwargs: Any):
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+
+    def __str__(self) -> str:
+        return str(self.func(*self.args, **self.kwargs))
+
+
+class RequestIdFilter(logging.Filter):
+    """현재 추적 컨텍스트의 request_id / trace_id 를 레코드에 붙입니다. (요청 처리 스레드에서 실행)"""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        current = current_span()
+        record.request_id = current.request_id if current is not None else "-"
+        record.trace_id = current.trace_id if current is not None else None
+        return True
+
+
+class SamplingFilter(logging.Filter):
+    """
+    지정한 로거의 INFO 이하 레코드를 rate 비율로만 통과시킵니다.
+    request_id 가 있으면 해시로 결정해 같은 요청의 로그가 함께 남도록 합니다.
+    """
+
+    def __init__(self, rate: float, loggers: FrozenSet[str]):
+        super().__init__()
+        self.rate = rate
+        self.loggers = loggers
+        self._threshold = int(rate * 10_000)
+        self.dropped = 0
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if self.rate >= 1.0 or record.levelno >= logging.WARNING or record.name not in self.loggers:
+            return True
+        request_id = getattr(record, "request_id", "-")
+        if request_id != "-":
+            keep = zlib.crc32(request_id.encode()) % 10_000 < self._threshold
+        else:
+            keep = random.random() < self.rate
+        if not keep:
+            self.dropped += 1
+        return keep
+
+
+class JsonFormatter(logging.Formatter):
+    """레코드를 한 줄 JSON 으로 출력합니다."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "ts": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "request_id": getattr(record, "request_id", "-"),
+        }
+        trace_id = getattr(record, "trace_id", None)
+        if trace_id:
+            payload["trace_id"] = trace_id
+        for key, value in vars(record).items():
+            if key not in _RESERVED_ATTRS:
+                payload[key] = value
+        if record.exc_info:
+            payload["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+class DeferredQueueHandler(logging.handlers.QueueHandler):
+    """
+    기본 QueueHandler 는 큐에 넣기 전에 호출 스레드에서 메시지를 포맷팅합니다.
+    같은 프로세스 안의 리스너로만 보내므로 레코드를 그대로 넘겨 포맷팅(과 lazy 인자 계산)을 리스너 스레드로 미룹니다.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+_listener: Optional[logging.handlers.QueueListener] = None
+_handler: Optional[DeferredQueueHandler] = None
+_sampler: Optional[SamplingFilter] = None
+
+
+def configure_logging(
+    level: str = GATEWAY_LOG_LEVEL,
+    fmt: str = GATEWAY_LOG_FORMAT,
+    sample_rate: float = GATEWAY_LOG_SAMPLE_RATE,
+    stream: Optional[TextIO] = None
+) -> None:
+    """
+    루트 로거를 큐 기반 비동기 핸들러로 설정합니다. 다시 호출하면 이전 설정을 정리하고 새로 설정합니다.
+
+    Args:
+        level: 루트 로그 레벨
+        fmt: "json" 또는 "text"
+        sample_rate: 샘플링 대상 로거의 INFO 이하 레코드를 남길 비율 (1.0 이면 모두 기록)
+        stream: 출력 스트림 (기본 sys.stdout)
+    """
+    global _listener, _handler, _sampler
+    shutdown_logging()
+
+    output = logging.StreamHandler(stream or sys.stdout)
+    output.setFormatter(JsonFormatter() if fmt == "json" else logging.Formatter(TEXT_FORMAT))
+
+    handler = DeferredQueueHandler(queue.SimpleQueue())
+    # 필터는 호출 스레드에서 실행되므로 request_id 를 먼저 붙이고 샘플링으로 버릴 레코드는 큐에 넣지 않음
+    sampler = SamplingFilter(sample_rate, GATEWAY_LOG_SAMPLED_LOGGERS)
+    handler.addFilter(RequestIdFilter())
+    handler.addFilter(sampler)
+
+    root = logging.getLogger()
+    for existing in root.handlers[:]:
+        root.removeHandler(existing)
+    root.addHandler(handler)
+    root.setLevel(level)
+
+    listener = logging.handlers.QueueListener(handler.queue, output, respect_handler_level=True)
+    listener.start()
+    _listener, _handler, _sampler = listener, handler, sampler
+
+
+def shutdown_logging() -> None:
+    """큐에 남은 레코드를 모두 기록하고 리스너 스레드를 종료합니다."""
+    global _listener, _handler
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+    if _handler is not None:
+        logging.getLogger().removeHandler(_handler)
+        _handler = None
+
+
+def logging_stats() -> dict:
+    """현재 로깅 설정과 샘플링으로 버린 레코드 수"""
+    return {
+        "format": GATEWAY_LOG_FORMAT,
+        "sample_rate": _sampler.rate if _sampler else None,
+        "sampled_loggers": sorted(GATEWAY_LOG_SAMPLED_LOGGERS),
+        "dropped": _sampler.dropped if _sampler else 0,
+        "queue_size": _handler.queue.qsize() if _handler else 0,
+    }
+
+
+atexit.register(shutdown_logging)
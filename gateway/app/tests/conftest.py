@@ -0,0 +1,12 @@
+"""
+게이트웨이 테스트 공통 설정
+"""
+import pytest
+
+from app.foundation.core.rate_limit import rate_limiter
+
+
+@pytest.fixture(autouse=True)
+def disable_rate_limit(monkeypatch):
+    # 테스트 클라이언트는 모두 같은 IP 로 요청하므로 속도 제한 테스트 밖에서는 끔
+    monkeypatch.setattr(rate_limiter, "enabled", False)
@@ -0,0 +1,86 @@
+"""
+입장 제어(동시 실행 한도/대기열) 테스트
+"""
+import asyncio
+
+import httpx
+import pytest
+import pytest_asyncio
+
+from app.main import app
+from app.domain.model.service_type import SERVICE_URLS, ServiceType
+from app.foundation.core.admission import AdmissionController, AdmissionPolicy, AdmissionRejected, admission
+from app.foundation.infrastructure.http_client_registry import client_registry
+
+
+@pytest.mark.asyncio
+async def test_concurrency_is_bounded_and_queue_drains():
+    controller = AdmissionController(ServiceType.TF, AdmissionPolicy(max_concurrency=2, max_queue=10, queue_timeout=1.0))
+    running = 0
+    peak = 0
+
+    async def work():
+        nonlocal running, peak
+        async with controller.slot():
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+    await asyncio.gather(*(work() for _ in range(6)))
+    assert peak == 2
+    stats = controller.stats()
+    assert stats["admitted"] == 6
+    assert stats["max_queue_depth_seen"] == 4
+    assert stats["queue_depth"] == 0 and stats["active"] == 0
+
+
+@pytest.mark.asyncio
+async def test_full_queue_fails_fast_and_deadline_expires():
+    controller = AdmissionController(ServiceType.TF, AdmissionPolicy(max_concurrency=1, max_queue=1, queue_timeout=0.05))
+    await controller.acquire()
+    waiter = asyncio.ensure_future(controller.acquire())
+    await asyncio.sleep(0)
+
+    with pytest.raises(AdmissionRejected) as full:
+        await controller.acquire()
+    assert full.value.status_code == 429
+    assert full.value.retry_after >= 1
+
+    with pytest.raises(AdmissionRejected) as expired:
+        await waiter
+    assert expired.value.status_code == 503
+    assert controller.stats()["rejected_timeout"] == 1
+
+
+@pytest.fixture
+def slow_upstream(monkeypatch):
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.1)
+        return httpx.Response(200, json={"answer": "ok"})
+
+    monkeypatch.setitem(SERVICE_URLS, ServiceType.CHATBOT, "http://chatbot")
+    monkeypatch.setitem(
+        client_registry._clients, ServiceType.CHATBOT,
+        httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    )
+    monkeypatch.setitem(admission._controllers, ServiceType.CHATBOT, AdmissionController(
+        ServiceType.CHATBOT, AdmissionPolicy(max_concurrency=1, max_queue=1, queue_timeout=5.0)
+    ))
+
+
+@pytest_asyncio.fixture
+async def gateway():
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://gateway") as client:
+        yield client
+
+
+@pytest.mark.asyncio
+async def test_gateway_returns_429_with_retry_after_when_queue_full(slow_upstream, gateway):
+    responses = await asyncio.gather(*(
+        gateway.post("/ai/v1/chatbot/chatbot/chat", json={"message": f"질문 {i}"}) for i in range(3)
+    ))
+    codes = sorted(response.status_code for response in responses)
+    assert codes == [200, 200, 429]
+    rejected = next(response for response in responses if response.status_code == 429)
+    assert int(rejected.headers["retry-after"]) >= 1
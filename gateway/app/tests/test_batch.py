@@ -0,0 +1,121 @@
+"""
+배치 요청(/ai/v1/batch) 테스트
+"""
+import json
+import asyncio
+
+import httpx
+import pytest
+import pytest_asyncio
+
+from app.main import app
+from app.domain.model.service_type import SERVICE_URLS, ServiceType
+from app.foundation.infrastructure.http_client_registry import client_registry
+from app.foundation.infrastructure.response_cache import response_cache
+
+
+@pytest.fixture
+def upstream(monkeypatch):
+    received = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        body = await request.aread()
+        received.append((request, body))
+        path = request.url.path
+        if path.endswith("/slow"):
+            await asyncio.sleep(float(request.url.params.get("seconds", "5")))
+        if path.endswith("/map"):
+            return httpx.Response(200, stream=httpx.ByteStream(b"<html>map</html>"), headers={"content-type": "text/html"})
+        if path.endswith("/image"):
+            return httpx.Response(200, stream=httpx.ByteStream(b"\x89PNG"), headers={"content-type": "image/png"})
+        if path.endswith("/broken"):
+            return httpx.Response(500, stream=httpx.ByteStream(b'{"detail": "boom"}'), headers={"content-type": "application/json"})
+        content = json.dumps({"path": path, "query": str(request.url.query, "ascii"), "body": json.loads(body or b"null")})
+        return httpx.Response(200, stream=httpx.ByteStream(content.encode()), headers={"content-type": "application/json"})
+
+    for service in (ServiceType.TITANIC, ServiceType.CRIME, ServiceType.NLP, ServiceType.TF):
+        monkeypatch.setitem(SERVICE_URLS, service, f"http://{service.value}")
+        monkeypatch.setitem(
+            client_registry._clients, service,
+            httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        )
+    return received
+
+
+@pytest_asyncio.fixture
+async def gateway():
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://gateway") as client:
+        yield client
+
+
+@pytest.mark.asyncio
+async def test_batch_returns_per_item_results_in_order(upstream, gateway):
+    response = await gateway.post("/ai/v1/batch", headers={"authorization": "Bearer t"}, json={"requests": [
+        {"id": "passengers", "service": "titanic", "path": "titanic/passengers", "query": {"page": 2}},
+        {"service": "nlp", "method": "POST", "path": "nlp/analyze", "body": {"text": "삼성"}},
+        {"service": "crime", "path": "crime/map"},
+        {"service": "tf", "path": "tf/image"},
+        {"service": "titanic", "path": "titanic/broken"},
+        {"service": "titanic", "method": "TRACE", "path": "titanic/x"},
+    ]})
+    assert response.status_code == 200
+    body = response.json()
+    results = body["results"]
+    assert [r["id"] for r in results] == ["passengers", "1", "2", "3", "4", "5"]
+    assert results[0]["status"] == 200
+    assert results[0]["body"] == {"path": "/titanic/passengers", "query": "page=2", "body": None}
+    assert results[1]["body"]["body"] == {"text": "삼성"}
+    assert results[2]["body"] == "<html>map</html>"
+    assert results[3]["body_encoding"] == "base64"
+    assert results[4]["status"] == 500
+    assert results[5]["status"] == 405
+    assert body["summary"] == {**body["summary"], "total": 6, "succeeded": 4, "failed": 2, "timed_out": 0}
+
+    # 배치 요청의 헤더는 하위 요청으로 이어지고, 본문 헤더는 하위 요청마다 다시 만들어짐
+    forwarded = [request for request, _ in upstream]
+    assert all(request.headers["authorization"] == "Bearer t" for request in forwarded)
+    assert all(request.headers["x-forwarded-prefix"].startswith("/ai/v1/") for request in forwarded)
+
+
+@pytest.mark.asyncio
+async def test_batch_overlaps_upstream_latency_and_enforces_deadline(upstream, gateway):
+    items = [{"service": "titanic", "path": "titanic/slow", "query": {"seconds": 0.2, "n": n}} for n in range(3)]
+    items.append({"id": "stuck", "service": "nlp", "path": "nlp/slow", "query": {"seconds": 5}})
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    response = await gateway.post("/ai/v1/batch", json={"requests": items, "timeout": 0.5})
+    elapsed = loop.time() - started
+
+    body = response.json()
+    assert [r["status"] for r in body["results"]] == [200, 200, 200, 504]
+    assert body["summary"]["timed_out"] == 1
+    # 하위 요청이 순서대로가 아니라 동시에 실행되고, 막힌 요청은 제한 시간에 끊김
+    assert elapsed < 1.0
+
+
+@pytest.mark.asyncio
+async def test_batch_rejects_too_many_items(upstream, gateway):
+    items = [{"service": "titanic", "path": "titanic/passengers"}] * 21
+    response = await gateway.post("/ai/v1/batch", json={"requests": items})
+    assert response.status_code == 413
+    assert upstream == []
+
+
+@pytest.mark.asyncio
+async def test_batch_item_query_matches_single_call_routing_and_cache(upstream, gateway, monkeypatch):
+    monkeypatch.setattr(response_cache, "route_ttls", {"titanic/passengers": 60.0})
+    response_cache.clear()
+    try:
+        single = await gateway.get("/ai/v1/titanic/titanic/passengers?page=2")
+        assert single.headers["x-cache"] == "MISS"
+        assert single.json()["query"] == "page=2"
+
+        item = {"service": "titanic", "path": "titanic/passengers", "query": {"page": 2}}
+        batch = (await gateway.post("/ai/v1/batch", json={"requests": [item, {**item, "query": {"page": 3}}]})).json()
+        # 쿼리가 있어도 경로로 캐시 정책을 찾고, 쿼리별로 캐시 항목이 나뉨
+        assert [r["headers"].get("x-cache") for r in batch["results"]] == ["HIT", "MISS"]
+        assert [r["body"]["query"] for r in batch["results"]] == ["page=2", "page=3"]
+        assert [str(request.url.query, "ascii") for request, _ in upstream] == ["page=2", "page=3"]
+    finally:
+        response_cache.clear()
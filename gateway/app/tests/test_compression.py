@@ -0,0 +1,129 @@
+"""
+응답 압축 협상 테스트
+"""
+import gzip
+import json
+
+import httpx
+import pytest
+import pytest_asyncio
+
+from app.main import app
+from app.domain.model.service_type import SERVICE_URLS, ServiceType
+from app.foundation.infrastructure.http_client_registry import client_registry
+from app.foundation.infrastructure.response_cache import response_cache
+from app.platform import compression
+from app.platform.compression import negotiate_encoding
+
+MAP_HTML = ("<html><body>" + "<div class='marker'>강남구 범죄 지도</div>" * 2000 + "</body></html>").encode()
+LARGE_JSON = json.dumps({"correlation": [[0.123456] * 50] * 50}).encode()
+
+
+def test_negotiate_encoding():
+    assert negotiate_encoding("gzip;q=0.5, br") == "br"
+    assert negotiate_encoding("zstd;q=0, gzip") == "gzip"
+    assert negotiate_encoding("*") == "zstd"
+    assert negotiate_encoding("identity") is None
+    assert negotiate_encoding(None) is None
+
+
+@pytest.fixture
+def upstream(monkeypatch):
+    received = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        received.append(request)
+        path = request.url.path
+        if path.endswith("/small"):
+            return httpx.Response(200, stream=httpx.ByteStream(b'{"ok": true}'), headers={"content-type": "application/json"})
+        if path.endswith("/map-gzip"):
+            return httpx.Response(200, stream=httpx.ByteStream(gzip.compress(MAP_HTML)), headers={
+                "content-type": "text/html; charset=utf-8", "content-encoding": "gzip"
+            })
+        if path.endswith("/map"):
+            return httpx.Response(200, stream=httpx.ByteStream(MAP_HTML), headers={"content-type": "text/html; charset=utf-8"})
+        return httpx.Response(200, stream=httpx.ByteStream(LARGE_JSON), headers={"content-type": "application/json"})
+
+    for service in (ServiceType.CRIME, ServiceType.TITANIC):
+        monkeypatch.setitem(SERVICE_URLS, service, f"http://{service.value}")
+        monkeypatch.setitem(
+            client_registry._clients, service,
+            httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        )
+    return received
+
+
+@pytest_asyncio.fixture
+async def gateway():
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://gateway") as client:
+        yield client
+
+
+@pytest.mark.asyncio
+async def test_buffered_json_is_compressed_above_threshold(upstream, gateway):
+    response = await gateway.get("/ai/v1/titanic/titanic/correlation", headers={"accept-encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert "accept-encoding" in response.headers["vary"].lower()
+    assert int(response.headers["content-length"]) < len(LARGE_JSON)
+    assert response.content == LARGE_JSON
+    # 버퍼링 경로에서는 클라이언트 Accept-Encoding 을 업스트림에 그대로 넘기지 않음
+    assert upstream[0].headers["accept-encoding"] != "gzip"
+
+    small = await gateway.get("/ai/v1/titanic/titanic/small", headers={"accept-encoding": "gzip"})
+    assert "content-encoding" not in small.headers
+
+    identity = await gateway.get("/ai/v1/titanic/titanic/correlation", headers={"accept-encoding": "identity"})
+    assert "content-encoding" not in identity.headers
+    assert "accept-encoding" in identity.headers["vary"].lower()
+    assert identity.content == LARGE_JSON
+
+
+@pytest.mark.asyncio
+async def test_streaming_map_is_compressed_with_preferred_encoding(upstream, gateway):
+    response = await gateway.get("/ai/v1/crime/crime/seoul/map", headers={"accept-encoding": "gzip, br"})
+    assert response.headers["content-encoding"] == "br"
+    assert "content-length" not in response.headers
+    assert response.content == MAP_HTML
+
+
+@pytest.mark.asyncio
+async def test_precompressed_upstream_body_is_reused_or_decoded(upstream, gateway):
+    before = compression.counters.passthrough_encoded
+    reused = await gateway.get("/ai/v1/crime/crime/seoul/map-gzip", headers={"accept-encoding": "gzip, br"})
+    assert reused.headers["content-encoding"] == "gzip"
+    assert reused.content == MAP_HTML
+    assert compression.counters.passthrough_encoded == before + 1
+    assert "accept-encoding" in reused.headers["vary"].lower()
+
+    decoded = await gateway.get("/ai/v1/crime/crime/seoul/map-gzip", headers={"accept-encoding": "identity"})
+    assert "content-encoding" not in decoded.headers
+    assert "accept-encoding" in decoded.headers["vary"].lower()
+    assert decoded.content == MAP_HTML
+
+
+def test_memo_is_keyed_on_body_not_etag():
+    memo = compression.CompressedBodyMemo(1024 * 1024)
+    first, second = b'{"service": "crime"}', b'{"service": "nlp!!"}'
+    assert len(first) == len(second)
+    memo.put(compression.memo_key("gzip", first), compression.compress(first, "gzip"))
+    assert memo.get(compression.memo_key("gzip", second)) is None
+    assert gzip.decompress(memo.get(compression.memo_key("gzip", first))) == first
+
+
+@pytest.mark.asyncio
+async def test_cache_hits_reuse_compressed_body(upstream, gateway):
+    response_cache.clear()
+    before = compression.counters.memo_hits
+
+    first = await gateway.get("/ai/v1/crime/crime/map", headers={"accept-encoding": "gzip"})
+    second = await gateway.get("/ai/v1/crime/crime/map", headers={"accept-encoding": "gzip"})
+    assert second.headers["x-cache"] == "HIT"
+    assert second.content == first.content == MAP_HTML
+    assert compression.counters.memo_hits == before + 1
+
+    # 압축 응답의 약한 ETag 로도 조건부 요청이 304 로 처리됨
+    revalidated = await gateway.get(
+        "/ai/v1/crime/crime/map", headers={"accept-encoding": "gzip", "if-none-match": first.headers["etag"]}
+    )
+    assert revalidated.status_code == 304
+    response_cache.clear()
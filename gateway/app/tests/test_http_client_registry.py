@@ -0,0 +1,74 @@
+"""
+HttpClientRegistry 테스트
+"""
+import httpx
+import pytest
+
+from app.domain.model.service_type import ServiceType
+from app.foundation.infrastructure.http_client_registry import (
+    CountingTransport, HttpClientRegistry, get_pool_limits
+)
+
+
+@pytest.mark.asyncio
+async def test_registry_reuses_client_per_service():
+    registry = HttpClientRegistry()
+    await registry.start()
+    try:
+        first = registry.get(ServiceType.CRIME)
+        assert registry.get(ServiceType.CRIME) is first
+        assert registry.get(ServiceType.NLP) is not first
+    finally:
+        await registry.close()
+    assert first.is_closed
+
+
+@pytest.mark.asyncio
+async def test_registry_recreates_client_after_close():
+    registry = HttpClientRegistry()
+    client = registry.get(ServiceType.TF)
+    await registry.close()
+    recreated = registry.get(ServiceType.TF)
+    assert recreated is not client
+    assert not recreated.is_closed
+    await registry.close()
+
+
+def test_pool_limits_env_override(monkeypatch):
+    monkeypatch.setenv("CHATBOT_MAX_CONNECTIONS", "3")
+    monkeypatch.setenv("CHATBOT_MAX_KEEPALIVE_CONNECTIONS", "2")
+    limits = get_pool_limits(ServiceType.CHATBOT)
+    assert limits.max_connections == 3
+    assert limits.max_keepalive_connections == 2
+
+
+@pytest.mark.asyncio
+async def test_counting_transport_tracks_in_use_until_body_closed():
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/fail":
+            raise httpx.ConnectError("refused", request=request)
+        return httpx.Response(200, content=b"ok")
+
+    transport = CountingTransport(httpx.MockTransport(handler))
+    async with httpx.AsyncClient(transport=transport, base_url="http://upstream") as client:
+        async with client.stream("GET", "/stream") as response:
+            assert transport.in_use == 1
+            assert await response.aread() == b"ok"
+        assert transport.in_use == 0
+
+        assert (await client.get("/read")).content == b"ok"
+        with pytest.raises(httpx.ConnectError):
+            await client.get("/fail")
+        assert transport.in_use == 0
+
+
+@pytest.mark.asyncio
+async def test_pool_usage_reports_configured_maximum(monkeypatch):
+    monkeypatch.setenv("TF_MAX_CONNECTIONS", "7")
+    registry = HttpClientRegistry()
+    registry.get(ServiceType.TF)
+    try:
+        assert registry.pool_usage() == {ServiceType.TF: (0, 7)}
+    finally:
+        await registry.close()
+    assert registry.pool_usage() == {}
@@ -0,0 +1,86 @@
+"""
+서비스 비동기 작업 API 프록시 테스트
+"""
+import json
+
+import httpx
+import pytest
+import pytest_asyncio
+
+from app.main import app
+from app.domain.model.service_type import SERVICE_URLS, ServiceType
+from app.foundation.infrastructure.http_client_registry import client_registry
+
+EVENTS = b"".join(
+    b"event: progress\ndata: " + json.dumps({"progress": i / 4, "padding": "x" * 400}).encode() + b"\n\n"
+    for i in range(4)
+) + b'event: done\ndata: {"status": "succeeded"}\n\n'
+
+
+def json_response(status_code: int, content: dict, **headers) -> httpx.Response:
+    return httpx.Response(
+        status_code, stream=httpx.ByteStream(json.dumps(content).encode()),
+        headers={"content-type": "application/json", **headers}
+    )
+
+
+@pytest.fixture
+def upstream(monkeypatch):
+    received = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        received.append(request)
+        path = request.url.path
+        if path.endswith("/events"):
+            return httpx.Response(200, stream=httpx.ByteStream(EVENTS), headers={"content-type": "text/event-stream"})
+        if request.method == "POST" and path.endswith("/full"):
+            return json_response(429, {"detail": "queue full"}, **{"retry-after": "5"})
+        if path.endswith("/result"):
+            return json_response(202, {"status": "running"}, **{"retry-after": "1"})
+        prefix = request.headers["x-forwarded-prefix"]
+        return json_response(202, {"status_url": f"{prefix}{path}/abc"}, location=f"{prefix}{path}/abc")
+
+    for service in (ServiceType.NLP, ServiceType.CRIME):
+        monkeypatch.setitem(SERVICE_URLS, service, f"http://{service.value}")
+        monkeypatch.setitem(
+            client_registry._clients, service,
+            httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        )
+    return received
+
+
+@pytest_asyncio.fixture
+async def gateway():
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://gateway") as client:
+        yield client
+
+
+@pytest.mark.asyncio
+async def test_submit_forwards_gateway_prefix(upstream, gateway):
+    for service in ("nlp", "crime"):
+        response = await gateway.post(f"/ai/v1/{service}/{service}/jobs/wordcloud", json={})
+        assert response.status_code == 202
+        assert response.headers["location"] == f"/ai/v1/{service}/{service}/jobs/wordcloud/abc"
+        assert upstream[-1].headers["x-forwarded-prefix"] == f"/ai/v1/{service}"
+
+
+@pytest.mark.asyncio
+async def test_pending_and_full_keep_retry_after(upstream, gateway):
+    pending = await gateway.get("/ai/v1/nlp/nlp/jobs/abc/result")
+    assert pending.status_code == 202
+    assert pending.headers["retry-after"] == "1"
+
+    full = await gateway.post("/ai/v1/nlp/nlp/jobs/full", json={})
+    assert full.status_code == 429
+    assert full.headers["retry-after"] == "5"
+
+
+@pytest.mark.asyncio
+async def test_job_events_are_streamed_uncompressed(upstream, gateway):
+    # nlp 는 버퍼링 서비스지만 이벤트 경로는 스트리밍으로 전달되고 압축하지 않음
+    async with gateway.stream("GET", "/ai/v1/nlp/nlp/jobs/abc/events", headers={"accept-encoding": "gzip, br"}) as response:
+        assert response.headers["content-type"].startswith("text/event-stream")
+        assert "content-encoding" not in response.headers
+        body = b"".join([chunk async for chunk in response.aiter_raw()])
+    assert body == EVENTS
+    assert upstream[-1].extensions["timeout"]["read"] == 60
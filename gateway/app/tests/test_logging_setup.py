@@ -0,0 +1,67 @@
+"""
+큐 기반 로깅 / 샘플링 / request_id 주입 테스트
+"""
+import io
+import json
+import logging
+
+import pytest
+
+from app.platform import logging_setup
+from app.platform.logging_setup import configure_logging, lazy, shutdown_logging
+from app.platform.tracing import span
+
+
+@pytest.fixture
+def log_stream():
+    stream = io.StringIO()
+    yield stream
+    # 다른 테스트에는 기본 설정을 되돌려 줌
+    configure_logging()
+
+
+def test_json_log_carries_request_id(log_stream):
+    configure_logging(fmt="json", sample_rate=1.0, stream=log_stream)
+    with span("request") as current:
+        logging.getLogger("gateway_api").warning("업스트림 %s 응답 지연", "crime", extra={"elapsed_ms": 12})
+    shutdown_logging()
+
+    record = json.loads(log_stream.getvalue().strip())
+    assert record["message"] == "업스트림 crime 응답 지연"
+    assert record["level"] == "WARNING"
+    assert record["request_id"] == current.request_id
+    assert record["trace_id"] == current.trace_id
+    assert record["elapsed_ms"] == 12
+
+
+def test_sampling_drops_whole_requests_but_keeps_warnings(log_stream):
+    configure_logging(sample_rate=0.0, stream=log_stream)
+    sampled = logging.getLogger("service_proxy")
+    with span("request"):
+        sampled.info("요청 URL: %s", "http://crime/crime/map")
+        sampled.warning("차단기 열림")
+        logging.getLogger("gateway_api").info("샘플링 대상이 아닌 로거")
+    dropped = logging_setup.logging_stats()["dropped"]
+    shutdown_logging()
+
+    output = log_stream.getvalue()
+    assert "요청 URL" not in output
+    assert "차단기 열림" in output
+    assert "샘플링 대상이 아닌 로거" in output
+    assert dropped == 1
+
+
+def test_lazy_argument_is_not_evaluated_when_dropped(log_stream):
+    configure_logging(level="WARNING", sample_rate=1.0, stream=log_stream)
+    calls = []
+
+    def expensive():
+        calls.append(1)
+        return "본문"
+
+    logging.getLogger("domain.service.request_service").info("챗봇 서비스 요청 본문: %s", lazy(expensive))
+    logging.getLogger("domain.service.request_service").warning("요청 본문: %s", lazy(expensive))
+    shutdown_logging()
+
+    assert calls == [1]
+    assert "요청 본문: 본문" in log_stream.getvalue()
@@ -0,0 +1,50 @@
+"""
+/metrics 계측 테스트
+"""
+import httpx
+import pytest
+import pytest_asyncio
+
+from app.main import app
+from app.domain.model.service_type import SERVICE_URLS, ServiceType
+from app.foundation.infrastructure.http_client_registry import client_registry
+
+
+@pytest.fixture
+def upstream(monkeypatch):
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/broken"):
+            return httpx.Response(500, text="boom")
+        return httpx.Response(200, json={"ok": True})
+
+    monkeypatch.setitem(SERVICE_URLS, ServiceType.TITANIC, "http://titanic")
+    monkeypatch.setitem(
+        client_registry._clients, ServiceType.TITANIC,
+        httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    )
+
+
+@pytest_asyncio.fixture
+async def gateway():
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://gateway") as client:
+        yield client
+
+
+def sample(text: str, prefix: str) -> float:
+    return sum(float(line.rsplit(" ", 1)[1]) for line in text.splitlines() if line.startswith(prefix))
+
+
+@pytest.mark.asyncio
+async def test_metrics_report_routes_and_upstreams(upstream, gateway):
+    await gateway.post("/ai/v1/titanic/titanic/passengers", json={"name": "Jack"})
+    await gateway.post("/ai/v1/titanic/titanic/broken", json={})
+
+    response = await gateway.get("/metrics")
+    assert response.status_code == 200
+    text = response.text
+    # route 라벨은 실제 경로가 아니라 라우트 템플릿
+    assert sample(text, 'http_requests_total{method="POST",route="/ai/v1/{service}/{path:path}",service="gateway",status="200"}') >= 1
+    assert sample(text, 'gateway_upstream_requests_total{outcome="5xx",service="titanic"}') >= 1
+    assert 'http_request_duration_seconds_bucket{' in text
+    assert "# TYPE gateway_upstream_pool_utilization gauge" in text
+    assert 'gateway_circuit_state{service="titanic"}' in text
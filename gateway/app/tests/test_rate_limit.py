@@ -0,0 +1,72 @@
+"""
+토큰 버킷 속도 제한 테스트
+"""
+import httpx
+import pytest
+import pytest_asyncio
+
+from app.main import app
+from app.domain.model.service_type import SERVICE_URLS, ServiceType
+from app.foundation.core.rate_limit import LocalBucketStore, RateLimitPolicy, rate_limiter
+from app.foundation.infrastructure.http_client_registry import client_registry
+
+
+@pytest.mark.asyncio
+async def test_bucket_allows_burst_then_refills():
+    now = [0.0]
+    store = LocalBucketStore(max_keys=2, clock=lambda: now[0])
+
+    results = [await store.take("chatbot:ip:1", rate=0.5, burst=3) for _ in range(4)]
+    assert [allowed for allowed, _, _ in results] == [True, True, True, False]
+    assert results[-1][2] == pytest.approx(2.0)
+
+    now[0] = 2.0
+    assert (await store.take("chatbot:ip:1", rate=0.5, burst=3))[0] is True
+    assert (await store.take("chatbot:ip:1", rate=0.5, burst=3))[0] is False
+
+    # 용량을 넘으면 가장 오래 안 쓴 버킷부터 제거
+    await store.take("chatbot:ip:2", rate=0.5, burst=3)
+    await store.take("chatbot:ip:3", rate=0.5, burst=3)
+    assert store.size() == 2
+
+
+@pytest.fixture
+def limited(monkeypatch):
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, stream=httpx.ByteStream(b'{"ok": true}'), headers={"content-type": "application/json"})
+
+    monkeypatch.setitem(SERVICE_URLS, ServiceType.TITANIC, "http://titanic")
+    monkeypatch.setitem(client_registry._clients, ServiceType.TITANIC, httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+    monkeypatch.setattr(rate_limiter, "enabled", True)
+    monkeypatch.setattr(rate_limiter, "store", LocalBucketStore())
+    monkeypatch.setitem(rate_limiter._policies, ServiceType.TITANIC, RateLimitPolicy(rate=0.1, burst=2))
+    monkeypatch.setattr(rate_limiter, "limited", {})
+    return rate_limiter
+
+
+@pytest_asyncio.fixture
+async def gateway():
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://gateway") as client:
+        yield client
+
+
+@pytest.mark.asyncio
+async def test_gateway_returns_429_per_client_and_service(limited, gateway):
+    statuses = [(await gateway.get("/ai/v1/titanic/titanic/passengers")).status_code for _ in range(3)]
+    assert statuses == [200, 200, 429]
+
+    rejected = await gateway.get("/ai/v1/titanic/titanic/passengers")
+    assert rejected.headers["retry-after"] == "10"
+    assert rejected.headers["x-ratelimit-limit"] == "2"
+
+    # API 키가 다른 클라이언트는 별도 버킷
+    other = await gateway.get("/ai/v1/titanic/titanic/passengers", headers={"x-api-key": "other"})
+    assert other.status_code == 200
+
+    # 배치 하위 요청도 같은 버킷에서 차감되고, 한도 초과는 하위 요청별 상태로 표시
+    batch = await gateway.post("/ai/v1/batch", json={"requests": [{"service": "titanic", "path": "titanic/passengers"}]})
+    assert batch.json()["results"][0]["status"] == 429
+
+    assert limited.limited[ServiceType.TITANIC] == 3
+    metrics = (await gateway.get("/metrics")).text
+    assert 'gateway_rate_limit_decisions_total{decision="limited",service="titanic"} 3.0' in metrics
@@ -0,0 +1,161 @@
+"""
+업스트림 복원력(차단기/재시도/헤징) 테스트
+"""
+import asyncio
+
+import httpx
+import pytest
+import pytest_asyncio
+
+from app.main import app
+from app.domain.model.service_type import SERVICE_URLS, ServiceType
+from app.foundation.core.resilience import (
+    CircuitBreaker, CircuitOpenError, ResiliencePolicy, UpstreamGuard, get_policy, resilience
+)
+from app.foundation.infrastructure.http_client_registry import client_registry
+
+
+def fast_policy(**overrides) -> ResiliencePolicy:
+    values = dict(connect_timeout=1.0, read_timeout=1.0, max_retries=2, backoff_base=0.001, backoff_max=0.001,
+                  failure_threshold=3, recovery_timeout=0.05)
+    values.update(overrides)
+    return ResiliencePolicy(**values)
+
+
+def test_per_service_timeouts(monkeypatch):
+    assert get_policy(ServiceType.CHATBOT).read_timeout > get_policy(ServiceType.TITANIC).read_timeout
+    monkeypatch.setenv("TITANIC_CONNECT_TIMEOUT", "0.5")
+    timeout = get_policy(ServiceType.TITANIC).timeout()
+    assert timeout.connect == 0.5
+    assert timeout.read == 5.0
+
+
+def test_breaker_opens_and_half_open_allows_one_probe():
+    breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=0.0)
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert breaker.allow()  # recovery_timeout 경과 → half-open 시험 호출
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert not breaker.allow()
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+@pytest.mark.asyncio
+async def test_idempotent_requests_are_retried():
+    guard = UpstreamGuard(ServiceType.TITANIC, fast_policy())
+    attempts = []
+
+    async def send():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise httpx.ConnectError("refused")
+        return httpx.Response(200)
+
+    response = await guard.call("GET", send)
+    assert response.status_code == 200
+    assert len(attempts) == 3
+    assert guard.retries == 2
+
+
+@pytest.mark.asyncio
+async def test_non_idempotent_requests_are_not_retried():
+    guard = UpstreamGuard(ServiceType.TITANIC, fast_policy())
+    attempts = []
+
+    async def send():
+        attempts.append(1)
+        return httpx.Response(503)
+
+    response = await guard.call("POST", send)
+    assert response.status_code == 503
+    assert len(attempts) == 1
+
+
+@pytest.mark.asyncio
+async def test_open_circuit_rejects_without_calling_upstream():
+    guard = UpstreamGuard(ServiceType.TITANIC, fast_policy(max_retries=0, recovery_timeout=30))
+    attempts = []
+
+    async def send():
+        attempts.append(1)
+        raise httpx.ConnectError("refused")
+
+    for _ in range(3):
+        with pytest.raises(httpx.ConnectError):
+            await guard.call("GET", send)
+    with pytest.raises(CircuitOpenError) as excinfo:
+        await guard.call("GET", send)
+    assert len(attempts) == 3
+    assert excinfo.value.retry_after > 0
+
+
+@pytest.mark.asyncio
+async def test_unexpected_error_in_probe_releases_half_open_slot():
+    guard = UpstreamGuard(ServiceType.TITANIC, fast_policy(max_retries=0, failure_threshold=1, recovery_timeout=0))
+    guard.breaker.record_failure()
+    assert guard.breaker.state == CircuitBreaker.OPEN
+
+    async def broken_send():
+        raise httpx.StreamConsumed()
+
+    # 업스트림과 무관한 오류로 시험 요청이 끝나도 다음 요청이 다시 시험할 수 있어야 함
+    with pytest.raises(httpx.StreamConsumed):
+        await guard.call("POST", broken_send)
+    assert guard.breaker.state == CircuitBreaker.HALF_OPEN
+
+    async def send():
+        return httpx.Response(200)
+
+    response = await guard.call("POST", send)
+    assert response.status_code == 200
+    assert guard.breaker.state == CircuitBreaker.CLOSED
+
+
+@pytest.mark.asyncio
+async def test_hedged_request_returns_faster_response():
+    guard = UpstreamGuard(ServiceType.TITANIC, fast_policy(hedge=True, hedge_min_delay=0.01))
+    for _ in range(guard.latency.min_samples):
+        guard.latency.record(0.01)
+    delays = [1.0, 0.0]
+
+    async def send():
+        await asyncio.sleep(delays.pop(0))
+        return httpx.Response(200)
+
+    response = await asyncio.wait_for(guard.call("GET", send), timeout=0.5)
+    assert response.status_code == 200
+    assert guard.hedges == 1
+    assert guard.hedge_wins == 1
+
+
+@pytest.fixture
+def failing_upstream(monkeypatch):
+    async def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("refused", request=request)
+
+    monkeypatch.setitem(SERVICE_URLS, ServiceType.NLP, "http://nlp")
+    monkeypatch.setitem(
+        client_registry._clients, ServiceType.NLP,
+        httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    )
+    monkeypatch.setitem(resilience._guards, ServiceType.NLP, UpstreamGuard(
+        ServiceType.NLP, fast_policy(max_retries=0, failure_threshold=1, recovery_timeout=30)
+    ))
+
+
+@pytest_asyncio.fixture
+async def gateway():
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://gateway") as client:
+        yield client
+
+
+@pytest.mark.asyncio
+async def test_gateway_returns_503_with_retry_after_when_open(failing_upstream, gateway):
+    first = await gateway.get("/ai/v1/nlp/nlp/status")
+    assert first.status_code == 503
+    second = await gateway.get("/ai/v1/nlp/nlp/status")
+    assert second.status_code == 503
+    assert int(second.headers["retry-after"]) >= 1
@@ -0,0 +1,116 @@
+"""
+게이트웨이 응답 캐시 테스트
+"""
+import json
+
+import httpx
+import pytest
+import pytest_asyncio
+
+from app.main import app
+from app.domain.model.service_type import SERVICE_URLS, ServiceType
+from app.foundation.infrastructure.http_client_registry import client_registry
+from app.foundation.infrastructure.response_cache import ResponseCache, parse_route_ttls, response_cache
+
+
+def test_parse_route_ttls():
+    assert parse_route_ttls("crime/map=300, /tf/mnist-sample/=60,broken") == {
+        "crime/map": 300.0,
+        "tf/mnist-sample": 60.0,
+    }
+
+
+def test_lru_evicts_least_recently_used_by_bytes():
+    cache = ResponseCache(route_ttls={}, max_bytes=350, max_entry_bytes=200)
+    keys = [cache.make_key(ServiceType.CRIME, f"crime/{i}", "", {}) for i in range(3)]
+    cache.store(keys[0], 200, {}, b"a" * 100, ttl=60)
+    cache.store(keys[1], 200, {}, b"b" * 100, ttl=60)
+    cache.get(keys[0])  # keys[0] 을 최근 사용으로 갱신
+    cache.store(keys[2], 200, {}, b"c" * 100, ttl=60)
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) is not None
+    assert cache.evictions == 1
+    # 항목 최대 크기를 넘으면 저장하지 않음
+    assert cache.store(keys[1], 200, {}, b"d" * 300, ttl=60) is None
+
+
+def test_key_includes_query_and_vary_headers():
+    cache = ResponseCache(route_ttls={})
+    base = cache.make_key(ServiceType.NLP, "nlp/generate-wordcloud", "", {"accept": "application/json"})
+    assert base != cache.make_key(ServiceType.NLP, "nlp/generate-wordcloud", "x=1", {"accept": "application/json"})
+    assert base != cache.make_key(ServiceType.NLP, "nlp/generate-wordcloud", "", {"accept": "text/html"})
+    assert base == cache.make_key(ServiceType.NLP, "/nlp/generate-wordcloud/", "", {"accept": "application/json"})
+
+
+@pytest.fixture
+def upstream(monkeypatch):
+    calls = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304, headers={"etag": '"v1"'})
+        # 캐시를 거치지 않는 요청은 스트리밍으로 전달되므로 아직 읽히지 않은 스트림으로 돌려줌
+        content = json.dumps({"message": "지도 완성"}).encode()
+        return httpx.Response(200, stream=httpx.ByteStream(content),
+                              headers={"etag": '"v1"', "content-type": "application/json"})
+
+    monkeypatch.setitem(SERVICE_URLS, ServiceType.CRIME, "http://crime")
+    monkeypatch.setitem(
+        client_registry._clients, ServiceType.CRIME,
+        httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    )
+    monkeypatch.setattr(response_cache, "route_ttls", {"crime/map": 60.0})
+    response_cache.clear()
+    yield calls
+    response_cache.clear()
+
+
+@pytest_asyncio.fixture
+async def gateway():
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://gateway") as client:
+        yield client
+
+
+@pytest.mark.asyncio
+async def test_repeat_get_is_served_from_cache(upstream, gateway):
+    hits_before = response_cache.hits
+    first = await gateway.get("/ai/v1/crime/crime/map")
+    second = await gateway.get("/ai/v1/crime/crime/map")
+    assert first.status_code == second.status_code == 200
+    assert first.json() == second.json() == {"message": "지도 완성"}
+    assert first.headers["x-cache"] == "MISS"
+    assert second.headers["x-cache"] == "HIT"
+    assert len(upstream) == 1
+    assert response_cache.hits == hits_before + 1
+
+
+@pytest.mark.asyncio
+async def test_client_if_none_match_gets_304(upstream, gateway):
+    first = await gateway.get("/ai/v1/crime/crime/map")
+    second = await gateway.get("/ai/v1/crime/crime/map", headers={"if-none-match": first.headers["etag"]})
+    assert second.status_code == 304
+    assert len(upstream) == 1
+
+
+@pytest.mark.asyncio
+async def test_expired_entry_is_revalidated_with_etag(upstream, gateway):
+    await gateway.get("/ai/v1/crime/crime/map")
+    for entry in response_cache._entries.values():
+        entry.expires_at = 0
+    response = await gateway.get("/ai/v1/crime/crime/map")
+    assert response.status_code == 200
+    assert response.headers["x-cache"] == "REVALIDATED"
+    assert upstream[-1].headers["if-none-match"] == '"v1"'
+    assert response.json() == {"message": "지도 완성"}
+
+
+@pytest.mark.asyncio
+async def test_requests_with_credentials_bypass_cache(upstream, gateway):
+    await gateway.get("/ai/v1/crime/crime/map")
+    private = await gateway.get("/ai/v1/crime/crime/map", headers={"authorization": "Bearer alice"})
+    assert "x-cache" not in private.headers
+    await gateway.get("/ai/v1/crime/crime/map", headers={"cookie": "session=bob"})
+    assert len(upstream) == 3
+    assert len(response_cache._entries) == 1
+    assert upstream[1].headers["authorization"] == "Bearer alice"
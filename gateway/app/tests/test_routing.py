@@ -0,0 +1,43 @@
+"""
+라우팅 테이블 / 프록시 인스턴스 캐시 / 경로 정규화 테스트
+"""
+import pytest
+
+from app.domain.model.service_type import SERVICE_URLS, STREAMING_SERVICES, ServiceType
+from app.domain.model.service_proxy_factory import get_service_proxy
+from app.domain.service.request_service import (
+    ROUTE_TABLE, dispatch_body, dispatch_get, dispatch_streaming, dispatch_streaming_get
+)
+from app.foundation.core.transform import transforms
+from app.foundation.utils.request_utils import clean_request_path
+
+
+def test_clean_request_path_collapses_repeated_slashes():
+    assert clean_request_path("titanic//passengers///1/") == "titanic/passengers/1/"
+    assert clean_request_path("crime/map") == "crime/map"
+    assert clean_request_path("////") == "/"
+
+
+def test_route_table_is_immutable_and_complete():
+    assert len(ROUTE_TABLE) == len(ServiceType) * 5
+    with pytest.raises(TypeError):
+        ROUTE_TABLE[(ServiceType.TITANIC, "GET")] = None
+
+    for (service, method), route in ROUTE_TABLE.items():
+        streaming = service in STREAMING_SERVICES and transforms.get(service).identity
+        assert route.streaming is streaming
+        if method == "GET":
+            assert route.dispatch is (dispatch_streaming_get if streaming else dispatch_get)
+        else:
+            assert route.dispatch is (dispatch_streaming if streaming else dispatch_body)
+
+
+def test_service_proxy_is_cached_until_urls_change(monkeypatch):
+    monkeypatch.setitem(SERVICE_URLS, ServiceType.MATZIP, "http://matzip")
+    first = get_service_proxy(ServiceType.MATZIP)
+    assert get_service_proxy(ServiceType.MATZIP) is first
+
+    monkeypatch.setitem(SERVICE_URLS, ServiceType.MATZIP, "http://matzip-1,http://matzip-2")
+    second = get_service_proxy(ServiceType.MATZIP)
+    assert second is not first
+    assert [replica.url for replica in second.pool.replicas] == ["http://matzip-1", "http://matzip-2"]
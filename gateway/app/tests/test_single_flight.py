@@ -0,0 +1,108 @@
+"""
+동일 요청 합치기(single-flight) 테스트
+"""
+import asyncio
+
+import httpx
+import pytest
+import pytest_asyncio
+
+from app.main import app
+from app.domain.model.service_type import SERVICE_URLS, ServiceType
+from app.foundation.core.single_flight import SingleFlight, request_coalescer
+from app.foundation.infrastructure.http_client_registry import client_registry
+from app.foundation.infrastructure.response_cache import response_cache
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_one_execution():
+    flight = SingleFlight(enabled=True)
+    calls = 0
+
+    async def work():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return object()
+
+    results = await asyncio.gather(*(flight.do("k", work) for _ in range(5)))
+    assert calls == 1
+    assert all(result is results[0] for result in results)
+    assert flight.stats()["coalesced"] == 4
+    assert flight.stats()["inflight"] == 0
+
+    # 완료된 뒤 들어온 요청은 새로 실행
+    await flight.do("k", work)
+    assert calls == 2
+
+
+@pytest.mark.asyncio
+async def test_errors_fan_out_and_leader_cancel_keeps_followers():
+    flight = SingleFlight(enabled=True)
+
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("upstream down")
+
+    results = await asyncio.gather(*(flight.do("err", fail) for _ in range(3)), return_exceptions=True)
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+    async def slow():
+        await asyncio.sleep(0.05)
+        return "ok"
+
+    leader = asyncio.ensure_future(flight.do("slow", slow))
+    await asyncio.sleep(0)
+    follower = asyncio.ensure_future(flight.do("slow", slow))
+    await asyncio.sleep(0)
+    leader.cancel()
+    assert await follower == "ok"
+
+
+@pytest.fixture
+def upstream(monkeypatch):
+    calls = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json={"path": request.url.path})
+
+    for service in (ServiceType.NLP, ServiceType.CRIME):
+        monkeypatch.setitem(SERVICE_URLS, service, f"http://{service.value}")
+        monkeypatch.setitem(
+            client_registry._clients, service,
+            httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        )
+    monkeypatch.setattr(response_cache, "route_ttls", {"crime/map": 60.0})
+    response_cache.clear()
+    yield calls
+    response_cache.clear()
+
+
+@pytest_asyncio.fixture
+async def gateway():
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://gateway") as client:
+        yield client
+
+
+@pytest.mark.asyncio
+async def test_identical_gets_are_coalesced(upstream, gateway):
+    coalesced_before = request_coalescer.coalesced
+    responses = await asyncio.gather(*(gateway.get("/ai/v1/nlp/nlp/status") for _ in range(5)))
+    assert all(response.status_code == 200 for response in responses)
+    assert {response.json()["path"] for response in responses} == {"/nlp/status"}
+    assert len(upstream) == 1
+    assert request_coalescer.coalesced == coalesced_before + 4
+
+    stats = await gateway.get("/gateway/coalescing/stats")
+    assert stats.json()["coalesced"] >= 4
+
+
+@pytest.mark.asyncio
+async def test_concurrent_cache_misses_store_once(upstream, gateway):
+    stores_before = response_cache.stores
+    responses = await asyncio.gather(*(gateway.get("/ai/v1/crime/crime/map") for _ in range(4)))
+    assert all(response.headers["x-cache"] == "MISS" for response in responses)
+    assert len(upstream) == 1
+    assert response_cache.stores == stores_before + 1
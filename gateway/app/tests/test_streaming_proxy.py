@@ -0,0 +1,86 @@
+"""
+스트리밍 패스스루 프록시 테스트
+"""
+import json
+
+import httpx
+import pytest
+import pytest_asyncio
+
+from app.main import app
+from app.domain.model.service_type import SERVICE_URLS, ServiceType
+from app.foundation.infrastructure.http_client_registry import client_registry
+
+
+@pytest.fixture
+def upstream(monkeypatch):
+    """업스트림을 MockTransport 로 대체하고 받은 요청을 기록합니다."""
+    received = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        body = await request.aread()
+        received.append((request, body))
+        # 실제 네트워크 응답처럼 아직 읽히지 않은 스트림으로 돌려줌
+        if request.url.path.endswith("/image"):
+            return httpx.Response(200, stream=httpx.ByteStream(bytes(range(256))), headers={"content-type": "image/png"})
+        content = json.dumps({"path": request.url.path, "size": len(body)}).encode()
+        return httpx.Response(200, stream=httpx.ByteStream(content), headers={"content-type": "application/json"})
+
+    for service in (ServiceType.TF, ServiceType.TITANIC):
+        monkeypatch.setitem(SERVICE_URLS, service, f"http://{service.value}")
+        monkeypatch.setitem(
+            client_registry._clients, service,
+            httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        )
+    return received
+
+
+@pytest_asyncio.fixture
+async def gateway():
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://gateway") as client:
+        yield client
+
+
+@pytest.mark.asyncio
+async def test_streaming_upload_forwards_raw_multipart_body(upstream, gateway):
+    payload = b"\x89PNG" + b"\x00" * 4096
+    response = await gateway.post(
+        "/ai/v1/tf/tf/upload-handwritten",
+        files={"file": ("digit.png", payload, "image/png")},
+    )
+    assert response.status_code == 200
+    request, body = upstream[0]
+    # 게이트웨이는 multipart 본문을 파싱하지 않고 경계(boundary)까지 그대로 전달
+    assert request.headers["content-type"].startswith("multipart/form-data; boundary=")
+    assert payload in body
+    assert "transfer-encoding" not in request.headers
+
+
+@pytest.mark.asyncio
+async def test_streaming_response_keeps_binary_body(upstream, gateway):
+    response = await gateway.get("/ai/v1/tf/tf/image")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "image/png"
+    assert response.content == bytes(range(256))
+
+
+@pytest.mark.asyncio
+async def test_buffered_service_still_parses_form_upload(upstream, gateway):
+    response = await gateway.post(
+        "/ai/v1/titanic/titanic/passengers",
+        files={"file": ("passengers.csv", b"id,name\n1,a\n", "text/csv")},
+        data={"json_data": '{"source": "test"}'},
+    )
+    assert response.status_code == 200
+    request, body = upstream[0]
+    assert b"passengers.csv" in body
+    assert b"source" in body
+
+
+@pytest.mark.asyncio
+async def test_buffered_response_passes_bytes_through_unchanged(upstream, gateway):
+    response = await gateway.get("/ai/v1/titanic/titanic/image")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "image/png"
+    # 예전처럼 1000자로 잘리거나 {"raw_response": ...} 로 감싸지지 않음
+    assert response.content == bytes(range(256))
@@ -0,0 +1,102 @@
+"""
+분산 추적 헤더 전파 테스트
+"""
+import json
+import os
+
+import httpx
+import pytest
+import pytest_asyncio
+
+from app.main import app
+from app.domain.model.service_type import SERVICE_URLS, ServiceType
+from app.foundation.infrastructure.http_client_registry import client_registry
+from app.platform import tracing
+from app.platform.tracing import JsonlSpanExporter, parse_traceparent, span, trace_headers
+
+TRACE_ID = "4bf92f3577b34da6a3ce929d0e0e4736"
+
+
+def test_parse_traceparent():
+    assert parse_traceparent(f"00-{TRACE_ID}-00f067aa0ba902b7-01") == (TRACE_ID, "00f067aa0ba902b7", True)
+    assert parse_traceparent(f"00-{TRACE_ID}-00f067aa0ba902b7-00")[2] is False
+    assert parse_traceparent("00-xyz-00f067aa0ba902b7-01") is None
+    assert parse_traceparent(f"00-{'0' * 32}-00f067aa0ba902b7-01") is None
+    assert parse_traceparent(None) is None
+
+
+def test_child_spans_share_trace_and_request_id():
+    assert trace_headers() == {}
+    with span("parent") as parent:
+        with span("child") as child:
+            headers = trace_headers()
+    assert child.trace_id == parent.trace_id
+    assert child.parent_id == parent.span_id
+    assert headers["traceparent"].split("-")[2] == child.span_id
+    assert headers["x-request-id"] == parent.request_id
+
+
+def test_exporter_writes_per_process_file_and_rotates(tmp_path, monkeypatch):
+    monkeypatch.setattr(tracing, "TRACING_ENABLED", True)
+    exporter = JsonlSpanExporter(str(tmp_path / "spans.jsonl"), max_bytes=1000, backups=2, queue_size=1000)
+    with span("parent") as parent:
+        pass
+    for _ in range(50):
+        exporter.export(parent)
+    exporter.close()
+
+    path = exporter.file_path()
+    assert path == str(tmp_path / f"spans.{os.getpid()}.jsonl")
+    files = sorted(os.listdir(tmp_path))
+    assert files == [f"spans.{os.getpid()}.jsonl", f"spans.{os.getpid()}.jsonl.1", f"spans.{os.getpid()}.jsonl.2"]
+    for name in files:
+        assert os.path.getsize(tmp_path / name) <= 1000 + 400
+        for line in (tmp_path / name).read_text(encoding="utf-8").splitlines():
+            assert json.loads(line)["span_id"] == parent.span_id
+
+
+@pytest.fixture
+def upstream(monkeypatch):
+    received = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        received.append(request)
+        return httpx.Response(200, json={"ok": True})
+
+    monkeypatch.setitem(SERVICE_URLS, ServiceType.TITANIC, "http://titanic")
+    monkeypatch.setitem(
+        client_registry._clients, ServiceType.TITANIC,
+        httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    )
+    return received
+
+
+@pytest_asyncio.fixture
+async def gateway():
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://gateway") as client:
+        yield client
+
+
+@pytest.mark.asyncio
+async def test_gateway_continues_incoming_trace(upstream, gateway):
+    response = await gateway.post(
+        "/ai/v1/titanic/titanic/passengers",
+        json={"name": "Rose"},
+        headers={"traceparent": f"00-{TRACE_ID}-00f067aa0ba902b7-01", "x-request-id": "req-123"},
+    )
+    assert response.status_code == 200
+    assert response.headers["x-request-id"] == "req-123"
+    forwarded = upstream[0].headers
+    trace_id, parent_id, sampled = parse_traceparent(forwarded["traceparent"])
+    assert trace_id == TRACE_ID and sampled
+    # 부모는 클라이언트 스팬이 아니라 게이트웨이의 업스트림 시도 스팬
+    assert parent_id != "00f067aa0ba902b7"
+    assert forwarded["x-request-id"] == "req-123"
+
+
+@pytest.mark.asyncio
+async def test_gateway_starts_trace_when_missing(upstream, gateway):
+    response = await gateway.get("/ai/v1/titanic/titanic/passengers")
+    request_id = response.headers["x-request-id"]
+    assert upstream[0].headers["x-request-id"] == request_id
+    assert parse_traceparent(upstream[0].headers["traceparent"])[0] == request_id
@@ -0,0 +1,91 @@
+"""
+서비스별 요청/응답 변환 파이프라인 테스트
+"""
+import json
+
+import httpx
+import pytest
+import pytest_asyncio
+
+from app.main import app
+from app.domain.model.service_type import SERVICE_URLS, ServiceType
+from app.domain.service.transforms import chatbot_message
+from app.foundation.core.transform import Transform, TransformRegistry, transforms
+from app.foundation.infrastructure.http_client_registry import client_registry
+
+
+@pytest.fixture
+def upstream(monkeypatch):
+    received = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        received.append((request, await request.aread()))
+        return httpx.Response(200, stream=httpx.ByteStream(b'{"ok": true}'), headers={"content-type": "application/json"})
+
+    for service in (ServiceType.TITANIC, ServiceType.CHATBOT):
+        monkeypatch.setitem(SERVICE_URLS, service, f"http://{service.value}")
+        monkeypatch.setitem(
+            client_registry._clients, service,
+            httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        )
+    return received
+
+
+@pytest_asyncio.fixture
+async def gateway():
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://gateway") as client:
+        yield client
+
+
+def test_chatbot_message_normalization():
+    assert chatbot_message({"message": "안녕"}) == {"message": "안녕", "user_id": "123"}
+    assert chatbot_message({"message": "안녕", "user_id": "u1"}) == {"message": "안녕", "user_id": "u1"}
+    assert chatbot_message({"text": "질문"}) == {"message": "질문", "user_id": "123"}
+    assert chatbot_message("그냥 문자열") == {"message": "그냥 문자열", "user_id": "123"}
+
+
+def test_registry_compiles_once_and_rejects_late_registration():
+    registry = TransformRegistry()
+    registry.register(ServiceType.NLP, Transform("upper", request_body=lambda body: {"text": body["text"].upper()}))
+    pipeline = registry.get(ServiceType.NLP)
+    assert pipeline.rewrites_body and not pipeline.identity
+    assert pipeline.apply_body({"text": "abc"}) == {"text": "ABC"}
+    assert registry.get(ServiceType.TITANIC).identity
+    with pytest.raises(RuntimeError):
+        registry.register(ServiceType.NLP, Transform("late"))
+
+    assert transforms.stats()["chatbot"]["transforms"] == ["chatbot.message"]
+    assert transforms.stats()["titanic"] == {"transforms": [], "rewrites_body": False, "rewrites_response": False}
+
+
+def test_response_transform_rewrites_json_only():
+    registry = TransformRegistry()
+    registry.register(ServiceType.NLP, Transform("wrap", response_body=lambda body: {"result": body}))
+    pipeline = registry.get(ServiceType.NLP)
+    assert json.loads(pipeline.apply_response(b'[1, 2]')) == {"result": [1, 2]}
+    assert pipeline.apply_response(b"<html></html>") == b"<html></html>"
+
+
+@pytest.mark.asyncio
+async def test_identity_service_forwards_body_bytes_verbatim(upstream, gateway):
+    raw = b'{"b": 1,  "a": [1,2]}'
+    response = await gateway.post("/ai/v1/titanic/predict", content=raw, headers={"content-type": "application/json"})
+    assert response.status_code == 200
+    request, body = upstream[-1]
+    assert body == raw
+    assert request.headers["content-type"] == "application/json"
+
+    text = "name,age\nkim,30\n".encode()
+    await gateway.put("/ai/v1/titanic/upload", content=text, headers={"content-type": "text/csv"})
+    request, body = upstream[-1]
+    assert body == text
+    assert request.headers["content-type"] == "text/csv"
+
+
+@pytest.mark.asyncio
+async def test_chatbot_transform_rewrites_body_and_content_type(upstream, gateway):
+    response = await gateway.post("/ai/v1/chatbot/chat", content="오늘 날씨".encode(), headers={"content-type": "text/plain"})
+    assert response.status_code == 200
+    request, body = upstream[-1]
+    assert json.loads(body) == {"message": "오늘 날씨", "user_id": "123"}
+    assert request.headers["content-type"] == "application/json"
@@ -0,0 +1,5 @@
+"""
+게이트웨이 성능 측정 스크립트
+- 로컬 스텁 업스트림
+- 지연 시간 / 처리량 벤치마크
+"""
@@ -0,0 +1,83 @@
+"""
+요청마다 새 httpx.AsyncClient 를 여는 방식과
+공유 커넥션 풀(HttpClientRegistry)을 쓰는 방식의 지연 시간/처리량 비교
+
+실행 (gateway 디렉토리에서):
+    python -m benchmarks.bench_client_pool --requests 2000 --concurrency 20
+"""
+import argparse
+import asyncio
+import time
+from typing import Awaitable, Callable, List
+
+import httpx
+
+from app.domain.model.service_type import ServiceType
+from app.foundation.infrastructure.http_client_registry import HttpClientRegistry
+from benchmarks.stub_upstream import StubUpstream
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+async def run_load(call: Callable[[], Awaitable[None]], total: int, concurrency: int) -> dict:
+    latencies: List[float] = []
+    remaining = total
+
+    async def worker():
+        nonlocal remaining
+        while remaining > 0:
+            remaining -= 1
+            started = time.perf_counter()
+            await call()
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    return {
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+        "rps": len(latencies) / elapsed,
+    }
+
+
+async def main(total: int, concurrency: int, latency: float, payload_size: int) -> None:
+    upstream = await StubUpstream(latency=latency, payload_size=payload_size).start()
+    url = f"{upstream.base_url}/titanic/passengers"
+
+    async def per_request_client():
+        async with httpx.AsyncClient(timeout=httpx.Timeout(30.0)) as client:
+            (await client.get(url)).raise_for_status()
+
+    registry = HttpClientRegistry()
+    await registry.start()
+    pooled = registry.get(ServiceType.TITANIC)
+
+    async def pooled_client():
+        (await pooled.get(url)).raise_for_status()
+
+    try:
+        for name, call in (("요청마다 새 클라이언트", per_request_client), ("공유 커넥션 풀", pooled_client)):
+            upstream.connections = 0
+            result = await run_load(call, total, concurrency)
+            print(
+                f"{name:<16} p50={result['p50_ms']:.2f}ms p99={result['p99_ms']:.2f}ms "
+                f"req/s={result['rps']:.0f} 업스트림 연결 수={upstream.connections}"
+            )
+    finally:
+        await registry.close()
+        await upstream.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="게이트웨이 커넥션 풀 벤치마크")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=0.0, help="스텁 업스트림 지연 (초)")
+    parser.add_argument("--payload-size", type=int, default=256)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.concurrency, args.latency, args.payload_size))
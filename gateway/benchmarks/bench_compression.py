@@ -0,0 +1,92 @@
+"""
+응답 압축 인코딩/레벨별 크기, 압축 시간, 예상 전송 완료 시간(time-to-last-byte) 비교
+
+folium 지도와 비슷한 HTML(GeoJSON 좌표 + 마커 스크립트)과 상관계수 JSON 을 만들어
+인코딩/레벨마다 압축하고, 주어진 대역폭에서의 전송 완료 시간 = 압축 시간 + 전송 시간 으로 추정합니다.
+
+실행 (gateway 디렉토리에서):
+    python -m benchmarks.bench_compression --bandwidth 10 50
+"""
+import argparse
+import json
+import random
+import time
+import zlib
+from typing import Callable, List, Tuple
+
+from app.platform import compression
+
+
+def folium_like_html(districts: int = 25, points: int = 400) -> bytes:
+    """구별 폴리곤 GeoJSON 과 원형 마커 스크립트가 들어간 지도 HTML 을 만듭니다."""
+    rng = random.Random(0)
+    features = []
+    for i in range(districts):
+        ring = [[round(126.8 + rng.random() * 0.3, 6), round(37.4 + rng.random() * 0.3, 6)] for _ in range(points)]
+        features.append({
+            "type": "Feature",
+            "properties": {"name": f"district-{i}", "crime_rate": rng.random()},
+            "geometry": {"type": "Polygon", "coordinates": [ring]},
+        })
+    geojson = json.dumps({"type": "FeatureCollection", "features": features})
+    markers = "".join(
+        f"var circle_{i} = L.circle([{37.4 + rng.random() * 0.3:.6f}, {126.8 + rng.random() * 0.3:.6f}], "
+        f"{{\"bubblingMouseEvents\": true, \"color\": \"crimson\", \"fill\": true, \"radius\": {rng.randint(50, 900)}}}"
+        f").addTo(map_0);\n"
+        for i in range(districts * 10)
+    )
+    return (
+        "<!DOCTYPE html><html><head><meta charset='utf-8'/>"
+        "<script src='https://cdn.jsdelivr.net/npm/leaflet@1.9.3/dist/leaflet.js'></script></head><body>"
+        "<div class='folium-map' id='map_0'></div><script>"
+        f"var map_0 = L.map('map_0', {{center: [37.5502, 126.982], zoom: 11}});\n"
+        f"var geo_json_0 = L.geoJson({geojson}).addTo(map_0);\n{markers}"
+        "</script></body></html>"
+    ).encode()
+
+
+def correlation_json(size: int = 60) -> bytes:
+    rng = random.Random(1)
+    matrix = [[round(rng.uniform(-1, 1), 6) for _ in range(size)] for _ in range(size)]
+    return json.dumps({"columns": [f"feature_{i}" for i in range(size)], "correlation": matrix}).encode()
+
+
+def variants() -> List[Tuple[str, Callable[[bytes], bytes]]]:
+    result = [("identity", lambda body: body)]
+    for level in (1, 4, 6, 9):
+        result.append((f"gzip-{level}", lambda body, level=level: zlib.compress(body, level)))
+    if compression.brotli is not None:
+        for quality in (1, 4, 5, 8, 11):
+            result.append((f"br-{quality}", lambda body, quality=quality: compression.brotli.compress(body, quality=quality)))
+    if compression.zstandard is not None:
+        for level in (1, 3, 9, 19):
+            result.append((f"zstd-{level}", lambda body, level=level: compression.zstandard.ZstdCompressor(level=level).compress(body)))
+    return result
+
+
+def main(bandwidths: List[float], repeat: int) -> None:
+    for name, body in (("folium 지도 HTML", folium_like_html()), ("상관계수 JSON", correlation_json())):
+        print(f"\n[{name}] 원본 {len(body) / 1024:.0f}KiB")
+        print(f"{'인코딩':<10} {'크기':>9} {'비율':>6} {'압축':>8} " + " ".join(f"{f'TTLB@{bw:g}Mbps':>14}" for bw in bandwidths))
+        for label, func in variants():
+            elapsed = min(_timed(func, body) for _ in range(repeat))
+            size = len(func(body))
+            ttlb = [elapsed + size * 8 / (bw * 1e6) for bw in bandwidths]
+            print(
+                f"{label:<10} {size / 1024:>7.0f}Ki {size / len(body):>6.2f} {elapsed * 1000:>6.1f}ms "
+                + " ".join(f"{t * 1000:>12.0f}ms" for t in ttlb)
+            )
+
+
+def _timed(func: Callable[[bytes], bytes], body: bytes) -> float:
+    started = time.perf_counter()
+    func(body)
+    return time.perf_counter() - started
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="응답 압축 인코딩/레벨 비교")
+    parser.add_argument("--bandwidth", type=float, nargs="+", default=[10.0, 50.0], help="클라이언트 대역폭 (Mbps)")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    main(args.bandwidth, args.repeat)
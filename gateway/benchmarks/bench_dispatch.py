@@ -0,0 +1,141 @@
+"""
+게이트웨이 디스패치 오버헤드 마이크로벤치마크
+- 업스트림은 MockTransport 로 대체하고 게이트웨이 ASGI 앱을 직접 호출해
+  라우팅 / 헤더 준비 / 프록시 조회 / 응답 변환 등 요청당 게이트웨이 자체 비용만 측정
+- 경로 정규화, 헤더 필터링은 이전 구현과 나란히 비교
+
+실행 (gateway 디렉토리에서):
+    python -m benchmarks.bench_dispatch --requests 5000
+"""
+import os
+
+# 스팬 파일 기록은 측정 대상이 아니므로 끔
+os.environ.setdefault("TRACING_ENABLED", "false")
+
+import argparse
+import asyncio
+import json
+import time
+import timeit
+from typing import List
+
+import httpx
+
+from app.main import app
+from app.domain.model.service_type import SERVICE_URLS, ServiceType
+from app.foundation.infrastructure.http_client_registry import client_registry
+from app.foundation.utils.request_utils import clean_request_path
+from app.platform.logging_setup import configure_logging
+from benchmarks.bench_client_pool import percentile
+
+HEADERS = [
+    (b"host", b"gateway"), (b"user-agent", b"bench"), (b"accept", b"*/*"),
+    (b"accept-encoding", b"gzip, deflate"), (b"content-length", b"0"), (b"x-forwarded-for", b"10.0.0.1"),
+]
+
+
+def legacy_clean_request_path(path: str) -> str:
+    while '//' in path:
+        path = path.replace('//', '/')
+    return path
+
+
+def legacy_filter_headers(headers: dict) -> dict:
+    return {k: v for k, v in headers.items() if k.lower() not in ['content-length', 'host']}
+
+
+EXCLUDED_REQUEST_HEADERS = frozenset(['content-length', 'host'])
+
+
+def filter_headers(headers: dict) -> dict:
+    return {k: v for k, v in headers.items() if k not in EXCLUDED_REQUEST_HEADERS}
+
+
+async def call_asgi(method: str, path: str, body: bytes = b"") -> int:
+    """httpx 클라이언트 비용 없이 ASGI 앱을 한 번 호출하고 상태 코드를 반환합니다."""
+    headers = list(HEADERS)
+    if body:
+        headers = [h for h in headers if h[0] != b"content-length"]
+        headers += [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())]
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": method,
+        "scheme": "http", "path": path, "raw_path": path.encode(), "query_string": b"",
+        "root_path": "", "headers": headers, "client": ("127.0.0.1", 50000), "server": ("gateway", 80),
+    }
+    sent = False
+    status_code = 0
+
+    async def receive():
+        nonlocal sent
+        if sent:
+            await asyncio.sleep(3600)
+        sent = True
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def send(message):
+        nonlocal status_code
+        if message["type"] == "http.response.start":
+            status_code = message["status"]
+
+    await app(scope, receive, send)
+    return status_code
+
+
+async def measure(method: str, path: str, body: bytes, total: int) -> dict:
+    for _ in range(min(200, total)):  # 워밍업
+        await call_asgi(method, path, body)
+    samples: List[float] = []
+    for _ in range(total):
+        started = time.perf_counter()
+        status_code = await call_asgi(method, path, body)
+        samples.append(time.perf_counter() - started)
+        assert status_code == 200, status_code
+    return {
+        "mean_us": sum(samples) / len(samples) * 1e6,
+        "p50_us": percentile(samples, 50) * 1e6,
+        "p99_us": percentile(samples, 99) * 1e6,
+    }
+
+
+async def main(total: int) -> None:
+    configure_logging(level="WARNING")
+    payload = json.dumps({"message": "ok"}).encode()
+
+    async def upstream(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, stream=httpx.ByteStream(payload), headers={"content-type": "application/json"})
+
+    for service in (ServiceType.TITANIC, ServiceType.CRIME):
+        SERVICE_URLS[service] = f"http://{service.value}"
+        client_registry._clients[service] = httpx.AsyncClient(transport=httpx.MockTransport(upstream))
+
+    print("[게이트웨이 디스패치 (업스트림 스텁, 순차 호출)]")
+    cases = (
+        ("GET  titanic (버퍼링)", "GET", "/ai/v1/titanic//titanic/passengers", b""),
+        ("POST titanic (JSON)", "POST", "/ai/v1/titanic/titanic/predict", json.dumps({"pclass": 1}).encode()),
+        ("GET  crime (스트리밍)", "GET", "/ai/v1/crime/crime/stats", b""),
+    )
+    for name, method, path, body in cases:
+        result = await measure(method, path, body, total)
+        print(f"{name:<22} mean={result['mean_us']:.1f}us p50={result['p50_us']:.1f}us p99={result['p99_us']:.1f}us")
+
+    print("\n[구성 요소 (호출당)]")
+    common, doubled = "titanic/titanic/passengers/1", "titanic//titanic/passengers/1"
+    headers = {k.decode(): v.decode() for k, v in HEADERS}
+    number = 200_000
+    for name, func, arg in (
+        ("경로 정규화 (while 루프)", legacy_clean_request_path, common),
+        ("경로 정규화 (한 번 치환)", clean_request_path, common),
+        ("경로 정규화 // (while 루프)", legacy_clean_request_path, doubled),
+        ("경로 정규화 // (한 번 치환)", clean_request_path, doubled),
+        ("헤더 필터 (list + lower)", legacy_filter_headers, headers),
+        ("헤더 필터 (frozenset)", filter_headers, headers),
+    ):
+        elapsed = timeit.timeit(lambda: func(arg), number=number)
+        print(f"{name:<28} {elapsed / number * 1e9:.0f}ns")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="게이트웨이 디스패치 오버헤드 마이크로벤치마크")
+    parser.add_argument("--requests", type=int, default=5000)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests))
@@ -0,0 +1,311 @@
+"""
+게이트웨이 부하 테스트
+가짜 업스트림(benchmarks.stub_upstream)과 게이트웨이를 각각 uvicorn 하위 프로세스로 띄우고,
+비동기 부하 생성기로 시나리오별 요청을 보내 처리량 / 지연 백분위 / 게이트웨이 CPU / RSS 를 보고합니다.
+Docker 없이 로컬/CI 에서 실행할 수 있습니다. (CPU/RSS 는 /proc 이 있는 Linux 에서만 측정)
+
+시나리오:
+    json_get          GET  titanic   버퍼링 프록시 (작은 JSON)
+    json_post         POST titanic   버퍼링 프록시 (JSON 본문)
+    upload            POST nlp       multipart 업로드 → handle_file_upload_request
+    upload_streaming  POST tf        multipart 업로드 → 스트리밍 패스스루
+    large_buffered    GET  titanic   큰 JSON 응답 (버퍼링 + 응답 압축)
+    large_streaming   GET  crime     큰 HTML 응답 (스트리밍 패스스루)
+
+실행 (gateway 디렉토리에서):
+    python -m benchmarks.bench_gateway --duration 10 --concurrency 32
+    python -m benchmarks.bench_gateway --scenarios json_post,upload --duration 3 --json bench.json --max-error-rate 0.01
+"""
+import os
+import sys
+import json
+import time
+import socket
+import asyncio
+import argparse
+import subprocess
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterator, List, Optional
+
+import httpx
+
+from app.domain.model.service_type import ServiceType
+
+GATEWAY_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CLOCK_TICKS = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+
+
+@dataclass(frozen=True)
+class Scenario:
+    method: str
+    path: str
+    description: str
+    json_body: Optional[dict] = None
+    upload: bool = False
+
+
+SCENARIOS: Dict[str, Scenario] = {
+    "json_get": Scenario("GET", "/ai/v1/titanic/titanic/passengers", "버퍼링 GET (작은 JSON)"),
+    "json_post": Scenario(
+        "POST", "/ai/v1/titanic/titanic/predict", "버퍼링 POST (JSON 본문)",
+        json_body={"data": {"pclass": 3, "sex": "male", "age": 22, "fare": 7.25, "embarked": "S"}}
+    ),
+    "upload": Scenario("POST", "/ai/v1/nlp/nlp/upload", "multipart 업로드 (버퍼링)", upload=True),
+    "upload_streaming": Scenario("POST", "/ai/v1/tf/tf/upload-handwritten", "multipart 업로드 (스트리밍)", upload=True),
+    "large_buffered": Scenario("GET", "/ai/v1/titanic/titanic/large", "큰 응답 (버퍼링 + 압축)"),
+    "large_streaming": Scenario("GET", "/ai/v1/crime/crime/large", "큰 응답 (스트리밍)"),
+}
+
+
+@dataclass
+class ProcessSample:
+    """하위 프로세스 CPU / 메모리 표본"""
+    cpu_seconds: Optional[float] = None
+    rss_bytes: Optional[int] = None
+
+
+def sample_process(pid: int) -> ProcessSample:
+    """/proc 에서 프로세스의 누적 CPU 시간(user + system)과 RSS 를 읽습니다."""
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            # comm 필드에 공백이 있을 수 있으므로 마지막 ')' 뒤부터 나눔
+            fields = f.read().rsplit(")", 1)[1].split()
+        with open(f"/proc/{pid}/status") as f:
+            rss = next(int(line.split()[1]) * 1024 for line in f if line.startswith("VmRSS:"))
+    except (OSError, StopIteration):
+        return ProcessSample()
+    return ProcessSample((int(fields[11]) + int(fields[12])) / CLOCK_TICKS, rss)
+
+
+@dataclass
+class ScenarioResult:
+    name: str
+    requests: int = 0
+    errors: int = 0
+    statuses: Dict[int, int] = field(default_factory=dict)
+    latencies: List[float] = field(default_factory=list)
+    bytes_received: int = 0
+    elapsed: float = 0.0
+    gateway_cpu_percent: Optional[float] = None
+    gateway_rss_peak: Optional[int] = None
+    upstream_cpu_percent: Optional[float] = None
+
+    def percentile(self, pct: float) -> float:
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        index = min(len(ordered) - 1, max(0, int(round(pct / 100 * len(ordered))) - 1))
+        return ordered[index]
+
+    def to_dict(self) -> dict:
+        return {
+            "scenario": self.name,
+            "requests": self.requests,
+            "errors": self.errors,
+            "error_rate": round(self.errors / self.requests, 6) if self.requests else 0.0,
+            "statuses": {str(code): count for code, count in sorted(self.statuses.items())},
+            "throughput_rps": round(self.requests / self.elapsed, 2) if self.elapsed else 0.0,
+            "received_mib_per_s": round(self.bytes_received / 2**20 / self.elapsed, 2) if self.elapsed else 0.0,
+            "latency_ms": {
+                f"p{pct}": round(self.percentile(pct) * 1000, 2) for pct in (50, 90, 99)
+            } | {"max": round(max(self.latencies, default=0.0) * 1000, 2)},
+            "gateway_cpu_percent": self.gateway_cpu_percent,
+            "gateway_rss_peak_mib": round(self.gateway_rss_peak / 2**20, 1) if self.gateway_rss_peak else None,
+            "upstream_cpu_percent": self.upstream_cpu_percent,
+        }
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def uvicorn_process(app: str, port: int, env: Dict[str, str]) -> subprocess.Popen:
+    return subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", app, "--host", "127.0.0.1", "--port", str(port),
+         "--log-level", "warning", "--no-access-log"],
+        cwd=GATEWAY_DIR, env={**os.environ, **env},
+        # 시작 배너(print)는 버리고 경고/오류 로그(stderr)만 보여줌
+        stdout=subprocess.DEVNULL,
+    )
+
+
+def wait_ready(url: str, process: subprocess.Popen, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"프로세스가 시작 중 종료되었습니다 (exit {process.returncode}): {url}")
+        try:
+            if httpx.get(url, timeout=1.0).status_code < 500:
+                return
+        except httpx.TransportError:
+            pass
+        time.sleep(0.1)
+    raise RuntimeError(f"{timeout}s 안에 준비되지 않았습니다: {url}")
+
+
+@contextmanager
+def running_stack(args) -> Iterator[tuple]:
+    """
+    가짜 업스트림과 게이트웨이를 띄우고 (게이트웨이 URL, 게이트웨이 프로세스, 업스트림 프로세스) 를 돌려줍니다.
+    게이트웨이 설정은 운영 기본값을 따르되, 측정을 흐리는 속도 제한 / 스팬 기록 / INFO 로그는 끕니다.
+    """
+    stub_port, gateway_port = free_port(), free_port()
+    stub_url = f"http://127.0.0.1:{stub_port}"
+    stub = uvicorn_process("benchmarks.stub_upstream:app", stub_port, {
+        "STUB_LATENCY_MS": args.latency,
+        "STUB_PAYLOAD_BYTES": str(args.payload_bytes),
+        "STUB_LARGE_BYTES": str(args.large_bytes),
+    })
+    gateway_env = {
+        **{f"{service.name}_SERVICE_URL": stub_url for service in ServiceType},
+        "TRACING_ENABLED": "false",
+        "GATEWAY_RATE_LIMIT_ENABLED": "false",
+        "GATEWAY_LOG_LEVEL": "WARNING",
+    }
+    if not args.production_admission:
+        # 게이트웨이 자체 오버헤드를 재기 위해 서비스별 동시 실행 한도를 부하 수준 이상으로 올림
+        for service in ServiceType:
+            gateway_env[f"{service.name}_MAX_CONCURRENCY"] = str(args.concurrency * 2)
+            gateway_env[f"{service.name}_MAX_QUEUE"] = str(args.concurrency * 4)
+    gateway = uvicorn_process("app.main:app", gateway_port, gateway_env)
+    try:
+        wait_ready(f"{stub_url}/health", stub)
+        wait_ready(f"http://127.0.0.1:{gateway_port}/gateway/upstreams", gateway)
+        yield f"http://127.0.0.1:{gateway_port}", gateway, stub
+    finally:
+        for process in (gateway, stub):
+            process.terminate()
+        for process in (gateway, stub):
+            try:
+                process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                process.kill()
+
+
+def request_factory(scenario: Scenario, upload: bytes) -> Callable[[httpx.AsyncClient], "asyncio.Future"]:
+    if scenario.upload:
+        return lambda client: client.request(
+            scenario.method, scenario.path, files={"file": ("bench.png", upload, "image/png")}
+        )
+    if scenario.json_body is not None:
+        return lambda client: client.request(scenario.method, scenario.path, json=scenario.json_body)
+    return lambda client: client.request(scenario.method, scenario.path)
+
+
+async def run_scenario(name: str, base_url: str, gateway: subprocess.Popen, stub: subprocess.Popen, args) -> ScenarioResult:
+    """
+    시나리오 하나를 concurrency 개의 닫힌 루프(응답을 받으면 다음 요청)로 duration 초 동안 실행합니다.
+
+    Returns:
+        시나리오 측정 결과
+    """
+    scenario = SCENARIOS[name]
+    send = request_factory(scenario, os.urandom(args.upload_bytes))
+    result = ScenarioResult(name)
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30.0) as client:
+        for _ in range(min(args.concurrency, 8)):  # 워밍업 (커넥션 풀 / 압축 메모)
+            await send(client)
+
+        gateway_start, stub_start = sample_process(gateway.pid), sample_process(stub.pid)
+        rss_peak = gateway_start.rss_bytes
+        started = time.perf_counter()
+        deadline = started + args.duration
+
+        async def worker():
+            while time.perf_counter() < deadline:
+                sent = time.perf_counter()
+                try:
+                    response = await send(client)
+                    status = response.status_code
+                    result.bytes_received += len(response.content)
+                except httpx.HTTPError:
+                    status = 0
+                result.latencies.append(time.perf_counter() - sent)
+                result.requests += 1
+                result.statuses[status] = result.statuses.get(status, 0) + 1
+                if status == 0 or status >= 400:
+                    result.errors += 1
+
+        async def sample_memory():
+            nonlocal rss_peak
+            while True:
+                await asyncio.sleep(0.2)
+                rss = sample_process(gateway.pid).rss_bytes
+                if rss is not None:
+                    rss_peak = max(rss_peak or 0, rss)
+
+        sampler = asyncio.create_task(sample_memory())
+        await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+        sampler.cancel()
+        result.elapsed = time.perf_counter() - started
+
+    gateway_end, stub_end = sample_process(gateway.pid), sample_process(stub.pid)
+    if gateway_start.cpu_seconds is not None and gateway_end.cpu_seconds is not None:
+        result.gateway_cpu_percent = round((gateway_end.cpu_seconds - gateway_start.cpu_seconds) / result.elapsed * 100, 1)
+        result.upstream_cpu_percent = round((stub_end.cpu_seconds - stub_start.cpu_seconds) / result.elapsed * 100, 1)
+    result.gateway_rss_peak = rss_peak
+    return result
+
+
+def print_report(results: List[ScenarioResult], args) -> None:
+    print(f"[게이트웨이 부하 테스트] 동시 {args.concurrency}개, 시나리오당 {args.duration}s, CPU {os.cpu_count()}개, "
+          f"업스트림 지연 {args.latency}ms, 큰 응답 {args.large_bytes // 1024}KiB, 업로드 {args.upload_bytes // 1024}KiB")
+    header = f"{'시나리오':<18}{'요청':>8}{'오류':>6}{'rps':>9}{'p50':>9}{'p90':>9}{'p99':>9}{'max':>9}{'MiB/s':>8}{'GW CPU':>8}{'GW RSS':>9}"
+    print(header)
+    for result in results:
+        row = result.to_dict()
+        latency = row["latency_ms"]
+        cpu = f"{row['gateway_cpu_percent']:.0f}%" if row["gateway_cpu_percent"] is not None else "-"
+        rss = f"{row['gateway_rss_peak_mib']:.0f}MiB" if row["gateway_rss_peak_mib"] is not None else "-"
+        print(
+            f"{result.name:<18}{row['requests']:>8}{row['errors']:>6}{row['throughput_rps']:>9.1f}"
+            f"{latency['p50']:>8.1f}ms{latency['p90']:>7.1f}ms{latency['p99']:>7.1f}ms{latency['max']:>7.1f}ms"
+            f"{row['received_mib_per_s']:>8.1f}{cpu:>8}{rss:>9}"
+        )
+
+
+async def main(args) -> int:
+    names = [name.strip() for name in args.scenarios.split(",") if name.strip()]
+    unknown = [name for name in names if name not in SCENARIOS]
+    if unknown:
+        raise SystemExit(f"알 수 없는 시나리오: {unknown} (가능: {list(SCENARIOS)})")
+
+    results = []
+    with running_stack(args) as (base_url, gateway, stub):
+        for name in names:
+            results.append(await run_scenario(name, base_url, gateway, stub, args))
+    print_report(results, args)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({
+                "config": {key: value for key, value in vars(args).items() if key != "json"},
+                "cpu_count": os.cpu_count(),
+                "results": [result.to_dict() for result in results],
+            }, f, ensure_ascii=False, indent=2)
+
+    # CI 에서 실패로 판단할 수 있도록 오류율이 한도를 넘으면 종료 코드 1
+    failed = [r.name for r in results if r.requests == 0 or r.errors / r.requests > args.max_error_rate]
+    if failed:
+        print(f"오류율 한도({args.max_error_rate}) 초과: {failed}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="가짜 업스트림을 둔 게이트웨이 부하 테스트")
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS), help="쉼표로 구분한 시나리오 이름")
+    parser.add_argument("--duration", type=float, default=10.0, help="시나리오당 측정 시간 (초)")
+    parser.add_argument("--concurrency", type=int, default=32, help="동시에 요청하는 클라이언트 수")
+    parser.add_argument("--latency", default="5", help="업스트림 지연 ms (예: 5,chatbot=200)")
+    parser.add_argument("--payload-bytes", type=int, default=1024, help="일반 응답 크기")
+    parser.add_argument("--large-bytes", type=int, default=2 * 1024 * 1024, help="큰 응답 크기")
+    parser.add_argument("--upload-bytes", type=int, default=256 * 1024, help="업로드 파일 크기")
+    parser.add_argument("--production-admission", action="store_true", help="서비스별 입장 제어 한도를 운영 기본값 그대로 사용")
+    parser.add_argument("--json", help="결과를 저장할 JSON 파일 경로")
+    parser.add_argument("--max-error-rate", type=float, default=0.0, help="이 오류율을 넘으면 종료 코드 1")
+    sys.exit(asyncio.run(main(parser.parse_args())))
@@ -0,0 +1,117 @@
+"""
+로깅 방식별 게이트웨이 처리량 비교
+- 동기 StreamHandler (기존 basicConfig 방식)
+- 큐 기반 비동기 핸들러
+- 큐 + 요청 로그 샘플링 (text / json)
+
+게이트웨이 앱을 ASGI 로 직접 호출하고 업스트림은 MockTransport 로 대체해
+네트워크 없이 게이트웨이 자체의 요청당 비용만 측정합니다.
+로그는 실제 파일에 기록하고, --write-latency 로 쓰기마다 지연을 주면
+소비자가 느린 컨테이너 stdout 파이프(쓰기가 막히는 상황)를 흉내 낼 수 있습니다.
+
+실행 (gateway 디렉토리에서):
+    python -m benchmarks.bench_logging --requests 3000 --concurrency 20
+    python -m benchmarks.bench_logging --write-latency 0.0002
+"""
+import os
+
+# 스팬 파일 기록은 측정 대상이 아니므로 끔 (request_id 는 그대로 생성됨)
+os.environ.setdefault("TRACING_ENABLED", "false")
+
+import argparse
+import asyncio
+import logging
+import tempfile
+import time
+from typing import TextIO
+
+import httpx
+
+from app.main import app
+from app.domain.model.service_type import SERVICE_URLS, ServiceType
+from app.foundation.core.admission import AdmissionController, AdmissionPolicy, admission
+from app.foundation.infrastructure.http_client_registry import client_registry
+from app.platform.logging_setup import TEXT_FORMAT, RequestIdFilter, configure_logging, shutdown_logging
+from benchmarks.bench_client_pool import run_load
+
+
+class SlowSink:
+    """쓰기마다 고정 지연이 있는 출력 스트림 (막히는 stdout 파이프 흉내)"""
+
+    def __init__(self, stream: TextIO, write_latency: float):
+        self.stream = stream
+        self.write_latency = write_latency
+
+    def write(self, text: str) -> int:
+        if self.write_latency > 0:
+            time.sleep(self.write_latency)
+        return self.stream.write(text)
+
+    def flush(self) -> None:
+        self.stream.flush()
+
+
+def configure_sync_logging(sink) -> None:
+    """기존 방식: 요청 처리 스레드에서 바로 포맷팅하고 쓰는 StreamHandler"""
+    shutdown_logging()
+    root = logging.getLogger()
+    for existing in root.handlers[:]:
+        root.removeHandler(existing)
+    handler = logging.StreamHandler(sink)
+    handler.addFilter(RequestIdFilter())
+    handler.setFormatter(logging.Formatter(TEXT_FORMAT))
+    root.addHandler(handler)
+    root.setLevel(logging.INFO)
+
+
+async def main(total: int, concurrency: int, message_size: int, write_latency: float, repeat: int) -> None:
+    async def upstream(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"response": "ok"})
+
+    SERVICE_URLS[ServiceType.CHATBOT] = "http://chatbot"
+    client_registry._clients[ServiceType.CHATBOT] = httpx.AsyncClient(transport=httpx.MockTransport(upstream))
+    # 챗봇 기본 동시 실행 한도(1)가 아니라 로깅 비용을 재도록 한도를 넉넉히 둠
+    admission._controllers[ServiceType.CHATBOT] = AdmissionController(
+        ServiceType.CHATBOT, AdmissionPolicy(max_concurrency=concurrency, max_queue=total, queue_timeout=30.0)
+    )
+    body = {"message": "안녕하세요 " * (message_size // 16)}
+
+    scenarios = (
+        ("동기 stdout (기존)", lambda sink: configure_sync_logging(sink)),
+        ("큐 핸들러", lambda sink: configure_logging(sample_rate=1.0, stream=sink)),
+        ("큐 + 샘플링 10%", lambda sink: configure_logging(sample_rate=0.1, stream=sink)),
+        ("큐 + 샘플링 10% (json)", lambda sink: configure_logging(fmt="json", sample_rate=0.1, stream=sink)),
+    )
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://gateway") as gateway:
+        async def call():
+            (await gateway.post("/ai/v1/chatbot/chatbot/chat", json=body)).raise_for_status()
+
+        with tempfile.TemporaryDirectory() as directory:
+            for name, setup in scenarios:
+                path = os.path.join(directory, "gateway.log")
+                results = []
+                for _ in range(repeat):
+                    with open(path, "w", encoding="utf-8") as f:
+                        setup(SlowSink(f, write_latency))
+                        await run_load(call, min(200, total), concurrency)  # 워밍업
+                        results.append(await run_load(call, total, concurrency))
+                        shutdown_logging()
+                # 반복 중 가장 좋은 결과 (다른 부하로 인한 잡음 제거)
+                result = max(results, key=lambda r: r["rps"])
+                size = os.path.getsize(path)
+                print(
+                    f"{name:<22} p50={result['p50_ms']:.2f}ms p99={result['p99_ms']:.2f}ms "
+                    f"req/s={result['rps']:.0f} 로그={size / 1024:.0f}KiB"
+                )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="게이트웨이 로깅 방식별 처리량 벤치마크")
+    parser.add_argument("--requests", type=int, default=3000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--message-size", type=int, default=2048, help="챗봇 요청 메시지 크기 (바이트)")
+    parser.add_argument("--write-latency", type=float, default=0.0, help="로그 한 줄 쓰기 지연 (초)")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.concurrency, args.message_size, args.write_latency, args.repeat))
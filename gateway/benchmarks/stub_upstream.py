@@ -0,0 +1,178 @@
+"""
+벤치마크용 경량 스텁 업스트림 서버입니다.
+
+1) StubUpstream: asyncio 스트림 위에서 HTTP/1.1 keep-alive 를 지원하는 최소한의 서버로,
+   외부 의존성 없이 실제 TCP 연결 비용을 포함한 측정이 가능합니다. (고정 지연 / 고정 크기 JSON)
+
+2) app: ServiceType 별 백엔드를 흉내 내는 가벼운 ASGI 앱입니다. (FastAPI 없이 응답해서 업스트림 오버헤드를 최소화)
+   게이트웨이의 서비스 URL 을 모두 이 서버로 두면 경로 첫 부분(/titanic/..., /crime/...)으로 서비스를 구분합니다.
+
+   - GET  /health                 : 헬스 체크
+   - GET  /{service}/.../large    : 큰 응답 (STUB_LARGE_BYTES, crime 은 HTML / 그 외 JSON)
+   - GET  /{service}/...          : STUB_PAYLOAD_BYTES 크기의 JSON
+   - POST /{service}/...          : 요청 본문(JSON / multipart)을 끝까지 읽고 받은 바이트 수를 JSON 으로 응답
+
+   서비스별 지연 시간은 STUB_LATENCY_MS 로 설정합니다. (예: "5,chatbot=200,tf=30" - 첫 값은 기본값)
+
+   실행 (gateway 디렉토리에서):
+       python -m uvicorn benchmarks.stub_upstream:app --port 9100
+"""
+import os
+import asyncio
+import json
+from typing import Dict, Optional, Tuple
+
+
+class StubUpstream:
+    """
+    고정 지연과 고정 크기 JSON 응답을 돌려주는 스텁 서버
+
+    Args:
+        latency: 응답 전 대기 시간 (초)
+        payload_size: 응답 본문의 대략적인 크기 (바이트)
+        host: 바인딩 주소
+        port: 바인딩 포트 (0이면 임의 포트)
+    """
+
+    def __init__(self, latency: float = 0.0, payload_size: int = 256, host: str = "127.0.0.1", port: int = 0):
+        self.latency = latency
+        self.host = host
+        self.port = port
+        self.connections = 0
+        self.requests = 0
+        self._server: Optional[asyncio.base_events.Server] = None
+        body = json.dumps({"message": "ok", "data": "x" * max(0, payload_size - 30)}).encode()
+        self._response = (
+            b"HTTP/1.1 200 OK\r\n"
+            b"content-type: application/json\r\n"
+            b"content-length: " + str(len(body)).encode() + b"\r\n"
+            b"connection: keep-alive\r\n\r\n" + body
+        )
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    async def start(self) -> "StubUpstream":
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                content_length = 0
+                close = False
+                for line in head.split(b"\r\n")[1:]:
+                    name, _, value = line.partition(b":")
+                    name = name.strip().lower()
+                    if name == b"content-length":
+                        content_length = int(value.strip())
+                    elif name == b"connection" and value.strip().lower() == b"close":
+                        close = True
+                if content_length:
+                    await reader.readexactly(content_length)
+                if self.latency:
+                    await asyncio.sleep(self.latency)
+                self.requests += 1
+                writer.write(self._response)
+                await writer.drain()
+                if close:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionResetError):
+            pass
+        finally:
+            writer.close()
+
+
+# ✅ 서비스별 백엔드를 흉내 내는 ASGI 앱 (bench_gateway 에서 uvicorn 으로 실행)
+STUB_LATENCY_MS = os.getenv("STUB_LATENCY_MS", "5")
+STUB_PAYLOAD_BYTES = int(os.getenv("STUB_PAYLOAD_BYTES", "1024"))
+STUB_LARGE_BYTES = int(os.getenv("STUB_LARGE_BYTES", str(2 * 1024 * 1024)))
+
+
+def parse_latencies(value: str) -> Tuple[float, Dict[str, float]]:
+    """ "5,chatbot=200" → (0.005, {"chatbot": 0.2}) """
+    default, overrides = 0.0, {}
+    for part in filter(None, (p.strip() for p in value.split(","))):
+        if "=" in part:
+            service, ms = part.split("=", 1)
+            overrides[service.strip()] = float(ms) / 1000
+        else:
+            default = float(part) / 1000
+    return default, overrides
+
+
+def make_json(size: int) -> bytes:
+    """size 바이트 정도의 JSON 목록 (실제 응답처럼 비슷한 레코드가 반복되는 형태)"""
+    record = {"id": 0, "name": "승객", "district": "강남구", "score": 0.123456, "tags": ["a", "b", "c"]}
+    per_record = len(json.dumps(record, ensure_ascii=False).encode()) + 1
+    rows = [{**record, "id": i, "score": round(i * 0.37 % 1, 6)} for i in range(max(1, size // per_record))]
+    return json.dumps({"rows": rows}, ensure_ascii=False).encode()
+
+
+def make_html(size: int) -> bytes:
+    """size 바이트 정도의 지도 HTML 비슷한 문서"""
+    row = '<div class="marker" data-lat="37.5665" data-lng="126.9780">범죄 발생 건수</div>\n'
+    count = max(1, size // len(row.encode()))
+    return ("<html><body>\n" + row * count + "</body></html>").encode()
+
+
+DEFAULT_LATENCY, SERVICE_LATENCY = parse_latencies(STUB_LATENCY_MS)
+PAYLOAD = make_json(STUB_PAYLOAD_BYTES)
+LARGE_JSON = make_json(STUB_LARGE_BYTES)
+LARGE_HTML = make_html(STUB_LARGE_BYTES)
+JSON_TYPE = (b"content-type", b"application/json")
+HTML_TYPE = (b"content-type", b"text/html; charset=utf-8")
+
+
+async def send(send_message, status: int, body: bytes, content_type: Tuple[bytes, bytes] = JSON_TYPE) -> None:
+    await send_message({
+        "type": "http.response.start",
+        "status": status,
+        "headers": [content_type, (b"content-length", str(len(body)).encode())],
+    })
+    await send_message({"type": "http.response.body", "body": body})
+
+
+async def app(scope, receive, send_message):
+    if scope["type"] == "lifespan":
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send_message({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await send_message({"type": "lifespan.shutdown.complete"})
+                return
+    path = scope["path"]
+    if path == "/health":
+        return await send(send_message, 200, b'{"status": "ok"}')
+
+    # 요청 본문은 업로드 크기와 상관없이 끝까지 읽음 (실제 서비스처럼 게이트웨이가 본문을 모두 보내야 응답)
+    received = 0
+    more_body = True
+    while more_body:
+        message = await receive()
+        received += len(message.get("body", b""))
+        more_body = message.get("more_body", False)
+
+    service = path.strip("/").split("/", 1)[0]
+    latency = SERVICE_LATENCY.get(service, DEFAULT_LATENCY)
+    if latency:
+        await asyncio.sleep(latency)
+
+    if scope["method"] == "POST":
+        body = json.dumps({"service": service, "received": received, "padding": "x" * max(0, STUB_PAYLOAD_BYTES - 64)})
+        return await send(send_message, 200, body.encode())
+    if path.endswith("/large"):
+        if service == "crime":
+            return await send(send_message, 200, LARGE_HTML, HTML_TYPE)
+        return await send(send_message, 200, LARGE_JSON)
+    return await send(send_message, 200, PAYLOAD)
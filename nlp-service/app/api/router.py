@@ -2,6 +2,7 @@ from fastapi import APIRouter, HTTPException, Request
 import logging
 import traceback
 from app.domain.controller.wordcloud_controller import WordCloudController
+from app.platform.jobs import jobs
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
@@ -45,6 +46,8 @@ async def generate_wordcloud(request: Request):
         
         logger.info(f"📤 응답 반환: {result}")
         return result
+    except HTTPException:
+        raise
     except Exception as e:
         error_msg = f"❌ 워드클라우드 생성 중 오류: {str(e)}"
         logger.error(error_msg)
@@ -57,4 +60,12 @@ async def generate_wordcloud(request: Request):
                 "error": str(e),
                 "traceback": traceback.format_exc()
             }
-        ) 
\ No newline at end of file
+        )
+
+
+# 비동기 작업 등록 - POST /nlp/jobs/wordcloud 로 제출하고 /nlp/jobs/{job_id}/events 로 단계별 진행률 확인
+def wordcloud_job(progress):
+    return WordCloudController().build_wordcloud(progress=progress)
+
+
+jobs.register("wordcloud", wordcloud_job, "삼성 보고서 워드클라우드 생성")
@@ -8,11 +8,30 @@ import os
 import shutil
 import traceback
 import logging
+import threading
+from app.platform.tracing import span, traced
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger("samsung_report")
 
+# ✅ 프로세스 전역 Okt 분석기 (JVM 기동 비용이 커서 요청마다 만들지 않음)
+_okt = None
+_okt_lock = threading.Lock()
+
+def get_okt() -> Okt:
+    """
+    프로세스에서 공유하는 Okt 분석기를 반환합니다. 처음 호출할 때 JVM 을 띄웁니다.
+    JVM 은 fork 후에 사용할 수 없으므로 gunicorn 마스터가 아니라 워커에서 처음 호출해야 합니다.
+    """
+    global _okt
+    if _okt is None:
+        with _okt_lock:
+            if _okt is None:
+                with span("nlp.load_okt"):
+                    _okt = Okt()
+    return _okt
+
 class SamsungReport:
     def __init__(self):
         # 인스턴스 변수 초기화
@@ -34,7 +53,7 @@ class SamsungReport:
         self.freq_distribution = None
         
         # NLP 관련 객체
-        self.okt = Okt()
+        self.okt = get_okt()
         
         # 파일 경로 로깅 (절대 경로로 변환하여 출력)
         self.abs_report_path = os.path.abspath(self.report_path)
@@ -61,6 +80,7 @@ class SamsungReport:
                 logger.error(f"⚠️ 로컬 출력 디렉토리 생성 실패: {e}")
                 logger.error(traceback.format_exc())
 
+    @traced("nlp.read_report")
     def read_report(self):
         """삼성 보고서 파일을 읽어옵니다."""
         try:
@@ -75,6 +95,7 @@ class SamsungReport:
             logger.error(traceback.format_exc())
             raise Exception(f"보고서 파일 읽기 실패: {e}")
 
+    @traced("nlp.extract_hangeul")
     def extract_hangeul(self):
         """한글만 추출합니다."""
         try:
@@ -91,6 +112,7 @@ class SamsungReport:
             logger.error(traceback.format_exc())
             raise Exception(f"한글 추출 실패: {e}")
 
+    @traced("nlp.change_token")
     def change_token(self):
         """텍스트를 토큰화합니다."""
         try:
@@ -105,6 +127,7 @@ class SamsungReport:
             logger.error(traceback.format_exc())
             raise Exception(f"토큰화 실패: {e}")
 
+    @traced("nlp.extract_noun")
     def extract_noun(self):
         """명사를 추출합니다."""
         try:
@@ -135,6 +158,7 @@ class SamsungReport:
             logger.error(traceback.format_exc())
             raise Exception(f"명사 추출 실패: {e}")
 
+    @traced("nlp.read_stopword")
     def read_stopword(self):
         """불용어 리스트를 읽어옵니다."""
         try:
@@ -153,6 +177,7 @@ class SamsungReport:
             self.stopwords = ['이', '그', '저', '것', '수', '등', '들', '및', '에서', '그리고']
             return self.stopwords
 
+    @traced("nlp.remove_stopword")
     def remove_stopword(self):
         """불용어를 제거합니다."""
         try:
@@ -169,6 +194,7 @@ class SamsungReport:
             logger.error(traceback.format_exc())
             raise Exception(f"불용어 제거 실패: {e}")
 
+    @traced("nlp.find_frequency")
     def find_frequency(self):
         """단어 빈도수를 분석합니다."""
         try:
@@ -188,6 +214,7 @@ class SamsungReport:
             logger.error(traceback.format_exc())
             raise Exception(f"빈도 분석 실패: {e}")
 
+    @traced("nlp.draw_wordcloud")
     def draw_wordcloud(self):
         """워드클라우드를 생성하고 저장합니다. 컨테이너 내부와 로컬에 모두 저장합니다."""
         try:
@@ -260,36 +287,34 @@ class SamsungReport:
             logger.error(traceback.format_exc())
             raise Exception(f"워드클라우드 생성 실패: {e}")
 
-    def process_all(self):
-        """모든 처리 과정을 순차적으로 실행합니다."""
+    @traced("nlp.process_all")
+    def process_all(self, progress=None):
+        """
+        모든 처리 과정을 순차적으로 실행합니다.
+
+        Args:
+            progress: 단계마다 progress(진행 비율, 단계 이름) 으로 호출되는 콜백 (선택)
+        """
+        # 각 단계를 명확히 분리하여 로깅
+        steps = [
+            ("📙 STEP 1: 보고서 읽기", self.read_report),
+            ("🔤 STEP 2: 한글 추출", self.extract_hangeul),
+            ("🔢 STEP 3: 토큰화", self.change_token),
+            ("📝 STEP 4: 명사 추출", self.extract_noun),
+            ("🗑️ STEP 5: 불용어 읽기", self.read_stopword),
+            ("✂️ STEP 6: 불용어 제거", self.remove_stopword),
+            ("📊 STEP 7: 빈도 분석", self.find_frequency),
+            ("🎨 STEP 8: 워드클라우드 생성", self.draw_wordcloud),
+        ]
         try:
             logger.info("🚀 삼성 보고서 분석 시작")
-            
-            # 각 단계를 명확히 분리하여 로깅
-            logger.info("📙 STEP 1: 보고서 읽기")
-            self.read_report()
-            
-            logger.info("🔤 STEP 2: 한글 추출")
-            self.extract_hangeul()
-            
-            logger.info("🔢 STEP 3: 토큰화")
-            self.change_token()
-            
-            logger.info("📝 STEP 4: 명사 추출")
-            self.extract_noun()
-            
-            logger.info("🗑️ STEP 5: 불용어 읽기")
-            self.read_stopword()
-            
-            logger.info("✂️ STEP 6: 불용어 제거")
-            self.remove_stopword()
-            
-            logger.info("📊 STEP 7: 빈도 분석")
-            self.find_frequency()
-            
-            logger.info("🎨 STEP 8: 워드클라우드 생성")
-            result = self.draw_wordcloud()
-            
+            result = None
+            for index, (name, step) in enumerate(steps):
+                logger.info(name)
+                if progress is not None:
+                    progress(index / len(steps), name)
+                result = step()
+
             logger.info("✅ 삼성 보고서 분석 완료")
             return result
         except Exception as e:
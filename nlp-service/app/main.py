@@ -4,7 +4,14 @@ NLP 서비스 메인 애플리케이션 진입점
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from app.api.router import router
+from app.domain.service.samsung_report import get_okt
+from app.platform.executor import blocking
+from app.platform.instrumentation import instrument
+from app.platform.jobs import jobs, create_job_router
+from app.platform import serving
+from app.platform.tracing import setup_tracing
 import uvicorn
+from contextlib import asynccontextmanager
 import logging
 import traceback
 import os
@@ -23,11 +30,27 @@ logger.info(f"📂 파일 목록: {os.listdir()}")
 logger.info(f"📂 original 폴더: {os.path.exists('original')} (파일: {os.listdir('original') if os.path.exists('original') else '없음'})")
 logger.info(f"📂 output 폴더: {os.path.exists('output')} (생성됨: {os.makedirs('output', exist_ok=True) or True})")
 
+# 워커 초기화 - Okt(JVM)는 fork 할 수 없으므로 워커마다 띄우고 첫 요청 전에 미리 분석을 한 번 실행
+@serving.on_worker_init
+def warm_up_okt():
+    get_okt().pos("삼성전자 지속가능경영보고서")
+
+# 라이프스팬 - 워커 준비, 비동기 작업 워커 시작/종료
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await serving.startup("nlp")
+    await jobs.start()
+    yield
+    await jobs.close()
+    blocking.close()
+    await serving.shutdown()
+
 # FastAPI 앱 생성
 app = FastAPI(
     title="NLP Service API",
     description="삼성 보고서 분석 및 워드클라우드 생성 서비스",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 # CORS 미들웨어 설정
@@ -39,6 +62,12 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 메트릭 계측 (/metrics)
+instrument(app, "nlp")
+
+# 분산 추적 (traceparent 이어받기, 스팬 JSONL 기록)
+setup_tracing(app, "nlp")
+
 # 예외 처리 미들웨어 추가
 @app.middleware("http")
 async def log_requests(request: Request, call_next):
@@ -57,6 +86,14 @@ async def log_requests(request: Request, call_next):
 logger.info("🔄 라우터 등록 (prefix='/nlp')")
 app.include_router(router, prefix="/nlp")
 
+# 비동기 작업 API (/nlp/jobs/...)
+app.include_router(create_job_router(jobs), prefix="/nlp")
+
+# 헬스 체크 (게이트웨이 능동 헬스 프로브용)
+@app.get("/health", tags=["상태 확인"])
+async def health():
+    return {"status": "ok"}
+
 # 루트 경로 핸들러
 @app.get("/", tags=["상태 확인"])
 async def root():
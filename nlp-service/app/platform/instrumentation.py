@@ -0,0 +1,128 @@
+"""
+Prometheus 계측 모듈 (원본: gateway - 수정 후 tools/sync_platform.py 로 각 서비스에 복사)
+- 요청 수 / 지연 히스토그램 / 진행 중 요청 게이지
+- GET /metrics 로 노출
+- gunicorn 등 멀티 프로세스 실행 시 PROMETHEUS_MULTIPROC_DIR 를 설정하면 워커 값을 합쳐서 노출
+"""
+import os
+import time
+from typing import Any, Callable, Dict, List
+
+from fastapi import FastAPI
+from prometheus_client import (
+    CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, Counter, Gauge, Histogram, generate_latest
+)
+from prometheus_client import multiprocess
+from prometheus_client.registry import Collector
+from starlette.requests import Request
+from starlette.responses import Response
+
+METRICS_PATH = "/metrics"
+
+# ✅ 지연 히스토그램 구간 (초) - 챗봇 생성처럼 긴 요청까지 포함
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+REQUESTS = Counter(
+    "http_requests_total", "처리한 HTTP 요청 수",
+    ["service", "method", "route", "status"]
+)
+LATENCY = Histogram(
+    "http_request_duration_seconds", "HTTP 요청 처리 시간 (응답 본문 전송 완료까지)",
+    ["service", "method", "route"], buckets=LATENCY_BUCKETS
+)
+IN_FLIGHT = Gauge(
+    "http_requests_in_flight", "처리 중인 HTTP 요청 수",
+    ["service"], multiprocess_mode="livesum"
+)
+
+
+class MetricsMiddleware:
+    """
+    요청 수, 지연 시간, 진행 중 요청 수를 기록하는 ASGI 미들웨어입니다.
+    route 라벨은 실제 경로가 아니라 라우트 템플릿(/crime/{id})을 사용해 라벨 수가 늘어나지 않게 합니다.
+    """
+
+    def __init__(self, app: Callable, service: str, routes_from: FastAPI):
+        self.app = app
+        self.service = service
+        self.routes_from = routes_from
+        self._templates: Dict[Any, str] = {}
+
+    def _route_template(self, scope: dict) -> str:
+        endpoint = scope.get("endpoint")
+        if endpoint is None:
+            return "unmatched"
+        template = self._templates.get(endpoint)
+        if template is None:
+            template = next(
+                (route.path for route in self.routes_from.routes if getattr(route, "endpoint", None) is endpoint),
+                "unmatched"
+            )
+            self._templates[endpoint] = template
+        return template
+
+    async def __call__(self, scope: dict, receive: Callable, send: Callable) -> None:
+        if scope["type"] != "http" or scope["path"] == METRICS_PATH:
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+        started = time.perf_counter()
+        in_flight = IN_FLIGHT.labels(self.service)
+        in_flight.inc()
+
+        async def send_with_status(message: dict) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            in_flight.dec()
+            route = self._route_template(scope)
+            REQUESTS.labels(self.service, scope["method"], route, str(status_code)).inc()
+            LATENCY.labels(self.service, scope["method"], route).observe(time.perf_counter() - started)
+
+
+# 프로세스 내부 상태를 읽어 수집 시점에 값을 만드는 수집기 (멀티 프로세스 모드에서도 함께 노출)
+_custom_collectors: List[Collector] = []
+
+
+def register_collector(collector: Collector) -> None:
+    """
+    수집 시점에 값을 계산하는 사용자 정의 수집기를 등록합니다.
+
+    Args:
+        collector: prometheus_client Collector
+    """
+    REGISTRY.register(collector)
+    _custom_collectors.append(collector)
+
+
+def _registry() -> CollectorRegistry:
+    if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        for collector in _custom_collectors:
+            registry.register(collector)
+        return registry
+    return REGISTRY
+
+
+async def metrics_endpoint(request: Request) -> Response:
+    """Prometheus 텍스트 형식으로 메트릭을 반환합니다."""
+    return Response(generate_latest(_registry()), media_type=CONTENT_TYPE_LATEST)
+
+
+def instrument(app: FastAPI, service: str) -> None:
+    """
+    앱에 계측 미들웨어와 /metrics 엔드포인트를 등록합니다.
+
+    Args:
+        app: FastAPI 앱
+        service: 메트릭 service 라벨 값
+    """
+    app.add_middleware(MetricsMiddleware, service=service, routes_from=app)
+    app.add_route(METRICS_PATH, metrics_endpoint, include_in_schema=False)
@@ -0,0 +1,73 @@
+"""
+블로킹 작업 실행기 테스트
+"""
+import asyncio
+import contextvars
+import threading
+import time
+
+import pytest
+from fastapi import HTTPException
+
+from app.platform.executor import BlockingExecutor
+
+request_id = contextvars.ContextVar("request_id", default=None)
+
+
+@pytest.mark.asyncio
+async def test_runs_off_loop_with_bounded_concurrency():
+    executor = BlockingExecutor(kind="thread", workers=4, max_concurrency=2, max_pending=8)
+    active, peak = 0, 0
+    lock = threading.Lock()
+
+    def work(value):
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.05)
+        with lock:
+            active -= 1
+        return value, request_id.get(), threading.current_thread().name
+
+    request_id.set("req-1")
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    tick_task = asyncio.create_task(ticker())
+    results = await asyncio.gather(*(executor.run(work, i) for i in range(4)))
+    tick_task.cancel()
+
+    assert [value for value, _, _ in results] == [0, 1, 2, 3]
+    # 호출한 요청의 컨텍스트를 이어받고, 이벤트 루프가 아닌 풀 스레드에서 실행
+    assert all(rid == "req-1" and name.startswith("blocking") for _, rid, name in results)
+    assert peak == 2
+    # 블로킹 작업 중에도 이벤트 루프는 계속 돎 (약 100ms 동안)
+    assert ticks >= 5
+    assert executor.stats()["completed"] == 4
+    executor.close()
+
+
+@pytest.mark.asyncio
+async def test_rejects_when_pending_limit_reached():
+    executor = BlockingExecutor(kind="thread", workers=1, max_concurrency=1, max_pending=1)
+    release = threading.Event()
+    running = asyncio.ensure_future(executor.run(release.wait, 5))
+    waiting = asyncio.ensure_future(executor.run(lambda: "ok"))
+    await asyncio.sleep(0.02)
+
+    with pytest.raises(HTTPException) as excinfo:
+        await executor.run(lambda: "rejected")
+    assert excinfo.value.status_code == 503
+    assert excinfo.value.headers["Retry-After"] == "1"
+
+    release.set()
+    assert await running is True
+    assert await waiting == "ok"
+    assert executor.stats()["rejected"] == 1
+    executor.close()
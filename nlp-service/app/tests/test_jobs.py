@@ -0,0 +1,104 @@
+"""
+비동기 작업 API 테스트
+"""
+import asyncio
+import threading
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from app.platform.jobs import JobManager, create_job_router
+
+
+def build(tmp_path, queue_size=4):
+    manager = JobManager(store_path=str(tmp_path / "jobs.sqlite3"), workers=1, queue_size=queue_size)
+    app = FastAPI()
+    app.include_router(create_job_router(manager), prefix="/nlp")
+    client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://nlp")
+    return manager, client
+
+
+async def wait_done(client, url):
+    for _ in range(200):
+        response = await client.get(url)
+        if response.status_code != 202:
+            return response
+        await asyncio.sleep(0.01)
+    raise AssertionError("작업이 끝나지 않았습니다")
+
+
+@pytest.mark.asyncio
+async def test_submit_poll_result_and_persistence(tmp_path):
+    manager, client = build(tmp_path)
+
+    def wordcloud(top: int = 3, progress=None):
+        for step in range(4):
+            progress(step / 4, f"STEP {step + 1}")
+        return {"top": list(range(top))}
+
+    manager.register("wordcloud", wordcloud)
+    await manager.start()
+    async with client:
+        submitted = await client.post(
+            "/nlp/jobs/wordcloud", json={"top": 2}, headers={"x-forwarded-prefix": "/ai/v1/nlp"}
+        )
+        assert submitted.status_code == 202
+        body = submitted.json()
+        assert body["status_url"] == f"/ai/v1/nlp/nlp/jobs/{body['job_id']}"
+        assert submitted.headers["location"] == body["status_url"]
+
+        result = await wait_done(client, f"/nlp/jobs/{body['job_id']}/result")
+        assert result.status_code == 200
+        assert result.json()["result"] == {"top": [0, 1]}
+        assert result.json()["progress"] == 1.0
+
+        assert (await client.post("/nlp/jobs/unknown")).status_code == 404
+        assert (await client.post("/nlp/jobs/wordcloud", json={"bogus": 1})).status_code == 422
+    await manager.close()
+
+    # 재시작 후에도 저장소에서 결과를 조회할 수 있음
+    restarted, client = build(tmp_path)
+    await restarted.start()
+    async with client:
+        again = await client.get(f"/nlp/jobs/{body['job_id']}/result")
+        assert again.json()["result"] == {"top": [0, 1]}
+    await restarted.close()
+
+
+@pytest.mark.asyncio
+async def test_failure_queue_limit_and_events(tmp_path):
+    manager, client = build(tmp_path, queue_size=1)
+    release = threading.Event()
+
+    def blocking(progress):
+        progress(0.5, "대기 중")
+        release.wait(5)
+        raise ValueError("boom")
+
+    manager.register("blocking", blocking)
+    await manager.start()
+    async with client:
+        first = (await client.post("/nlp/jobs/blocking")).json()
+        await asyncio.sleep(0.05)  # 워커가 첫 작업을 가져가 대기열이 빔
+        await client.post("/nlp/jobs/blocking")
+        full = await client.post("/nlp/jobs/blocking")
+        assert full.status_code == 429
+        assert "retry-after" in full.headers
+
+        async def read_events():
+            async with client.stream("GET", f"/nlp/jobs/{first['job_id']}/events") as response:
+                assert response.headers["content-type"].startswith("text/event-stream")
+                return [line async for line in response.aiter_lines() if line.startswith("event:")]
+
+        reader = asyncio.create_task(read_events())
+        await asyncio.sleep(0.05)
+        release.set()
+        events = await asyncio.wait_for(reader, 5)
+        assert events[0] == "event: progress"
+        assert events[-1] == "event: done"
+
+        failed = await wait_done(client, f"/nlp/jobs/{first['job_id']}/result")
+        assert failed.status_code == 409
+        assert failed.json()["error"] == "ValueError: boom"
+    await manager.close()
@@ -0,0 +1,31 @@
+"""
+운영 서빙 설정 (gunicorn + uvicorn 워커)
+- 워커 수: WEB_CONCURRENCY 또는 CPU 수 x WORKERS_PER_CORE
+- preload_app: 앱과 읽기 전용 상태를 fork 전에 한 번 로드해 워커끼리 공유
+
+실행:
+    gunicorn app.main:app -c gunicorn.conf.py
+개발 중에는 uvicorn app.main:app --reload 를 사용합니다.
+"""
+import os
+
+from app.platform import serving
+
+# 앱(prometheus_client)을 import 하기 전에 실행해야 함
+serving.prepare_master()
+
+bind = f"0.0.0.0:{os.getenv('PORT', '9004')}"
+workers = serving.worker_count()
+worker_class = "uvicorn.workers.UvicornWorker"
+preload_app = True
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "120"))
+graceful_timeout = int(os.getenv("GUNICORN_GRACEFUL_TIMEOUT", "30"))
+keepalive = 5
+# 메모리 누수/단편화 대비 주기적 워커 교체 (0 이면 끄기)
+max_requests = int(os.getenv("GUNICORN_MAX_REQUESTS", "0"))
+max_requests_jitter = max_requests // 10
+
+when_ready = serving.when_ready
+post_fork = serving.post_fork
+post_worker_init = serving.post_worker_init
+child_exit = serving.child_exit
@@ -1,14 +1,15 @@
-from fastapi import APIRouter, File, UploadFile
+from fastapi import APIRouter, File, HTTPException, UploadFile
 from fastapi.responses import JSONResponse
 import logging
 import os
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 from tensorflow import keras
 import numpy as np
 import shutil
 from PIL import Image
 from app.domain.controller.file_controller import process_upload_file, process_handwritten_file
 from app.domain.model.file_schema import UploadResponse, HandwrittenPredictionResponse
+from app.platform.executor import run_blocking
 
 router = APIRouter()
 logger = logging.getLogger("tf_main")
@@ -51,26 +52,9 @@ async def get_mnist_sample():
     - **image_path**: 저장된 이미지 파일 경로
     """
     try:
-        # MNIST 데이터셋 로드
-        mnist = keras.datasets.mnist
-        (train_images, train_labels), (_, _) = mnist.load_data()
-        
-        # 100번째 이미지 선택
+        # 데이터셋 로드와 이미지 저장은 블로킹 연산이므로 실행기 풀에서 실행
         mnist_idx = 100
-        image = train_images[mnist_idx]
-        label = int(train_labels[mnist_idx])
-        
-        # 이미지 파일 저장 경로 설정
-        mnist_dir = "/mnist"
-        os.makedirs(mnist_dir, exist_ok=True)
-        image_path = os.path.join(mnist_dir, "mnist_sample.png")
-        
-        # Matplotlib을 사용하여 이미지 저장
-        plt.figure(figsize=(5, 5))
-        plt.imshow(image, cmap='gray')
-        plt.axis('off')  # 축 제거
-        plt.savefig(image_path, bbox_inches='tight', pad_inches=0)
-        plt.close()
+        label, image_path = await run_blocking(save_mnist_sample, mnist_idx)
         
         logger.info(f"MNIST 샘플 이미지(인덱스: {mnist_idx}, 레이블: {label})가 {image_path}에 저장되었습니다.")
         
@@ -80,6 +64,8 @@ async def get_mnist_sample():
             "image_path": image_path
         }
     
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"MNIST 샘플 이미지 생성 오류: {str(e)}")
         return JSONResponse(
@@ -87,6 +73,34 @@ async def get_mnist_sample():
             status_code=500
         )
 
+def save_mnist_sample(mnist_idx: int) -> tuple:
+    """
+    MNIST 학습 데이터에서 mnist_idx 번째 이미지를 /mnist/mnist_sample.png 로 저장합니다.
+    pyplot 전역 상태를 쓰지 않도록 Figure 를 직접 만들어 여러 스레드에서 동시에 실행해도 안전합니다.
+    
+    Returns:
+        tuple: (레이블, 저장된 이미지 경로)
+    """
+    # MNIST 데이터셋 로드
+    mnist = keras.datasets.mnist
+    (train_images, train_labels), (_, _) = mnist.load_data()
+    
+    image = train_images[mnist_idx]
+    label = int(train_labels[mnist_idx])
+    
+    # 이미지 파일 저장 경로 설정
+    mnist_dir = "/mnist"
+    os.makedirs(mnist_dir, exist_ok=True)
+    image_path = os.path.join(mnist_dir, "mnist_sample.png")
+    
+    # Matplotlib을 사용하여 이미지 저장
+    figure = Figure(figsize=(5, 5))
+    axes = figure.add_subplot()
+    axes.imshow(image, cmap='gray')
+    axes.axis('off')  # 축 제거
+    figure.savefig(image_path, bbox_inches='tight', pad_inches=0)
+    return label, image_path
+
 @router.post("/upload-handwritten", response_model=HandwrittenPredictionResponse)
 async def upload_handwritten(file: UploadFile = File(...)):
     """
@@ -104,6 +118,8 @@ async def upload_handwritten(file: UploadFile = File(...)):
         result = await process_handwritten_file(file)
         return result
     
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"손글씨 분류 중 오류 발생: {str(e)}")
         return JSONResponse(
@@ -1,6 +1,7 @@
 import os
 import shutil
 import logging
+import threading
 from fastapi import UploadFile
 from tensorflow import keras
 
@@ -53,4 +54,31 @@ def load_mnist_model(model_path: str):
         return model
     except Exception as e:
         logger.error(f"모델 로드 중 오류 발생: {str(e)}")
-        raise RuntimeError(f"모델 로드 중 오류 발생: {str(e)}") 
\ No newline at end of file
+        raise RuntimeError(f"모델 로드 중 오류 발생: {str(e)}")
+
+# ✅ 프로세스 전역 MNIST 모델 (요청마다 .h5 를 다시 읽지 않음)
+MNIST_MODEL_PATHS = (
+    os.path.join(os.getcwd(), "app", "models", "my_mnist_model.h5"),
+    "/app/models/my_mnist_model.h5",
+)
+_mnist_model = None
+_mnist_model_lock = threading.Lock()
+
+def get_mnist_model():
+    """
+    프로세스에서 공유하는 MNIST 모델을 반환합니다. 처음 호출할 때 MNIST_MODEL_PATHS 중 있는 파일을 로드합니다.
+    TF 런타임은 fork 후에 사용할 수 없으므로 gunicorn 마스터가 아니라 워커에서 처음 호출해야 합니다.
+
+    Returns:
+        로드된 Keras 모델
+    """
+    global _mnist_model
+    if _mnist_model is None:
+        with _mnist_model_lock:
+            if _mnist_model is None:
+                model_path = next((path for path in MNIST_MODEL_PATHS if os.path.exists(path)), None)
+                if model_path is None:
+                    logger.error(f"모델 파일을 찾을 수 없습니다: {MNIST_MODEL_PATHS}")
+                    raise FileNotFoundError(f"모델 파일을 찾을 수 없습니다: {MNIST_MODEL_PATHS}")
+                _mnist_model = load_mnist_model(model_path)
+    return _mnist_model
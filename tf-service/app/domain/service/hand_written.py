@@ -3,8 +3,10 @@ import logging
 import numpy as np
 from PIL import Image
 from fastapi import UploadFile
-from app.domain.repository.handwritten_repository import save_uploaded_file, load_mnist_model
+from app.domain.repository.handwritten_repository import save_uploaded_file, get_mnist_model
 from app.domain.model.file_schema import HandwrittenPredictionResponse
+from app.platform.executor import run_blocking
+from app.platform.tracing import span
 
 logger = logging.getLogger("tf_main")
 
@@ -23,36 +25,45 @@ async def process_handwritten_image(file: UploadFile) -> HandwrittenPredictionRe
     file_path = os.path.join(mnist_dir, file.filename)
     
     # 파일 저장 (Repository 호출)
-    await save_uploaded_file(file, file_path)
+    with span("tf.file_write", path=file_path):
+        await save_uploaded_file(file, file_path)
     
-    # 이미지 전처리
-    img_array = preprocess_image(file_path)
+    # 전처리/모델 로드/예측은 블로킹 연산이므로 실행기 풀에서 실행
+    predicted_digit, confidence = await run_blocking(predict_digit, file_path)
     
-    # 모델 경로 설정
-    model_path = os.path.join(os.getcwd(), "app", "models", "my_mnist_model.h5")
-    alt_model_path = "/app/models/my_mnist_model.h5"
+    # 응답 모델 생성 및 반환
+    return HandwrittenPredictionResponse(
+        predicted_digit=predicted_digit,
+        confidence=confidence,
+        file_path=file_path
+    )
+
+def predict_digit(file_path: str) -> tuple:
+    """
+    저장된 손글씨 이미지를 전처리하고 MNIST 모델로 숫자를 예측합니다.
     
-    try:
-        # 모델 로드 시도 (Repository 호출)
-        model = load_mnist_model(model_path)
-    except FileNotFoundError:
-        # 대체 경로 시도
-        logger.info(f"대체 모델 경로로 시도: {alt_model_path}")
-        model = load_mnist_model(alt_model_path)
+    Args:
+        file_path: 이미지 파일 경로
+    
+    Returns:
+        tuple: (예측 숫자, 예측 확률)
+    """
+    # 이미지 전처리
+    with span("tf.preprocess"):
+        img_array = preprocess_image(file_path)
+    
+    # 모델 로드 (워커에서 한 번 로드한 모델을 재사용)
+    with span("tf.model_load"):
+        model = get_mnist_model()
     
     # 모델 예측 수행
-    predictions = model.predict(img_array)
+    with span("tf.inference"):
+        predictions = model.predict(img_array)
     predicted_digit = np.argmax(predictions[0])
     confidence = float(predictions[0][predicted_digit])
     
     logger.info(f"손글씨 숫자 예측 결과: {predicted_digit} (확률: {confidence:.4f})")
-    
-    # 응답 모델 생성 및 반환
-    return HandwrittenPredictionResponse(
-        predicted_digit=int(predicted_digit),
-        confidence=confidence,
-        file_path=file_path
-    )
+    return int(predicted_digit), confidence
 
 def preprocess_image(file_path: str) -> np.ndarray:
     """
@@ -3,8 +3,9 @@ import os
 import logging
 import traceback
 import shutil
-from fastapi import UploadFile
+from fastapi import HTTPException, UploadFile
 from app.domain.model.file_schema import MosaicResult, UploadResponse
+from app.platform.executor import run_blocking
 
 logger = logging.getLogger("tf_main")
 
@@ -80,8 +81,8 @@ async def process_upload_and_mosaic(file: UploadFile) -> UploadResponse:
             filename, extension = os.path.splitext(file.filename)
             mosaic_file_location = os.path.join(OUTPUT_DIR, f"{filename}_mosaic{extension}")
             
-            # 얼굴 감지 및 모자이크 처리
-            result = mosaic_faces(file_location, mosaic_file_location)
+            # 얼굴 감지 및 모자이크 처리 (OpenCV 연산은 실행기 풀에서 실행)
+            result = await run_blocking(mosaic_faces, file_location, mosaic_file_location)
             result_obj = MosaicResult(**result)
             
             if result_obj.success:
@@ -99,6 +100,9 @@ async def process_upload_and_mosaic(file: UploadFile) -> UploadResponse:
                     original_path=file_location,
                     faces_detected=0
                 )
+        except HTTPException:
+            # 실행기 과부하(503)는 부분 성공으로 감추지 않고 그대로 전달
+            raise
         except Exception as e:
             logger.error(f"얼굴 모자이크 처리 오류: {str(e)}")
             logger.error(traceback.format_exc())
@@ -108,6 +112,8 @@ async def process_upload_and_mosaic(file: UploadFile) -> UploadResponse:
                 original_path=file_location,
                 faces_detected=0
             )
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"파일 업로드 실패: {str(e)}")
         logger.error(traceback.format_exc())
@@ -4,7 +4,13 @@ TF 서비스 메인 애플리케이션 진입점
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from app.api.file_router import router as file_router
+from app.domain.repository.handwritten_repository import get_mnist_model
+from app.platform.executor import blocking
+from app.platform.instrumentation import instrument
+from app.platform import serving
+from app.platform.tracing import setup_tracing
 import uvicorn
+from contextlib import asynccontextmanager
 import logging
 import traceback
 import os
@@ -34,11 +40,28 @@ try:
 except ImportError:
     logger.warning(f"⚠️ OpenCV가 설치되어 있지 않습니다. 얼굴 인식 기능이 동작하지 않을 수 있습니다.")
 
+# 워커 초기화 - TF 런타임은 fork 할 수 없으므로 MNIST 모델은 워커마다 첫 요청 전에 로드
+@serving.on_worker_init
+def load_models():
+    try:
+        get_mnist_model()
+    except FileNotFoundError as e:
+        logger.warning(f"⚠️ MNIST 모델을 미리 로드하지 못했습니다: {e}")
+
+# 라이프스팬 - 워커 준비, 종료 시 블로킹 작업 실행기 정리
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await serving.startup("tf")
+    yield
+    blocking.close()
+    await serving.shutdown()
+
 # FastAPI 앱 생성
 app = FastAPI(
     title="TensorFlow & Computer Vision Service API",
     description="TensorFlow 기반 계산 및 컴퓨터 비전 서비스",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 # CORS 미들웨어 설정
@@ -50,6 +73,12 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 메트릭 계측 (/metrics)
+instrument(app, "tf")
+
+# 분산 추적 (traceparent 이어받기, 스팬 JSONL 기록)
+setup_tracing(app, "tf")
+
 # 예외 처리 미들웨어 추가
 @app.middleware("http")
 async def log_requests(request: Request, call_next):
@@ -67,6 +96,11 @@ async def log_requests(request: Request, call_next):
 logger.info("🔄 파일 업로드 라우터 등록 (prefix='/tf')")
 app.include_router(file_router, prefix="/tf", tags=["파일 업로드"])
 
+# 헬스 체크 (게이트웨이 능동 헬스 프로브용)
+@app.get("/health", tags=["상태 확인"])
+async def health():
+    return {"status": "ok"}
+
 # 직접 실행 시 (개발 환경)
 if __name__ == "__main__":
     logger.info(f"💻 개발 모드로 실행 - 포트: 9005")
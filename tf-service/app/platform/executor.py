@@ -0,0 +1,176 @@
+"""
+블로킹 작업 실행 모듈 (원본: crime-service - 수정 후 tools/sync_platform.py 로 각 서비스에 복사)
+- async 핸들러 안의 pandas / TF / torch 같은 동기 연산을 이벤트 루프 밖(스레드 또는 프로세스 풀)에서 실행
+- 동시에 실행하는 블로킹 작업 수를 제한하고, 대기 중인 작업이 너무 많으면 503 으로 거절
+- 대기/실행 시간을 Prometheus 메트릭으로 노출 (/metrics)
+
+사용:
+    result = await run_blocking(controller.preprocess, 'cctv_in_seoul.csv')
+"""
+import os
+import time
+import asyncio
+import functools
+import contextvars
+import multiprocessing
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Optional, TypeVar
+
+from fastapi import HTTPException, status
+from prometheus_client import Counter, Gauge, Histogram
+
+T = TypeVar("T")
+
+# ✅ 실행기 설정
+# thread: GIL 을 놓는 numpy/pandas/TF/torch 연산에 적합, 모델을 프로세스 안에서 공유
+# process: 순수 파이썬 CPU 연산용 (함수와 인자가 pickle 가능해야 하고, 워커 프로세스마다 모듈을 새로 import)
+EXECUTOR_KIND = os.getenv("EXECUTOR_KIND", "thread").lower()
+EXECUTOR_WORKERS = int(os.getenv("EXECUTOR_WORKERS", str(min(4, os.cpu_count() or 1))))
+# 동시에 실행할 블로킹 작업 수 (메모리를 많이 쓰는 모델 추론은 1 로 제한하는 식으로 사용)
+EXECUTOR_MAX_CONCURRENCY = int(os.getenv("EXECUTOR_MAX_CONCURRENCY", str(EXECUTOR_WORKERS)))
+# 실행 슬롯을 기다릴 수 있는 최대 작업 수 (초과하면 503)
+EXECUTOR_MAX_PENDING = int(os.getenv("EXECUTOR_MAX_PENDING", "32"))
+
+WAIT_SECONDS = Histogram(
+    "blocking_task_wait_seconds", "블로킹 작업이 실행 슬롯을 기다린 시간",
+    ["task"], buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0)
+)
+RUN_SECONDS = Histogram(
+    "blocking_task_run_seconds", "블로킹 작업 실행 시간",
+    ["task"], buckets=(0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+)
+RUNNING = Gauge("blocking_tasks_running", "실행 중인 블로킹 작업 수", multiprocess_mode="livesum")
+REJECTED = Counter("blocking_tasks_rejected_total", "대기열이 가득 차 거절한 블로킹 작업 수")
+
+
+class BlockingExecutor:
+    """
+    동기 함수를 풀에서 실행하고 결과를 기다리는 실행기입니다.
+    스레드 모드에서는 호출한 요청의 컨텍스트(추적 스팬 등)를 그대로 이어서 실행합니다.
+    """
+
+    def __init__(self, kind: str = EXECUTOR_KIND, workers: int = EXECUTOR_WORKERS,
+                 max_concurrency: int = EXECUTOR_MAX_CONCURRENCY, max_pending: int = EXECUTOR_MAX_PENDING):
+        if kind not in ("thread", "process"):
+            raise ValueError(f"EXECUTOR_KIND 는 thread 또는 process 여야 합니다: {kind}")
+        self.kind = kind
+        self.workers = workers
+        self.max_concurrency = max_concurrency
+        self.max_pending = max_pending
+        self._pool: Optional[Executor] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self.running = 0
+        self.pending = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+
+    def _get_pool(self) -> Executor:
+        if self._pool is None:
+            if self.kind == "process":
+                # TF/torch 가 만든 스레드를 fork 로 복제하지 않도록 spawn 사용
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.workers, mp_context=multiprocessing.get_context("spawn")
+                )
+            else:
+                self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="blocking")
+        return self._pool
+
+    async def run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        동기 함수를 풀에서 실행합니다.
+
+        Args:
+            func: 실행할 동기 함수
+            *args, **kwargs: 함수 인자
+
+        Returns:
+            함수 반환값
+
+        Raises:
+            HTTPException: 대기 중인 작업이 EXECUTOR_MAX_PENDING 을 넘은 경우 (503)
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        if self.pending >= self.max_pending:
+            self.rejected += 1
+            REJECTED.inc()
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="처리 중인 작업이 많아 요청을 받을 수 없습니다. 잠시 후 다시 시도해 주세요.",
+                headers={"Retry-After": "1"}
+            )
+
+        task = getattr(func, "__qualname__", type(func).__name__)
+        call = functools.partial(func, *args, **kwargs)
+        if self.kind == "thread":
+            call = functools.partial(contextvars.copy_context().run, call)
+
+        loop = asyncio.get_running_loop()
+        queued_at = time.perf_counter()
+        self.pending += 1
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self.pending -= 1
+        started = time.perf_counter()
+        WAIT_SECONDS.labels(task).observe(started - queued_at)
+        self.running += 1
+        RUNNING.inc()
+        try:
+            future = self._get_pool().submit(call)
+        except BaseException:
+            self._finish(task, started, None)
+            raise
+        # 요청이 취소돼도(클라이언트 연결 끊김, 게이트웨이 타임아웃) 워커의 작업은 계속 돌기 때문에
+        # 슬롯 반환 / 카운터 / 실행 시간 기록은 작업이 실제로 끝났을 때 이벤트 루프에서 처리
+        future.add_done_callback(lambda done: self._finish_threadsafe(loop, task, started, done))
+        return await asyncio.wrap_future(future, loop=loop)
+
+    def _finish_threadsafe(self, loop: asyncio.AbstractEventLoop, task: str, started: float,
+                           future: Future) -> None:
+        """워커 스레드에서 불리는 완료 콜백 - 정리 작업을 이벤트 루프로 넘깁니다."""
+        try:
+            loop.call_soon_threadsafe(self._finish, task, started, future)
+        except RuntimeError:
+            # 이벤트 루프가 이미 닫힘 (프로세스 종료 중)
+            pass
+
+    def _finish(self, task: str, started: float, future: Optional[Future]) -> None:
+        """실행 슬롯을 반환하고 카운터와 실행 시간을 기록합니다."""
+        if future is None or future.cancelled() or future.exception() is not None:
+            self.failed += 1
+        else:
+            self.completed += 1
+        self.running -= 1
+        RUNNING.dec()
+        RUN_SECONDS.labels(task).observe(time.perf_counter() - started)
+        self._semaphore.release()
+
+    def close(self) -> None:
+        """풀을 종료합니다. (lifespan 종료 시 호출)"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    def stats(self) -> dict:
+        return {
+            "kind": self.kind,
+            "workers": self.workers,
+            "max_concurrency": self.max_concurrency,
+            "max_pending": self.max_pending,
+            "running": self.running,
+            "pending": self.pending,
+            "completed": self.completed,
+            "failed": self.failed,
+            "rejected": self.rejected,
+        }
+
+
+# ✅ 프로세스 전역 실행기
+blocking = BlockingExecutor()
+
+
+async def run_blocking(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """전역 실행기로 동기 함수를 실행합니다. (BlockingExecutor.run 참고)"""
+    return await blocking.run(func, *args, **kwargs)
@@ -1,6 +1,7 @@
 from fastapi import APIRouter, Request
 import logging
 from app.domain.controller.titanic_controller import TitanicController
+from app.platform.jobs import jobs
 
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -84,3 +85,11 @@ async def patch_passenger(request: Request):
             "name": "Patched John Smith"
         }
     }
+
+
+# ✅ 비동기 작업 - POST /titanic/jobs/train {"train_fname": ..., "test_fname": ...}
+def train_job(train_fname: str = 'train.csv', test_fname: str = 'test.csv', progress=None):
+    return TitanicController().train(train_fname, test_fname, progress=progress)
+
+
+jobs.register("train", train_job, "전처리 후 모델별 교차검증 정확도 계산")
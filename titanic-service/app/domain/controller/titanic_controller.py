@@ -1,5 +1,6 @@
 from sklearn.svm import SVC
 import pandas as pd
+from types import SimpleNamespace
 from app.domain.service.titanic_service import TitanicService
 '''
 print(f'결정트리 활용한 검증 정확도 {None}')
@@ -23,6 +24,35 @@ class TitanicController:
         """
         return self.service.preprocess(train_fname, test_fname)
     
+    def train(self, train_fname='train.csv', test_fname='test.csv', progress=None):
+        """
+        전처리 후 다섯 가지 모델의 교차검증 정확도를 계산합니다. (비동기 작업 워커에서 실행)
+        Args:
+            train_fname: Training data file name
+            test_fname: Test data file name
+            progress: 모델마다 progress(진행 비율, 메시지) 로 호출되는 콜백 (선택)
+        Returns:
+            모델별 검증 정확도 dict
+        """
+        service = self.service
+        report = progress or (lambda fraction, message: None)
+        report(0.0, "전처리")
+        data = self.preprocess(train_fname, test_fname)
+        this = SimpleNamespace(train=data['train'], label=data['labels'])
+        models = [
+            ('결정트리', service.accuracy_by_dtree),
+            ('랜덤포레스트', service.accuracy_by_random_forest),
+            ('나이브베이즈', service.accuracy_by_naive_bayes),
+            ('KNN', service.accuracy_by_knn),
+            ('SVM', service.accuracy_by_svm),
+        ]
+        accuracy = {}
+        for index, (name, func) in enumerate(models):
+            report((index + 1) / (len(models) + 1), f'{name} 교차검증')
+            accuracy[name] = float(func(this))
+            print(f'{name} 활용한 검증 정확도 {accuracy[name]}')
+        return {"accuracy": accuracy}
+
     def learning(self, train, test):
         service = self.service
         this = self.preprocess(train, test)
@@ -12,6 +12,10 @@ import json
 from pydantic import BaseModel
 
 from app.api.titanic_router import router as titanic_api_router
+from app.platform.instrumentation import instrument
+from app.platform.jobs import jobs, create_job_router
+from app.platform import serving
+from app.platform.tracing import setup_tracing
 
 # ✅ 로깅 설정
 logging.basicConfig(
@@ -32,7 +36,11 @@ class TitanicRequest(BaseModel):
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     print("🚀🚀🚀 Titanic Service가 시작됩니다.")
+    await serving.startup("titanic")
+    await jobs.start()
     yield
+    await jobs.close()
+    await serving.shutdown()
     print("🛑 Titanic Service가 종료됩니다.")
 
 # ✅ FastAPI 설정
@@ -52,15 +60,29 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# ✅ 메트릭 계측 (/metrics)
+instrument(app, "titanic")
+
+# ✅ 분산 추적 (traceparent 이어받기, 스팬 JSONL 기록)
+setup_tracing(app, "titanic")
+
 # ✅ 서브 라우터 생성
 titanic_router = APIRouter(prefix="/titanic", tags=["Titanic Service"])
 
 # ✅ 서브 라우터와 엔드포인트를 연결함
 app.include_router(titanic_api_router, prefix="/titanic")
 
+# ✅ 비동기 작업 API (/titanic/jobs/...)
+app.include_router(create_job_router(jobs), prefix="/titanic")
+
 # ✅ 서브 라우터 등록
 app.include_router(titanic_router)
 
+# ✅ 헬스 체크 (게이트웨이 능동 헬스 프로브용)
+@app.get("/health", tags=["상태 확인"])
+async def health():
+    return {"status": "ok"}
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(
@@ -0,0 +1,437 @@
+"""
+비동기 작업(Job) 모듈 (원본: crime-service - 수정 후 tools/sync_platform.py 로 오래 걸리는 작업이 있는 서비스에 복사)
+- 제출하면 바로 job_id 를 돌려주고, 동기 파이프라인은 워커 스레드 풀에서 실행 (이벤트 루프를 막지 않음)
+- 대기열 크기를 제한해 넘치면 429 로 거절
+- 상태/결과는 로컬 SQLite 에 저장 (프로세스 재시작 후에도 결과 조회 가능)
+- GET .../jobs/{id}/events 로 진행률을 Server-Sent Events 스트림으로 제공
+"""
+import os
+import json
+import time
+import uuid
+import asyncio
+import inspect
+import logging
+import sqlite3
+import threading
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Set
+
+from fastapi import APIRouter, Body, HTTPException, Request, status
+from fastapi.responses import JSONResponse, StreamingResponse
+
+logger = logging.getLogger("platform.jobs")
+
+# ✅ 작업 설정
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", "1"))
+JOB_QUEUE_SIZE = int(os.getenv("JOB_QUEUE_SIZE", "16"))
+JOB_STORE_PATH = os.getenv("JOB_STORE_PATH", "jobs/jobs.sqlite3")
+# 완료된 작업을 보관하는 기간 (초)
+JOB_RETENTION = float(os.getenv("JOB_RETENTION", str(7 * 24 * 3600)))
+# 진행 이벤트가 없을 때 SSE 연결 유지용 주석을 보내는 간격 (초)
+JOB_SSE_HEARTBEAT = float(os.getenv("JOB_SSE_HEARTBEAT", "15"))
+# 진행률을 저장소에 기록하는 최소 간격 (초) - 이벤트 스트림은 매번 전달
+JOB_PROGRESS_SAVE_INTERVAL = 1.0
+# 다른 워커 프로세스가 실행 중인 작업의 진행률을 저장소에서 다시 읽는 간격 (초)
+JOB_SSE_POLL_INTERVAL = 1.0
+# 서빙 시작 시각 - 이보다 먼저 만들어졌는데 끝나지 않은 작업은 이전 실행에서 중단된 것
+# (gunicorn 다중 워커는 마스터가 정한 값을 공유하므로 다른 워커가 실행 중인 작업을 건드리지 않음)
+SERVING_STARTED_AT = float(os.getenv("SERVING_STARTED_AT") or time.time())
+
+QUEUED, RUNNING, SUCCEEDED, FAILED = "queued", "running", "succeeded", "failed"
+TERMINAL_STATES = frozenset((SUCCEEDED, FAILED))
+
+
+class Job:
+    """작업 하나의 상태"""
+
+    def __init__(self, kind: str, params: Dict[str, Any], job_id: Optional[str] = None):
+        self.id = job_id or uuid.uuid4().hex
+        self.kind = kind
+        self.params = params
+        self.status = QUEUED
+        self.progress = 0.0
+        self.message = ""
+        self.result: Any = None
+        self.error: Optional[str] = None
+        self.created_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        # 제출한 요청의 컨텍스트 (추적 스팬 등) - 워커에서 이어서 실행
+        self.context: Optional[contextvars.Context] = None
+
+    @property
+    def done(self) -> bool:
+        return self.status in TERMINAL_STATES
+
+    def to_dict(self, include_result: bool = False) -> Dict[str, Any]:
+        data = {
+            "job_id": self.id,
+            "kind": self.kind,
+            "status": self.status,
+            "progress": round(self.progress, 4),
+            "message": self.message,
+            "error": self.error,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+        }
+        if include_result:
+            data["result"] = self.result
+        return data
+
+
+class JobStore:
+    """작업 상태를 저장하는 로컬 SQLite 저장소 (워커 스레드와 이벤트 루프에서 함께 사용)"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def open(self) -> None:
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS jobs ("
+            " id TEXT PRIMARY KEY, kind TEXT NOT NULL, status TEXT NOT NULL, progress REAL NOT NULL,"
+            " message TEXT, params TEXT, result TEXT, error TEXT,"
+            " created_at REAL NOT NULL, started_at REAL, finished_at REAL)"
+        )
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def save(self, job: Job) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO jobs VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (job.id, job.kind, job.status, job.progress, job.message,
+                 json.dumps(job.params, ensure_ascii=False, default=str),
+                 json.dumps(job.result, ensure_ascii=False, default=str) if job.result is not None else None,
+                 job.error, job.created_at, job.started_at, job.finished_at)
+            )
+
+    def load(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return self._to_job(row) if row else None
+
+    def recent(self, limit: int = 20) -> List[Job]:
+        with self._lock:
+            rows = self._conn.execute("SELECT * FROM jobs ORDER BY created_at DESC LIMIT ?", (limit,)).fetchall()
+        return [self._to_job(row) for row in rows]
+
+    def fail_interrupted(self, before: float) -> int:
+        """before 이전에 만들어졌지만 끝나지 못한 작업(이전 실행에서 중단된 작업)을 실패로 표시합니다."""
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE jobs SET status = ?, error = ?, finished_at = ? WHERE status IN (?, ?) AND created_at < ?",
+                (FAILED, "서비스 재시작으로 작업이 중단되었습니다.", time.time(), QUEUED, RUNNING, before)
+            )
+        return cursor.rowcount
+
+    def purge(self, older_than: float) -> int:
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM jobs WHERE finished_at IS NOT NULL AND finished_at < ?", (older_than,)
+            )
+        return cursor.rowcount
+
+    @staticmethod
+    def _to_job(row: tuple) -> Job:
+        job = Job(row[1], json.loads(row[5]) if row[5] else {}, job_id=row[0])
+        job.status, job.progress, job.message = row[2], row[3], row[4] or ""
+        job.result = json.loads(row[6]) if row[6] else None
+        job.error = row[7]
+        job.created_at, job.started_at, job.finished_at = row[8], row[9], row[10]
+        return job
+
+
+class JobQueueFull(Exception):
+    """대기열이 가득 차 작업을 받을 수 없는 경우"""
+
+
+class JobManager:
+    """
+    작업 종류 등록, 제출, 워커 풀 실행, 진행 이벤트 전달을 담당합니다.
+    작업 함수는 동기 함수이며, progress 인자를 받으면 progress(비율, 메시지) 로 진행률을 알릴 수 있습니다.
+    """
+
+    def __init__(self, store_path: str = JOB_STORE_PATH, workers: int = JOB_WORKERS, queue_size: int = JOB_QUEUE_SIZE):
+        self.store = JobStore(store_path)
+        self.workers = workers
+        self.queue_size = queue_size
+        self._kinds: Dict[str, Callable[..., Any]] = {}
+        self._descriptions: Dict[str, str] = {}
+        self._jobs: Dict[str, Job] = {}
+        self._subscribers: Dict[str, Set[asyncio.Queue]] = {}
+        self._queue: Optional[asyncio.Queue] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._tasks: List[asyncio.Task] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def register(self, kind: str, func: Callable[..., Any], description: str = "") -> None:
+        """
+        작업 종류를 등록합니다.
+
+        Args:
+            kind: 작업 이름 (URL 경로에 사용, 예: "preprocess")
+            func: 실행할 동기 함수 (progress 인자는 선택)
+            description: 작업 설명
+        """
+        self._kinds[kind] = func
+        self._descriptions[kind] = description
+
+    def kinds(self) -> Dict[str, str]:
+        return dict(self._descriptions)
+
+    async def start(self) -> None:
+        """저장소를 열고 워커를 시작합니다. (lifespan 시작 시 호출)"""
+        if self._tasks:
+            return
+        self.store.open()
+        interrupted = self.store.fail_interrupted(SERVING_STARTED_AT)
+        if interrupted:
+            logger.warning("재시작 전 끝나지 못한 작업 %d개를 실패로 표시했습니다.", interrupted)
+        self.store.purge(time.time() - JOB_RETENTION)
+        self._loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue(maxsize=self.queue_size)
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="job-worker")
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+
+    async def close(self) -> None:
+        """워커를 멈추고 저장소를 닫습니다. 실행 중인 작업은 다음 시작 때 실패로 표시됩니다."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        self.store.close()
+
+    def submit(self, kind: str, params: Optional[Dict[str, Any]] = None) -> Job:
+        """
+        작업을 대기열에 넣습니다.
+
+        Args:
+            kind: 등록된 작업 이름
+            params: 작업 함수에 전달할 키워드 인자
+
+        Returns:
+            생성된 작업
+
+        Raises:
+            KeyError: 등록되지 않은 작업
+            TypeError: 작업 함수가 받지 않는 인자
+            JobQueueFull: 대기열이 가득 찬 경우
+        """
+        func = self._kinds[kind]
+        params = params or {}
+        if "progress" in params:
+            raise TypeError("progress 는 작업 인자로 지정할 수 없습니다.")
+        inspect.signature(func).bind_partial(**params)
+        job = Job(kind, params)
+        job.context = contextvars.copy_context()
+        try:
+            self._queue.put_nowait(job)
+        except asyncio.QueueFull:
+            raise JobQueueFull(f"작업 대기열이 가득 찼습니다 ({self.queue_size})")
+        self._jobs[job.id] = job
+        self.store.save(job)
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        return self._jobs.get(job_id) or self.store.load(job_id)
+
+    def stats(self) -> dict:
+        return {
+            "workers": self.workers,
+            "queue_size": self.queue_size,
+            "queued": self._queue.qsize() if self._queue else 0,
+            "running": sum(1 for job in self._jobs.values() if job.status == RUNNING),
+            "kinds": self.kinds(),
+        }
+
+    async def _worker(self) -> None:
+        while True:
+            job = await self._queue.get()
+            try:
+                await self._run(job)
+            finally:
+                self._queue.task_done()
+
+    async def _run(self, job: Job) -> None:
+        job.status, job.started_at, job.message = RUNNING, time.time(), "실행 중"
+        self.store.save(job)
+        self._publish(job)
+        try:
+            job.result = await self._loop.run_in_executor(self._executor, job.context.run, self._call, job)
+            job.status, job.progress, job.message = SUCCEEDED, 1.0, "완료"
+        except Exception as e:
+            logger.exception("작업 실패: %s (%s)", job.id, job.kind)
+            job.status, job.error, job.message = FAILED, f"{type(e).__name__}: {e}", "실패"
+        job.finished_at = time.time()
+        job.context = None
+        self.store.save(job)
+        self._publish(job)
+        self._jobs.pop(job.id, None)
+
+    def _call(self, job: Job) -> Any:
+        """워커 스레드에서 작업 함수를 실행합니다."""
+        func = self._kinds[job.kind]
+        params = dict(job.params)
+        if "progress" in inspect.signature(func).parameters:
+            last_saved = [0.0]
+
+            def progress(fraction: float, message: str = "") -> None:
+                job.progress = max(0.0, min(1.0, fraction))
+                job.message = message
+                now = time.monotonic()
+                if now - last_saved[0] >= JOB_PROGRESS_SAVE_INTERVAL:
+                    last_saved[0] = now
+                    self.store.save(job)
+                self._loop.call_soon_threadsafe(self._publish, job)
+
+            params["progress"] = progress
+        result = func(**params)
+        # 결과는 JSON 으로 저장/응답하므로 직렬화할 수 없는 값은 문자열로 바꿈
+        return json.loads(json.dumps(result, ensure_ascii=False, default=str))
+
+    def _publish(self, job: Job) -> None:
+        snapshot = job.to_dict()
+        for queue in self._subscribers.get(job.id, ()):
+            queue.put_nowait(snapshot)
+
+    async def events(self, job_id: str) -> AsyncIterator[str]:
+        """
+        작업 진행 상황을 SSE 형식 문자열로 내보냅니다. 작업이 끝나면 종료합니다.
+        다른 워커 프로세스가 실행 중인 작업은 저장소를 주기적으로 다시 읽어 전달합니다.
+
+        Args:
+            job_id: 작업 ID
+        """
+        job = self.get(job_id)
+        if job is None:
+            return
+        queue: asyncio.Queue = asyncio.Queue()
+        self._subscribers.setdefault(job_id, set()).add(queue)
+        try:
+            snapshot, sent, last_sent = job.to_dict(), None, time.monotonic()
+            while True:
+                if snapshot != sent:
+                    event = "done" if snapshot["status"] in TERMINAL_STATES else "progress"
+                    yield f"event: {event}\ndata: {json.dumps(snapshot, ensure_ascii=False)}\n\n"
+                    if event == "done":
+                        return
+                    sent, last_sent = snapshot, time.monotonic()
+                elif time.monotonic() - last_sent >= JOB_SSE_HEARTBEAT:
+                    yield ": keep-alive\n\n"
+                    last_sent = time.monotonic()
+                timeout = JOB_SSE_HEARTBEAT if job_id in self._jobs else JOB_SSE_POLL_INTERVAL
+                try:
+                    snapshot = await asyncio.wait_for(queue.get(), timeout=timeout)
+                except asyncio.TimeoutError:
+                    snapshot = self.get(job_id).to_dict()
+        finally:
+            subscribers = self._subscribers.get(job_id)
+            if subscribers is not None:
+                subscribers.discard(queue)
+                if not subscribers:
+                    del self._subscribers[job_id]
+
+
+def _job_urls(base: str, job: Job) -> Dict[str, str]:
+    return {
+        "status_url": f"{base}/{job.id}",
+        "result_url": f"{base}/{job.id}/result",
+        "events_url": f"{base}/{job.id}/events",
+    }
+
+
+def _jobs_base(request: Request) -> str:
+    """클라이언트가 볼 작업 URL 의 기준 경로 (게이트웨이를 거치면 X-Forwarded-Prefix 를 앞에 붙임)"""
+    path = request.url.path
+    base = path[:path.index("/jobs") + len("/jobs")]
+    return request.headers.get("x-forwarded-prefix", "").rstrip("/") + base
+
+
+def create_job_router(manager: JobManager) -> APIRouter:
+    """
+    작업 API 라우터를 만듭니다. 서비스 prefix 아래에 등록합니다. (예: /crime/jobs/...)
+
+    Args:
+        manager: 작업 관리자
+
+    Returns:
+        APIRouter
+    """
+    router = APIRouter(prefix="/jobs", tags=["작업"])
+
+    def get_or_404(job_id: str) -> Job:
+        job = manager.get(job_id)
+        if job is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"작업을 찾을 수 없습니다: {job_id}")
+        return job
+
+    @router.get("", summary="작업 종류와 최근 작업 목록")
+    async def list_jobs(request: Request):
+        base = _jobs_base(request)
+        return {
+            **manager.stats(),
+            "recent": [{**job.to_dict(), **_job_urls(base, job)} for job in manager.store.recent()],
+        }
+
+    @router.post("/{kind}", summary="작업 제출", status_code=status.HTTP_202_ACCEPTED)
+    async def submit_job(kind: str, request: Request, params: Optional[Dict[str, Any]] = Body(default=None)):
+        try:
+            job = manager.submit(kind, params)
+        except KeyError:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"등록되지 않은 작업입니다: {kind}")
+        except TypeError as e:
+            raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=f"잘못된 작업 인자: {e}")
+        except JobQueueFull as e:
+            raise HTTPException(status_code=status.HTTP_429_TOO_MANY_REQUESTS, detail=str(e), headers={"Retry-After": "5"})
+        urls = _job_urls(_jobs_base(request), job)
+        return JSONResponse(
+            {**job.to_dict(), **urls},
+            status_code=status.HTTP_202_ACCEPTED,
+            headers={"Location": urls["status_url"]}
+        )
+
+    @router.get("/{job_id}", summary="작업 상태 조회")
+    async def job_status(job_id: str, request: Request):
+        job = get_or_404(job_id)
+        return {**job.to_dict(), **_job_urls(_jobs_base(request), job)}
+
+    @router.get("/{job_id}/result", summary="작업 결과 조회")
+    async def job_result(job_id: str):
+        job = get_or_404(job_id)
+        if job.status == SUCCEEDED:
+            return job.to_dict(include_result=True)
+        if job.status == FAILED:
+            return JSONResponse(job.to_dict(), status_code=status.HTTP_409_CONFLICT)
+        # 아직 끝나지 않음 - 잠시 후 다시 조회
+        return JSONResponse(job.to_dict(), status_code=status.HTTP_202_ACCEPTED, headers={"Retry-After": "1"})
+
+    @router.get("/{job_id}/events", summary="작업 진행 이벤트 (Server-Sent Events)")
+    async def job_events(job_id: str):
+        get_or_404(job_id)
+        return StreamingResponse(
+            manager.events(job_id),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+        )
+
+    return router
+
+
+# ✅ 프로세스 전역 작업 관리자
+jobs = JobManager()
@@ -0,0 +1,97 @@
+"""
+서비스 공통 platform 모듈 동기화 / 검사
+- 각 서비스 이미지는 자기 디렉토리만 빌드 컨텍스트로 쓰므로 공통 모듈을 서비스마다 app/platform 에 복사해 둠
+- 모듈마다 원본 서비스를 하나 정해 두고, 수정은 원본에서만 한 뒤 이 스크립트로 나머지에 복사
+- --check 는 복사본이 원본과 다르면 차이를 출력하고 1 로 종료 (CI 에서 실행)
+
+실행 (저장소 루트에서):
+    python tools/sync_platform.py            # 원본 → 복사본
+    python tools/sync_platform.py --check    # 복사본이 원본과 같은지 검사
+"""
+import os
+import sys
+import difflib
+import argparse
+from typing import Dict, List, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+ALL_SERVICES = ("gateway", "chatbot-service", "crime-service", "nlp-service", "tf-service", "titanic-service")
+BACKEND_SERVICES = ALL_SERVICES[1:]
+
+# ✅ 공통 모듈: 파일 이름 → (원본 서비스, 복사할 서비스 목록)
+SHARED_MODULES: Dict[str, Tuple[str, Tuple[str, ...]]] = {
+    "tracing.py": ("gateway", ALL_SERVICES),
+    "instrumentation.py": ("gateway", ALL_SERVICES),
+    "serving.py": ("crime-service", BACKEND_SERVICES),
+    "executor.py": ("crime-service", ("chatbot-service", "crime-service", "nlp-service", "tf-service")),
+    "jobs.py": ("crime-service", ("crime-service", "nlp-service", "titanic-service")),
+}
+
+
+def platform_path(service: str, module: str) -> str:
+    return os.path.join(ROOT, service, "app", "platform", module)
+
+
+def read(path: str) -> str:
+    if not os.path.exists(path):
+        return ""
+    with open(path, encoding="utf-8") as f:
+        return f.read()
+
+
+def check() -> List[str]:
+    """원본과 다른 복사본의 unified diff 목록을 반환합니다. (없는 복사본도 차이로 봄)"""
+    diffs = []
+    for module, (source, services) in SHARED_MODULES.items():
+        source_path = platform_path(source, module)
+        expected = read(source_path)
+        for service in services:
+            if service == source:
+                continue
+            path = platform_path(service, module)
+            actual = read(path)
+            if actual != expected:
+                diffs.append("".join(difflib.unified_diff(
+                    expected.splitlines(keepends=True), actual.splitlines(keepends=True),
+                    fromfile=os.path.relpath(source_path, ROOT), tofile=os.path.relpath(path, ROOT),
+                )) or f"{os.path.relpath(path, ROOT)}: 파일 없음\n")
+    return diffs
+
+
+def sync() -> List[str]:
+    """원본을 복사본 위치에 씁니다. 바뀐 파일 경로 목록을 반환합니다."""
+    changed = []
+    for module, (source, services) in SHARED_MODULES.items():
+        content = read(platform_path(source, module))
+        for service in services:
+            path = platform_path(service, module)
+            if service != source and read(path) != content:
+                with open(path, "w", encoding="utf-8") as f:
+                    f.write(content)
+                changed.append(os.path.relpath(path, ROOT))
+    return changed
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="서비스 공통 platform 모듈 동기화")
+    parser.add_argument("--check", action="store_true", help="복사본이 원본과 같은지 검사만 함")
+    args = parser.parse_args(argv)
+
+    if args.check:
+        diffs = check()
+        for diff in diffs:
+            sys.stdout.write(diff)
+        if diffs:
+            print(f"\n원본과 다른 platform 모듈 복사본 {len(diffs)}개 - python tools/sync_platform.py 로 동기화하세요.")
+            return 1
+        print("platform 모듈 복사본이 모두 원본과 같습니다.")
+        return 0
+
+    for path in sync():
+        print(f"동기화: {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())